@@ -0,0 +1,9 @@
+"""
+Benchmarks 모듈
+
+성능 개선 전후 비교용 독립 실행 벤치마크 스크립트.
+각 스크립트는 임시 디렉토리/로컬 스텁만 사용하며 외부 서비스에 접속하지 않습니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_storage_write
+"""
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+MessagePipeline 분류(우선순위 + 액션 감지) 마이크로 벤치마크
+
+기존 방식(키워드별 정규식/부분 문자열 반복 + 마감일 정규식 2회)과
+KeywordMatcher 단일 패스 방식의 메시지당 분류 지연을 한국어/영어 코퍼스로 비교하고,
+두 방식의 결과가 코퍼스 전체에서 동일한지 확인합니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_classify [--rounds 2000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.gateway.keyword_matcher import KeywordMatcher
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.pipeline import DEFAULT_CONFIG
+from scripts.gateway.project_context import ProjectContext
+
+CORPUS = [
+    "긴급! 바로 확인해주세요",
+    "Please check this ASAP",
+    "2/15까지 완료 부탁드립니다",
+    "안녕하세요. 점심 뭐 먹을까요?",
+    "보고서 검토 부탁드립니다",
+    "오늘 중으로 확인해주세요",
+    "이거 어떻게 하면 될까요?",
+    "지금까지 진행 상황 공유드립니다. 검토 완료했습니다.",
+    "바로가기 링크: https://example.com/a?b=c&d=e",
+    "서버다운 발생했습니다 지금 바로 대응 필요",
+    "방송사고 같은 건 없겠죠",
+    "v2.0 배포 준비 완료, 내일까지 릴리즈 예정",
+    "`SELECT ?` 쿼리 확인 감사합니다",
+    "The quarterly report is attached. Let me know when you have time.",
+    "urgent: production incident, please respond",
+    "이번 주 내로 회신 주세요. 10일 까지 처리 부탁",
+    "FYI - meeting notes from today's sync",
+    "자막 업로드 요청드립니다. 인코딩 이슈 있나요?",
+    "Thanks, 확인했습니다.",
+    "왜 이렇게 느린지 모르겠네요, 언제 고쳐지나요",
+]
+
+# 이메일 본문 길이의 메시지 (키워드 없음 / 끝부분에 키워드)
+_EMAIL_BODY = (
+    "안녕하세요, 지난주 회의에서 논의된 내용 정리해서 공유드립니다. "
+    "The release schedule has been updated and the team will follow the new timeline. "
+    "관련 자료는 첨부 파일을 참고해 주시기 바랍니다. "
+) * 8
+CORPUS = CORPUS * 5 + [_EMAIL_BODY, _EMAIL_BODY + "금요일까지 검토 부탁드립니다."] * 5
+
+PROJECTS = [
+    ProjectContext("secretary", urgent_keywords=["서버다운", "장애"], action_keywords=["배포", "릴리즈"]),
+    ProjectContext("wsoptv", urgent_keywords=["방송사고", "송출"], action_keywords=["인코딩", "업로드"]),
+]
+
+
+class LegacyClassifier:
+    """기존 MessagePipeline._analyze_priority/_detect_actions 구현 (비교 기준)"""
+
+    def __init__(self, config):
+        self.config = config
+        self._deadline_patterns = [re.compile(p, re.IGNORECASE) for p in config["deadline_patterns"]]
+        self._urgent_patterns = [
+            re.compile(
+                rf'(?:^|[\s,.\-!?;:()\"\'·]){re.escape(kw)}(?:[\s,.\-!?;:()\"\'·]|$)',
+                re.IGNORECASE,
+            )
+            for kw in config["urgent_keywords"]
+        ]
+        self._urgent_deny_patterns = [
+            re.compile(r'지금까지|지금은|지금처럼|지금도', re.IGNORECASE),
+            re.compile(r'바로가기|바로잡|바로옆|바로그', re.IGNORECASE),
+        ]
+        self._action_completion_patterns = {
+            kw: re.compile(rf'{re.escape(kw)}(했|됐|완료|끝|드립니다|드렸|감사)', re.IGNORECASE)
+            for kw in config["action_keywords"]
+        }
+        self._url_pattern = re.compile(r'https?://\S+')
+        self._code_block_pattern = re.compile(r'`[^`]*`')
+        self._question_patterns = [
+            re.compile(r'\?(?!\S*[/=&])'),
+            re.compile(r'(?:^|[\s])어떻게(?:[\s]|$)', re.MULTILINE),
+            re.compile(r'(?:^|[\s])언제(?:[\s]|$)', re.MULTILINE),
+            re.compile(r'(?:^|[\s])왜(?:[\s,.\-!?]|$)', re.MULTILINE),
+        ]
+
+    def priority(self, message, project_ctx):
+        text = message.text or ""
+        has_deny = any(p.search(text) for p in self._urgent_deny_patterns)
+        if not has_deny:
+            for pattern in self._urgent_patterns:
+                if pattern.search(text):
+                    return "urgent"
+            if project_ctx and project_ctx.urgent_keywords:
+                text_lower = text.lower()
+                for kw in project_ctx.urgent_keywords:
+                    if kw.lower() in text_lower:
+                        return "urgent"
+        if message.is_mention:
+            return "high"
+        for pattern in self._deadline_patterns:
+            if pattern.search(text):
+                return "high"
+        return "normal"
+
+    def actions(self, message, project_ctx):
+        text = message.text or ""
+        text_lower = text.lower()
+        actions = []
+        for keyword in self.config["action_keywords"]:
+            if keyword.lower() in text_lower:
+                completion_pat = self._action_completion_patterns.get(keyword)
+                if completion_pat and completion_pat.search(text):
+                    continue
+                actions.append(f"action_request:{keyword}")
+        for pattern in self._deadline_patterns:
+            match = pattern.search(text)
+            if match:
+                actions.append(f"deadline:{match.group(0)}")
+        if project_ctx and project_ctx.action_keywords:
+            for kw in project_ctx.action_keywords:
+                if kw.lower() in text_lower:
+                    actions.append(f"action_request:{kw}")
+        text_clean = self._url_pattern.sub('', text)
+        text_clean = self._code_block_pattern.sub('', text_clean)
+        if any(p.search(text_clean) for p in self._question_patterns):
+            actions.append("question")
+        return actions
+
+
+def classify_matcher(matcher, message, project_ctx):
+    """KeywordMatcher 기반 분류 (MessagePipeline._stage_classify와 동일 로직)"""
+    hits = matcher.scan(message.text or "")
+    pid = project_ctx.project_id if project_ctx else None
+
+    if not hits.deny and (hits.urgent or pid in hits.project_urgent):
+        priority = "urgent"
+    elif message.is_mention or hits.deadlines:
+        priority = "high"
+    else:
+        priority = "normal"
+
+    actions = [f"action_request:{kw}" for kw in hits.actions]
+    actions.extend(f"deadline:{d}" for d in hits.deadlines)
+    actions.extend(f"action_request:{kw}" for kw in hits.project_actions.get(pid, []))
+    if hits.question:
+        actions.append("question")
+    return priority, actions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분류 지연 마이크로 벤치마크")
+    parser.add_argument("--rounds", type=int, default=2000, help="코퍼스 반복 횟수")
+    args = parser.parse_args()
+
+    messages = [
+        NormalizedMessage(id=f"m{i}", channel=ChannelType.SLACK, channel_id="C1",
+                          sender_id="U1", text=text)
+        for i, text in enumerate(CORPUS)
+    ]
+    cases = [(m, PROJECTS[i % 3] if i % 3 < 2 else None) for i, m in enumerate(messages)]
+
+    legacy = LegacyClassifier(DEFAULT_CONFIG)
+    matcher = KeywordMatcher(DEFAULT_CONFIG, PROJECTS)
+
+    mismatches = [
+        m.text for m, ctx in cases
+        if (legacy.priority(m, ctx), legacy.actions(m, ctx)) != classify_matcher(matcher, m, ctx)
+    ]
+
+    def bench(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for m, ctx in cases:
+                fn(m, ctx)
+        return (time.perf_counter() - start) / (args.rounds * len(cases)) * 1e6
+
+    legacy_us = bench(lambda m, ctx: (legacy.priority(m, ctx), legacy.actions(m, ctx)))
+    matcher_us = bench(lambda m, ctx: classify_matcher(matcher, m, ctx))
+
+    print(f"코퍼스: {len(cases)}개 메시지 x {args.rounds}회")
+    print(f"  기존 (키워드별 반복): {legacy_us:7.2f} us/msg")
+    print(f"  KeywordMatcher:       {matcher_us:7.2f} us/msg")
+    print(f"  개선 배율: {legacy_us / matcher_us:.2f}x")
+    print(f"  결과 불일치: {len(mismatches)}건")
+    for text in mismatches:
+        print(f"    - {text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+DB 행 → NormalizedMessage 변환(hydration) 벤치마크
+
+기존 방식(행마다 dict 복사 + Enum 생성자/try-except + media_urls JSON 파싱 +
+__post_init__ 검사가 있는 일반 dataclass)과 StoredMessage.from_row 방식(__slots__,
+컬럼 위치 1회 계산, media_urls 지연 파싱)의 변환 시간과 메시지당 메모리를 비교합니다.
+
+목표: 100k행 기준 3배 이상 빠르고 메시지당 메모리 감소.
+
+Usage:
+    python -m scripts.benchmarks.bench_message_hydration [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.gateway.models import ChannelType, MessageType, Priority
+from scripts.gateway.storage import MESSAGE_COLUMNS, _db_rows_to_messages
+
+NOW = datetime(2026, 1, 1)
+
+
+@dataclass
+class LegacyMessage:
+    """기존 NormalizedMessage (slots 없음, __post_init__ 검사)"""
+    id: str
+    channel: ChannelType
+    channel_id: str
+    sender_id: str
+    sender_name: str | None = None
+    text: str = ""
+    message_type: MessageType = MessageType.TEXT
+    timestamp: datetime = field(default_factory=datetime.now)
+    is_group: bool = False
+    is_mention: bool = False
+    reply_to_id: str | None = None
+    media_urls: list[str] = field(default_factory=list)
+    raw_json: str | None = None
+    priority: Priority | None = None
+    has_action: bool = False
+    project_id: str | None = None
+    thread_id: str | None = None
+
+    def __post_init__(self):
+        if isinstance(self.channel, str):
+            self.channel = ChannelType(self.channel)
+        if isinstance(self.message_type, str):
+            self.message_type = MessageType(self.message_type)
+        if self.priority is not None and isinstance(self.priority, str):
+            self.priority = Priority(self.priority)
+        if isinstance(self.timestamp, str):
+            self.timestamp = datetime.fromisoformat(self.timestamp)
+
+
+def legacy_row_to_message(row) -> LegacyMessage:
+    """기존 _db_row_to_message 구현 (비교 기준)"""
+    data = dict(row)
+    channel = data.get('channel', 'unknown')
+    try:
+        channel = ChannelType(channel)
+    except ValueError:
+        channel = ChannelType.UNKNOWN
+    message_type = data.get('message_type', 'text')
+    try:
+        message_type = MessageType(message_type)
+    except ValueError:
+        message_type = MessageType.TEXT
+    priority = data.get('priority')
+    if priority:
+        try:
+            priority = Priority(priority)
+        except ValueError:
+            priority = None
+    timestamp = data.get('timestamp')
+    if timestamp and isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    media_urls = data.get('media_urls')
+    if media_urls and isinstance(media_urls, str):
+        media_urls = json.loads(media_urls)
+    return LegacyMessage(
+        id=data['id'],
+        channel=channel,
+        channel_id=data['channel_id'],
+        sender_id=data['sender_id'],
+        sender_name=data.get('sender_name'),
+        text=data.get('text', ''),
+        message_type=message_type,
+        timestamp=timestamp or datetime.now(),
+        is_group=bool(data.get('is_group', False)),
+        is_mention=bool(data.get('is_mention', False)),
+        reply_to_id=data.get('reply_to_id'),
+        media_urls=media_urls or [],
+        raw_json=data.get('raw_json'),
+        priority=priority,
+        has_action=bool(data.get('has_action', False)),
+        project_id=data.get('project_id'),
+    )
+
+
+def load_rows(count: int) -> list[sqlite3.Row]:
+    """인메모리 DB에 합성 메시지를 넣고 SELECT *로 읽은 행 (10%는 첨부 URL 포함)"""
+    rng = random.Random(42)
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"CREATE TABLE messages ({', '.join(MESSAGE_COLUMNS)})")
+    rows = []
+    for i in range(count):
+        ts = (NOW - timedelta(seconds=i * 7)).isoformat()
+        media = json.dumps([f"https://files.example.com/{i}/a.png"]) if i % 10 == 0 else None
+        rows.append((
+            f"m{i:07d}", rng.choice(("slack", "email")), f"C{i % 50:03d}", f"U{i % 500:04d}",
+            f"user{i % 500}", f"메시지 본문 {i} 확인 부탁드립니다", "text", ts, i % 3 == 0, i % 7 == 0,
+            None, media, '{"ts": "1.0"}', rng.choice(("normal", "high", None)), i % 5 == 0,
+            f"proj{i % 20:02d}", None, ts,
+        ))
+    conn.executemany(
+        f"INSERT INTO messages VALUES ({', '.join('?' for _ in MESSAGE_COLUMNS)})", rows
+    )
+    result = conn.execute("SELECT * FROM messages").fetchall()
+    conn.close()
+    return result
+
+
+def timed(fn, rows, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn(rows)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def bytes_per_message(fn, rows) -> float:
+    """변환 결과가 유지하는 메모리 / 행 수 (tracemalloc)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    messages = fn(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del messages
+    return (after - before) / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 행 hydration 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="변환할 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    rows = load_rows(args.rows)
+
+    def legacy(rows):
+        return [legacy_row_to_message(row) for row in rows]
+
+    legacy_ms = timed(legacy, rows, args.repeat)
+    stored_ms = timed(_db_rows_to_messages, rows, args.repeat)
+    legacy_mem = bytes_per_message(legacy, rows)
+    stored_mem = bytes_per_message(_db_rows_to_messages, rows)
+
+    mismatches = sum(
+        1 for old, new in zip(legacy(rows), _db_rows_to_messages(rows), strict=True)
+        if old.__dict__ != {name: getattr(new, name) for name in old.__dict__}
+    )
+
+    print(f"행 수: {args.rows:,} (반복 {args.repeat}회 중앙값)")
+    print(f"  기존 (dict + Enum 생성자 + dataclass): {legacy_ms:8.1f} ms  {legacy_mem:6.0f} B/msg")
+    print(f"  StoredMessage.from_row (slots, 지연): {stored_ms:8.1f} ms  {stored_mem:6.0f} B/msg")
+    print(f"  개선 배율: {legacy_ms / stored_ms:.2f}x (목표 3x), 메모리 {1 - stored_mem / legacy_mem:.0%} 감소")
+    print(f"  결과 불일치: {mismatches}건")
+
+
+if __name__ == "__main__":
+    main()
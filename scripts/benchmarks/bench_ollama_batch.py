@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Tier 1 Ollama 분석: 단건 호출 vs 배치 프롬프트(analyze_batch) vs 스트리밍 조기 종료 벤치마크
+
+로컬 stub Ollama 서버(/api/chat)를 띄우고 같은 메시지 묶음을 여러 방식으로 분석해
+메시지당 프롬프트 토큰, 생성 토큰, HTTP 요청 수, 지연을 비교합니다.
+
+stub 서버는 실제 Ollama처럼 요청을 하나씩 처리(num_parallel=1)하고, 지연을
+요청 오버헤드 + 프롬프트 토큰 x prefill 비용 + 생성 토큰 x decode 비용으로 흉내 냅니다.
+토큰 수는 문자 수 / --chars-per-token 으로 추정하고, 생성 토큰은 두 방식 모두
+메시지당 --reply-tokens 로 동일하게 가정합니다 (차이는 프롬프트 공유분에서만 발생).
+모델이 결정 마커 뒤에 덧붙이는 부연 설명(--trailing-tokens)은 스트리밍 모드에서
+클라이언트가 연결을 닫으면 생성되지 않습니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_ollama_batch [--messages 32] [--batch-sizes 4,8] [--time-scale 0.1]
+        [--trailing-tokens 40]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.intelligence.response.analyzer import OllamaAnalyzer
+from scripts.shared.ollama_client import OllamaClient
+
+PROMPT_DIR = Path(__file__).resolve().parent.parent / "intelligence" / "prompts"
+PROJECTS_PATH = Path(__file__).resolve().parent.parent.parent / "config" / "projects.json"
+
+TEXTS = (
+    "배포 일정 확인 부탁드립니다", "staging 로그에 오류가 계속 납니다", "회의록 공유드립니다",
+    "리뷰 요청드린 PR 확인 가능할까요?", "내일 오전 회의 참석 가능하신가요?", "점심 뭐 드실래요",
+    "티켓 상태 업데이트했습니다", "daily report 자동화 진행 상황 궁금합니다",
+)
+
+_MSG_HEADING = re.compile(r"^### \[MSG (\d+)\]", re.MULTILINE)
+
+
+class StubOllama:
+    """요청을 순차 처리하고 토큰 기반 지연을 흉내 내는 /api/chat stub"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self._lock = asyncio.Lock()
+        self._server: asyncio.Server | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.eval_tokens = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        # 연결이 닫힌 뒤에도 생성 중인 응답이 끝까지 정리되도록 대기
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=5)
+        await self._server.wait_closed()
+
+    def reset(self) -> None:
+        self.requests = self.prompt_tokens = self.eval_tokens = 0
+
+    def _reply(self, prompt: str) -> str:
+        decision = "[RESPONSE_NEEDED] project_id=secretary confidence=0.8"
+        reasoning = "진행 상황을 묻는 요청으로 보입니다. " * max(1, self.args.reply_tokens // 15)
+        trailing = "\n\n과거 대화를 참고해 판단했습니다. " * (self.args.trailing_tokens // 15)
+        count = len(_MSG_HEADING.findall(prompt))
+        if not count:
+            return f"{reasoning}\n{decision}{trailing}"
+        blocks = "\n\n".join(f"[MSG {i}]\n{reasoning}\n{decision}" for i in range(1, count + 1))
+        return blocks + trailing
+
+    async def _generate(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                        content: str, stream: bool) -> None:
+        """생성 토큰 지연을 흉내 내며 응답 전송 (실제로 생성한 토큰만 eval_tokens에 집계)"""
+        decode_s = self.args.decode_ms * self.args.time_scale / 1000
+        if not stream:
+            eval_tokens = len(content) // self.args.chars_per_token
+            await asyncio.sleep(eval_tokens * decode_s)
+            self.eval_tokens += eval_tokens
+            payload = json.dumps({
+                "message": {"role": "assistant", "content": content}, "eval_count": eval_tokens, "done": True,
+            }).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+            return
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n")
+        step = self.args.chars_per_token
+        started = time.perf_counter()
+        for n, i in enumerate(range(0, len(content), step), 1):
+            # 클라이언트가 응답을 닫으면 Ollama처럼 생성 중단
+            if reader.at_eof() or writer.is_closing():
+                return
+            # 토큰마다 sleep 하면 타이머 오차가 쌓이므로 누적 목표 시각까지 대기
+            await asyncio.sleep(max(0.0, started + n * decode_s - time.perf_counter()))
+            self.eval_tokens += 1
+            line = json.dumps({"message": {"role": "assistant", "content": content[i:i + step]}, "done": False})
+            data = (line + "\n").encode()
+            writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            await writer.drain()
+        data = b'{"done": true}\n'
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n0\r\n\r\n")
+        await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = json.loads(await reader.readexactly(length))
+                prompt = "\n".join(m["content"] for m in body["messages"])
+                content = self._reply(prompt)
+
+                prompt_tokens = len(prompt) // self.args.chars_per_token
+                self.requests += 1
+                self.prompt_tokens += prompt_tokens
+                async with self._lock:
+                    delay_ms = self.args.request_overhead_ms + prompt_tokens * self.args.prefill_ms
+                    await asyncio.sleep(delay_ms * self.args.time_scale / 1000)
+                    await self._generate(reader, writer, content, body.get("stream", False))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+
+def make_messages(count: int, rag_entries: int) -> list[dict]:
+    """handler가 만드는 형태의 분석 요청 (규칙 힌트 + RAG 컨텍스트 포함)"""
+    rng = random.Random(42)
+    messages = []
+    for i in range(count):
+        rag = "\n".join(
+            f"[Slack 2026-01-{d + 1:02d}] user{d}: " + " ".join(rng.choices(TEXTS, k=6))
+            for d in range(rag_entries)
+        )
+        messages.append({
+            "text": rng.choice(TEXTS),
+            "sender_name": f"user{i % 7}",
+            "source_channel": "slack",
+            "channel_id": f"C{i % 3:03d}",
+            "rule_hint": "channel_match=secretary, confidence=0.6" if i % 2 else None,
+            "rag_context": rag,
+        })
+    return messages
+
+
+async def run_mode(stub: StubOllama, analyzer: OllamaAnalyzer, messages: list[dict],
+                   projects: list[dict], batch_size: int, stream: bool) -> dict:
+    stub.reset()
+    analyzer.stream = stream
+    started = time.perf_counter()
+    if batch_size <= 1:
+        results = [
+            await analyzer.analyze(project_list=projects, **msg)
+            for msg in messages
+        ]
+    else:
+        results = await analyzer.analyze_batch(messages, projects, max_batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+    assert all(r.needs_response for r in results), "stub 응답 파싱 실패"
+    count = len(messages)
+    return {
+        "requests": stub.requests,
+        "prompt": stub.prompt_tokens / count,
+        "eval": stub.eval_tokens / count,
+        "latency_ms": elapsed * 1000 / count,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    projects = json.loads(PROJECTS_PATH.read_text(encoding="utf-8")).get("projects", [])
+    messages = make_messages(args.messages, args.rag_entries)
+    stub = StubOllama(args)
+    await stub.start()
+    try:
+        analyzer = OllamaAnalyzer(
+            ollama_url=stub.url, prompt_dir=PROMPT_DIR, max_requests_per_minute=1_000_000,
+        )
+        print(f"메시지 {len(messages)}개, 프로젝트 {len(projects)}개, RAG {args.rag_entries}건/메시지 "
+              f"(time-scale={args.time_scale})")
+        print(f"  {'mode':<16} {'requests':>8} {'prompt tok/msg':>15} {'eval tok/msg':>13} {'ms/msg':>9}")
+        baseline = None
+        modes = [(batch_size, stream) for batch_size in [1, *args.batch_sizes] for stream in (False, True)]
+        for batch_size, stream in modes:
+            stats = await run_mode(stub, analyzer, messages, projects, batch_size, stream)
+            baseline = baseline or stats
+            label = ("single" if batch_size == 1 else f"batch={batch_size}") + ("+stream" if stream else "")
+            print(f"  {label:<16} {stats['requests']:>8} {stats['prompt']:>15.0f} {stats['eval']:>13.0f} "
+                  f"{stats['latency_ms']:>9.1f}  ({baseline['latency_ms'] / stats['latency_ms']:.2f}x)")
+    finally:
+        await OllamaClient.shutdown()
+        await stub.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tier 1 배치 분석 벤치마크 (stub Ollama)")
+    parser.add_argument("--messages", type=int, default=32, help="메시지 수 (기본: 32)")
+    parser.add_argument("--batch-sizes", type=lambda v: [int(x) for x in v.split(",")], default=[4, 8],
+                        help="비교할 배치 크기 (기본: 4,8)")
+    parser.add_argument("--rag-entries", type=int, default=3, help="메시지당 RAG 이력 건수")
+    parser.add_argument("--chars-per-token", type=int, default=2, help="토큰 추정용 문자/토큰")
+    parser.add_argument("--reply-tokens", type=int, default=60, help="메시지당 생성 토큰 (대략)")
+    parser.add_argument("--trailing-tokens", type=int, default=40, help="결정 마커 뒤 부연 설명 토큰 (대략)")
+    parser.add_argument("--request-overhead-ms", type=float, default=50.0, help="요청당 고정 비용")
+    parser.add_argument("--prefill-ms", type=float, default=0.5, help="프롬프트 토큰당 비용")
+    parser.add_argument("--decode-ms", type=float, default=20.0, help="생성 토큰당 비용")
+    parser.add_argument("--time-scale", type=float, default=0.1, help="stub 지연 배율")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
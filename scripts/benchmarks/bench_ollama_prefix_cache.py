@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tier 1 Ollama 분석: 프롬프트 prefix KV 캐시 재사용 벤치마크 (time-to-first-token)
+
+Ollama(llama.cpp 러너)는 모델이 로드된 동안 직전 요청의 KV 캐시를 유지하고, 새 요청
+프롬프트가 직전 프롬프트와 공유하는 앞부분(prefix)은 prefill을 건너뜁니다. 공유
+prefix가 길수록 prompt_eval_count와 첫 토큰까지의 시간이 줄어듭니다.
+
+로컬 stub Ollama 서버(/api/chat, 스트리밍)가 이 동작을 흉내 냅니다:
+- 직전 프롬프트와의 공통 prefix 토큰은 캐시로 처리, 나머지만 prefill 비용 부과
+- 최종 chunk에 prompt_eval_count(실제로 prefill한 토큰 수) 보고
+- 요청 수신부터 첫 content chunk 전송까지를 TTFT로 기록
+
+같은 메시지 묶음을 OllamaAnalyzer.analyze(단건)와 analyze_batch로 순차 분석해
+메시지당 프롬프트 토큰, prefill 토큰, 캐시 적중률, TTFT를 출력합니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_ollama_prefix_cache [--messages 32] [--projects 12] [--time-scale 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.benchmarks.bench_ollama_batch import PROJECTS_PATH, PROMPT_DIR, make_messages
+from scripts.intelligence.response.analyzer import OllamaAnalyzer
+from scripts.shared.ollama_client import OllamaClient
+
+DECISION = "[RESPONSE_NEEDED] project_id=secretary confidence=0.8"
+
+
+class PrefixCacheStub:
+    """직전 프롬프트와의 공통 prefix만큼 prefill을 생략하는 스트리밍 /api/chat stub"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self._lock = asyncio.Lock()
+        self._server: asyncio.Server | None = None
+        self._cached_prompt = ""
+        self.reset()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def reset(self) -> None:
+        self._cached_prompt = ""
+        self.prompt_tokens = 0
+        self.prompt_eval_tokens = 0
+        self.ttft: list[float] = []
+
+    def _reply(self, prompt: str) -> str:
+        count = prompt.count("### [MSG ")
+        if not count:
+            return f"진행 상황을 묻는 요청입니다.\n{DECISION}\n"
+        return "".join(f"[MSG {i}]\n진행 상황을 묻는 요청입니다.\n{DECISION}\n\n" for i in range(1, count + 1))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await reader.readline():
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = json.loads(await reader.readexactly(length))
+                prompt = "\n".join(m["content"] for m in body["messages"])
+                received = time.perf_counter()
+
+                async with self._lock:
+                    cpt = self.args.chars_per_token
+                    cached = len(os.path.commonprefix([self._cached_prompt, prompt])) // cpt
+                    total = len(prompt) // cpt
+                    prompt_eval = total - cached
+                    self._cached_prompt = prompt
+                    self.prompt_tokens += total
+                    self.prompt_eval_tokens += prompt_eval
+                    delay_ms = self.args.request_overhead_ms + prompt_eval * self.args.prefill_ms
+                    await asyncio.sleep(delay_ms * self.args.time_scale / 1000)
+
+                    content = self._reply(prompt)
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                                 b"Transfer-Encoding: chunked\r\n\r\n")
+                    chunks = [json.dumps({"message": {"content": content}, "done": False}),
+                              json.dumps({"done": True, "prompt_eval_count": prompt_eval})]
+                    for i, chunk in enumerate(chunks):
+                        data = (chunk + "\n").encode()
+                        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                        await writer.drain()
+                        if i == 0:
+                            self.ttft.append((time.perf_counter() - received) / self.args.time_scale)
+                    writer.write(b"0\r\n\r\n")
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def make_projects(count: int) -> list[dict]:
+    """config/projects.json에 가상 프로젝트를 더해 count개로 맞춘 목록"""
+    projects = json.loads(PROJECTS_PATH.read_text(encoding="utf-8")).get("projects", [])
+    for i in range(len(projects), count):
+        projects.append({
+            "id": f"project-{i}",
+            "name": f"Project {i}",
+            "keywords": [f"kw{i}-{k}" for k in range(6)],
+            "description": f"프로젝트 {i} 자동화 및 운영 지원 (채널, 메일, 티켓 연동)",
+        })
+    return projects
+
+
+async def run_mode(stub: PrefixCacheStub, analyzer: OllamaAnalyzer, messages: list[dict],
+                   projects: list[dict], batch_size: int) -> dict:
+    stub.reset()
+    if batch_size <= 1:
+        results = [await analyzer.analyze(project_list=projects, **msg) for msg in messages]
+    else:
+        results = await analyzer.analyze_batch(messages, projects, max_batch_size=batch_size)
+    assert all(r.needs_response for r in results), "stub 응답 파싱 실패"
+    count = len(messages)
+    return {
+        "requests": len(stub.ttft),
+        "prompt": stub.prompt_tokens / count,
+        "prompt_eval": stub.prompt_eval_tokens / count,
+        "hit": 1 - stub.prompt_eval_tokens / stub.prompt_tokens,
+        "ttft_ms": statistics.mean(stub.ttft) * 1000,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    projects = make_projects(args.projects)
+    messages = make_messages(args.messages, args.rag_entries)
+    stub = PrefixCacheStub(args)
+    await stub.start()
+    try:
+        analyzer = OllamaAnalyzer(
+            ollama_url=stub.url, prompt_dir=PROMPT_DIR, max_requests_per_minute=1_000_000, stream=True,
+        )
+        print(f"메시지 {len(messages)}개, 프로젝트 {len(projects)}개, RAG {args.rag_entries}건/메시지 "
+              f"(time-scale={args.time_scale})")
+        print(f"  {'mode':<8} {'requests':>8} {'prompt tok/msg':>15} {'prefill tok/msg':>16} "
+              f"{'cache hit':>10} {'TTFT ms':>9}")
+        for batch_size in [1, *args.batch_sizes]:
+            stats = await run_mode(stub, analyzer, messages, projects, batch_size)
+            label = "single" if batch_size == 1 else f"batch={batch_size}"
+            print(f"  {label:<8} {stats['requests']:>8} {stats['prompt']:>15.0f} {stats['prompt_eval']:>16.0f} "
+                  f"{stats['hit']:>10.0%} {stats['ttft_ms']:>9.1f}")
+    finally:
+        await OllamaClient.shutdown()
+        await stub.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tier 1 프롬프트 prefix 캐시 벤치마크 (stub Ollama)")
+    parser.add_argument("--messages", type=int, default=32, help="메시지 수 (기본: 32)")
+    parser.add_argument("--projects", type=int, default=12, help="프로젝트 수 (기본: 12)")
+    parser.add_argument("--batch-sizes", type=lambda v: [int(x) for x in v.split(",")], default=[8],
+                        help="비교할 배치 크기 (기본: 8)")
+    parser.add_argument("--rag-entries", type=int, default=3, help="메시지당 RAG 이력 건수")
+    parser.add_argument("--chars-per-token", type=int, default=2, help="토큰 추정용 문자/토큰")
+    parser.add_argument("--request-overhead-ms", type=float, default=20.0, help="요청당 고정 비용")
+    parser.add_argument("--prefill-ms", type=float, default=0.5, help="prefill 토큰당 비용")
+    parser.add_argument("--time-scale", type=float, default=0.1, help="stub 지연 배율 (TTFT는 배율 보정 후 출력)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
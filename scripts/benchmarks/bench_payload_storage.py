@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+gateway.db raw_json 저장 방식 벤치마크 (인라인 vs 행 밖 압축 payload)
+
+합성 메시지(기본 1,000,000행, 메시지당 약 1.5KB 원본 이벤트 JSON)를 두 가지 구성으로 시드합니다.
+
+- inline: 기존 방식. messages.raw_json에 원문 그대로 저장
+- payload: UnifiedStorage 방식. 큰 raw_json은 message_payloads에 zlib 압축 저장
+
+파일 크기와 get_recent_messages(SELECT *) / 전체 스캔 집계 / 단건 get_message /
+payload 포함 최근 50건 조회 지연을 비교합니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_payload_storage [--messages 1000000] [--payload-bytes 1500] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.gateway.storage import (
+    MESSAGE_COLUMNS,
+    UnifiedStorage,
+    _decode_payload,
+    _split_payloads,
+)
+
+NOW = datetime(2026, 1, 1)
+SEED_BATCH = 10_000
+WORDS = ("배포", "일정", "확인", "부탁", "회의", "리뷰", "오류", "로그", "deploy", "review", "ticket", "staging")
+
+RECENT_SQL = "SELECT * FROM messages WHERE 1=1 AND channel = ? ORDER BY timestamp DESC LIMIT 50"
+PAYLOAD_SQL = "SELECT message_id, codec, raw_json FROM message_payloads WHERE message_id IN ({})"
+
+
+def fake_event(i: int, rng: random.Random, size: int) -> str:
+    """Slack 이벤트 형태의 합성 원본 JSON (size 바이트 내외)"""
+    event = {
+        "type": "message", "ts": f"{1760000000 + i}.{i % 1000000:06d}",
+        "user": f"U{i % 500:04d}", "channel": f"C{i % 50:03d}", "team": "T0001",
+        "client_msg_id": f"{rng.getrandbits(128):032x}",
+        "blocks": [],
+    }
+    while len(json.dumps(event, ensure_ascii=False).encode()) < size:
+        event["blocks"].append({
+            "type": "rich_text", "block_id": f"{rng.getrandbits(24):06x}",
+            "elements": [{"type": "text", "text": " ".join(rng.choices(WORDS, k=8))}],
+        })
+    return json.dumps(event, ensure_ascii=False)
+
+
+def seed(conn: sqlite3.Connection, count: int, payload_bytes: int, out_of_row: bool) -> None:
+    """같은 시드로 두 구성에 동일한 메시지 생성 (90일 분포)"""
+    rng = random.Random(42)
+    span = 90 * 86400
+    insert = (
+        f"INSERT INTO messages ({', '.join(MESSAGE_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in MESSAGE_COLUMNS)})"
+    )
+    for start in range(0, count, SEED_BATCH):
+        rows = []
+        for i in range(start, min(start + SEED_BATCH, count)):
+            ts = (NOW - timedelta(seconds=span * (count - i) / count)).isoformat()
+            rows.append((
+                f"m{i:07d}", rng.choice(("slack", "email", "email")), f"C{i % 50:03d}", f"U{i % 500:04d}",
+                None, " ".join(rng.choices(WORDS, k=12)), "text", ts, False, False, None, None,
+                fake_event(i, rng, payload_bytes), "normal", False, f"proj{i % 20:02d}", ts, ts,
+            ))
+        payloads = []
+        if out_of_row:
+            rows, payloads = _split_payloads(rows)
+        conn.executemany(insert, rows)
+        conn.executemany(
+            "INSERT INTO message_payloads (message_id, codec, raw_json) VALUES (?, ?, ?)", payloads
+        )
+        conn.commit()
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def measure(db_path: Path, count: int, repeat: int, out_of_row: bool) -> dict[str, float]:
+    """시드 후 새 연결에서 쿼리별 중앙값 ms"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    rng = random.Random(7)
+    ids = [f"m{rng.randrange(count):07d}" for _ in range(repeat)]
+
+    def recent_with_raw():
+        rows = conn.execute(RECENT_SQL, ["slack"]).fetchall()
+        if out_of_row:
+            missing = [r["id"] for r in rows if r["raw_json"] is None]
+            for r in conn.execute(PAYLOAD_SQL.format(", ".join("?" for _ in missing)), missing):
+                _decode_payload(r["codec"], r["raw_json"])
+
+    def get_message():
+        message_id = ids[rng.randrange(len(ids))]
+        row = conn.execute("SELECT * FROM messages WHERE id = ?", [message_id]).fetchone()
+        if out_of_row and row["raw_json"] is None:
+            r = conn.execute(
+                "SELECT codec, raw_json FROM message_payloads WHERE message_id = ?", [message_id]
+            ).fetchone()
+            _decode_payload(r["codec"], r["raw_json"])
+
+    results = {
+        "recent 50 (SELECT *)": timed(lambda: conn.execute(RECENT_SQL, ["slack"]).fetchall(), repeat),
+        "recent 50 + raw_json": timed(recent_with_raw, repeat),
+        "get_message": timed(get_message, repeat),
+        "full scan (sender)": timed(
+            lambda: conn.execute("SELECT COUNT(*) FROM messages WHERE sender_id = 'U0007'").fetchone(), repeat
+        ),
+    }
+    conn.close()
+    return results
+
+
+async def create_schema(db_path: Path) -> None:
+    async with UnifiedStorage(db_path):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="raw_json 인라인 vs 행 밖 압축 payload 벤치마크")
+    parser.add_argument("--messages", type=int, default=1_000_000, help="시드할 messages 행 수")
+    parser.add_argument("--payload-bytes", type=int, default=1500, help="메시지당 원본 JSON 크기")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리당 반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout in ("inline", "payload"):
+            db_path = Path(tmp) / f"{layout}.db"
+            asyncio.run(create_schema(db_path))
+            conn = sqlite3.connect(db_path)
+            started = time.perf_counter()
+            seed(conn, args.messages, args.payload_bytes, out_of_row=layout == "payload")
+            conn.close()
+            print(f"[{layout}] seeded in {time.perf_counter() - started:.1f}s")
+
+            size_mb = db_path.stat().st_size / 1024 / 1024
+            results[layout] = {"file MB": size_mb, **measure(db_path, args.messages, args.repeat, layout == "payload")}
+
+    print(f"{'metric':<24} | {'inline':>10} | {'payload':>10}")
+    for metric, inline in results["inline"].items():
+        print(f"{metric:<24} | {inline:>10.2f} | {results['payload'][metric]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+ProjectContextResolver 프로젝트 수 확장성 벤치마크
+
+프로젝트 수(기본 10/50/100/500)별로 projects.json을 생성하고,
+기존 순차 탐색(프로젝트마다 채널 리스트 확인 + subject 정규식 + 키워드 소문자 변환)과
+인덱스 기반 resolve()의 메시지당 해석 지연을 비교합니다. 두 방식의 결과가 같은지도 확인합니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_project_resolve [--projects 10,50,100,500] [--rounds 200]
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.project_context import ProjectContextResolver
+
+
+def legacy_resolve(projects: list[dict], message: NormalizedMessage) -> str | None:
+    """인덱스 도입 이전의 순차 탐색 (비교 기준)"""
+    for project in projects:
+        pid = project.get("id", "")
+        if not pid:
+            continue
+        if message.channel == ChannelType.SLACK:
+            if message.channel_id in project.get("slack_channels", []):
+                return pid
+        if message.channel == ChannelType.EMAIL:
+            text = (message.text or "").lower()
+            combined = f"{(message.sender_id or '').lower()} {text}"
+            for query in project.get("gmail_queries", []):
+                subject_match = re.search(r"subject:\(([^)]+)\)", query, re.IGNORECASE)
+                if subject_match:
+                    terms = re.split(r"\s+OR\s+", subject_match.group(1), flags=re.IGNORECASE)
+                    if any(term.strip().lower() in combined for term in terms):
+                        return pid
+                elif query.lower() in combined:
+                    return pid
+        text_lower = (message.text or "").lower()
+        if any(kw.lower() in text_lower for kw in project.get("keywords", [])):
+            return pid
+    return None
+
+
+def make_projects(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"proj{i:03d}",
+            "slack_channels": [f"C{i:03d}A", f"C{i:03d}B"],
+            "gmail_queries": [f"subject:(project{i:03d} OR 작업{i:03d})", f"from:team{i:03d}@example.com"],
+            "keywords": [f"kw{i:03d}", f"키워드{i:03d}", f"모듈{i:03d}"],
+        }
+        for i in range(count)
+    ]
+
+
+def make_messages(count: int) -> list[NormalizedMessage]:
+    """앞/중간/끝 프로젝트 매칭 + 미매칭 메시지 혼합"""
+    picks = sorted({0, count // 2, count - 1})
+    messages = []
+    for i in picks:
+        messages += [
+            NormalizedMessage(id=f"s{i}", channel=ChannelType.SLACK, channel_id=f"C{i:03d}B",
+                              sender_id="U1", text="배포 일정 공유드립니다"),
+            NormalizedMessage(id=f"e{i}", channel=ChannelType.EMAIL, channel_id="inbox",
+                              sender_id="someone@example.com", text=f"[작업{i:03d}] 주간 보고"),
+            NormalizedMessage(id=f"k{i}", channel=ChannelType.SLACK, channel_id="C_OTHER",
+                              sender_id="U2", text=f"모듈{i:03d} 빌드가 깨졌어요"),
+        ]
+    messages += [
+        NormalizedMessage(id="n1", channel=ChannelType.SLACK, channel_id="C_OTHER",
+                          sender_id="U3", text="점심 뭐 먹을까요? 오늘은 국수 어떠세요"),
+        NormalizedMessage(id="n2", channel=ChannelType.EMAIL, channel_id="inbox",
+                          sender_id="news@example.com", text="Weekly newsletter " * 20),
+    ]
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트 해석 확장성 벤치마크")
+    parser.add_argument("--projects", default="10,50,100,500", help="프로젝트 수 목록 (쉼표 구분)")
+    parser.add_argument("--rounds", type=int, default=200, help="메시지 세트 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"{'projects':>8} | {'legacy us/msg':>13} | {'indexed us/msg':>14} | mismatches")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (int(n) for n in args.projects.split(",")):
+            projects = make_projects(count)
+            config_path = Path(tmp) / f"projects_{count}.json"
+            config_path.write_text(json.dumps({"projects": projects}), encoding="utf-8")
+            resolver = ProjectContextResolver(config_path)
+            messages = make_messages(count)
+
+            mismatches = sum(
+                legacy_resolve(projects, m) != resolver.resolve(m) for m in messages
+            )
+
+            def bench(fn, messages=messages) -> float:
+                start = time.perf_counter()
+                for _ in range(args.rounds):
+                    for m in messages:
+                        fn(m)
+                return (time.perf_counter() - start) / (args.rounds * len(messages)) * 1e6
+
+            legacy_us = bench(lambda m, projects=projects: legacy_resolve(projects, m))
+            indexed_us = bench(resolver.resolve)
+            print(f"{count:>8} | {legacy_us:>13.2f} | {indexed_us:>14.2f} | {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
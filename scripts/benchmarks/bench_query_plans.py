@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+gateway.db / intelligence.db 핫 쿼리 인덱스 벤치마크
+
+합성 데이터(기본 messages 1,000,000행, draft_responses 100,000행)를 시드한 뒤
+기존 단일 컬럼 인덱스 구성과 INDEX_MIGRATIONS의 복합/커버링 인덱스 구성에서
+DigestReport / iter_unprocessed / iter_recent / list_drafts 등의 쿼리 지연과 플랜을 비교합니다.
+30일 digest는 messages 직접 집계와 message_rollups_hourly 집계를 함께 측정합니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_query_plans [--messages 1000000] [--drafts 100000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.gateway import storage as gateway_storage
+from scripts.gateway.storage import LIGHT_COLUMNS, UnifiedStorage
+from scripts.intelligence import context_store
+from scripts.intelligence.context_store import IntelligenceStorage
+
+# 복합 인덱스 도입 이전 구성 (비교 기준)
+LEGACY_INDEXES = {
+    "gateway": [
+        "CREATE INDEX idx_messages_channel ON messages(channel)",
+        "CREATE INDEX idx_messages_timestamp ON messages(timestamp DESC)",
+        "CREATE INDEX idx_messages_priority ON messages(priority)",
+        "CREATE INDEX idx_messages_processed ON messages(processed_at)",
+        "CREATE INDEX idx_messages_project_id ON messages(project_id)",
+    ],
+    "intelligence": [
+        "CREATE INDEX idx_draft_status ON draft_responses(status)",
+        "CREATE INDEX idx_draft_match_status ON draft_responses(match_status)",
+        "CREATE INDEX idx_draft_project ON draft_responses(project_id)",
+    ],
+}
+
+NOW = datetime(2026, 1, 1)
+SINCE = (NOW - timedelta(days=1)).isoformat()
+SINCE_30D = (NOW - timedelta(days=30)).isoformat()
+PAGE_AFTER = (NOW - timedelta(days=30)).isoformat()
+LIGHT = ", ".join(LIGHT_COLUMNS)
+
+QUERIES = {
+    "gateway": [
+        ("digest total", "SELECT COUNT(*) FROM messages WHERE timestamp >= ?", [SINCE]),
+        ("digest urgent", "SELECT COUNT(*) FROM messages WHERE timestamp >= ? AND priority = 'urgent'", [SINCE]),
+        ("digest high+project",
+         "SELECT COUNT(*) FROM messages WHERE timestamp >= ? AND priority = 'high' AND project_id = ?",
+         [SINCE, "proj07"]),
+        ("digest actions+project",
+         "SELECT COUNT(*) FROM messages WHERE timestamp >= ? AND has_action = 1 AND project_id = ?",
+         [SINCE, "proj07"]),
+        ("unprocessed page",
+         f"SELECT {LIGHT} FROM messages WHERE processed_at IS NULL ORDER BY timestamp ASC, id ASC LIMIT 500",
+         []),
+        ("unprocessed keyset page",
+         f"SELECT {LIGHT} FROM messages WHERE processed_at IS NULL AND (timestamp, id) > (?, ?) "
+         "ORDER BY timestamp ASC, id ASC LIMIT 500",
+         [PAGE_AFTER, ""]),
+        ("recent channel",
+         f"SELECT {LIGHT} FROM messages WHERE channel = ? AND timestamp >= ? "
+         "ORDER BY timestamp DESC, id DESC LIMIT 50",
+         ["email", SINCE]),
+        ("recent project",
+         "SELECT * FROM messages WHERE 1=1 AND project_id = ? ORDER BY timestamp DESC LIMIT 50",
+         ["proj07"]),
+        ("stats unprocessed", "SELECT COUNT(*) FROM messages WHERE processed_at IS NULL", []),
+        ("digest 30d raw",
+         "SELECT priority, COUNT(*), SUM(has_action) FROM messages WHERE timestamp >= ? GROUP BY priority",
+         [SINCE_30D]),
+        ("digest 30d rollup",
+         "SELECT priority, SUM(message_count), SUM(action_count) FROM message_rollups_hourly"
+         " WHERE hour >= ? GROUP BY priority",
+         [SINCE_30D]),
+    ],
+    "intelligence": [
+        ("drafts by status",
+         "SELECT * FROM draft_responses WHERE 1=1 AND status = ? ORDER BY created_at DESC LIMIT 50",
+         ["pending"]),
+        ("drafts status+match",
+         "SELECT * FROM draft_responses WHERE 1=1 AND status = ? AND match_status = ? "
+         "ORDER BY created_at DESC LIMIT 50",
+         ["approved", "matched"]),
+        ("awaiting drafts",
+         "SELECT * FROM draft_responses WHERE status = 'awaiting_draft' AND match_status = 'matched' "
+         "ORDER BY created_at ASC LIMIT 20",
+         []),
+        ("pending matches",
+         "SELECT * FROM draft_responses WHERE match_status = 'pending_match' ORDER BY created_at ASC LIMIT 50",
+         []),
+        ("digest drafts approved",
+         "SELECT COUNT(*) FROM draft_responses WHERE created_at >= ? AND status = 'approved'",
+         [SINCE]),
+        ("digest drafts total", "SELECT COUNT(*) FROM draft_responses WHERE created_at >= ?", [SINCE]),
+    ],
+}
+
+
+def seed_messages(conn: sqlite3.Connection, count: int, rng: random.Random) -> None:
+    """90일 분포의 합성 메시지 (최근 1%만 미처리)"""
+    span = 90 * 86400
+
+    def rows():
+        for i in range(count):
+            ts = NOW - timedelta(seconds=span * (count - i) / count)
+            yield (
+                f"m{i:07d}", rng.choice(("slack", "email", "email")), f"C{i % 50:03d}",
+                f"U{i % 500:04d}", "벤치마크 메시지", ts.isoformat(),
+                rng.choices(("urgent", "high", "normal", "low"), (1, 5, 70, 24))[0],
+                int(rng.random() < 0.1), f"proj{i % 20:02d}",
+                None if i >= count * 0.99 else ts.isoformat(), ts.isoformat(),
+            )
+
+    conn.executemany(
+        "INSERT INTO messages (id, channel, channel_id, sender_id, text, timestamp, priority,"
+        " has_action, project_id, processed_at, received_at) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+        rows(),
+    )
+    conn.commit()
+
+
+def seed_drafts(conn: sqlite3.Connection, count: int, rng: random.Random) -> None:
+    span = 90 * 86400
+
+    def rows():
+        for i in range(count):
+            created = NOW - timedelta(seconds=span * (count - i) / count)
+            yield (
+                f"proj{i % 20:02d}", "slack", f"m{i:07d}", "원문",
+                rng.choices(("matched", "pending_match", "manual"), (90, 2, 8))[0],
+                rng.choices(("approved", "rejected", "pending", "awaiting_draft"), (60, 30, 8, 2))[0],
+                created.isoformat(),
+            )
+
+    conn.executemany(
+        "INSERT INTO draft_responses (project_id, source_channel, source_message_id, original_text,"
+        " match_status, status, created_at) VALUES (?,?,?,?,?,?,?)",
+        rows(),
+    )
+    conn.commit()
+
+
+def use_indexes(conn: sqlite3.Connection, drop_sql: list[str], create_sql: list[str]) -> None:
+    """인덱스 구성 전환 (DROP 대상은 CREATE 문의 인덱스 이름)"""
+    for sql in drop_sql:
+        if sql.startswith("CREATE"):
+            name = sql.split(" ON ")[0].split()[-1]
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+    for sql in create_sql:
+        if sql.startswith("CREATE"):
+            conn.execute(sql)
+    conn.commit()
+
+
+def time_queries(conn: sqlite3.Connection, queries, repeat: int) -> dict[str, tuple[float, str]]:
+    """쿼리별 (중앙값 ms, 플랜 요약)"""
+    results = {}
+    for label, sql, params in queries:
+        plan = " / ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            samples.append((time.perf_counter() - start) * 1000)
+        results[label] = (statistics.median(samples), plan)
+    return results
+
+
+async def create_schemas(gateway_db: Path, intel_db: Path) -> None:
+    async with UnifiedStorage(gateway_db):
+        pass
+    async with IntelligenceStorage(intel_db):
+        pass
+
+
+async def rebuild_rollups(gateway_db: Path) -> int:
+    """직접 INSERT한 시드 데이터의 시간 단위 집계 backfill"""
+    async with UnifiedStorage(gateway_db) as storage:
+        return await storage.rebuild_rollups()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 쿼리 인덱스 벤치마크")
+    parser.add_argument("--messages", type=int, default=1_000_000, help="시드할 messages 행 수")
+    parser.add_argument("--drafts", type=int, default=100_000, help="시드할 draft_responses 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리당 반복 횟수 (중앙값)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        dbs = {"gateway": Path(tmp) / "gateway.db", "intelligence": Path(tmp) / "intelligence.db"}
+        migrations = {
+            "gateway": gateway_storage.INDEX_MIGRATIONS,
+            "intelligence": context_store.INDEX_MIGRATIONS,
+        }
+        asyncio.run(create_schemas(dbs["gateway"], dbs["intelligence"]))
+
+        for name, db_path in dbs.items():
+            conn = sqlite3.connect(db_path)
+            started = time.perf_counter()
+            if name == "gateway":
+                seed_messages(conn, args.messages, rng)
+            else:
+                seed_drafts(conn, args.drafts, rng)
+            print(f"[{name}] seeded in {time.perf_counter() - started:.1f}s")
+            if name == "gateway":
+                started = time.perf_counter()
+                hours = asyncio.run(rebuild_rollups(db_path))
+                print(f"[{name}] rollups backfilled ({hours} hours) in {time.perf_counter() - started:.1f}s")
+
+            use_indexes(conn, migrations[name], LEGACY_INDEXES[name])
+            legacy = time_queries(conn, QUERIES[name], args.repeat)
+            use_indexes(conn, LEGACY_INDEXES[name], migrations[name])
+            composite = time_queries(conn, QUERIES[name], args.repeat)
+            conn.close()
+
+            print(f"{'query':<24} | {'legacy ms':>10} | {'composite ms':>12} | composite plan")
+            for label, (legacy_ms, _) in legacy.items():
+                composite_ms, plan = composite[label]
+                print(f"{label:<24} | {legacy_ms:>10.2f} | {composite_ms:>12.2f} | {plan}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
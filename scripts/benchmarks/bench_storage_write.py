@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+UnifiedStorage 쓰기 벤치마크
+
+기존 경로(메시지당 INSERT + commit)와 write-behind 경로(executemany 배치)의
+messages/sec를 합성 메시지 버스트로 비교합니다.
+
+Usage:
+    python -m scripts.benchmarks.bench_storage_write [--count 50000] [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 스크립트 직접 실행 시 경로 추가
+if __name__ == "__main__":
+    _project_root = Path(__file__).resolve().parent.parent.parent
+    if str(_project_root) not in sys.path:
+        sys.path.insert(0, str(_project_root))
+
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.storage import UnifiedStorage
+
+
+def make_burst(count: int) -> list[NormalizedMessage]:
+    """합성 Slack/Gmail 메시지 버스트 생성"""
+    base = datetime.now()
+    return [
+        NormalizedMessage(
+            id=f"bench_{i}",
+            channel=ChannelType.SLACK if i % 3 else ChannelType.EMAIL,
+            channel_id=f"C{i % 40:04d}",
+            sender_id=f"U{i % 200:04d}",
+            sender_name=f"User {i % 200}",
+            text=f"벤치마크 메시지 {i} - 확인 부탁드립니다 please review",
+            timestamp=base + timedelta(milliseconds=i),
+            raw_json='{"bench": true}',
+        )
+        for i in range(count)
+    ]
+
+
+async def run_once(db_path: Path, messages: list[NormalizedMessage], **storage_kwargs) -> float:
+    """메시지 전체 저장 소요 시간(초) 측정 (close 시 flush 포함)"""
+    storage = UnifiedStorage(db_path, **storage_kwargs)
+    await storage.connect()
+    start = time.perf_counter()
+    for msg in messages:
+        await storage.save_message(msg)
+    await storage.close()
+    return time.perf_counter() - start
+
+
+async def main_async(count: int, batch_size: int) -> None:
+    messages = make_burst(count)
+    print(f"합성 버스트: {count:,}개 메시지")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        baseline = await run_once(tmp_dir / "baseline.db", messages)
+        batched = await run_once(
+            tmp_dir / "write_behind.db", messages,
+            write_behind=True, batch_size=batch_size,
+        )
+
+    print(f"  기존 경로 (INSERT+commit): {baseline:8.2f}s  {count / baseline:10,.0f} msg/s")
+    print(f"  write-behind (batch={batch_size}): {batched:8.2f}s  {count / batched:10,.0f} msg/s")
+    print(f"  개선 배율: {baseline / batched:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UnifiedStorage 쓰기 벤치마크")
+    parser.add_argument("--count", type=int, default=50_000, help="메시지 수 (기본: 50000)")
+    parser.add_argument("--batch-size", type=int, default=500, help="write-behind 배치 크기")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.count, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Channel Adapter Base Interface
 모든 메시징 채널 어댑터가 구현해야 하는 추상 인터페이스.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
@@ -18,6 +19,14 @@ except ImportError:
     except ImportError:
         from ..models import ChannelType, NormalizedMessage, OutboundMessage
 
+try:
+    from scripts.shared.metrics import MetricsRegistry
+except ImportError:
+    try:
+        from shared.metrics import MetricsRegistry
+    except ImportError:
+        from ...shared.metrics import MetricsRegistry
+
 
 @dataclass
 class SendResult:
@@ -76,8 +85,13 @@ class ChannelAdapter(ABC):
         ...     async def connect(self) -> bool:
         ...         self._connected = True
         ...         return True
+
+    push 수신을 지원하는 어댑터는 supports_push = True로 두고 handle_push()를 구현합니다.
+    push 모드에서 listen()의 polling은 누락 보정용 reconciliation sweep으로만 동작합니다.
     """
 
+    supports_push: bool = False
+
     def __init__(self, config: dict):
         """
         어댑터 초기화
@@ -88,12 +102,89 @@ class ChannelAdapter(ABC):
         self.config = config
         self.channel_type: ChannelType | None = None
         self._connected = False
+        self._push_enabled = False
+        # stop_listening() 호출 시 set (listen 루프 종료 + 대기 중단)
+        self._intake_stopped = asyncio.Event()
 
     @property
     def is_connected(self) -> bool:
         """연결 상태 확인"""
         return self._connected
 
+    @property
+    def is_listening(self) -> bool:
+        """listen() 루프를 계속할지 여부 (연결 중이고 수신 중단 요청이 없음)"""
+        return self._connected and not self._intake_stopped.is_set()
+
+    def stop_listening(self) -> None:
+        """
+        수신 중단 요청 (graceful drain)
+
+        listen()은 이미 조회한 메시지를 모두 전달한 뒤 다음 polling 없이 종료합니다.
+        """
+        self._intake_stopped.set()
+
+    async def _idle(self, seconds: float) -> None:
+        """polling 간격 대기 (stop_listening() 시 즉시 반환)"""
+        try:
+            await asyncio.wait_for(self._intake_stopped.wait(), seconds)
+        except TimeoutError:
+            pass
+
+    @property
+    def push_enabled(self) -> bool:
+        """push 수신 모드 여부"""
+        return self._push_enabled
+
+    def get_cursors(self) -> dict[str, str]:
+        """
+        재시작 후 이어서 조회할 위치 (종료 시 checkpoint로 저장)
+
+        Returns:
+            키 → 조회 위치 (기본: 없음)
+        """
+        return {}
+
+    def restore_cursors(self, cursors: dict[str, str]) -> None:
+        """
+        저장된 조회 위치 복원 (connect() 전에 호출)
+
+        Args:
+            cursors: get_cursors()로 저장했던 값
+        """
+        return
+
+    def _poll_timer(self):
+        """polling 1회 소요 시간 기록 (with 블록, secretary_adapter_poll_seconds)"""
+        channel = self.channel_type.value if self.channel_type else type(self).__name__
+        return MetricsRegistry.get_instance().histogram(
+            "secretary_adapter_poll_seconds", "채널 어댑터 polling 1회 소요 시간 (초)", ("channel",)
+        ).labels(channel).time()
+
+    def enable_push(self, reconcile_interval: float) -> None:
+        """
+        push 수신 모드 전환
+
+        Args:
+            reconcile_interval: push 누락 보정을 위한 polling 간격 (초)
+        """
+        if not self.supports_push:
+            raise NotImplementedError(f"{type(self).__name__} does not support push ingestion")
+        self._push_enabled = True
+
+    async def handle_push(self, payload: dict) -> list[NormalizedMessage]:
+        """
+        push 수신 payload 처리
+
+        Args:
+            payload: 채널별 push 요청 본문 (JSON 디코딩 결과)
+
+        Returns:
+            바로 파이프라인에 넣을 NormalizedMessage 목록
+            (알림만 오는 채널은 빈 목록을 반환하고 listen()에서 조회)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support push ingestion")
+
     @abstractmethod
     async def connect(self) -> bool:
         """
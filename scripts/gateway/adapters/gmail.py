@@ -8,6 +8,10 @@ Features:
 - 60초 polling 기반
 - historyId 증분 조회 (History API)
 - Fallback: messages.list (historyId 만료 시)
+- 새 메시지 본문은 Gmail batch 요청(최대 50건/요청)으로 필요한 필드만 조회,
+  batch를 쓸 수 없으면 개별 get_email을 한 스레드에서 순차 조회 (service 객체는 thread-safe하지 않음)
+- push 모드: Gmail Pub/Sub 알림(historyId)을 받으면 다음 polling을 기다리지 않고 바로 조회,
+  주기 polling은 reconcile_interval 간격의 누락 보정 sweep으로 전환
 """
 
 import asyncio
@@ -15,8 +19,10 @@ import base64
 import json
 import logging
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from email.mime.text import MIMEText
+from email.utils import getaddresses
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -33,6 +39,81 @@ except ImportError:
         from ..models import ChannelType, MessageType, NormalizedMessage
         from .base import ChannelAdapter, SendResult
 
+try:
+    from scripts.shared.seen_ids import BoundedSeenSet
+except ImportError:
+    try:
+        from shared.seen_ids import BoundedSeenSet
+    except ImportError:
+        from ...shared.seen_ids import BoundedSeenSet
+
+# batch 요청당 메시지 수 (Gmail 권장 상한 50)
+DEFAULT_BATCH_SIZE = 50
+BODY_LIMIT = 2000
+# 정규화에 쓰는 필드만 요청 (첨부 메타데이터/raw 제외)
+MESSAGE_FIELDS = (
+    "id,threadId,snippet,internalDate,"
+    "payload(mimeType,headers(name,value),body/data,"
+    "parts(mimeType,body/data,parts(mimeType,body/data)))"
+)
+# BODY_LIMIT 글자(UTF-8 최대 4바이트)를 담는 base64 길이 (4의 배수)
+_BODY_DATA_LIMIT = -(-BODY_LIMIT * 4 // 3) * 4
+
+
+@dataclass
+class FetchedEmail:
+    """batch 응답에서 파싱한 이메일 (lib.gmail 이메일 객체와 같은 속성 이름)"""
+    id: str
+    thread_id: str | None = None
+    subject: str = ""
+    sender: str | None = None
+    to: list[str] = field(default_factory=list)
+    date: datetime | None = None
+    body_text: str | None = None
+    snippet: str = ""
+
+
+def _decode_body(data: str) -> str:
+    """base64url 본문을 BODY_LIMIT 글자 근처까지만 디코딩"""
+    data = data[:_BODY_DATA_LIMIT]
+    data += "=" * (-len(data) % 4)
+    return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+
+
+def _find_plain_text(payload: dict) -> str | None:
+    """MIME 트리에서 첫 text/plain 본문 데이터"""
+    if payload.get("mimeType") == "text/plain" and payload.get("body", {}).get("data"):
+        return payload["body"]["data"]
+    for part in payload.get("parts", []) or []:
+        found = _find_plain_text(part)
+        if found:
+            return found
+    return None
+
+
+def parse_gmail_message(raw: dict) -> FetchedEmail:
+    """users.messages.get(format=full) 응답 → FetchedEmail"""
+    payload = raw.get("payload", {})
+    headers = {h.get("name", "").lower(): h.get("value", "") for h in payload.get("headers", [])}
+    internal_date = raw.get("internalDate")
+    data = _find_plain_text(payload)
+    return FetchedEmail(
+        id=raw.get("id", ""),
+        thread_id=raw.get("threadId"),
+        subject=headers.get("subject", ""),
+        sender=headers.get("from") or None,
+        to=[addr for _, addr in getaddresses([headers["to"]]) if addr] if headers.get("to") else [],
+        date=datetime.fromtimestamp(int(internal_date) / 1000) if internal_date else None,
+        body_text=_decode_body(data) if data else None,
+        snippet=raw.get("snippet", ""),
+    )
+
+
+def _is_not_found(error: Exception) -> bool:
+    status = getattr(getattr(error, "resp", None), "status", None)
+    error_str = str(error)
+    return str(status) == "404" or "404" in error_str or "notFound" in error_str
+
 
 class GmailAdapter(ChannelAdapter):
     """
@@ -48,15 +129,23 @@ class GmailAdapter(ChannelAdapter):
         "CATEGORY_PROMOTIONS", "CATEGORY_FORUMS",
     }
 
+    supports_push = True
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.channel_type = ChannelType.EMAIL
         self._client = None
         self._polling_interval: int = config.get("polling_interval", 60)
         self._last_history_id: str | None = None
-        self._seen_ids: set = set()
-        self._max_seen: int = 5000
+        self._max_seen: int = config.get("max_seen", 5000)
+        # 처리한 메시지 ID (오래된 순 제거, seen_ids_path 지정 시 재시작 후 복원)
+        self._seen_ids = BoundedSeenSet(self._max_seen, path=config.get("seen_ids_path"))
         self._start_time: datetime | None = None
+        self._batch_size: int = max(1, min(config.get("batch_size", DEFAULT_BATCH_SIZE), 100))
+        self._fetch_stats: dict[str, int] = {"batch_requests": 0, "single_requests": 0, "not_found": 0}
+        # push 알림 수신 시 listen 루프를 깨움
+        self._poll_wakeup = asyncio.Event()
+        self._push_stats: dict[str, int] = {"notifications": 0, "stale": 0}
 
         # Deprecated config 경고
         if "label_filter" in config:
@@ -68,8 +157,14 @@ class GmailAdapter(ChannelAdapter):
             from lib.gmail import GmailClient
             self._client = await asyncio.to_thread(GmailClient)
 
+            restored = await asyncio.to_thread(self._seen_ids.load)
+            if restored:
+                print(f"[GmailAdapter] seen ID {restored}개 복원")
+
             profile = await asyncio.to_thread(self._client.get_profile)
-            self._last_history_id = str(profile.get("historyId", ""))
+            # 복원한 historyId가 있으면 그 이후부터 이어서 조회 (만료 시 History API 실패 → fallback)
+            if not self._last_history_id:
+                self._last_history_id = str(profile.get("historyId", ""))
             email = profile.get("emailAddress", "unknown")
 
             self._connected = True
@@ -81,27 +176,77 @@ class GmailAdapter(ChannelAdapter):
             print(f"[GmailAdapter] 연결 실패: {e}")
             return False
 
+    def get_cursors(self) -> dict[str, str]:
+        """마지막으로 조회한 historyId"""
+        return {"history_id": self._last_history_id} if self._last_history_id else {}
+
+    def restore_cursors(self, cursors: dict[str, str]) -> None:
+        if cursors.get("history_id"):
+            self._last_history_id = cursors["history_id"]
+
     async def disconnect(self) -> None:
         """연결 해제"""
         self._connected = False
         self._client = None
+        await asyncio.to_thread(self._seen_ids.save)
 
     async def listen(self) -> AsyncIterator[NormalizedMessage]:
         """
-        Gmail 메시지 polling (60초 간격)
+        Gmail 메시지 polling (60초 간격, push 알림 수신 시 즉시)
 
         Yields:
             NormalizedMessage
         """
-        while self._connected:
+        while self.is_listening:
             try:
-                messages = await self._poll_new_messages()
+                with self._poll_timer():
+                    messages = await self._poll_new_messages()
                 for msg in messages:
                     yield msg
             except Exception as e:
                 print(f"[GmailAdapter] polling 오류: {e}")
 
-            await asyncio.sleep(self._polling_interval)
+            try:
+                await asyncio.wait_for(self._poll_wakeup.wait(), self._polling_interval)
+            except TimeoutError:
+                pass
+            self._poll_wakeup.clear()
+
+    def stop_listening(self) -> None:
+        super().stop_listening()
+        self._poll_wakeup.set()
+
+    def enable_push(self, reconcile_interval: float) -> None:
+        """push 모드: 주기 polling을 reconcile_interval 간격으로 늦춤"""
+        super().enable_push(reconcile_interval)
+        self._polling_interval = reconcile_interval
+
+    async def handle_push(self, payload: dict) -> list[NormalizedMessage]:
+        """
+        Gmail Pub/Sub 알림 처리
+
+        알림에는 historyId만 있으므로 메시지는 listen()의 History API 조회로 전달합니다.
+        이미 조회한 historyId 이하의 알림(재전송 포함)은 무시합니다.
+
+        Args:
+            payload: Pub/Sub message.data 디코딩 결과 ({"emailAddress", "historyId"})
+
+        Returns:
+            빈 목록 (메시지는 listen()에서 yield)
+        """
+        history_id = payload.get("historyId")
+        if not history_id:
+            return []
+        try:
+            stale = self._last_history_id and int(history_id) <= int(self._last_history_id)
+        except (TypeError, ValueError):
+            stale = False
+        if stale:
+            self._push_stats["stale"] += 1
+        else:
+            self._push_stats["notifications"] += 1
+            self._poll_wakeup.set()
+        return []
 
     async def send(self, message) -> SendResult:
         """이메일 전송
@@ -160,6 +305,9 @@ class GmailAdapter(ChannelAdapter):
             "last_history_id": self._last_history_id,
             "polling_interval": self._polling_interval,
             "seen_messages": len(self._seen_ids),
+            "fetch": dict(self._fetch_stats),
+            "push_enabled": self._push_enabled,
+            "push": dict(self._push_stats),
         }
 
     async def _poll_new_messages(self) -> list:
@@ -199,50 +347,112 @@ class GmailAdapter(ChannelAdapter):
                 if msg_id and msg_id not in self._seen_ids:
                     message_ids[msg_id] = label_ids
 
+        fetched = await self._fetch_emails(list(message_ids))
+
         normalized = []
         for msg_id, label_ids in message_ids.items():
-            try:
-                email = await asyncio.to_thread(self._client.get_email, msg_id)
-                self._seen_ids.add(msg_id)
+            email = fetched.get(msg_id)
+            if email is None:
+                continue
+            self._seen_ids.add(msg_id)
+
+            body = email.body_text or email.snippet or ""
+            if len(body) > BODY_LIMIT:
+                body = body[:BODY_LIMIT] + "..."
+
+            # 라벨에서 channel_id 추출
+            channel_id = self._extract_primary_label(label_ids)
+
+            normalized.append(NormalizedMessage(
+                id=f"gmail_{msg_id}",
+                channel=ChannelType.EMAIL,
+                channel_id=channel_id,
+                sender_id=email.sender or "unknown",
+                sender_name=email.sender,
+                text=f"[{email.subject}] {body}",
+                message_type=MessageType.TEXT,
+                timestamp=email.date or datetime.now(),
+                is_group=len(email.to) > 1 if email.to else False,
+                raw_json=json.dumps({
+                    "id": email.id,
+                    "thread_id": email.thread_id,
+                    "subject": email.subject,
+                    "label_ids": list(label_ids),
+                }, ensure_ascii=False),
+            ))
+
+        await asyncio.to_thread(self._seen_ids.save)
 
-                body = email.body_text or email.snippet or ""
-                if len(body) > 2000:
-                    body = body[:2000] + "..."
+        return normalized
 
-                # 라벨에서 channel_id 추출
-                channel_id = self._extract_primary_label(label_ids)
+    async def _fetch_emails(self, msg_ids: list[str]) -> dict:
+        """
+        메시지 일괄 조회 (batch 요청 → 실패/미지원 시 개별 순차 조회)
 
-                normalized.append(NormalizedMessage(
-                    id=f"gmail_{msg_id}",
-                    channel=ChannelType.EMAIL,
-                    channel_id=channel_id,
-                    sender_id=email.sender or "unknown",
-                    sender_name=email.sender,
-                    text=f"[{email.subject}] {body}",
-                    message_type=MessageType.TEXT,
-                    timestamp=email.date or datetime.now(),
-                    is_group=len(email.to) > 1 if email.to else False,
-                    raw_json=json.dumps({
-                        "id": email.id,
-                        "thread_id": email.thread_id,
-                        "subject": email.subject,
-                        "label_ids": list(label_ids),
-                    }, ensure_ascii=False),
-                ))
+        404(삭제된 메시지)는 seen 처리 후 건너뛰고, 그 외 오류는 로그만 남깁니다.
+
+        Returns:
+            msg_id → 이메일 객체 (조회 실패한 ID는 제외)
+        """
+        results: dict = {}
+        if not msg_ids:
+            return results
+
+        remaining = msg_ids
+        service = getattr(self._client, "service", None)
+        if self._batch_size > 1 and hasattr(service, "new_batch_http_request"):
+            retry: list[str] = []
+            try:
+                await asyncio.to_thread(self._batch_fetch_sync, service, msg_ids, results, retry)
+                remaining = retry
+            except Exception as e:
+                logger.warning(f"[GmailAdapter] batch 조회 실패, 개별 조회로 전환: {e}")
+                handled = set(results) | set(retry)
+                remaining = [msg_id for msg_id in msg_ids if msg_id not in handled] + retry
+
+        if remaining:
+            results.update(await asyncio.to_thread(self._sequential_fetch_sync, remaining))
+        return results
+
+    def _batch_fetch_sync(self, service, msg_ids: list[str], results: dict, retry: list[str]) -> None:
+        """batch 요청 실행 (스레드). 404가 아닌 항목 오류는 retry에 모아 개별 조회로 재시도"""
+        def callback(request_id, response, exception):
+            if exception is None:
+                results[request_id] = parse_gmail_message(response)
+            elif _is_not_found(exception):
+                self._mark_not_found(request_id)
+            else:
+                retry.append(request_id)
+
+        messages = service.users().messages()
+        for start in range(0, len(msg_ids), self._batch_size):
+            batch = service.new_batch_http_request(callback=callback)
+            for msg_id in msg_ids[start:start + self._batch_size]:
+                batch.add(
+                    messages.get(userId="me", id=msg_id, format="full", fields=MESSAGE_FIELDS),
+                    request_id=msg_id,
+                )
+            batch.execute()
+            self._fetch_stats["batch_requests"] += 1
+
+    def _sequential_fetch_sync(self, msg_ids: list[str]) -> dict:
+        """lib.gmail get_email 개별 조회 (스레드). 공유 service/http는 thread-safe하지 않으므로 순차 실행"""
+        results: dict = {}
+        for msg_id in msg_ids:
+            self._fetch_stats["single_requests"] += 1
+            try:
+                results[msg_id] = self._client.get_email(msg_id)
             except Exception as e:
-                error_str = str(e)
-                if "404" in error_str or "notFound" in error_str:
-                    self._seen_ids.add(msg_id)
-                    logger.warning(f"[GmailAdapter] 메시지 없음(삭제됨) - 건너뜀: {msg_id}")
+                if _is_not_found(e):
+                    self._mark_not_found(msg_id)
                 else:
                     logger.error(f"[GmailAdapter] 메시지 조회 실패 ({msg_id}): {e}")
+        return results
 
-        # seen_ids 크기 제한
-        if len(self._seen_ids) > self._max_seen:
-            keep = list(self._seen_ids)[-self._max_seen // 2:]
-            self._seen_ids = set(keep)
-
-        return normalized
+    def _mark_not_found(self, msg_id: str) -> None:
+        self._seen_ids.add(msg_id)
+        self._fetch_stats["not_found"] += 1
+        logger.warning(f"[GmailAdapter] 메시지 없음(삭제됨) - 건너뜀: {msg_id}")
 
     async def _fallback_poll(self) -> list:
         """Fallback: messages.list로 최근 메시지 조회"""
@@ -272,8 +482,8 @@ class GmailAdapter(ChannelAdapter):
                 self._seen_ids.add(email.id)
 
                 body = email.body_text or email.snippet or ""
-                if len(body) > 2000:
-                    body = body[:2000] + "..."
+                if len(body) > BODY_LIMIT:
+                    body = body[:BODY_LIMIT] + "..."
 
                 normalized.append(NormalizedMessage(
                     id=f"gmail_{email.id}",
@@ -292,10 +502,7 @@ class GmailAdapter(ChannelAdapter):
                     }, ensure_ascii=False),
                 ))
 
-            # seen_ids 크기 제한
-            if len(self._seen_ids) > self._max_seen:
-                keep = list(self._seen_ids)[-self._max_seen // 2:]
-                self._seen_ids = set(keep)
+            await asyncio.to_thread(self._seen_ids.save)
 
             return normalized
         except Exception as e:
@@ -5,15 +5,23 @@ lib.slack.SlackClient를 사용하여 Slack 채널 메시지를 수신합니다.
 asyncio.to_thread()로 동기 API를 비동기로 브릿지합니다.
 
 Features:
-- 5초 polling 기반 메시지 수신
-- 채널별 last_ts 추적 (증분 조회)
+- 채널별 동시 polling (max_concurrency 상한)
+- 채널별 적응형 polling 간격 (조용한 채널은 점진적으로 늦추고, 활발한 채널은 앞당김)
+- conversations.history 호출은 shared.rate_limiter.RateLimiter로 Slack tier 한도 준수
+- 채널별 last_ts 추적 (증분 조회) 및 poll 지연/메시지 지연 통계
+- 사용자 디렉토리: gateway.db에 영속화, connect() 시 일괄 warm-up, 백그라운드 TTL 갱신
+  (메시지 정규화 중에는 캐시만 조회하고 Slack API를 기다리지 않음)
+- push 모드: Events API message 이벤트를 바로 정규화 (handle_push),
+  polling은 reconcile_interval 간격의 누락 보정 sweep으로 전환하고 push로 받은 메시지는 건너뜀
 - lib.slack Browser OAuth 토큰 자동 로드
 """
 
 import asyncio
 import json
 import re
+import time
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -29,22 +37,164 @@ except ImportError:
         from ..models import ChannelType, MessageType, NormalizedMessage
         from .base import ChannelAdapter, SendResult
 
+try:
+    from scripts.shared.rate_limiter import RateLimiter
+except ImportError:
+    try:
+        from shared.rate_limiter import RateLimiter
+    except ImportError:
+        from ...shared.rate_limiter import RateLimiter
+
+try:
+    from scripts.shared.seen_ids import BoundedSeenSet
+except ImportError:
+    try:
+        from shared.seen_ids import BoundedSeenSet
+    except ImportError:
+        from ...shared.seen_ids import BoundedSeenSet
+
+# conversations.history rate limit bucket (Slack Tier 3: 분당 50회 이상)
+HISTORY_RATE_BUCKET = "slack_history"
+DEFAULT_HISTORY_RATE_LIMIT = 50
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 60.0
+# 빈 poll마다 간격 배율 / 새 메시지가 있으면 간격 배율
+BACKOFF_FACTOR = 1.5
+SPEEDUP_FACTOR = 0.5
+# 평균 지연 지수이동평균 가중치
+_EWMA_ALPHA = 0.2
+# 사용자 디렉토리: 이름 유효 기간, 백그라운드 갱신 주기, 조회 실패 시 재시도 대기 (초)
+DEFAULT_USER_CACHE_TTL = 24 * 3600
+DEFAULT_USER_REFRESH_INTERVAL = 300.0
+USER_RETRY_DELAY = 300.0
+USER_DIRECTORY_CHANNEL = "slack"
+# push로 받은 메시지 키(channel:ts) 보관 수 (reconciliation sweep 중복 제거용)
+DEFAULT_MAX_PUSHED = 5000
+# 새 메시지로 처리하는 message 이벤트 subtype (None = 일반 메시지)
+PUSH_MESSAGE_SUBTYPES = {None, "thread_broadcast", "file_share"}
+
+
+@dataclass
+class ChannelPollState:
+    """
+    채널별 polling 상태 및 통계
+
+    Attributes:
+        interval: 현재 polling 간격 (초)
+        next_due: 다음 poll 시각 (time.monotonic 기준)
+        polls: poll 횟수
+        errors: 실패 횟수
+        messages: 수신 메시지 수 (push 포함)
+        pushed: push로 수신한 메시지 수
+        last_latency: 마지막 get_history 지연 (초, rate limit 대기 제외)
+        avg_latency: get_history 지연 지수이동평균 (초)
+        last_lag: 마지막 poll에서 가장 최근 메시지의 게시 → 수신 지연 (초)
+        max_lag: 최대 메시지 지연 (초)
+        last_error: 마지막 오류 메시지
+    """
+    interval: float
+    next_due: float = 0.0
+    polls: int = 0
+    errors: int = 0
+    messages: int = 0
+    pushed: int = 0
+    last_latency: float | None = None
+    avg_latency: float | None = None
+    last_lag: float | None = None
+    max_lag: float = 0.0
+    last_error: str | None = None
+
+    def record_latency(self, latency: float) -> None:
+        self.last_latency = latency
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += _EWMA_ALPHA * (latency - self.avg_latency)
+
+    def record_lag(self, lag: float) -> None:
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def to_dict(self) -> dict:
+        return {
+            "interval": round(self.interval, 2),
+            "polls": self.polls,
+            "errors": self.errors,
+            "messages": self.messages,
+            "pushed": self.pushed,
+            "last_latency_ms": _ms(self.last_latency),
+            "avg_latency_ms": _ms(self.avg_latency),
+            "last_lag_s": round(self.last_lag, 3) if self.last_lag is not None else None,
+            "max_lag_s": round(self.max_lag, 3),
+            "last_error": self.last_error,
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def _user_display_name(user) -> str | None:
+    return user.real_name or user.display_name or user.name
+
 
 class SlackAdapter(ChannelAdapter):
     """
     Slack 채널 어댑터
 
     lib.slack.SlackClient를 사용하여 Slack 메시지를 polling합니다.
+    due 상태인 채널들을 max_concurrency 한도 내에서 동시에 조회하며,
+    채널마다 polling_interval에서 시작해 min_interval ~ max_interval 사이로 간격을 조정합니다.
+    push 모드에서는 Events API 이벤트를 handle_push로 받고 polling은 고정 간격 sweep만 수행합니다.
     """
 
-    def __init__(self, config: dict):
+    supports_push = True
+
+    def __init__(self, config: dict, storage=None):
+        """
+        Args:
+            config: 어댑터 설정
+            storage: 사용자 디렉토리를 영속화할 UnifiedStorage (None이면 메모리 캐시만 사용)
+        """
         super().__init__(config)
         self.channel_type = ChannelType.SLACK
         self._client = None
         self._channels: list = config.get("channels", [])
         self._polling_interval: int = config.get("polling_interval", 5)
+        self._max_concurrency: int = max(1, config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+        self._min_interval: float = min(
+            config.get("min_interval", DEFAULT_MIN_INTERVAL), self._polling_interval
+        )
+        self._max_interval: float = max(
+            config.get("max_interval", DEFAULT_MAX_INTERVAL), self._polling_interval
+        )
         self._last_ts: dict[str, str] = {}
         self._user_cache: dict[str, str] = {}
+        self._poll_states: dict[str, ChannelPollState] = {}
+
+        # 모든 채널이 하나의 history bucket을 공유 (대기 중 호출 순서 보장용 lock)
+        self._rate_limiter = RateLimiter.get_instance()
+        self._rate_limiter.configure(
+            HISTORY_RATE_BUCKET,
+            config.get("history_rate_limit", DEFAULT_HISTORY_RATE_LIMIT),
+        )
+        self._rate_lock = asyncio.Lock()
+
+        # 사용자 디렉토리 (user_id → 이름, 갱신 시각)
+        self._storage = storage
+        self._user_cache_ttl: float = config.get("user_cache_ttl", DEFAULT_USER_CACHE_TTL)
+        self._user_refresh_interval: float = config.get(
+            "user_refresh_interval", DEFAULT_USER_REFRESH_INTERVAL
+        )
+        self._user_updated_at: dict[str, float] = {}
+        self._pending_users: set[str] = set()
+        self._user_retry_after: dict[str, float] = {}
+        self._user_wakeup = asyncio.Event()
+        self._user_refresh_task: asyncio.Task | None = None
+
+        # push로 이미 전달한 메시지 (channel:ts)
+        self._pushed = BoundedSeenSet(config.get("max_pushed", DEFAULT_MAX_PUSHED))
 
     async def connect(self) -> bool:
         """Slack 연결 (lib.slack 사용)"""
@@ -65,42 +215,176 @@ class SlackAdapter(ChannelAdapter):
                 self._connected = False
                 return False
 
-            # 서버 시작 시점 이후 메시지만 처리 (기존 메시지 무시)
-            import time
+            # 사용자 디렉토리 warm-up 후 백그라운드 갱신 시작
+            await self._warm_user_directory()
+            self._start_user_refresh()
+
+            # 복원한 위치가 없는 채널은 서버 시작 시점 이후 메시지만 처리 (기존 메시지 무시)
             start_ts = f"{time.time():.6f}"
+            resumed = sum(1 for channel_id in self._channels if channel_id in self._last_ts)
             for channel_id in self._channels:
                 if channel_id not in self._last_ts:
                     self._last_ts[channel_id] = start_ts
 
-            print(f"[SlackAdapter] 연결 성공 ({len(self._channels)}개 채널, 시작 기준: {start_ts})")
+            print(
+                f"[SlackAdapter] 연결 성공 ({len(self._channels)}개 채널, 시작 기준: {start_ts},"
+                f" 이어서 조회 {resumed}개)"
+            )
             return True
 
         except Exception as e:
             print(f"[SlackAdapter] 연결 실패: {e}")
             return False
 
+    def get_cursors(self) -> dict[str, str]:
+        """채널 ID → last_ts"""
+        return dict(self._last_ts)
+
+    def restore_cursors(self, cursors: dict[str, str]) -> None:
+        """감시 중인 채널의 last_ts만 복원 (connect()가 시작 시점으로 덮어쓰지 않음)"""
+        for channel_id, ts in cursors.items():
+            if channel_id in self._channels:
+                self._last_ts[channel_id] = ts
+
     async def disconnect(self) -> None:
         """연결 해제"""
         self._connected = False
+        if self._user_refresh_task is not None:
+            self._user_refresh_task.cancel()
+            try:
+                await self._user_refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._user_refresh_task = None
         self._client = None
 
     async def listen(self) -> AsyncIterator[NormalizedMessage]:
         """
-        Slack 메시지 polling (5초 간격)
+        Slack 메시지 polling (채널별 적응형 간격, 동시 조회)
+
+        due 상태인 채널들을 동시에 조회하고 먼저 끝난 채널의 메시지부터 전달합니다.
+        채널 내 메시지 순서는 유지됩니다.
 
         Yields:
             NormalizedMessage
         """
-        while self._connected:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def poll(channel_id: str) -> list:
+            async with semaphore:
+                with self._poll_timer():
+                    return await self._poll_channel(channel_id)
+
+        while self.is_listening:
             try:
-                for channel_id in self._channels:
-                    messages = await self._poll_channel(channel_id)
-                    for msg in messages:
+                now = time.monotonic()
+                due = [
+                    channel_id for channel_id in self._channels
+                    if self._poll_state(channel_id).next_due <= now
+                ]
+                for next_done in asyncio.as_completed([poll(channel_id) for channel_id in due]):
+                    for msg in await next_done:
                         yield msg
             except Exception as e:
                 print(f"[SlackAdapter] polling 오류: {e}")
 
-            await asyncio.sleep(self._polling_interval)
+            await self._idle(self._sleep_until_next_due())
+
+    def enable_push(self, reconcile_interval: float) -> None:
+        """push 모드: 모든 채널을 reconcile_interval 고정 간격으로 sweep"""
+        super().enable_push(reconcile_interval)
+        self._polling_interval = self._min_interval = self._max_interval = reconcile_interval
+        for state in self._poll_states.values():
+            state.interval = reconcile_interval
+
+    async def handle_push(self, payload: dict) -> list[NormalizedMessage]:
+        """
+        Slack Events API event_callback 처리 (감시 채널의 새 message 이벤트만)
+
+        같은 메시지의 재전송(X-Slack-Retry)과 이후 reconciliation sweep 결과는 건너뜁니다.
+
+        Args:
+            payload: Events API 요청 본문
+
+        Returns:
+            NormalizedMessage 목록 (0~1개)
+        """
+        if payload.get("type") != "event_callback":
+            return []
+        event = payload.get("event") or {}
+        channel_id = event.get("channel")
+        ts = event.get("ts")
+        if (
+            event.get("type") != "message"
+            or event.get("subtype") not in PUSH_MESSAGE_SUBTYPES
+            or channel_id not in self._channels
+            or not ts
+        ):
+            return []
+        if not self._pushed.add(f"{channel_id}:{ts}"):
+            return []
+
+        state = self._poll_state(channel_id)
+        state.messages += 1
+        state.pushed += 1
+        try:
+            timestamp = datetime.fromtimestamp(float(ts))
+            state.record_lag(max(time.time() - float(ts), 0.0))
+        except (TypeError, ValueError):
+            timestamp = None
+        return [self._normalize(
+            channel_id, ts, event.get("user"), event.get("text"), event.get("thread_ts"), timestamp,
+        )]
+
+    def _normalize(
+        self,
+        channel_id: str,
+        ts: str,
+        user: str | None,
+        text: str | None,
+        thread_ts: str | None,
+        timestamp: datetime | None,
+    ) -> NormalizedMessage:
+        """
+        Slack 메시지 필드 → NormalizedMessage (polling/push 공용)
+
+        이름을 아직 모르는 사용자는 조회를 기다리지 않고 user ID를 sender_name으로 씁니다
+        (저장된 메시지는 나중에 갱신되지 않으므로 None 대신 식별 가능한 값을 남김).
+        """
+        return NormalizedMessage(
+            id=f"slack_{channel_id}_{ts}",
+            channel=ChannelType.SLACK,
+            channel_id=channel_id,
+            sender_id=user or "unknown",
+            sender_name=(self._lookup_user(user) or user) if user else None,
+            text=text or "",
+            message_type=MessageType.TEXT,
+            timestamp=timestamp or datetime.now(),
+            is_group=True,
+            is_mention=bool(re.search(r'<@U[A-Z0-9]+>', text or "")),
+            reply_to_id=thread_ts if thread_ts != ts else None,
+            raw_json=json.dumps({"ts": ts, "channel": channel_id}),
+        )
+
+    def _poll_state(self, channel_id: str) -> ChannelPollState:
+        state = self._poll_states.get(channel_id)
+        if state is None:
+            state = ChannelPollState(interval=float(self._polling_interval))
+            self._poll_states[channel_id] = state
+        return state
+
+    def _sleep_until_next_due(self) -> float:
+        """가장 빠른 채널 due까지 대기 시간 (새 채널 반영을 위해 polling_interval 상한)"""
+        if not self._channels:
+            return self._polling_interval
+        next_due = min(self._poll_state(channel_id).next_due for channel_id in self._channels)
+        return min(max(next_due - time.monotonic(), 0.05), self._polling_interval)
+
+    def _reschedule(self, state: ChannelPollState, active: bool) -> None:
+        """새 메시지가 있으면 간격 단축, 없거나 실패하면 간격 확대"""
+        factor = SPEEDUP_FACTOR if active else BACKOFF_FACTOR
+        state.interval = min(max(state.interval * factor, self._min_interval), self._max_interval)
+        state.next_due = time.monotonic() + state.interval
 
     async def send(self, message) -> SendResult:
         """메시지 전송
@@ -141,7 +425,15 @@ class SlackAdapter(ChannelAdapter):
             "connected": self._connected,
             "channels": len(self._channels),
             "polling_interval": self._polling_interval,
+            "max_concurrency": self._max_concurrency,
+            "push_enabled": self._push_enabled,
             "tracked_channels": list(self._last_ts.keys()),
+            "channel_stats": {
+                channel_id: state.to_dict() for channel_id, state in self._poll_states.items()
+            },
+            "rate_limit_remaining": self._rate_limiter.get_remaining(HISTORY_RATE_BUCKET),
+            "known_users": len(self._user_cache),
+            "pending_users": len(self._pending_users),
         }
 
     async def _poll_channel(self, channel_id: str) -> list:
@@ -150,7 +442,13 @@ class SlackAdapter(ChannelAdapter):
             return []
 
         oldest = self._last_ts.get(channel_id)
+        state = self._poll_state(channel_id)
+
+        async with self._rate_lock:
+            await self._rate_limiter.wait_if_needed(HISTORY_RATE_BUCKET)
 
+        state.polls += 1
+        started = time.perf_counter()
         try:
             slack_messages = await asyncio.to_thread(
                 self._client.get_history,
@@ -158,13 +456,20 @@ class SlackAdapter(ChannelAdapter):
                 100,
                 oldest,
             )
-        except Exception:
+        except Exception as e:
+            state.errors += 1
+            state.last_error = str(e)
+            self._reschedule(state, active=False)
             return []
+        finally:
+            state.record_latency(time.perf_counter() - started)
 
         if not slack_messages:
+            self._reschedule(state, active=False)
             return []
 
         max_ts = oldest
+        min_new_ts = None
         normalized = []
 
         for msg in slack_messages:
@@ -173,41 +478,152 @@ class SlackAdapter(ChannelAdapter):
 
             if max_ts is None or msg.ts > max_ts:
                 max_ts = msg.ts
+            # push로 이미 전달한 메시지
+            if f"{channel_id}:{msg.ts}" in self._pushed:
+                continue
+            if min_new_ts is None or msg.ts < min_new_ts:
+                min_new_ts = msg.ts
 
-            sender_name = await self._resolve_user(msg.user) if msg.user else None
-
-            normalized.append(NormalizedMessage(
-                id=f"slack_{channel_id}_{msg.ts}",
-                channel=ChannelType.SLACK,
-                channel_id=channel_id,
-                sender_id=msg.user or "unknown",
-                sender_name=sender_name,
-                text=msg.text or "",
-                message_type=MessageType.TEXT,
-                timestamp=msg.timestamp or datetime.now(),
-                is_group=True,
-                is_mention=bool(re.search(r'<@U[A-Z0-9]+>', msg.text or "")),
-                reply_to_id=msg.thread_ts if msg.thread_ts != msg.ts else None,
-                raw_json=json.dumps({"ts": msg.ts, "channel": channel_id}),
+            normalized.append(self._normalize(
+                channel_id, msg.ts, msg.user, msg.text, msg.thread_ts, msg.timestamp,
             ))
 
         if max_ts:
             self._last_ts[channel_id] = max_ts
 
+        if normalized:
+            state.messages += len(normalized)
+            # 가장 오래 기다린 새 메시지 기준 게시 → 수신 지연
+            try:
+                state.record_lag(max(time.time() - float(min_new_ts), 0.0))
+            except (TypeError, ValueError):
+                pass
+        self._reschedule(state, active=bool(normalized))
+
         return normalized
 
-    async def _resolve_user(self, user_id: str) -> str | None:
-        """User ID → 이름 변환 (캐시 포함)"""
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+    def _lookup_user(self, user_id: str) -> str | None:
+        """User ID → 이름 (캐시 전용, 비차단). 모르는 ID는 백그라운드 조회 대기열에 추가."""
+        name = self._user_cache.get(user_id)
+        if name is None and time.monotonic() >= self._user_retry_after.get(user_id, 0.0):
+            self._pending_users.add(user_id)
+            self._user_wakeup.set()
+        return name
+
+    def _remember_users(self, names: dict[str, str], updated_at: float) -> None:
+        self._user_cache.update(names)
+        for user_id in names:
+            self._user_updated_at[user_id] = updated_at
+            self._user_retry_after.pop(user_id, None)
+
+    async def _persist_users(self, names: dict[str, str], updated_at: float) -> None:
+        if self._storage is None or not names:
+            return
+        try:
+            await self._storage.save_user_names(USER_DIRECTORY_CHANNEL, names, updated_at)
+        except Exception as e:
+            print(f"[SlackAdapter] 사용자 디렉토리 저장 실패: {e}")
+
+    async def _warm_user_directory(self) -> None:
+        """저장된 디렉토리 로드 후, 비었거나 만료된 항목이 있으면 일괄 조회"""
+        if self._storage is not None:
+            try:
+                rows = await self._storage.load_user_directory(USER_DIRECTORY_CHANNEL)
+            except Exception as e:
+                print(f"[SlackAdapter] 사용자 디렉토리 로드 실패: {e}")
+                rows = {}
+            for user_id, (name, updated_at) in rows.items():
+                self._user_cache[user_id] = name
+                self._user_updated_at[user_id] = updated_at
+
+        if not self._user_cache or self._stale_users():
+            await self._load_bulk_users()
 
+    async def _load_bulk_users(self) -> bool:
+        """
+        전체 사용자 목록 일괄 조회 및 저장
+
+        lib.slack 클라이언트가 list_users()를 제공할 때만 사용하며,
+        없으면 개별 get_user() 백그라운드 조회로 대체됩니다.
+
+        Returns:
+            일괄 조회 성공 여부
+        """
+        list_users = getattr(self._client, "list_users", None)
+        if list_users is None:
+            return False
+        try:
+            users = await asyncio.to_thread(list_users)
+        except Exception as e:
+            print(f"[SlackAdapter] 사용자 목록 조회 실패: {e}")
+            return False
+
+        names = {
+            user.id: name for user in users
+            if getattr(user, "id", None) and (name := _user_display_name(user))
+        }
+        now = time.time()
+        self._remember_users(names, now)
+        await self._persist_users(names, now)
+        return True
+
+    def _stale_users(self) -> list[str]:
+        cutoff = time.time() - self._user_cache_ttl
+        return [user_id for user_id, updated_at in self._user_updated_at.items() if updated_at < cutoff]
+
+    def _start_user_refresh(self) -> None:
+        if self._user_refresh_task is None or self._user_refresh_task.done():
+            self._user_refresh_task = asyncio.create_task(self._user_refresh_loop())
+
+    async def _user_refresh_loop(self) -> None:
+        """새 사용자 요청 또는 갱신 주기마다 디렉토리 갱신"""
+        while True:
+            try:
+                await asyncio.wait_for(self._user_wakeup.wait(), self._user_refresh_interval)
+            except TimeoutError:
+                pass
+            self._user_wakeup.clear()
+            try:
+                await self._refresh_users()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[SlackAdapter] 사용자 디렉토리 갱신 오류: {e}")
+
+    async def _refresh_users(self) -> int:
+        """
+        대기 중인 미확인 사용자와 TTL 만료 사용자 조회 후 한 번에 저장
+
+        Returns:
+            갱신된 사용자 수
+        """
+        stale = self._stale_users()
+        if stale and await self._load_bulk_users():
+            stale = []
+
+        targets = list(dict.fromkeys([*self._pending_users, *stale]))
+        self._pending_users.clear()
+
+        names: dict[str, str] = {}
+        for user_id in targets:
+            name = await self._resolve_user(user_id)
+            if name:
+                names[user_id] = name
+            else:
+                self._user_retry_after[user_id] = time.monotonic() + USER_RETRY_DELAY
+
+        now = time.time()
+        self._remember_users(names, now)
+        await self._persist_users(names, now)
+        return len(names)
+
+    async def _resolve_user(self, user_id: str) -> str | None:
+        """User ID → 이름 Slack API 조회 (백그라운드 갱신 전용)"""
         if not self._client:
             return None
 
         try:
             user = await asyncio.to_thread(self._client.get_user, user_id)
-            name = user.real_name or user.display_name or user.name
-            self._user_cache[user_id] = name
-            return name
+            return _user_display_name(user)
         except Exception:
             return None
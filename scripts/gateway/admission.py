@@ -0,0 +1,192 @@
+"""
+AdmissionController - 채널/발신자별 token bucket 기반 수용 제어 (load shedding)
+
+채널이 폭주할 때(장애 채널, 봇 루프) 모든 메시지가 dispatch/핸들러(Intelligence, LLM)까지
+가지 않도록 MessagePipeline의 classify 이후에 수용 여부를 결정합니다.
+
+결정:
+- admitted: 채널/발신자 bucket 모두 토큰이 있으면 소비 후 전체 처리
+- bypassed: bypass_priorities(기본 urgent/high) 또는 멘션은 토큰과 무관하게 항상 처리
+- coalesced: 한도 초과 (overflow="coalesce"): 저장만 하고 dispatch/핸들러 생략,
+  같은 채널의 다음 수용 메시지 결과에 생략 건수(coalesced)를 기록
+- dropped: 한도 초과 (overflow="drop"): 저장하지 않고 버림
+
+Example:
+    admission = AdmissionController({"sender_per_minute": 10, "channel_per_minute": 60})
+    decision = admission.admit(message, "normal")
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+# 상대/절대 import 모두 지원
+try:
+    from scripts.gateway.models import NormalizedMessage
+except ImportError:
+    try:
+        from gateway.models import NormalizedMessage
+    except ImportError:
+        from .models import NormalizedMessage
+
+ADMITTED = "admitted"
+BYPASSED = "bypassed"
+COALESCED = "coalesced"
+DROPPED = "dropped"
+
+DEFAULT_ADMISSION_CONFIG = {
+    "enabled": False,
+    # 채널(channel_id) 단위 분당 토큰 / 최대 버스트
+    "channel_per_minute": 60,
+    "channel_burst": 30,
+    # 발신자(channel_id + sender_id) 단위 분당 토큰 / 최대 버스트 (None이면 rate_limit_per_minute)
+    "sender_per_minute": None,
+    "sender_burst": 10,
+    # 한도와 무관하게 항상 처리하는 우선순위 (멘션은 항상 처리)
+    "bypass_priorities": ["urgent", "high"],
+    # 한도 초과 시 처리: "coalesce" (저장만) | "drop" (버림)
+    "overflow": "coalesce",
+    # 메모리 상한: 최근 사용 순으로 유지할 bucket 수
+    "max_buckets": 10000,
+}
+
+
+@dataclass
+class TokenBucket:
+    """
+    token bucket (분당 rate 토큰 보충, 최대 burst개 보관)
+
+    Attributes:
+        rate: 초당 보충 토큰 수
+        capacity: 최대 토큰 수
+        tokens: 현재 토큰 수
+        updated: 마지막 보충 시각 (clock 기준)
+    """
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+
+    def refill(self, now: float) -> float:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        return self.tokens
+
+
+class _BucketTable:
+    """키별 TokenBucket (LRU로 max_buckets개 유지, 제거된 bucket은 가득 찬 상태로 다시 생성)"""
+
+    def __init__(self, per_minute: float, burst: float, max_buckets: int):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, float(burst))
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def get(self, key: str, now: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity, self.capacity, now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.refill(now)
+        return bucket
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class AdmissionController:
+    """
+    채널/발신자별 수용 제어
+
+    두 bucket 모두 토큰이 1개 이상일 때만 양쪽에서 1개씩 소비합니다.
+    bypass 메시지는 토큰을 소비하지 않습니다.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            config: DEFAULT_ADMISSION_CONFIG 형식의 설정 (누락 키는 기본값)
+            clock: 시각 함수 (테스트용)
+        """
+        self.config = {**DEFAULT_ADMISSION_CONFIG, **(config or {})}
+        if self.config["overflow"] not in ("coalesce", "drop"):
+            raise ValueError(f"unknown admission overflow: {self.config['overflow']}")
+        self._clock = clock
+        max_buckets = self.config["max_buckets"]
+        self._channels = _BucketTable(
+            self.config["channel_per_minute"], self.config["channel_burst"], max_buckets
+        )
+        sender_rate = self.config["sender_per_minute"] or self.config.get("rate_limit_per_minute", 10)
+        self._senders = _BucketTable(sender_rate, self.config["sender_burst"], max_buckets)
+        self._bypass = set(self.config["bypass_priorities"])
+        self._overflow = COALESCED if self.config["overflow"] == "coalesce" else DROPPED
+
+        self._counts: dict[str, int] = {ADMITTED: 0, BYPASSED: 0, COALESCED: 0, DROPPED: 0}
+        # 채널별 누적 shed 수 / 다음 수용 메시지에 넘길 coalesced 수
+        self._shed_by_channel: dict[str, int] = {}
+        self._pending_coalesced: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config["enabled"])
+
+    def admit(self, message: NormalizedMessage, priority: str | None) -> str:
+        """
+        메시지 수용 여부 결정
+
+        Args:
+            message: 분류를 마친 메시지
+            priority: classify stage의 우선순위
+
+        Returns:
+            ADMITTED | BYPASSED | COALESCED | DROPPED
+        """
+        if not self.enabled:
+            return ADMITTED
+        if message.is_mention or priority in self._bypass:
+            self._counts[BYPASSED] += 1
+            return BYPASSED
+
+        now = self._clock()
+        channel_key = f"{message.channel.value}:{message.channel_id}"
+        channel = self._channels.get(channel_key, now)
+        sender = self._senders.get(f"{channel_key}:{message.sender_id}", now)
+        if channel.tokens >= 1 and sender.tokens >= 1:
+            channel.tokens -= 1
+            sender.tokens -= 1
+            self._counts[ADMITTED] += 1
+            return ADMITTED
+
+        self._counts[self._overflow] += 1
+        self._shed_by_channel[channel_key] = self._shed_by_channel.get(channel_key, 0) + 1
+        if self._overflow == COALESCED:
+            self._pending_coalesced[channel_key] = self._pending_coalesced.get(channel_key, 0) + 1
+        return self._overflow
+
+    def take_coalesced(self, message: NormalizedMessage) -> int:
+        """같은 채널에서 마지막 수용 이후 coalesce된 메시지 수 (호출 시 0으로 초기화)"""
+        return self._pending_coalesced.pop(f"{message.channel.value}:{message.channel_id}", 0)
+
+    def get_stats(self, top: int = 10) -> dict[str, Any]:
+        """
+        수용 제어 통계
+
+        Returns:
+            결정별 건수, shed 합계, shed가 많은 채널 상위 top개, bucket 수
+        """
+        shed = sorted(self._shed_by_channel.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        return {
+            "enabled": self.enabled,
+            **self._counts,
+            "shed": self._counts[COALESCED] + self._counts[DROPPED],
+            "shed_by_channel": dict(shed),
+            "buckets": {"channels": len(self._channels), "senders": len(self._senders)},
+        }
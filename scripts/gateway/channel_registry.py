@@ -10,15 +10,46 @@ from pathlib import Path
 class ChannelRegistry:
     def __init__(self):
         self._channels: list = []
+        # 채널 ID 인덱스 (같은 ID가 여러 번 나오면 첫 항목 기준)
+        self._enabled: dict[str, bool] = {}
+        self._project_ids: dict[str, str | None] = {}
+        self._path: Path | None = None
+        self._mtime: float | None = None
 
     def load(self, path: Path) -> None:
         """channels.json 로드. 파일 없거나 파싱 실패 시 빈 목록 유지."""
+        self._path = Path(path)
+        self._mtime = self._stat_mtime(self._path)
         try:
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
             self._channels = data.get("channels", [])
         except (FileNotFoundError, json.JSONDecodeError, OSError):
             self._channels = []
+        self._build_index()
+
+    def reload_if_changed(self) -> bool:
+        """마지막 load() 이후 channels.json이 바뀌었으면 다시 로드."""
+        if self._path is None or self._stat_mtime(self._path) == self._mtime:
+            return False
+        self.load(self._path)
+        return True
+
+    def _build_index(self) -> None:
+        self._enabled = {}
+        self._project_ids = {}
+        for ch in self._channels:
+            channel_id = ch.get("id")
+            self._enabled.setdefault(channel_id, ch.get("enabled", True))
+            if "project-bound" in ch.get("roles", []):
+                self._project_ids.setdefault(channel_id, ch.get("project_id"))
+
+    @staticmethod
+    def _stat_mtime(path: Path) -> float | None:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
 
     def get_by_role(self, role: str, channel_type: str = "slack") -> list[str]:
         """특정 role이 부여된 enabled 채널 ID 목록 반환."""
@@ -33,16 +64,10 @@ class ChannelRegistry:
 
     def get_project_id(self, channel_id: str) -> str | None:
         """채널 ID → project_id 반환."""
-        for ch in self._channels:
-            if ch.get("id") == channel_id and "project-bound" in ch.get("roles", []):
-                return ch.get("project_id")
-        return None
+        return self._project_ids.get(channel_id)
 
     def is_enabled(self, channel_id: str) -> bool:
-        for ch in self._channels:
-            if ch.get("id") == channel_id:
-                return ch.get("enabled", True)
-        return False
+        return self._enabled.get(channel_id, False)
 
     def all_channel_ids(self, channel_type: str = "slack") -> list[str]:
         return [
@@ -0,0 +1,301 @@
+"""
+KeywordMatcher - 우선순위/액션 감지용 단일 패스 키워드 매처
+
+MessagePipeline의 긴급/액션/완료형/부정 컨텍스트/프로젝트 키워드를
+하나의 대소문자 무시 alternation 정규식으로 컴파일하여 텍스트를 한 번만 스캔합니다.
+
+- 모든 리터럴 키워드를 하나의 접두사 트리 정규식으로 묶고, 소문자 텍스트에서
+  매칭 시작 위치 + 1부터 재탐색하여 겹치는 매칭까지 위치별로 가장 긴 키워드를 찾습니다.
+- 같은 위치에서 시작하는 더 짧은 키워드는 접두사 테이블로 함께 보고하므로
+  기존 `kw.lower() in text.lower()` 부분 문자열 판정과 결과가 같습니다.
+- 마감일 정규식은 필수 리터럴(예: "까지")이 텍스트에 있을 때만 실행하고,
+  결과는 우선순위/액션 판정에서 공유합니다.
+
+프로젝트 키워드가 바뀌면(ProjectContextResolver.reload) 매처를 다시 빌드해야 합니다.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+# 긴급 키워드 단어 경계 문자 (기존 정규식 [\s,.\-!?;:()"'·]와 동일)
+_BOUNDARY_CHARS = frozenset(",.-!?;:()\"'·")
+
+# 긴급 부정 컨텍스트 (이 표현이 있으면 긴급이 아님)
+URGENT_DENY_PHRASES = (
+    "지금까지", "지금은", "지금처럼", "지금도",
+    "바로가기", "바로잡", "바로옆", "바로그",
+)
+
+# 액션 완료형 접미사 (예: "확인했", "검토완료")
+ACTION_COMPLETION_SUFFIXES = ("했", "됐", "완료", "끝", "드립니다", "드렸", "감사")
+
+# 질문 패턴 (URL, 코드블록 제거 후 적용)
+_URL_PATTERN = re.compile(r'https?://\S+')
+_CODE_BLOCK_PATTERN = re.compile(r'`[^`]*`')
+_QUESTION_PATTERN = re.compile(
+    r'\?(?!\S*[/=&])'  # URL query string이 아닌 ?
+    r'|(?:^|[\s])어떻게(?:[\s]|$)'
+    r'|(?:^|[\s])언제(?:[\s]|$)'
+    r'|(?:^|[\s])왜(?:[\s,.\-!?]|$)',
+    re.MULTILINE,
+)
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """index 위치가 문자열 경계이거나 경계 문자인지"""
+    if index < 0 or index >= len(text):
+        return True
+    ch = text[index]
+    return ch.isspace() or ch in _BOUNDARY_CHARS
+
+
+def _required_literal(pattern: str) -> str | None:
+    """
+    정규식이 매칭되려면 반드시 포함해야 하는 가장 긴 리터럴 (없으면 None)
+
+    최상위(그룹/문자 클래스 밖)에서 수량자가 붙지 않은 일반 문자 연속 구간만 고려하며,
+    최상위 `|`가 있으면 판단하지 않습니다. 예: "(숫자)일 까지" 패턴 → "까지"
+    """
+    special = set(".^$*+?{}[]\\|()")
+    quantifiers = set("*+?{")
+    depth = 0
+    run = ""
+    best = ""
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            run = ""
+            i += 2
+            continue
+        if ch == "[":
+            run = ""
+            close = pattern.find("]", i + 2)
+            if close < 0:
+                return None
+            i = close + 1
+            continue
+        if ch == "(":
+            depth += 1
+            run = ""
+        elif ch == ")":
+            depth -= 1
+            run = ""
+        elif ch == "|" and depth == 0:
+            return None
+        elif ch in special or depth > 0:
+            run = ""
+        else:
+            next_ch = pattern[i + 1] if i + 1 < len(pattern) else ""
+            if next_ch in quantifiers:
+                run = ""
+            else:
+                run += ch
+                if len(run) > len(best):
+                    best = run
+        i += 1
+    return best or None
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    키워드 목록을 접두사 트리 정규식으로 변환
+
+    공통 접두사를 한 번만 비교하므로 단순 alternation보다 위치당 시도 횟수가 적고,
+    탐욕적 선택 그룹으로 같은 위치에서 가장 긴 키워드를 매칭합니다.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class LiteralIndex:
+    """
+    소문자 리터럴 집합의 겹침 포함 전체 매칭 인덱스
+
+    접두사 트리 정규식으로 텍스트를 한 번 스캔하며, 매칭 시작 위치 + 1부터 재탐색하여
+    `key in text` 부분 문자열 판정과 같은 결과를 냅니다.
+
+    Example:
+        index = LiteralIndex(["배포", "배포완료"])
+        index.find("배포완료 공유")  # {"배포", "배포완료"}
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        keys = {key for key in keys if key}
+        # 같은 위치에서 시작하는 짧은 키 = 긴 키의 접두사
+        self.prefixes: dict[str, tuple[str, ...]] = {
+            key: tuple(other for other in keys if key.startswith(other)) for key in keys
+        }
+        self._search = re.compile(_trie_pattern(keys)).search if keys else None
+
+    def iter_matches(self, lowered: str) -> Iterator[tuple[int, str]]:
+        """(시작 위치, 해당 위치의 가장 긴 키) 순회"""
+        if self._search is None:
+            return
+        match = self._search(lowered)
+        while match is not None:
+            start = match.start()
+            yield start, match.group()
+            match = self._search(lowered, start + 1)
+
+    def find(self, lowered: str) -> set[str]:
+        """텍스트에 포함된 모든 키"""
+        found: set[str] = set()
+        for _, matched in self.iter_matches(lowered):
+            found.update(self.prefixes[matched])
+        return found
+
+
+@dataclass
+class KeywordHits:
+    """
+    단일 스캔 결과
+
+    Attributes:
+        urgent: 기본 긴급 키워드가 단어 경계로 매칭됨
+        deny: 긴급 부정 컨텍스트 포함
+        actions: 완료형이 아닌 기본 액션 키워드 (설정 순서)
+        deadlines: 마감일 패턴별 첫 매칭 문자열 (패턴 순서)
+        question: 질문 패턴 포함
+        project_urgent: 긴급 키워드가 매칭된 project_id 집합
+        project_actions: project_id별 매칭된 액션 키워드 (설정 순서)
+    """
+    urgent: bool = False
+    deny: bool = False
+    actions: list[str] = field(default_factory=list)
+    deadlines: list[str] = field(default_factory=list)
+    question: bool = False
+    project_urgent: set[str] = field(default_factory=set)
+    project_actions: dict[str, list[str]] = field(default_factory=dict)
+
+
+class KeywordMatcher:
+    """
+    컴파일된 단일 패스 키워드 매처
+
+    Example:
+        matcher = KeywordMatcher(DEFAULT_CONFIG, resolver.list_contexts())
+        hits = matcher.scan("긴급! 오늘까지 검토 부탁드립니다")
+    """
+
+    def __init__(self, config: dict[str, Any], project_contexts: Iterable[Any] = ()):
+        """
+        Args:
+            config: urgent_keywords, action_keywords, deadline_patterns를 포함한 설정
+            project_contexts: ProjectContext 목록 (project_id, urgent/action_keywords)
+        """
+        keys: set[str] = set()
+
+        def index(keyword: str, table: dict[str, list[str]] | None = None,
+                  value: str | None = None) -> str:
+            key = keyword.lower()
+            if key:
+                keys.add(key)
+                if table is not None:
+                    table.setdefault(key, []).append(value)
+            return key
+
+        # 기본 긴급 키워드 (단어 경계 검사 대상)
+        self._urgent_keys = {index(kw) for kw in config.get("urgent_keywords", []) if kw}
+
+        # 기본 액션 키워드: (키워드, 소문자 키, 완료형 키 집합)
+        self._action_specs: list[tuple[str, str, frozenset[str]]] = [
+            (kw, index(kw), frozenset(index(kw + suffix) for suffix in ACTION_COMPLETION_SUFFIXES))
+            for kw in config.get("action_keywords", []) if kw
+        ]
+
+        self._deny_keys = frozenset(index(phrase) for phrase in URGENT_DENY_PHRASES)
+
+        # 프로젝트 키워드: 소문자 키 → project_id 목록
+        self._project_urgent: dict[str, list[str]] = {}
+        self._project_action: dict[str, list[str]] = {}
+        self._project_action_order: dict[str, list[tuple[str, str]]] = {}
+        for ctx in project_contexts:
+            pid = ctx.project_id
+            for kw in ctx.urgent_keywords:
+                index(kw, self._project_urgent, pid)
+            self._project_action_order[pid] = [
+                (kw, index(kw, self._project_action, pid)) for kw in ctx.action_keywords if kw
+            ]
+
+        self._literals = LiteralIndex(keys)
+        # 가장 긴 매칭 키 → 접두사 중 기본 긴급 키워드의 길이 (경계 검사용)
+        self._urgent_lengths: dict[str, tuple[int, ...]] = {
+            key: lengths for key, prefixes in self._literals.prefixes.items()
+            if (lengths := tuple(len(k) for k in prefixes if k in self._urgent_keys))
+        }
+
+        # 마감일: 필수 리터럴이 텍스트에 있을 때만 정규식 실행
+        self._deadline_patterns: list[tuple[re.Pattern, str | None]] = []
+        for p in config.get("deadline_patterns", []):
+            literal = _required_literal(p)
+            self._deadline_patterns.append(
+                (re.compile(p, re.IGNORECASE), literal.lower() if literal else None)
+            )
+
+    def has_project(self, project_id: str) -> bool:
+        """project_id의 키워드가 매처에 포함되어 있는지"""
+        return project_id in self._project_action_order
+
+    def scan(self, text: str) -> KeywordHits:
+        """텍스트를 한 번 스캔하여 모든 키워드/패턴 매칭 결과 반환"""
+        hits = KeywordHits()
+        if not text:
+            return hits
+
+        # 소문자 텍스트에서 모든 시작 위치의 가장 긴 키워드 탐색 (겹침 포함)
+        lowered = text.lower()
+        found: set[str] = set()
+        prefixes_of = self._literals.prefixes
+        for start, matched in self._literals.iter_matches(lowered):
+            found.update(prefixes_of[matched])
+            lengths = self._urgent_lengths.get(matched)
+            if lengths and not hits.urgent and _is_boundary(lowered, start - 1):
+                hits.urgent = any(_is_boundary(lowered, start + n) for n in lengths)
+
+        if found:
+            hits.deny = not self._deny_keys.isdisjoint(found)
+            hits.actions = [
+                kw for kw, key, completions in self._action_specs
+                if key in found and completions.isdisjoint(found)
+            ]
+            for key in found:
+                if key in self._project_urgent:
+                    hits.project_urgent.update(self._project_urgent[key])
+                for pid in self._project_action.get(key, ()):
+                    if pid not in hits.project_actions:
+                        hits.project_actions[pid] = [
+                            kw for kw, kw_key in self._project_action_order[pid] if kw_key in found
+                        ]
+
+        for pattern, literal in self._deadline_patterns:
+            if literal is None or literal in lowered:
+                deadline = pattern.search(text)
+                if deadline:
+                    hits.deadlines.append(deadline.group(0))
+
+        # 질문 사전 필터: 물음표/의문사가 없으면 정규식 생략
+        if "?" in text or "어떻게" in text or "언제" in text or "왜" in text:
+            text_clean = text
+            if "`" in text_clean:
+                text_clean = _CODE_BLOCK_PATTERN.sub('', _URL_PATTERN.sub('', text_clean))
+            elif "http" in text_clean:
+                text_clean = _URL_PATTERN.sub('', text_clean)
+            hits.question = _QUESTION_PATTERN.search(text_clean) is not None
+
+        return hits
@@ -4,6 +4,7 @@ Gateway 데이터 모델 - Phase 4
 멀티 채널 메시징을 위한 통합 데이터 모델 정의.
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -40,8 +41,13 @@ class Priority(Enum):
 # Alias for backward compatibility
 MessagePriority = Priority
 
+# 값 → Enum 역조회 (신뢰된 DB 값 변환용, Enum 생성자/예외 처리 비용 회피)
+CHANNEL_BY_VALUE = {member.value: member for member in ChannelType}
+MESSAGE_TYPE_BY_VALUE = {member.value: member for member in MessageType}
+PRIORITY_BY_VALUE = {member.value: member for member in Priority}
 
-@dataclass
+
+@dataclass(slots=True)
 class NormalizedMessage:
     """
     통합 메시지 모델 - 모든 채널의 메시지를 정규화
@@ -117,6 +123,80 @@ class NormalizedMessage:
             "thread_id": self.thread_id,
         }
 
+    def __eq__(self, other):
+        # StoredMessage와 일반 생성 메시지도 필드가 같으면 동일
+        if not isinstance(other, NormalizedMessage):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _MESSAGE_FIELDS)
+
+
+_MESSAGE_FIELDS = NormalizedMessage.__match_args__
+_MEDIA_URLS_SLOT = NormalizedMessage.media_urls
+
+
+class StoredMessage(NormalizedMessage):
+    """
+    DB에서 읽은 NormalizedMessage
+
+    __init__/__post_init__ 검사를 거치지 않고 from_row로 생성합니다.
+    media_urls JSON은 처음 접근할 때 파싱합니다.
+    """
+    __slots__ = ('_media_json',)
+
+    @classmethod
+    def from_row(
+        cls,
+        id: str,
+        channel: str,
+        channel_id: str,
+        sender_id: str,
+        sender_name: str | None,
+        text: str | None,
+        message_type: str | None,
+        timestamp: str | None,
+        is_group,
+        is_mention,
+        reply_to_id: str | None,
+        media_json: str | None,
+        raw_json: str | None,
+        priority: str | None,
+        has_action,
+        project_id: str | None,
+    ) -> "StoredMessage":
+        """신뢰된 DB 값으로 생성 (알 수 없는 Enum 값은 기본값으로 대체)"""
+        message = cls.__new__(cls)
+        message.id = id
+        message.channel = CHANNEL_BY_VALUE.get(channel, ChannelType.UNKNOWN)
+        message.channel_id = channel_id
+        message.sender_id = sender_id
+        message.sender_name = sender_name
+        message.text = text
+        message.message_type = MESSAGE_TYPE_BY_VALUE.get(message_type, MessageType.TEXT)
+        message.timestamp = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
+        message.is_group = bool(is_group)
+        message.is_mention = bool(is_mention)
+        message.reply_to_id = reply_to_id
+        message._media_json = media_json or '[]'
+        message.raw_json = raw_json
+        message.priority = PRIORITY_BY_VALUE.get(priority) if priority else None
+        message.has_action = bool(has_action)
+        message.project_id = project_id
+        message.thread_id = None
+        return message
+
+    @property
+    def media_urls(self) -> list[str]:
+        media_json = self._media_json
+        if media_json is not None:
+            self._media_json = None
+            _MEDIA_URLS_SLOT.__set__(self, json.loads(media_json) or [])
+        return _MEDIA_URLS_SLOT.__get__(self)
+
+    @media_urls.setter
+    def media_urls(self, value: list[str]) -> None:
+        self._media_json = None
+        _MEDIA_URLS_SLOT.__set__(self, value)
+
 
 @dataclass
 class OutboundMessage:
@@ -9,10 +9,21 @@ Stages:
 2. Action Detection (할일, 마감일 감지, 프로젝트별)
 3. Storage (DB 저장, project_id 포함)
 4. Action Dispatch (TODO 생성 등)
+
+실행 모드:
+- process(): 모든 stage를 호출자 태스크에서 순차 실행 (인라인)
+- start()/submit(): stage별 asyncio 큐 + 워커 풀 (resolve → classify → persist →
+  dispatch → handlers). 각 stage는 channel_id 해시로 샤딩된 bounded 큐를 사용하므로
+  같은 채널의 메시지 순서가 유지되고, 큐가 가득 차면 submit()이 대기(backpressure)합니다.
+
+수용 제어 (config["admission"]["enabled"]):
+- classify 직후 채널/발신자별 token bucket으로 수용 여부 결정 (AdmissionController)
+- urgent/high 우선순위와 멘션은 항상 처리, 한도 초과 메시지는 저장만 하거나(coalesce) 버림(drop)
 """
 
-import re
+import asyncio
 import sys
+import zlib
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -28,19 +39,33 @@ if __name__ == "__main__":
 
 # 상대/절대 import 모두 지원
 try:
+    from scripts.gateway.admission import ADMITTED, BYPASSED, DROPPED, AdmissionController
+    from scripts.gateway.keyword_matcher import KeywordHits, KeywordMatcher
     from scripts.gateway.models import EnrichedMessage, NormalizedMessage, Priority
     from scripts.gateway.project_context import ProjectContext, ProjectContextResolver
     from scripts.gateway.storage import UnifiedStorage
 except ImportError:
     try:
+        from gateway.admission import ADMITTED, BYPASSED, DROPPED, AdmissionController
+        from gateway.keyword_matcher import KeywordHits, KeywordMatcher
         from gateway.models import EnrichedMessage, NormalizedMessage, Priority
         from gateway.project_context import ProjectContext, ProjectContextResolver
         from gateway.storage import UnifiedStorage
     except ImportError:
+        from .admission import ADMITTED, BYPASSED, DROPPED, AdmissionController
+        from .keyword_matcher import KeywordHits, KeywordMatcher
         from .models import EnrichedMessage, NormalizedMessage, Priority
         from .project_context import ProjectContext, ProjectContextResolver
         from .storage import UnifiedStorage
 
+try:
+    from scripts.shared.metrics import MetricsRegistry
+except ImportError:
+    try:
+        from shared.metrics import MetricsRegistry
+    except ImportError:
+        from ..shared.metrics import MetricsRegistry
+
 
 # 기본 설정
 DEFAULT_CONFIG = {
@@ -54,8 +79,25 @@ DEFAULT_CONFIG = {
         r"이번\s*주\s*(내|까지)",  # 이번 주 내
     ],
     "rate_limit_per_minute": 10,
+    # write-behind 스토리지 사용 시 저장 직후 flush()로 내구성을 보장할 우선순위
+    "durable_priorities": ["urgent"],
+    # 스테이지 모드 (start/submit) 워커 수 및 샤드별 큐 크기
+    "stage_workers": {
+        "resolve": 1,
+        "classify": 2,
+        "persist": 1,
+        "dispatch": 2,
+        "handlers": 4,
+    },
+    "stage_queue_size": 256,
+    # 채널/발신자별 수용 제어 (admission.DEFAULT_ADMISSION_CONFIG 참조, 발신자 한도 기본값은 rate_limit_per_minute)
+    "admission": {"enabled": False},
 }
 
+STAGE_NAMES = ("resolve", "classify", "persist", "dispatch", "handlers")
+# 저장 전에 종료된 메시지의 처리 원장 stage (STAGE_NAMES에 없으므로 replay 시 처음부터 처리)
+CHECKPOINT_STAGE = "queued"
+
 
 @dataclass
 class PipelineResult:
@@ -67,6 +109,9 @@ class PipelineResult:
     actions: list[str] = field(default_factory=list)
     error: str | None = None
     processed_at: datetime | None = None
+    # 수용 제어 결정 (admitted/bypassed/coalesced/dropped) 및 직전까지 coalesce된 같은 채널 메시지 수
+    admission: str | None = None
+    coalesced: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """딕셔너리로 변환"""
@@ -78,6 +123,8 @@ class PipelineResult:
             "actions": self.actions,
             "error": self.error,
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
+            "admission": self.admission,
+            "coalesced": self.coalesced,
         }
 
 
@@ -85,6 +132,45 @@ class PipelineResult:
 PipelineHandler = Callable[['EnrichedMessage', 'PipelineResult'], Awaitable[None]]
 
 
+@dataclass
+class _PipelineItem:
+    """stage 간에 전달되는 처리 단위"""
+    message: NormalizedMessage
+    result: PipelineResult
+    enriched: EnrichedMessage
+    project_ctx: ProjectContext | None = None
+    future: asyncio.Future | None = None
+    # 마지막으로 완료된 stage (실패 기록/재처리 재개 지점)
+    completed: str | None = None
+    # replay 시 처리 원장에 있던 stage (저장 전 checkpoint 메시지의 실패 기록용)
+    ledger_stage: str | None = None
+
+
+class _PipelineStage:
+    """channel_id로 샤딩된 bounded 큐 + 샤드당 워커 1개"""
+
+    def __init__(self, name: str, fn: Callable[[_PipelineItem], Awaitable[None]],
+                 workers: int, maxsize: int):
+        self.name = name
+        self.fn = fn
+        self.queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=maxsize) for _ in range(max(1, workers))
+        ]
+        self.tasks: list[asyncio.Task] = []
+
+    async def put(self, item: _PipelineItem) -> None:
+        """같은 channel_id는 항상 같은 샤드로 (채널별 순서 보장)"""
+        key = (item.message.channel_id or "").encode("utf-8")
+        await self.queues[zlib.crc32(key) % len(self.queues)].put(item)
+
+    async def join(self) -> None:
+        for queue in self.queues:
+            await queue.join()
+
+    def depth(self) -> int:
+        return sum(q.qsize() for q in self.queues)
+
+
 class MessagePipeline:
     """
     메시지 처리 파이프라인
@@ -115,44 +201,26 @@ class MessagePipeline:
         self.config = {**DEFAULT_CONFIG, **(config or {})}
         self.handlers: list[PipelineHandler] = []
         self._project_resolver = project_resolver or ProjectContextResolver()
-
-        # 정규식 컴파일
-        self._deadline_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.config["deadline_patterns"]
-        ]
-
-        # 긴급 키워드 정규식 (단어 경계)
-        self._urgent_patterns = []
-        for keyword in self.config["urgent_keywords"]:
-            pattern = re.compile(
-                rf'(?:^|[\s,.\-!?;:()\"\'·]){re.escape(keyword)}(?:[\s,.\-!?;:()\"\'·]|$)',
-                re.IGNORECASE
-            )
-            self._urgent_patterns.append(pattern)
-
-        # 긴급 부정 컨텍스트 패턴 (이 패턴에 매칭되면 긴급이 아님)
-        self._urgent_deny_patterns = [
-            re.compile(r'지금까지|지금은|지금처럼|지금도', re.IGNORECASE),
-            re.compile(r'바로가기|바로잡|바로옆|바로그', re.IGNORECASE),
-        ]
-
-        # 액션 완료형 제외 패턴
-        self._action_completion_patterns = {}
-        for keyword in self.config["action_keywords"]:
-            self._action_completion_patterns[keyword] = re.compile(
-                rf'{re.escape(keyword)}(했|됐|완료|끝|드립니다|드렸|감사)',
-                re.IGNORECASE
-            )
-
-        # 질문 패턴 (URL, 코드블록 제외용 정규식)
-        self._url_pattern = re.compile(r'https?://\S+')
-        self._code_block_pattern = re.compile(r'`[^`]*`')
-        self._question_patterns = [
-            re.compile(r'\?(?!\S*[/=&])'),  # URL query string이 아닌 ?
-            re.compile(r'(?:^|[\s])어떻게(?:[\s]|$)', re.MULTILINE),
-            re.compile(r'(?:^|[\s])언제(?:[\s]|$)', re.MULTILINE),
-            re.compile(r'(?:^|[\s])왜(?:[\s,.\-!?]|$)', re.MULTILINE),
-        ]
+        self._stages: list[_PipelineStage] = []
+        self._interrupted: list[_PipelineItem] = []
+        self._admission = AdmissionController({
+            "rate_limit_per_minute": self.config.get("rate_limit_per_minute", 10),
+            **self.config.get("admission", {}),
+        })
+
+        # 메트릭 (stage별 처리 시간, 완료 메시지 수)
+        registry = MetricsRegistry.get_instance()
+        self._stage_seconds = registry.histogram(
+            "secretary_pipeline_stage_seconds", "파이프라인 stage별 처리 시간 (초)", ("stage",)
+        )
+        self._messages_total = registry.counter(
+            "secretary_pipeline_messages_total", "파이프라인 처리 완료 메시지 수", ("admission", "status")
+        )
+
+        # 단일 패스 키워드 매처 (기본 설정 + 프로젝트 키워드, resolver reload 시 재빌드)
+        self._matcher: KeywordMatcher | None = None
+        self._matcher_version = -1
+        self._get_matcher()
 
         # Action Dispatcher 초기화
         try:
@@ -186,67 +254,338 @@ class MessagePipeline:
         Returns:
             처리 결과
         """
-        result = PipelineResult(message_id=message.id)
-        enriched = EnrichedMessage(original=message)
+        item = self._new_item(message)
+        await self._run_stages(item, STAGE_NAMES)
+        return item.result
 
+    async def _run_stages(self, item: _PipelineItem, names: tuple[str, ...]) -> None:
+        """지정한 stage들을 순서대로 인라인 실행 (process/replay 공용)"""
+        stage_fns = dict(zip(STAGE_NAMES, self._stage_functions(), strict=True))
         try:
-            # Stage 0.5: Project Context Resolution
-            project_id = message.project_id or self._project_resolver.resolve(message)
-            project_ctx = self._project_resolver.get_context(project_id) if project_id else None
-            result.project_id = project_id
-            enriched.project_id = project_id
-
-            # Stage 1: Priority Analysis → EnrichedMessage에 기록 (프로젝트별 키워드 확장)
-            priority = self._analyze_priority(message, project_ctx)
-            if priority:
-                result.priority = priority
-                enriched.priority = Priority(priority)
-
-            # Stage 2: Action Detection → EnrichedMessage에 기록 (프로젝트별 키워드 확장)
-            actions = self._detect_actions(message, project_ctx)
-            if actions:
-                result.has_action = True
-                result.actions = actions
-                enriched.has_action = True
-                enriched.actions = actions
-
-            # Stage 3: Storage (원본 메시지 저장, project_id 포함)
-            await self._save_to_storage(message, project_id)
-
-            # Stage 4: Action Dispatch (TODO 생성 등)
-            if result.has_action:
-                await self._dispatch_actions(message, result)
-
-            # Stage 6: Custom Handlers (EnrichedMessage 전달)
-            for handler in self.handlers:
-                await handler(enriched, result)
+            for name in names:
+                with self._stage_seconds.labels(name).time():
+                    await stage_fns[name](item)
+                # replay 시 재계산한 resolve/classify가 재개 지점을 되돌리지 않도록
+                if item.completed is None or STAGE_NAMES.index(name) > STAGE_NAMES.index(item.completed):
+                    item.completed = name
+            item.result.processed_at = datetime.now()
+        except Exception as e:
+            item.result.error = str(e)
+            await self._record_failure(item, name, e)
+        self._count_finished(item)
+
+    async def replay(self, limit: int = 100, max_attempts: int = 5) -> list[PipelineResult]:
+        """
+        처리 원장의 미완료 메시지를 마지막 완료 stage 다음부터 재처리
 
-            result.processed_at = datetime.now()
+        resolve/classify는 부수 효과가 없으므로 다시 계산하고, 이미 완료된
+        persist/dispatch는 건너뜁니다. max_attempts 이상 실패한 메시지는 제외합니다.
 
+        Returns:
+            재처리 결과 목록
+        """
+        results = []
+        for state in await self.storage.get_processing_states(limit, max_attempts):
+            message = await self.storage.get_message(state["message_id"])
+            if message is None:
+                # 원본이 없으면 재처리 불가 → 원장에서 제거
+                await self.storage.mark_processed_many([state["message_id"]])
+                continue
+
+            item = self._new_item(message)
+            # 이미 저장된 메시지이므로 수용 제어를 다시 거치지 않음
+            item.result.admission = ADMITTED
+            item.ledger_stage = state["stage"]
+            resume_at = 0
+            if state["stage"] in STAGE_NAMES:
+                item.completed = state["stage"]
+                resume_at = STAGE_NAMES.index(state["stage"]) + 1
+            names = STAGE_NAMES[:2] + tuple(n for n in STAGE_NAMES[max(resume_at, 2):])
+            await self._run_stages(item, names)
+            results.append(item.result)
+        return results
+
+    async def _record_failure(self, item: _PipelineItem, stage: str, error: Exception) -> None:
+        """저장된 메시지의 stage 실패를 처리 원장에 기록 (재처리 대상)"""
+        if item.completed in ("persist", "dispatch"):
+            ledger_stage = item.completed
+        else:
+            # persist 전 실패: checkpoint로 이미 저장된 replay 메시지만 기록 (attempts 증가)
+            ledger_stage = item.ledger_stage
+        if ledger_stage is None:
+            return
+        try:
+            await self.storage.record_stage(item.message.id, ledger_stage, error=f"{stage}: {error}")
         except Exception as e:
-            result.error = str(e)
+            print(f"[Pipeline] 처리 원장 기록 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # Stage 함수 (process()와 스테이지 워커가 공유)
+    # ------------------------------------------------------------------
+
+    def _new_item(self, message: NormalizedMessage) -> _PipelineItem:
+        return _PipelineItem(
+            message=message,
+            result=PipelineResult(message_id=message.id),
+            enriched=EnrichedMessage(original=message),
+        )
+
+    def _stage_functions(self) -> list[Callable[[_PipelineItem], Awaitable[None]]]:
+        """STAGE_NAMES 순서의 stage 함수 목록"""
+        return [
+            self._stage_resolve,
+            self._stage_classify,
+            self._stage_persist,
+            self._stage_dispatch,
+            self._stage_handlers,
+        ]
 
-        return result
+    async def _stage_resolve(self, item: _PipelineItem) -> None:
+        """Stage 0.5: Project Context Resolution"""
+        message = item.message
+        project_id = message.project_id or self._project_resolver.resolve(message)
+        item.project_ctx = self._project_resolver.get_context(project_id) if project_id else None
+        item.result.project_id = project_id
+        item.enriched.project_id = project_id
+
+    async def _stage_classify(self, item: _PipelineItem) -> None:
+        """Stage 1-2: Priority Analysis + Action Detection → EnrichedMessage에 기록"""
+        message, result, enriched = item.message, item.result, item.enriched
+        hits = self._get_matcher().scan(message.text or "")
+
+        # Stage 1: Priority Analysis (프로젝트별 키워드 확장)
+        priority = self._analyze_priority(message, item.project_ctx, hits)
+        if priority:
+            result.priority = priority
+            enriched.priority = Priority(priority)
+
+        # Stage 2: Action Detection (프로젝트별 키워드 확장)
+        actions = self._detect_actions(message, item.project_ctx, hits)
+        if actions:
+            result.has_action = True
+            result.actions = actions
+            enriched.has_action = True
+            enriched.actions = actions
+
+        # 수용 제어 (우선순위 확정 후)
+        if result.admission is None:
+            result.admission = self._admission.admit(message, priority)
+            if result.admission in (ADMITTED, BYPASSED):
+                result.coalesced = self._admission.take_coalesced(message)
+
+    def _is_shed(self, item: _PipelineItem) -> bool:
+        """수용 제어로 dispatch/핸들러를 생략할 메시지인지"""
+        return item.result.admission not in (None, ADMITTED, BYPASSED)
+
+    async def _stage_persist(self, item: _PipelineItem) -> None:
+        """Stage 3: Storage (원본 메시지 저장, project_id 포함) + 처리 원장 등록"""
+        if item.result.admission == DROPPED:
+            return
+        await self._save_to_storage(item.message, item.result.project_id)
+        if item.result.priority in self.config["durable_priorities"]:
+            await self.storage.flush()
+
+    async def _stage_dispatch(self, item: _PipelineItem) -> None:
+        """Stage 4: Action Dispatch (TODO 생성 등)"""
+        if item.result.has_action and not self._is_shed(item):
+            await self._dispatch_actions(item.message, item.result)
+            await self.storage.record_stage(item.message.id, "dispatch")
+
+    async def _stage_handlers(self, item: _PipelineItem) -> None:
+        """Stage 6: Custom Handlers (EnrichedMessage 전달)"""
+        if item.result.admission == DROPPED:
+            return
+        if not self._is_shed(item):
+            for handler in self.handlers:
+                await handler(item.enriched, item.result)
+        await self.storage.mark_processed(item.message.id)
+
+    # ------------------------------------------------------------------
+    # 스테이지 모드 (bounded 큐 + 워커 풀)
+    # ------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        """스테이지 워커 실행 여부"""
+        return bool(self._stages)
+
+    async def start(self) -> None:
+        """
+        스테이지 워커 시작
+
+        config["stage_workers"]의 stage별 워커 수만큼 샤드 큐를 만들고,
+        각 샤드에 워커 태스크 1개를 띄웁니다.
+        """
+        if self._stages:
+            return
+
+        workers = {**DEFAULT_CONFIG["stage_workers"], **self.config.get("stage_workers", {})}
+        maxsize = self.config.get("stage_queue_size", DEFAULT_CONFIG["stage_queue_size"])
+
+        self._stages = [
+            _PipelineStage(name, fn, workers.get(name, 1), maxsize)
+            for name, fn in zip(STAGE_NAMES, self._stage_functions(), strict=True)
+        ]
+        depth = MetricsRegistry.get_instance().gauge(
+            "secretary_pipeline_queue_depth", "파이프라인 stage 큐 대기 메시지 수", ("stage",)
+        )
+        for index, stage in enumerate(self._stages):
+            depth.labels(stage.name).set_function(stage.depth)
+            for queue in stage.queues:
+                stage.tasks.append(asyncio.create_task(self._stage_worker(index, queue)))
+
+    async def submit(self, message: NormalizedMessage) -> asyncio.Future:
+        """
+        메시지를 첫 stage 큐에 넣고 즉시 반환
+
+        첫 stage 큐가 가득 차면 자리가 날 때까지 대기합니다 (backpressure).
+        워커가 실행 중이 아니면 process()로 인라인 처리합니다.
+
+        Returns:
+            처리 완료 시 PipelineResult가 설정되는 Future
+        """
+        future = asyncio.get_running_loop().create_future()
+        if not self._stages:
+            future.set_result(await self.process(message))
+            return future
+
+        item = self._new_item(message)
+        item.future = future
+        await self._stages[0].put(item)
+        return future
+
+    async def stop(self, drain: bool = True, timeout: float | None = 30.0) -> int:
+        """
+        스테이지 워커 중지
+
+        drain 후에도 남은 메시지(큐 대기 + 처리 중 취소)는 처리 원장에 checkpoint해
+        다음 실행의 replay()가 이어서 처리합니다.
+
+        Args:
+            drain: True면 큐에 남은 메시지를 모두 처리한 뒤 중지
+            timeout: drain 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            checkpoint한 메시지 수
+        """
+        if not self._stages:
+            return 0
+
+        if drain:
+            async def _join_all():
+                for stage in self._stages:
+                    await stage.join()
+            try:
+                await asyncio.wait_for(_join_all(), timeout=timeout)
+            except TimeoutError:
+                print(f"[Pipeline] drain 시간 초과 ({timeout}s), 남은 메시지 checkpoint")
+
+        tasks = [t for stage in self._stages for t in stage.tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 처리되지 못한 메시지의 Future 취소
+        leftover, self._interrupted = self._interrupted, []
+        for stage in self._stages:
+            for queue in stage.queues:
+                while not queue.empty():
+                    leftover.append(queue.get_nowait())
+        for item in leftover:
+            if item.future and not item.future.done():
+                item.future.cancel()
+        self._stages = []
+        return await self._checkpoint(leftover)
+
+    async def _checkpoint(self, items: list[_PipelineItem]) -> int:
+        """
+        끝내지 못한 메시지를 처리 원장에 남김
+
+        persist 이후 단계의 메시지는 이미 원장에 있으므로, 아직 저장되지 않은 메시지만
+        CHECKPOINT_STAGE로 저장합니다 (replay 시 처음부터 처리).
+        """
+        saved = 0
+        for item in items:
+            if item.completed in ("persist", "dispatch") or item.result.admission == DROPPED:
+                continue
+            try:
+                await self.storage.save_message(
+                    item.message, project_id=item.result.project_id, stage=CHECKPOINT_STAGE
+                )
+                saved += 1
+            except Exception as e:
+                print(f"[Pipeline] checkpoint 실패 ({item.message.id}): {e}")
+        if items:
+            print(f"[Pipeline] 미완료 메시지 {len(items)}건 처리 원장에 보존 (신규 저장 {saved}건)")
+        return len(items)
+
+    async def _stage_worker(self, index: int, queue: asyncio.Queue) -> None:
+        """단일 샤드 워커: stage 실행 후 다음 stage로 전달"""
+        stage = self._stages[index]
+        next_stage = self._stages[index + 1] if index + 1 < len(self._stages) else None
+
+        while True:
+            item: _PipelineItem = await queue.get()
+            try:
+                try:
+                    with self._stage_seconds.labels(stage.name).time():
+                        await stage.fn(item)
+                    item.completed = stage.name
+                except Exception as e:
+                    item.result.error = str(e)
+                    await self._record_failure(item, stage.name, e)
+
+                if item.result.error is None and next_stage is not None:
+                    await next_stage.put(item)
+                else:
+                    self._finish(item)
+            except asyncio.CancelledError:
+                # stop() 중 처리/전달이 끊긴 메시지 (checkpoint 대상)
+                self._interrupted.append(item)
+                raise
+            finally:
+                queue.task_done()
+
+    def _finish(self, item: _PipelineItem) -> None:
+        """마지막 stage 완료 또는 오류 시 결과 확정"""
+        if item.result.error is None:
+            item.result.processed_at = datetime.now()
+        if item.future and not item.future.done():
+            item.future.set_result(item.result)
+        self._count_finished(item)
+
+    def _count_finished(self, item: _PipelineItem) -> None:
+        status = "error" if item.result.error else "ok"
+        self._messages_total.labels(item.result.admission or "none", status).inc()
+
+    def _get_matcher(self) -> KeywordMatcher:
+        """키워드 매처 반환 (프로젝트 설정이 reload되었으면 재빌드)"""
+        version = getattr(self._project_resolver, "version", 0)
+        if self._matcher is None or version != self._matcher_version:
+            self._matcher = KeywordMatcher(self.config, self._project_resolver.list_contexts())
+            self._matcher_version = version
+        return self._matcher
 
     def _analyze_priority(self, message: NormalizedMessage,
-                          project_ctx: ProjectContext | None = None) -> str | None:
+                          project_ctx: ProjectContext | None = None,
+                          hits: KeywordHits | None = None) -> str | None:
         """우선순위 분석 (프로젝트별 긴급 키워드 확장)"""
-        text = message.text or ""
-
-        # 부정 컨텍스트 체크 (먼저 실행)
-        has_deny = any(p.search(text) for p in self._urgent_deny_patterns)
+        if hits is None:
+            hits = self._get_matcher().scan(message.text or "")
 
-        # 긴급 키워드 체크 (단어 경계 정규식 - 기본 키워드)
-        if not has_deny:
-            for pattern in self._urgent_patterns:
-                if pattern.search(text):
-                    return "urgent"
+        # 긴급 키워드 체크 (부정 컨텍스트가 없을 때만)
+        if not hits.deny:
+            if hits.urgent:
+                return "urgent"
 
             # 프로젝트별 긴급 키워드 체크
             if project_ctx and project_ctx.urgent_keywords:
-                text_lower = text.lower()
-                for kw in project_ctx.urgent_keywords:
-                    if kw.lower() in text_lower:
+                if self._get_matcher().has_project(project_ctx.project_id):
+                    if project_ctx.project_id in hits.project_urgent:
+                        return "urgent"
+                else:
+                    text_lower = (message.text or "").lower()
+                    if any(kw.lower() in text_lower for kw in project_ctx.urgent_keywords):
                         return "urgent"
 
         # 멘션인 경우 높은 우선순위
@@ -254,53 +593,43 @@ class MessagePipeline:
             return "high"
 
         # 마감일 감지
-        for pattern in self._deadline_patterns:
-            if pattern.search(text):
-                return "high"
+        if hits.deadlines:
+            return "high"
 
         return "normal"
 
     def _detect_actions(self, message: NormalizedMessage,
-                        project_ctx: ProjectContext | None = None) -> list[str]:
+                        project_ctx: ProjectContext | None = None,
+                        hits: KeywordHits | None = None) -> list[str]:
         """액션 감지 (프로젝트별 액션 키워드 확장)"""
-        text = message.text or ""
-        text_lower = text.lower()
-        actions = []
-
-        # 액션 키워드 체크 (완료형 제외, 모든 매칭 수집)
-        action_keywords = self.config["action_keywords"]
-        for keyword in action_keywords:
-            if keyword.lower() in text_lower:
-                # 완료형인지 확인
-                completion_pat = self._action_completion_patterns.get(keyword)
-                if completion_pat and completion_pat.search(text):
-                    continue
-                actions.append(f"action_request:{keyword}")
-
-        # 마감일 감지 (모든 매칭 수집)
-        for pattern in self._deadline_patterns:
-            match = pattern.search(text)
-            if match:
-                actions.append(f"deadline:{match.group(0)}")
+        if hits is None:
+            hits = self._get_matcher().scan(message.text or "")
+
+        # 액션 키워드 (완료형 제외, 모든 매칭 수집)
+        actions = [f"action_request:{kw}" for kw in hits.actions]
+
+        # 마감일 감지 (패턴별 첫 매칭)
+        actions.extend(f"deadline:{d}" for d in hits.deadlines)
 
         # 프로젝트별 액션 키워드 체크
         if project_ctx and project_ctx.action_keywords:
-            for kw in project_ctx.action_keywords:
-                if kw.lower() in text_lower:
-                    actions.append(f"action_request:{kw}")
+            if self._get_matcher().has_project(project_ctx.project_id):
+                project_kws = hits.project_actions.get(project_ctx.project_id, [])
+            else:
+                text_lower = (message.text or "").lower()
+                project_kws = [kw for kw in project_ctx.action_keywords if kw.lower() in text_lower]
+            actions.extend(f"action_request:{kw}" for kw in project_kws)
 
         # 질문 패턴 감지 (URL, 코드블록 제외)
-        text_clean = self._url_pattern.sub('', text)
-        text_clean = self._code_block_pattern.sub('', text_clean)
-        if any(p.search(text_clean) for p in self._question_patterns):
+        if hits.question:
             actions.append("question")
 
         return actions
 
     async def _save_to_storage(self, message: NormalizedMessage,
                                project_id: str | None = None) -> None:
-        """스토리지에 메시지 저장 (project_id 포함)"""
-        await self.storage.save_message(message, project_id=project_id)
+        """스토리지에 메시지 저장 (project_id 포함, 처리 원장 persist 등록)"""
+        await self.storage.save_message(message, project_id=project_id, stage="persist")
 
     async def _dispatch_actions(self, message: NormalizedMessage, result: PipelineResult) -> None:
         """
@@ -331,4 +660,9 @@ class MessagePipeline:
         return {
             "handlers_count": len(self.handlers),
             "rate_limit_max": self.config.get("rate_limit_per_minute", 10),
+            "admission": self._admission.get_stats(),
+            "stages": {
+                stage.name: {"workers": len(stage.queues), "queue_depth": stage.depth()}
+                for stage in self._stages
+            },
         }
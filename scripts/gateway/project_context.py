@@ -3,12 +3,18 @@ ProjectContextResolver - Stage 0.5 프로젝트 컨텍스트 해석기
 
 메시지가 어느 프로젝트에 속하는지 확인하고,
 프로젝트별 파이프라인 설정을 반환합니다.
+
+로드 시점에 채널 → 프로젝트 해시 인덱스, 이메일 규칙 매처, 키워드 매처를 만들어
+메시지당 해석 비용이 프로젝트 수와 무관하게 유지됩니다. 매칭된 프로젝트 중
+projects.json 순서상 가장 앞선 프로젝트를 선택하므로 기존 순차 탐색과 결과가 같습니다.
+projects.json / channels.json이 바뀌면 resolve() 중 자동으로 다시 로드합니다.
 """
 
 import json
 import logging
 import re
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -22,13 +28,16 @@ if __name__ == "__main__":
 
 try:
     from scripts.gateway.channel_registry import ChannelRegistry
+    from scripts.gateway.keyword_matcher import LiteralIndex
     from scripts.gateway.models import ChannelType, NormalizedMessage
 except ImportError:
     try:
         from gateway.channel_registry import ChannelRegistry
+        from gateway.keyword_matcher import LiteralIndex
         from gateway.models import ChannelType, NormalizedMessage
     except ImportError:
         from .channel_registry import ChannelRegistry
+        from .keyword_matcher import LiteralIndex
         from .models import ChannelType, NormalizedMessage
 
 logger = logging.getLogger(__name__)
@@ -37,6 +46,53 @@ _DEFAULT_CONFIG_PATH = (
     Path(__file__).resolve().parent.parent.parent / "config" / "projects.json"
 )
 
+_SUBJECT_PATTERN = re.compile(r"subject:\(([^)]+)\)", re.IGNORECASE)
+_OR_PATTERN = re.compile(r"\s+OR\s+", re.IGNORECASE)
+
+# 설정 파일 변경 확인 최소 간격 (초)
+DEFAULT_RELOAD_CHECK_INTERVAL = 5.0
+
+
+def _email_terms(query: str) -> list[str]:
+    """Gmail query → 부분 문자열 매칭 용어 (subject:(a OR b)는 a, b / 그 외는 쿼리 전체)"""
+    subject_match = _SUBJECT_PATTERN.search(query)
+    if subject_match:
+        return [term.strip().lower() for term in _OR_PATTERN.split(subject_match.group(1))]
+    return [query.lower()]
+
+
+class _RuleIndex:
+    """
+    리터럴 → 프로젝트 순번 인덱스
+
+    빈 리터럴은 모든 텍스트에 포함되므로(`"" in text`) 항상 매칭되는 순번으로 따로 보관합니다.
+    """
+
+    def __init__(self) -> None:
+        self._positions: dict[str, int] = {}
+        self._always: int | None = None
+        self._literals: LiteralIndex | None = None
+
+    def add(self, literal: str, position: int) -> None:
+        if not literal:
+            if self._always is None:
+                self._always = position
+            return
+        self._positions.setdefault(literal, position)
+
+    def build(self) -> None:
+        self._literals = LiteralIndex(self._positions)
+
+    def first(self, lowered: str) -> int | None:
+        """텍스트에 포함된 리터럴 중 가장 앞선 프로젝트 순번"""
+        best = self._always
+        if self._literals is not None:
+            for key in self._literals.find(lowered):
+                position = self._positions[key]
+                if best is None or position < best:
+                    best = position
+        return best
+
 
 @dataclass
 class ProjectContext:
@@ -54,40 +110,143 @@ class ProjectContextResolver:
     def __init__(
         self, projects_config_path: Path | None = None, registry: ChannelRegistry | None = None
     ):
-        config_path = projects_config_path or _DEFAULT_CONFIG_PATH
+        self._config_path = projects_config_path or _DEFAULT_CONFIG_PATH
         self._projects: list[dict[str, Any]] = []
         self._contexts: dict[str, ProjectContext] = {}
         self._registry = registry
-        self._load(config_path)
+        # 로드 시 구성되는 해석 인덱스 (프로젝트 순번 기준)
+        self._project_ids: list[str] = []
+        self._channel_index: dict[str, int] = {}
+        self._email_index = _RuleIndex()
+        self._keyword_index = _RuleIndex()
+        # reload()마다 증가 (파생 인덱스/매처 재빌드 판단용)
+        self.version = 0
+        # 핫 리로드: 설정 파일 mtime 확인 간격
+        self.reload_check_interval = DEFAULT_RELOAD_CHECK_INTERVAL
+        self._config_mtime = self._mtime(self._config_path)
+        self._last_check = time.monotonic()
+        self._load(self._config_path)
 
-    def _load(self, path: Path) -> None:
-        """projects.json 로드 및 내부 인덱스 구성"""
-        if not path.exists():
-            logger.warning("projects.json not found: %s", path)
-            return
+    def reload(self) -> bool:
+        """
+        projects.json 재로드 (성공 시 version 증가)
 
+        Returns:
+            재로드 여부 (파싱 실패 시 False, 기존 프로젝트/인덱스 유지)
+        """
+        self._config_mtime = self._mtime(self._config_path)
+        if not self._load(self._config_path):
+            return False
+        self.version += 1
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """
+        projects.json / channels.json 변경 시 재로드
+
+        Returns:
+            재로드 여부
+        """
+        self._last_check = time.monotonic()
+        changed = False
+        if self._registry is not None and self._registry.reload_if_changed():
+            logger.info("channels.json changed, registry reloaded")
+            changed = True
+        if self._mtime(self._config_path) != self._config_mtime:
+            logger.info("projects.json changed, reloading: %s", self._config_path)
+            if self.reload():
+                return True
+        if changed:
+            self.version += 1
+        return changed
+
+    @staticmethod
+    def _mtime(path: Path) -> float | None:
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            self._projects = data.get("projects", [])
-            for p in self._projects:
-                pid = p.get("id", "")
-                if not pid:
-                    continue
-                pipeline_cfg = p.get("pipeline_config", {})
-                self._contexts[pid] = ProjectContext(
-                    project_id=pid,
-                    urgent_keywords=pipeline_cfg.get("urgent_keywords", []),
-                    action_keywords=pipeline_cfg.get("action_keywords", []),
-                    notification_rules=pipeline_cfg.get("notification_rules", {}),
-                    rate_limit_overrides=pipeline_cfg.get("rate_limit_overrides", {}),
-                )
-            logger.debug("Loaded %d projects from %s", len(self._projects), path)
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _load(self, path: Path) -> bool:
+        """
+        projects.json 로드 및 내부 인덱스 구성
+
+        새 목록/컨텍스트/인덱스를 모두 만든 뒤 한 번에 교체합니다. 파일이 없으면 빈 설정으로
+        교체하고, 파싱에 실패하면 기존 상태를 그대로 유지합니다.
+
+        Returns:
+            교체 여부
+        """
+        try:
+            projects, contexts = self._parse(path)
+            index = self._build_index(projects)
         except Exception as e:
-            logger.error("Failed to load projects config: %s", e)
+            logger.error("Failed to load projects config, keeping previous: %s", e)
+            return False
+
+        self._projects, self._contexts = projects, contexts
+        self._project_ids, self._channel_index, self._email_index, self._keyword_index = index
+        return True
+
+    @staticmethod
+    def _parse(path: Path) -> tuple[list[dict[str, Any]], dict[str, ProjectContext]]:
+        """projects.json → (프로젝트 목록, project_id별 ProjectContext). 파일이 없으면 빈 설정"""
+        if not path.exists():
+            logger.warning("projects.json not found: %s", path)
+            return [], {}
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        projects = data.get("projects", [])
+        contexts: dict[str, ProjectContext] = {}
+        for p in projects:
+            pid = p.get("id", "")
+            if not pid:
+                continue
+            pipeline_cfg = p.get("pipeline_config", {})
+            contexts[pid] = ProjectContext(
+                project_id=pid,
+                urgent_keywords=pipeline_cfg.get("urgent_keywords", []),
+                action_keywords=pipeline_cfg.get("action_keywords", []),
+                notification_rules=pipeline_cfg.get("notification_rules", {}),
+                rate_limit_overrides=pipeline_cfg.get("rate_limit_overrides", {}),
+            )
+        logger.debug("Loaded %d projects from %s", len(projects), path)
+        return projects, contexts
+
+    @staticmethod
+    def _build_index(
+        projects: list[dict[str, Any]],
+    ) -> tuple[list[str], dict[str, int], _RuleIndex, _RuleIndex]:
+        """프로젝트 목록 → (프로젝트 ID, 채널, 이메일, 키워드) 인덱스 (같은 키는 앞선 프로젝트 우선)"""
+        project_ids: list[str] = []
+        channel_index: dict[str, int] = {}
+        email_index = _RuleIndex()
+        keyword_index = _RuleIndex()
+
+        for p in projects:
+            pid = p.get("id", "")
+            if not pid:
+                continue
+            position = len(project_ids)
+            project_ids.append(pid)
+            for channel_id in p.get("slack_channels", []):
+                channel_index.setdefault(channel_id, position)
+            for query in p.get("gmail_queries", []):
+                for term in _email_terms(query):
+                    email_index.add(term, position)
+            for kw in p.get("keywords", []):
+                keyword_index.add(kw.lower(), position)
+
+        email_index.build()
+        keyword_index.build()
+        return project_ids, channel_index, email_index, keyword_index
 
     def resolve(self, message: NormalizedMessage) -> str | None:
         """메시지에서 project_id 결정. 순서: Registry → Slack 채널 → Email 패턴 → 키워드"""
+        if time.monotonic() - self._last_check >= self.reload_check_interval:
+            self.reload_if_changed()
+
         # 0. ChannelRegistry 우선 시도 (Slack)
         if message.channel == ChannelType.SLACK and self._registry is not None:
             registry_pid = self._registry.get_project_id(message.channel_id)
@@ -95,30 +254,27 @@ class ProjectContextResolver:
                 logger.debug("Resolved project '%s' via ChannelRegistry", registry_pid)
                 return registry_pid
 
-        for project in self._projects:
-            pid = project.get("id", "")
-            if not pid:
-                continue
+        # 1. Slack 채널 / 2. Email 패턴 / 3. 키워드 중 가장 앞선 프로젝트
+        text = (message.text or "").lower()
+        candidates: list[tuple[int, str]] = []
+        if message.channel == ChannelType.SLACK:
+            position = self._channel_index.get(message.channel_id)
+            if position is not None:
+                candidates.append((position, "Slack channel"))
+        if message.channel == ChannelType.EMAIL:
+            sender = (message.sender_id or "").lower()
+            position = self._email_index.first(f"{sender} {text}")
+            if position is not None:
+                candidates.append((position, "email pattern"))
+        position = self._keyword_index.first(text)
+        if position is not None:
+            candidates.append((position, "keyword match"))
 
-            # 1. Slack 채널 매칭
-            if message.channel == ChannelType.SLACK:
-                slack_channels = project.get("slack_channels", [])
-                if message.channel_id in slack_channels:
-                    logger.debug("Resolved project '%s' via Slack channel", pid)
-                    return pid
-
-            # 2. Email sender/subject/text 패턴 매칭
-            if message.channel == ChannelType.EMAIL:
-                gmail_queries = project.get("gmail_queries", [])
-                if gmail_queries and self._match_email(message, gmail_queries):
-                    logger.debug("Resolved project '%s' via email pattern", pid)
-                    return pid
-
-            # 3. 키워드 매칭 (텍스트)
-            keywords = project.get("keywords", [])
-            if keywords and self._match_keywords(message.text or "", keywords):
-                logger.debug("Resolved project '%s' via keyword match", pid)
-                return pid
+        if candidates:
+            position, via = min(candidates, key=lambda c: c[0])
+            pid = self._project_ids[position]
+            logger.debug("Resolved project '%s' via %s", pid, via)
+            return pid
 
         logger.debug("No project resolved for message %s", message.id)
         return None
@@ -127,32 +283,6 @@ class ProjectContextResolver:
         """project_id에 해당하는 ProjectContext 반환. 없으면 None."""
         return self._contexts.get(project_id)
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
-
-    def _match_email(
-        self, message: NormalizedMessage, queries: list[str]
-    ) -> bool:
-        """Gmail query 스타일 패턴을 텍스트/발신자에서 간단히 매칭"""
-        text = (message.text or "").lower()
-        sender = (message.sender_id or "").lower()
-        combined = f"{sender} {text}"
-
-        for query in queries:
-            # subject:(...) 구문에서 괄호 안 키워드 추출
-            subject_match = re.search(r"subject:\(([^)]+)\)", query, re.IGNORECASE)
-            if subject_match:
-                terms = re.split(r"\s+OR\s+", subject_match.group(1), flags=re.IGNORECASE)
-                if any(term.strip().lower() in combined for term in terms):
-                    return True
-            else:
-                # 쿼리 자체를 텍스트에서 검색
-                if query.lower() in combined:
-                    return True
-        return False
-
-    def _match_keywords(self, text: str, keywords: list[str]) -> bool:
-        """키워드 목록 중 하나라도 텍스트에 포함되면 True (case-insensitive)"""
-        text_lower = text.lower()
-        return any(kw.lower() in text_lower for kw in keywords)
+    def list_contexts(self) -> list[ProjectContext]:
+        """로드된 전체 ProjectContext 목록"""
+        return list(self._contexts.values())
@@ -0,0 +1,302 @@
+"""
+PushListener - push 방식 메시지 수신 (Slack Events API / Gmail Pub/Sub push)
+
+SecretaryGateway 설정의 port에서 asyncio 기반 최소 HTTP/1.1 서버를 실행합니다.
+외부 웹 프레임워크 없이 JSON POST 요청만 처리하며, 요청마다 연결을 닫습니다.
+
+Routes:
+- POST /slack/events: Slack Events API (url_verification challenge 응답, 그 외 이벤트 전달)
+- POST /gmail/push: Gmail Pub/Sub push (message.data의 {"emailAddress", "historyId"} 전달)
+- GET /health: 상태 및 수신 통계
+
+검증:
+- slack_signing_secret 설정 시 X-Slack-Signature(HMAC-SHA256) 및 5분 이내 타임스탬프 확인
+- gmail_token 설정 시 push endpoint URL의 ?token= 값 확인
+- secret이 하나라도 없으면 loopback 주소에만 바인드 (외부 주소면 시작 거부)
+
+Example:
+    listener = PushListener(on_push, port=8800, slack_signing_secret="...")
+    await listener.start()
+    ...
+    await listener.stop()
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import ipaddress
+import json
+import time
+from collections.abc import Awaitable, Callable
+from urllib.parse import parse_qs
+
+# 상대/절대 import 모두 지원
+try:
+    from scripts.gateway.models import ChannelType
+except ImportError:
+    try:
+        from gateway.models import ChannelType
+    except ImportError:
+        from .models import ChannelType
+
+SLACK_EVENTS_PATH = "/slack/events"
+GMAIL_PUSH_PATH = "/gmail/push"
+HEALTH_PATH = "/health"
+
+# 요청 본문 상한 / 요청 읽기 제한 시간 / Slack 서명 허용 시차 (초)
+MAX_BODY_BYTES = 1024 * 1024
+REQUEST_TIMEOUT = 10.0
+SLACK_SIGNATURE_MAX_AGE = 300
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+    405: "Method Not Allowed", 408: "Request Timeout", 413: "Payload Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+# (채널, payload) → 파이프라인에 넣은 메시지 수. 채널 어댑터가 없으면 None
+PushHandler = Callable[[ChannelType, dict], Awaitable[int | None]]
+
+
+class HttpError(Exception):
+    """요청 처리 실패 (status 코드로 응답)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def verify_slack_signature(secret: str, timestamp: str, body: bytes, signature: str) -> bool:
+    """
+    Slack 요청 서명 검증
+
+    Args:
+        secret: Slack 앱 signing secret
+        timestamp: X-Slack-Request-Timestamp 헤더
+        body: 요청 본문 원문
+        signature: X-Slack-Signature 헤더 (v0=...)
+
+    Returns:
+        서명이 일치하고 타임스탬프가 SLACK_SIGNATURE_MAX_AGE 이내이면 True
+    """
+    try:
+        if abs(time.time() - int(timestamp)) > SLACK_SIGNATURE_MAX_AGE:
+            return False
+    except (TypeError, ValueError):
+        return False
+    base = b"v0:" + timestamp.encode() + b":" + body
+    expected = "v0=" + hmac.new(secret.encode(), base, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature or "")
+
+
+def is_loopback_host(host: str) -> bool:
+    """바인드 주소가 loopback(127.0.0.0/8, ::1, localhost)인지 확인"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def decode_pubsub_message(payload: dict) -> dict:
+    """
+    Pub/Sub push 요청 본문 → message.data JSON
+
+    Raises:
+        HttpError: message.data가 없거나 base64/JSON이 아닌 경우 (400)
+    """
+    data = (payload.get("message") or {}).get("data")
+    if not data:
+        raise HttpError(400, "missing message.data")
+    try:
+        # 표준/URL-safe base64 모두 허용
+        data = data.replace("-", "+").replace("_", "/")
+        return json.loads(base64.b64decode(data + "=" * (-len(data) % 4)))
+    except (binascii.Error, ValueError) as e:
+        raise HttpError(400, f"invalid message.data: {e}") from e
+
+
+class PushListener:
+    """
+    Slack/Gmail push 수신 HTTP 서버
+
+    요청 본문을 검증/디코딩한 뒤 on_push(채널, payload)를 호출합니다.
+    on_push는 어댑터의 handle_push 결과를 파이프라인에 넣고 메시지 수를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        on_push: PushHandler,
+        host: str = "127.0.0.1",
+        port: int = 8800,
+        slack_signing_secret: str | None = None,
+        gmail_token: str | None = None,
+    ):
+        """
+        Args:
+            on_push: push payload 처리 콜백
+            host: 바인드 주소
+            port: 바인드 포트 (0이면 임의 포트)
+            slack_signing_secret: Slack 서명 검증 secret (None이면 검증 생략, loopback 바인드만 허용)
+            gmail_token: Gmail push endpoint ?token= 값 (None이면 검증 생략, loopback 바인드만 허용)
+        """
+        self._on_push = on_push
+        self.host = host
+        self._port = port
+        self._slack_signing_secret = slack_signing_secret
+        self._gmail_token = gmail_token
+        self._server: asyncio.Server | None = None
+        self._stats: dict[str, int] = {
+            "requests": 0, "messages": 0, "rejected": 0, "errors": 0,
+        }
+
+    @property
+    def port(self) -> int:
+        """실제 바인드된 포트 (port=0으로 시작한 경우 포함)"""
+        if self._server and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        """
+        HTTP 서버 시작
+
+        Raises:
+            ValueError: 검증 secret 없이 loopback이 아닌 주소에 바인드하려는 경우
+        """
+        missing = [
+            name for name, value in (
+                ("slack_signing_secret", self._slack_signing_secret), ("gmail_token", self._gmail_token),
+            ) if not value
+        ]
+        if missing and not is_loopback_host(self.host):
+            raise ValueError(f"{', '.join(missing)} 없이 {self.host}에 바인드할 수 없습니다 (loopback만 허용)")
+        if missing:
+            print(f"[PushListener] 경고: {', '.join(missing)} 미설정 - 해당 push 요청을 검증 없이 수신합니다")
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self._port)
+
+    async def stop(self) -> None:
+        """새 연결 수신 중지 후 서버 종료"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def get_stats(self) -> dict:
+        return {"running": self.is_running, "port": self.port, **self._stats}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._stats["requests"] += 1
+        try:
+            status, body = await asyncio.wait_for(self._handle_request(reader), REQUEST_TIMEOUT)
+        except TimeoutError:
+            status, body = 408, {"error": "request timeout"}
+        except asyncio.IncompleteReadError:
+            status, body = 400, {"error": "incomplete body"}
+        except HttpError as e:
+            status, body = e.status, {"error": e.message}
+        except Exception as e:
+            self._stats["errors"] += 1
+            print(f"[PushListener] 요청 처리 오류: {e}")
+            status, body = 500, {"error": "internal error"}
+        if status in (400, 401, 405, 413):
+            self._stats["rejected"] += 1
+
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> tuple[int, dict]:
+        """요청 한 건 파싱 및 라우팅 → (status, 응답 JSON)"""
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "malformed request line") from None
+
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "invalid content-length") from None
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "body too large")
+        body = await reader.readexactly(length) if length > 0 else b""
+
+        path, _, query = target.partition("?")
+        if path == HEALTH_PATH:
+            if method != "GET":
+                raise HttpError(405, "method not allowed")
+            return 200, self.get_stats()
+        if path not in (SLACK_EVENTS_PATH, GMAIL_PUSH_PATH):
+            raise HttpError(404, "not found")
+        if method != "POST":
+            raise HttpError(405, "method not allowed")
+
+        if path == SLACK_EVENTS_PATH:
+            return await self._handle_slack(headers, body)
+        return await self._handle_gmail(parse_qs(query), body)
+
+    async def _handle_slack(self, headers: dict[str, str], body: bytes) -> tuple[int, dict]:
+        if self._slack_signing_secret and not verify_slack_signature(
+            self._slack_signing_secret,
+            headers.get("x-slack-request-timestamp", ""),
+            body,
+            headers.get("x-slack-signature", ""),
+        ):
+            raise HttpError(401, "invalid slack signature")
+
+        payload = _load_json(body)
+        if payload.get("type") == "url_verification":
+            return 200, {"challenge": payload.get("challenge", "")}
+        return await self._dispatch(ChannelType.SLACK, payload)
+
+    async def _handle_gmail(self, query: dict[str, list[str]], body: bytes) -> tuple[int, dict]:
+        if self._gmail_token and not hmac.compare_digest(
+            (query.get("token") or [""])[0], self._gmail_token
+        ):
+            raise HttpError(401, "invalid push token")
+        return await self._dispatch(ChannelType.EMAIL, decode_pubsub_message(_load_json(body)))
+
+    async def _dispatch(self, channel: ChannelType, payload: dict) -> tuple[int, dict]:
+        count = await self._on_push(channel, payload)
+        if count is None:
+            raise HttpError(503, f"{channel.value} adapter not connected")
+        self._stats["messages"] += count
+        return 200, {"ok": True, "messages": count}
+
+
+def _load_json(body: bytes) -> dict:
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise HttpError(400, f"invalid json: {e}") from e
+    if not isinstance(payload, dict):
+        raise HttpError(400, "json object expected")
+    return payload
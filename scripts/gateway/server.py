@@ -9,6 +9,8 @@ Usage:
     python server.py stop
     python server.py status
     python server.py channels
+    python server.py rollups
+    python server.py payloads
 
 Examples:
     python server.py start
@@ -20,8 +22,9 @@ import argparse
 import asyncio
 import json
 import signal
+import sqlite3
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -44,20 +47,42 @@ if __name__ == "__main__":
 try:
     from scripts.gateway.adapters.base import ChannelAdapter
     from scripts.gateway.channel_registry import ChannelRegistry
+    from scripts.gateway.models import ChannelType
     from scripts.gateway.pipeline import MessagePipeline
+    from scripts.gateway.push_listener import PushListener
     from scripts.gateway.storage import UnifiedStorage
 except ImportError:
     try:
         from gateway.adapters.base import ChannelAdapter
         from gateway.channel_registry import ChannelRegistry
+        from gateway.models import ChannelType
         from gateway.pipeline import MessagePipeline
+        from gateway.push_listener import PushListener
         from gateway.storage import UnifiedStorage
     except ImportError:
         from .adapters.base import ChannelAdapter
         from .channel_registry import ChannelRegistry
+        from .models import ChannelType
         from .pipeline import MessagePipeline
+        from .push_listener import PushListener
         from .storage import UnifiedStorage
 
+try:
+    from scripts.shared.metrics import MetricsRegistry, MetricsServer
+except ImportError:
+    try:
+        from shared.metrics import MetricsRegistry, MetricsServer
+    except ImportError:
+        from ..shared.metrics import MetricsRegistry, MetricsServer
+
+try:
+    from scripts.shared.ollama_client import OllamaClient
+except ImportError:
+    try:
+        from shared.ollama_client import OllamaClient
+    except ImportError:
+        from ..shared.ollama_client import OllamaClient
+
 
 # 기본 경로
 DEFAULT_CONFIG_PATH = Path(r"C:\claude\secretary\config\gateway.json")
@@ -100,6 +125,41 @@ def load_config(config_path: Path | None = None) -> dict[str, Any]:
             "require_confirmation": True,
             "rate_limit_per_minute": 10,
         },
+        "admission": {
+            "enabled": False,
+            "channel_per_minute": 60,
+            "channel_burst": 30,
+            "sender_burst": 10,
+            "bypass_priorities": ["urgent", "high"],
+            "overflow": "coalesce",
+        },
+        "storage": {
+            "write_behind": False,
+            "batch_size": 500,
+            "flush_interval": 0.5,
+        },
+        "retention": {
+            "enabled": False,
+            "days": 90,
+            "interval_hours": 6,
+            "batch_size": 1000,
+            "vacuum_pages": 2000,
+        },
+        "push": {
+            "enabled": False,
+            "host": "127.0.0.1",
+            "reconcile_interval": 300,
+            "slack_signing_secret": None,
+            "gmail_token": None,
+        },
+        "shutdown": {
+            "drain_timeout": 30,
+        },
+        "metrics": {
+            "enabled": True,
+            "host": "127.0.0.1",
+            "port": 9108,
+        },
     }
 
 
@@ -110,6 +170,7 @@ class SecretaryGateway:
     Features:
     - 여러 채널 어댑터 관리
     - 통합 메시지 파이프라인
+    - push 수신 (port에서 Slack Events API / Gmail Pub/Sub 요청 수신, polling은 누락 보정 sweep)
     - CLI 인터페이스
 
     Example:
@@ -130,12 +191,18 @@ class SecretaryGateway:
         self.storage: UnifiedStorage | None = None
         self._running = False
         self._tasks: list[asyncio.Task] = []
+        self._listen_tasks: list[asyncio.Task] = []
         self._start_time: datetime | None = None
         self._reporter = None
         self._intel_storage = None
         self._intel_handler = None
         self._channel_registry: ChannelRegistry | None = None
         self._channel_watcher = None
+        self._push_listener: PushListener | None = None
+        self._metrics_server: MetricsServer | None = None
+        self._messages_received = MetricsRegistry.get_instance().counter(
+            "secretary_messages_received_total", "채널별 수신 메시지 수", ("channel",)
+        )
 
     async def start(self) -> None:
         """Gateway 시작"""
@@ -152,15 +219,29 @@ class SecretaryGateway:
         data_dir = Path(self.config.get("data_dir", str(DEFAULT_DATA_DIR)))
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        self.storage = UnifiedStorage(data_dir / "gateway.db")
+        storage_cfg = self.config.get("storage", {})
+        self.storage = UnifiedStorage(
+            data_dir / "gateway.db",
+            write_behind=storage_cfg.get("write_behind", False),
+            batch_size=storage_cfg.get("batch_size", 500),
+            flush_interval=storage_cfg.get("flush_interval", 0.5),
+            archive_dir=data_dir / "archive",
+        )
         await self.storage.connect()
 
         # 파이프라인 초기화
         pipeline_config = self.config.get("pipeline", {})
         safety_cfg = self.config.get("safety", {})
         pipeline_config["rate_limit_per_minute"] = safety_cfg.get("rate_limit_per_minute", 10)
+        # 수용 제어: admission.enabled로 opt-in, 발신자 한도 기본값은 safety.rate_limit_per_minute
+        pipeline_config["admission"] = {"enabled": False, **self.config.get("admission", {})}
 
         self.pipeline = MessagePipeline(self.storage, pipeline_config)
+        await self.pipeline.start()
+
+        # 메트릭 노출 (GET /metrics, Prometheus 텍스트 형식)
+        if self.config.get("metrics", {}).get("enabled", True):
+            await self._start_metrics_server()
 
         # 어댑터 연결
         await self._connect_adapters()
@@ -168,6 +249,10 @@ class SecretaryGateway:
         self._running = True
         self._start_time = datetime.now()
 
+        # push 수신 (listen 루프 시작 전에 polling 간격 전환)
+        if self.config.get("push", {}).get("enabled", False):
+            await self._start_push_listener()
+
         print(f"Gateway 시작 완료 (포트: {self.config.get('port', 8800)})")
         print(f"활성화된 채널: {list(self.adapters.keys())}")
         print("종료: Ctrl+C")
@@ -178,6 +263,13 @@ class SecretaryGateway:
         # FR-04: 초기 채널 덤프 (덤프 없는 채널만, 백그라운드)
         asyncio.create_task(self._run_initial_channel_dumps())
 
+        # 이전 실행에서 중단된 메시지 재처리 (처리 원장 기준, 백그라운드)
+        asyncio.create_task(self._replay_pending())
+
+        # 보존 기간 지난 메시지 월별 아카이브 + 공간 회수 (주기 실행)
+        if self.config.get("retention", {}).get("enabled", False):
+            self._tasks.append(asyncio.create_task(self._retention_loop()))
+
         # 메시지 수신 루프 시작
         await self._message_loop()
 
@@ -191,10 +283,61 @@ class SecretaryGateway:
 
         self._running = False
 
+        # push 수신 중지 (새 요청 거부)
+        if self._push_listener:
+            try:
+                await self._push_listener.stop()
+                print("  - Push listener 중지")
+            except Exception as e:
+                print(f"  - Push listener 중지 실패: {e}")
+
+        if self._metrics_server:
+            await self._metrics_server.stop()
+
+        drain_timeout = self.config.get("shutdown", {}).get("drain_timeout", 30)
+
+        # 수신 중단: 어댑터가 이미 조회한 메시지까지 파이프라인에 넣은 뒤 listen 종료
+        for adapter in self.adapters.values():
+            adapter.stop_listening()
+        if self._listen_tasks:
+            _, pending = await asyncio.wait(self._listen_tasks, timeout=drain_timeout)
+            if pending:
+                print(f"  - 수신 루프 {len(pending)}개 종료 대기 시간 초과, 취소")
+
         # 진행 중인 태스크 취소
         for task in self._tasks:
             task.cancel()
 
+        # 파이프라인 스테이지 큐 drain (수신 중단 후 남은 메시지 처리, 남으면 처리 원장에 checkpoint)
+        if self.pipeline:
+            try:
+                await self.pipeline.stop(drain=True, timeout=drain_timeout)
+                print("  - Pipeline 스테이지 drain 완료")
+            except Exception as e:
+                print(f"  - Pipeline 중지 실패: {e}")
+
+        # Intelligence 큐 drain (끝내지 못한 메시지는 처리 원장에 남겨 재시작 후 handlers부터 재처리)
+        if self._intel_handler:
+            try:
+                leftover = await self._intel_handler.drain(timeout=drain_timeout)
+                if leftover and self.storage:
+                    requeued = await self.storage.record_stage_many(
+                        [getattr(item, "original", item).id for item, _ in leftover], "dispatch"
+                    )
+                    print(f"  - Intelligence 미처리 {requeued}건 처리 원장에 보존")
+                print("  - Intelligence 워커 중지")
+            except Exception as e:
+                print(f"  - Intelligence 워커 중지 실패: {e}")
+
+        # Ollama 공유 연결 풀 종료 (drain 이후: 남은 분석 요청이 없음)
+        try:
+            await OllamaClient.shutdown()
+        except Exception as e:
+            print(f"  - Ollama 연결 풀 종료 실패: {e}")
+
+        # 어댑터 조회 위치 저장 (재시작 시 이어서 조회)
+        await self._save_cursors()
+
         # 어댑터 연결 해제
         for name, adapter in self.adapters.items():
             try:
@@ -219,14 +362,6 @@ class SecretaryGateway:
             except Exception as e:
                 print(f"  - ChannelWatcher 중지 실패: {e}")
 
-        # Intelligence 워커 중지
-        if self._intel_handler:
-            try:
-                await self._intel_handler.stop_worker()
-                print("  - Intelligence 워커 중지")
-            except Exception as e:
-                print(f"  - Intelligence 워커 중지 실패: {e}")
-
         # Intelligence 스토리지 종료
         if self._intel_storage:
             try:
@@ -263,6 +398,7 @@ class SecretaryGateway:
                 # 메시지 수신 태스크 시작
                 task = asyncio.create_task(self._adapter_listen_loop(adapter))
                 self._tasks.append(task)
+                self._listen_tasks.append(task)
 
     async def _connect_adapters(self) -> None:
         """설정된 어댑터 연결"""
@@ -300,6 +436,7 @@ class SecretaryGateway:
                 continue
 
             adapter = self.adapters[channel_name]
+            await self._restore_cursors(channel_name, adapter)
             success = await adapter.connect()
             if success:
                 print(f"  - {channel_name} 어댑터 연결 성공")
@@ -309,12 +446,37 @@ class SecretaryGateway:
         # Intelligence 핸들러 등록
         await self._register_intelligence_handler()
 
+    async def _restore_cursors(self, channel_name: str, adapter: ChannelAdapter) -> None:
+        """이전 종료 시 저장한 조회 위치 복원 (connect() 전)"""
+        if not self.storage:
+            return
+        try:
+            cursors = await self.storage.load_cursors(channel_name)
+            if cursors:
+                adapter.restore_cursors(cursors)
+        except Exception as e:
+            print(f"  - {channel_name} 조회 위치 복원 실패 (시작 시점부터 조회): {e}")
+
+    async def _save_cursors(self) -> None:
+        """어댑터별 조회 위치 저장 (수신 중단 + drain 이후)"""
+        if not self.storage:
+            return
+        for name, adapter in self.adapters.items():
+            try:
+                await self.storage.save_cursors(name, adapter.get_cursors())
+            except Exception as e:
+                print(f"  - {name} 조회 위치 저장 실패: {e}")
+
     def _create_adapter(self, channel_name: str, config: dict):
         """채널 이름으로 어댑터 자동 생성"""
+        if channel_name in ("gmail", "email"):
+            # 처리한 메시지 ID를 data_dir에 영속화 (재시작 시 마지막 창 재조회 방지)
+            data_dir = Path(self.config.get("data_dir", str(DEFAULT_DATA_DIR)))
+            config = {"seen_ids_path": str(data_dir / "gmail_seen_ids.txt"), **config}
         try:
             if channel_name == "slack":
                 from scripts.gateway.adapters.slack import SlackAdapter
-                return SlackAdapter(config)
+                return SlackAdapter(config, storage=self.storage)
             elif channel_name in ("gmail", "email"):
                 from scripts.gateway.adapters.gmail import GmailAdapter
                 return GmailAdapter(config)
@@ -322,7 +484,7 @@ class SecretaryGateway:
             try:
                 if channel_name == "slack":
                     from gateway.adapters.slack import SlackAdapter
-                    return SlackAdapter(config)
+                    return SlackAdapter(config, storage=self.storage)
                 elif channel_name in ("gmail", "email"):
                     from gateway.adapters.gmail import GmailAdapter
                     return GmailAdapter(config)
@@ -355,6 +517,10 @@ class SecretaryGateway:
             ollama_config = intel_config.get("ollama")
             claude_config = intel_config.get("claude_draft")
 
+            # Ollama 공유 연결 풀 설정 (intelligence.ollama.pool: max_connections 등)
+            if ollama_config and ollama_config.get("pool"):
+                OllamaClient.configure(**ollama_config["pool"])
+
             # 레지스트리 우선, 없으면 gateway.json 폴백
             if self._channel_registry is not None:
                 chatbot_channels = self._channel_registry.get_by_role("chatbot", "slack")
@@ -367,6 +533,7 @@ class SecretaryGateway:
                 ollama_config=ollama_config,
                 claude_config=claude_config,
                 chatbot_channels=chatbot_channels,
+                worker_config=intel_config.get("workers"),
             )
 
             # handler 참조 보관 (종료 시 worker 정리용)
@@ -377,7 +544,7 @@ class SecretaryGateway:
 
             # PriorityQueue 워커 시작
             await handler.start_worker()
-            print("  - Intelligence PriorityQueue 워커 시작")
+            print(f"  - Intelligence 워커 시작 ({handler.worker_count}개)")
 
             # Reporter 초기화 (gateway.json의 reporter 섹션)
             reporter_config = self.config.get("reporter", {})
@@ -413,6 +580,54 @@ class SecretaryGateway:
         except Exception as e:
             print(f"  - Intelligence 핸들러 등록 실패: {e}")
 
+    async def _replay_pending(self) -> None:
+        """
+        처리 원장에 남은 메시지를 마지막 완료 stage 다음부터 재처리
+
+        replay()는 한 번에 limit건만 읽으므로 남은 항목이 없을 때까지 반복합니다.
+        실패한 메시지는 attempts가 늘어 max_attempts에 도달하면 대상에서 빠집니다.
+        처리 완료는 즉시 commit되므로 끝난 메시지는 다시 처리하지 않지만, stage 기록은
+        다음 commit까지 버퍼되므로 처리 도중 종료되면 dispatch가 한 번 더 실행될 수 있습니다.
+        """
+        max_attempts = 5
+        total = failed = 0
+        try:
+            while self._running:
+                results = await self.pipeline.replay(max_attempts=max_attempts)
+                total += len(results)
+                failed += sum(1 for r in results if r.error)
+                # 원본이 없는 항목만 정리된 배치는 빈 결과이므로 원장을 다시 확인
+                if not results and not await self.storage.get_processing_states(1, max_attempts):
+                    break
+        except Exception as e:
+            print(f"  - 미완료 메시지 재처리 실패: {e}")
+        if total:
+            print(f"  - 미완료 메시지 재처리: {total}건 (실패 {failed}건)")
+
+    async def _retention_loop(self) -> None:
+        """retention.days 이전 메시지를 월별 아카이브로 옮기고 빈 페이지 회수 (interval_hours 주기)"""
+        retention_cfg = self.config.get("retention", {})
+        days = retention_cfg.get("days", 90)
+        interval = retention_cfg.get("interval_hours", 6) * 3600
+        while self._running:
+            try:
+                cutoff = datetime.now() - timedelta(days=days)
+                archived = await self.storage.archive_messages(
+                    cutoff, batch_size=retention_cfg.get("batch_size", 1000)
+                )
+                # incremental vacuum은 주기마다 vacuum_pages씩 나눠서 회수
+                vacuum = await self.storage.reclaim_space(retention_cfg.get("vacuum_pages", 2000))
+                if archived or vacuum["freed_pages"]:
+                    print(
+                        f"  - 메시지 아카이브: {sum(archived.values())}건 ({', '.join(sorted(archived))}),"
+                        f" 회수 {vacuum['freed_pages']} 페이지 ({vacuum['mode']})"
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"  - 메시지 아카이브 실패: {e}")
+            await asyncio.sleep(interval)
+
     async def _run_initial_channel_dumps(self) -> None:
         """FR-04: 등록된 채널 중 덤프 파일 없는 채널을 백그라운드로 덤프."""
         try:
@@ -501,24 +716,96 @@ class SecretaryGateway:
         channel_name = adapter.channel_type.value if adapter.channel_type else "unknown"
 
         try:
+            # 종료 시 stop_listening()으로 listen()이 스스로 끝나므로 조회한 메시지는 모두 전달
             async for message in adapter.listen():
-                if not self._running:
-                    break
-
-                # 파이프라인 처리
-                if self.pipeline:
-                    result = await self.pipeline.process(message)
-
-                    if result.error:
-                        print(f"[{channel_name}] 처리 오류: {result.error}")
-                    elif result.priority == "urgent":
-                        print(f"[{channel_name}] 긴급 메시지: {message.sender_name}")
+                await self._submit(channel_name, message)
 
         except asyncio.CancelledError:
             pass
         except Exception as e:
             print(f"[{channel_name}] 수신 오류: {e}")
 
+    async def _submit(self, channel_name: str, message) -> None:
+        """파이프라인 처리 (스테이지 모드면 큐에 넣고 바로 반환)"""
+        self._messages_received.labels(channel_name).inc()
+        if self.pipeline:
+            future = await self.pipeline.submit(message)
+            future.add_done_callback(
+                lambda f, m=message: self._report_result(channel_name, m, f)
+            )
+
+    async def _start_metrics_server(self) -> None:
+        """metrics.host:metrics.port에서 /metrics 노출 (실패해도 Gateway는 계속 실행)"""
+        metrics_cfg = self.config.get("metrics", {})
+        server = MetricsServer(host=metrics_cfg.get("host", "127.0.0.1"), port=metrics_cfg.get("port", 9108))
+        try:
+            await server.start()
+        except OSError as e:
+            print(f"  - Metrics 서버 시작 실패: {e}")
+            return
+        self._metrics_server = server
+        print(f"  - Metrics: http://{server.host}:{server.port}/metrics")
+
+    async def _start_push_listener(self) -> None:
+        """push 지원 어댑터를 push 모드로 전환하고 port에서 push 수신 시작"""
+        push_cfg = self.config.get("push", {})
+        listener = PushListener(
+            self._on_push,
+            host=push_cfg.get("host", "127.0.0.1"),
+            port=self.config.get("port", 8800),
+            slack_signing_secret=push_cfg.get("slack_signing_secret"),
+            gmail_token=push_cfg.get("gmail_token"),
+        )
+        try:
+            await listener.start()
+        except (OSError, ValueError) as e:
+            print(f"  - Push listener 시작 실패 (polling 유지): {e}")
+            return
+        self._push_listener = listener
+
+        reconcile_interval = push_cfg.get("reconcile_interval", 300)
+        pushed = []
+        for name, adapter in self.adapters.items():
+            if adapter.supports_push and adapter.is_connected:
+                adapter.enable_push(reconcile_interval)
+                pushed.append(name)
+        print(
+            f"  - Push listener 시작 ({listener.host}:{listener.port}, 채널: {pushed},"
+            f" reconciliation {reconcile_interval}초)"
+        )
+
+    async def _on_push(self, channel: ChannelType, payload: dict) -> int | None:
+        """
+        push payload를 채널 어댑터로 정규화해 파이프라인에 전달
+
+        Returns:
+            파이프라인에 넣은 메시지 수 (push 모드 어댑터가 없으면 None)
+        """
+        adapter = next(
+            (
+                a for a in self.adapters.values()
+                if a.channel_type == channel and a.push_enabled and a.is_connected
+            ),
+            None,
+        )
+        if adapter is None or not self._running:
+            return None
+        messages = await adapter.handle_push(payload)
+        for message in messages:
+            await self._submit(channel.value, message)
+        return len(messages)
+
+    @staticmethod
+    def _report_result(channel_name: str, message, future: asyncio.Future) -> None:
+        """파이프라인 처리 결과 로그 (오류, 긴급 메시지)"""
+        if future.cancelled():
+            return
+        result = future.result()
+        if result.error:
+            print(f"[{channel_name}] 처리 오류: {result.error}")
+        elif result.priority == "urgent":
+            print(f"[{channel_name}] 긴급 메시지: {message.sender_name}")
+
     def get_status(self) -> dict[str, Any]:
         """
         상태 조회
@@ -544,6 +831,9 @@ class SecretaryGateway:
             "adapters": adapters_status,
             "adapters_count": len(self.adapters),
             "tasks_count": len(self._tasks),
+            "pipeline": self.pipeline.get_stats() if self.pipeline else None,
+            "push": self._push_listener.get_stats() if self._push_listener else None,
+            "metrics_port": self._metrics_server.port if self._metrics_server else None,
         }
 
     def _write_pid(self) -> None:
@@ -727,6 +1017,7 @@ def cmd_status(args: argparse.Namespace) -> None:
 
     if pid is None:
         print("Gateway 상태: 중지됨")
+        asyncio.run(_print_message_summary(args))
         return
 
     # 프로세스 존재 여부 확인
@@ -751,6 +1042,87 @@ def cmd_status(args: argparse.Namespace) -> None:
         if PID_FILE.exists():
             PID_FILE.unlink()
 
+    asyncio.run(_print_message_summary(args))
+
+
+def _gateway_db_path(args: argparse.Namespace) -> Path:
+    config = load_config(Path(args.config) if args.config else None)
+    return Path(config.get("data_dir", str(DEFAULT_DATA_DIR))) / "gateway.db"
+
+
+async def _print_message_summary(args: argparse.Namespace) -> None:
+    """오늘 메시지 집계 출력 (message_rollups_hourly 조회, 메시지 수와 무관한 비용)"""
+    db_path = _gateway_db_path(args)
+    if not db_path.exists():
+        return
+
+    since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    # 실행 중인 Gateway와 경합하지 않도록 스키마 초기화 없이 읽기 전용으로 조회
+    try:
+        async with UnifiedStorage(db_path, read_only=True) as storage:
+            counts = await storage.get_message_counts(since)
+    except sqlite3.OperationalError as e:
+        print(f"메시지 집계 조회 실패 (rollups 명령으로 집계 생성 필요): {e}")
+        return
+
+    by_priority = counts["by_priority"]
+    print(
+        f"오늘 메시지: {counts['total']}건"
+        f" (긴급 {by_priority.get('urgent', 0)}, 높음 {by_priority.get('high', 0)},"
+        f" 액션 {counts['actions']})"
+    )
+    for channel, count in sorted(counts["by_channel"].items()):
+        print(f"  {channel}: {count}건")
+
+
+def cmd_rollups(args: argparse.Namespace) -> None:
+    """rollups 명령 처리 (기존 DB의 시간 단위 집계 backfill)"""
+    db_path = _gateway_db_path(args)
+    if not db_path.exists():
+        print(f"DB 파일이 없습니다: {db_path}")
+        return
+
+    async def rebuild() -> int:
+        async with UnifiedStorage(db_path) as storage:
+            return await storage.rebuild_rollups()
+
+    hours = asyncio.run(rebuild())
+    print(f"시간 단위 집계 재계산 완료: {hours}개 버킷")
+
+
+def cmd_payloads(args: argparse.Namespace) -> None:
+    """payloads 명령 처리 (기존 DB의 큰 인라인 raw_json을 압축 payload 테이블로 이동)"""
+    db_path = _gateway_db_path(args)
+    if not db_path.exists():
+        print(f"DB 파일이 없습니다: {db_path}")
+        return
+
+    async def compact() -> tuple[int, dict]:
+        async with UnifiedStorage(db_path) as storage:
+            moved = await storage.compact_payloads()
+            return moved, await storage.reclaim_space()
+
+    moved, vacuum = asyncio.run(compact())
+    print(f"payload 이동 완료: {moved}건, 회수 {vacuum['freed_pages']} 페이지 ({vacuum['mode']})")
+
+
+def cmd_vacuum(args: argparse.Namespace) -> None:
+    """vacuum 명령 처리 (전체 VACUUM + auto_vacuum=INCREMENTAL 전환, Gateway 중지 상태에서 실행)"""
+    db_path = _gateway_db_path(args)
+    if not db_path.exists():
+        print(f"DB 파일이 없습니다: {db_path}")
+        return
+    if SecretaryGateway.get_running_pid() is not None:
+        print("Gateway 실행 중에는 vacuum을 실행할 수 없습니다. 먼저 stop 하세요.")
+        return
+
+    async def vacuum() -> dict:
+        async with UnifiedStorage(db_path) as storage:
+            return await storage.vacuum()
+
+    result = asyncio.run(vacuum())
+    print(f"VACUUM 완료: 회수 {result['freed_pages']} 페이지 (auto_vacuum=INCREMENTAL)")
+
 
 def cmd_channels(args: argparse.Namespace) -> None:
     """channels 명령 처리"""
@@ -782,6 +1154,9 @@ Examples:
   python server.py stop               # Gateway 중지
   python server.py status             # 상태 확인
   python server.py channels           # 채널 목록
+  python server.py rollups            # 시간 단위 집계 backfill
+  python server.py payloads           # 큰 raw_json 압축 payload로 이동
+  python server.py vacuum             # 전체 VACUUM (Gateway 중지 상태, 1회)
         """,
     )
 
@@ -815,6 +1190,15 @@ Examples:
     # channels 명령
     subparsers.add_parser("channels", help="채널 목록")
 
+    # rollups 명령
+    subparsers.add_parser("rollups", help="시간 단위 메시지 집계 backfill")
+
+    # payloads 명령
+    subparsers.add_parser("payloads", help="큰 raw_json을 압축 payload 테이블로 이동")
+
+    # vacuum 명령
+    subparsers.add_parser("vacuum", help="전체 VACUUM 후 incremental vacuum 모드로 전환")
+
     args = parser.parse_args()
 
     if args.command is None:
@@ -829,6 +1213,12 @@ Examples:
         cmd_status(args)
     elif args.command == "channels":
         cmd_channels(args)
+    elif args.command == "rollups":
+        cmd_rollups(args)
+    elif args.command == "payloads":
+        cmd_payloads(args)
+    elif args.command == "vacuum":
+        cmd_vacuum(args)
 
 
 if __name__ == "__main__":
@@ -8,9 +8,15 @@ Note:
     이 모듈은 models.NormalizedMessage를 DB 형식으로 변환/저장하는 역할을 합니다.
 """
 
+import asyncio
 import json
+import operator
+import re
 import sys
-from datetime import datetime
+import time
+import zlib
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -25,12 +31,55 @@ if __name__ == "__main__":
 
 # models.py의 NormalizedMessage 사용 (단일 정의)
 try:
-    from scripts.gateway.models import ChannelType, MessageType, NormalizedMessage, Priority
+    from scripts.gateway.models import (
+        ChannelType,
+        MessageType,
+        NormalizedMessage,
+        Priority,
+        StoredMessage,
+    )
 except ImportError:
     try:
-        from gateway.models import ChannelType, MessageType, NormalizedMessage, Priority
+        from gateway.models import (
+            ChannelType,
+            MessageType,
+            NormalizedMessage,
+            Priority,
+            StoredMessage,
+        )
     except ImportError:
-        from .models import ChannelType, MessageType, NormalizedMessage, Priority
+        from .models import ChannelType, MessageType, NormalizedMessage, Priority, StoredMessage
+
+try:
+    from scripts.shared.sqlite_profile import (
+        GATEWAY_ARCHIVE_PROFILE,
+        GATEWAY_PROFILE,
+        SQLiteProfile,
+        open_connection,
+    )
+except ImportError:
+    try:
+        from shared.sqlite_profile import (
+            GATEWAY_ARCHIVE_PROFILE,
+            GATEWAY_PROFILE,
+            SQLiteProfile,
+            open_connection,
+        )
+    except ImportError:
+        from ..shared.sqlite_profile import (
+            GATEWAY_ARCHIVE_PROFILE,
+            GATEWAY_PROFILE,
+            SQLiteProfile,
+            open_connection,
+        )
+
+try:
+    from scripts.shared.metrics import MetricsRegistry
+except ImportError:
+    try:
+        from shared.metrics import MetricsRegistry
+    except ImportError:
+        from ..shared.metrics import MetricsRegistry
 
 # 기본 DB 경로
 DEFAULT_DB_PATH = Path(r"C:\claude\secretary\data\gateway.db")
@@ -57,12 +106,81 @@ CREATE TABLE IF NOT EXISTS messages (
     received_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_messages_channel ON messages(channel);
-CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_messages_priority ON messages(priority);
-CREATE INDEX IF NOT EXISTS idx_messages_processed ON messages(processed_at);
+-- messages 인덱스는 project_id 컬럼 마이그레이션 이후 INDEX_MIGRATIONS에서 생성
+
+-- 처리 중/실패 메시지 원장 (완료 시 삭제되므로 작게 유지)
+CREATE TABLE IF NOT EXISTS processing_state (
+    message_id TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at DATETIME NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS user_directory (
+    channel TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (channel, user_id)
+);
+
+-- 월별 아카이브 파일로 옮긴 메시지 위치 (get_message 폴백)
+CREATE TABLE IF NOT EXISTS archive_index (
+    message_id TEXT PRIMARY KEY,
+    month TEXT NOT NULL
+);
+
+-- 시간 단위 메시지 집계 (ROLLUP_TRIGGERS가 행 단위 증감으로 유지, hour는 UTC, NULL 차원은 '')
+CREATE TABLE IF NOT EXISTS message_rollups_hourly (
+    hour TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    project_id TEXT NOT NULL DEFAULT '',
+    priority TEXT NOT NULL DEFAULT '',
+    message_count INTEGER NOT NULL DEFAULT 0,
+    action_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour, channel, project_id, priority)
+);
+
+-- 큰 raw_json 원본 (messages 행 밖에 압축 저장, include_raw/get_raw_json 조회 시에만 읽음)
+CREATE TABLE IF NOT EXISTS message_payloads (
+    message_id TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    raw_json BLOB NOT NULL
+);
+
+-- 어댑터별 조회 위치 (종료 시 checkpoint, 재시작 시 이어서 조회)
+CREATE TABLE IF NOT EXISTS channel_cursors (
+    adapter TEXT NOT NULL,
+    cursor_key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at DATETIME NOT NULL,
+    PRIMARY KEY (adapter, cursor_key)
+);
 """
 
+# 복합/커버링 인덱스 (실제 쿼리 집합 기준 설계, 멱등)
+# 쿼리 플랜 회귀는 tests/test_query_plans.py에서 검사합니다.
+INDEX_MIGRATIONS = [
+    # 아래 복합 인덱스의 선두 컬럼과 중복되는 단일 컬럼 인덱스 (쓰기 비용만 발생)
+    "DROP INDEX IF EXISTS idx_messages_channel",
+    "DROP INDEX IF EXISTS idx_messages_timestamp",
+    "DROP INDEX IF EXISTS idx_messages_priority",
+    "DROP INDEX IF EXISTS idx_messages_processed",
+    "DROP INDEX IF EXISTS idx_messages_project_id",
+    # DigestReport 집계는 message_rollups_hourly를 읽으므로 messages 집계용 인덱스는 쓰기 비용만 발생
+    "DROP INDEX IF EXISTS idx_messages_priority_ts",
+    "DROP INDEX IF EXISTS idx_messages_action_ts",
+    # iter_recent/get_recent_messages: 필터 등호 → (timestamp, id) keyset 정렬
+    "CREATE INDEX IF NOT EXISTS idx_messages_ts_id ON messages(timestamp, id)",
+    "CREATE INDEX IF NOT EXISTS idx_messages_channel_ts ON messages(channel, timestamp, id)",
+    "CREATE INDEX IF NOT EXISTS idx_messages_project_ts ON messages(project_id, timestamp, id)",
+    # iter_unprocessed: 미처리 backlog만 담는 부분 인덱스 (처리 완료 시 빠져나가 작게 유지)
+    "CREATE INDEX IF NOT EXISTS idx_messages_unprocessed ON messages(timestamp, id) WHERE processed_at IS NULL",
+    # get_processing_states 정렬 + attempts 필터, get_stats 원장 집계 (커버링)
+    "CREATE INDEX IF NOT EXISTS idx_state_updated ON processing_state(updated_at, attempts)",
+]
+
 
 def _message_to_db_dict(message: NormalizedMessage, received_at: datetime | None = None,
                         project_id: str | None = None) -> dict[str, Any]:
@@ -90,68 +208,190 @@ def _message_to_db_dict(message: NormalizedMessage, received_at: datetime | None
     return data
 
 
-def _db_row_to_message(row: dict[str, Any]) -> NormalizedMessage:
+def _db_rows_to_messages(rows: list) -> list[NormalizedMessage]:
+    """
+    DB 행 목록을 NormalizedMessage(StoredMessage)로 변환
+
+    컬럼 위치는 첫 행 기준으로 한 번만 계산하고, 행마다 dict 복사나 __post_init__ 검사 없이
+    StoredMessage.from_row로 생성합니다. media_urls JSON은 처음 접근할 때 파싱합니다.
+    조회하지 않은 컬럼(LIGHT_COLUMNS 프로젝션의 raw_json)은 None입니다.
+
+    Args:
+        rows: 같은 쿼리의 DB 행 목록
+
+    Returns:
+        NormalizedMessage 목록
+    """
+    if not rows:
+        return []
+    keys = rows[0].keys()
+    missing = len(keys)
+    positions = [keys.index(column) if column in keys else missing for column in HYDRATE_COLUMNS]
+    values = operator.itemgetter(*positions)
+    from_row = StoredMessage.from_row
+    if missing in positions:
+        return [from_row(*values((*row, None))) for row in rows]
+    return [from_row(*values(row)) for row in rows]
+
+
+def _db_row_to_message(row: aiosqlite.Row | dict[str, Any]) -> NormalizedMessage:
     """
     DB 행을 NormalizedMessage로 변환
 
     Args:
-        row: DB 행 데이터
+        row: DB 행 (aiosqlite.Row/sqlite3.Row) 또는 컬럼명 → 값 딕셔너리
 
     Returns:
         NormalizedMessage 인스턴스
     """
-    data = dict(row)
+    if isinstance(row, dict):
+        # dict_keys는 위치 조회(index)가 없으므로 컬럼명으로 직접 조회
+        return StoredMessage.from_row(*(row.get(column) for column in HYDRATE_COLUMNS))
+    return _db_rows_to_messages([row])[0]
 
-    # 채널 타입 변환
-    channel = data.get('channel', 'unknown')
-    try:
-        channel = ChannelType(channel)
-    except ValueError:
-        channel = ChannelType.UNKNOWN
 
-    # 메시지 타입 변환
-    message_type = data.get('message_type', 'text')
-    try:
-        message_type = MessageType(message_type)
-    except ValueError:
-        message_type = MessageType.TEXT
+# save_message INSERT 컬럼 순서 (_message_to_db_dict 키 순서와 동일)
+MESSAGE_COLUMNS = (
+    'id', 'channel', 'channel_id', 'sender_id', 'sender_name', 'text',
+    'message_type', 'timestamp', 'is_group', 'is_mention', 'reply_to_id',
+    'media_urls', 'raw_json', 'priority', 'has_action', 'project_id',
+    'processed_at', 'received_at',
+)
 
-    # 우선순위 변환
-    priority = data.get('priority')
-    if priority:
-        try:
-            priority = Priority(priority)
-        except ValueError:
-            priority = None
-
-    # 타임스탬프 변환
-    timestamp = data.get('timestamp')
-    if timestamp and isinstance(timestamp, str):
-        timestamp = datetime.fromisoformat(timestamp)
-
-    # 미디어 URL 변환
-    media_urls = data.get('media_urls')
-    if media_urls and isinstance(media_urls, str):
-        media_urls = json.loads(media_urls)
-
-    return NormalizedMessage(
-        id=data['id'],
-        channel=channel,
-        channel_id=data['channel_id'],
-        sender_id=data['sender_id'],
-        sender_name=data.get('sender_name'),
-        text=data.get('text', ''),
-        message_type=message_type,
-        timestamp=timestamp or datetime.now(),
-        is_group=bool(data.get('is_group', False)),
-        is_mention=bool(data.get('is_mention', False)),
-        reply_to_id=data.get('reply_to_id'),
-        media_urls=media_urls or [],
-        raw_json=data.get('raw_json'),
-        priority=priority,
-        has_action=bool(data.get('has_action', False)),
-        project_id=data.get('project_id'),
+# StoredMessage.from_row 인자 순서
+HYDRATE_COLUMNS = MESSAGE_COLUMNS[:MESSAGE_COLUMNS.index('processed_at')]
+
+# 덮어쓰기는 INSERT OR REPLACE(DELETE + INSERT) 대신 UPDATE로 처리하여 집계 트리거가 이전 값을 빼도록 함
+INSERT_MESSAGE_SQL = (
+    f"INSERT INTO messages ({', '.join(MESSAGE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in MESSAGE_COLUMNS)}) "
+    f"ON CONFLICT(id) DO UPDATE SET "
+    f"{', '.join(f'{c} = excluded.{c}' for c in MESSAGE_COLUMNS[1:])}, enrichments = NULL"
+)
+
+# 처리 원장 upsert: 오류 기록 시 attempts 증가, 오류 없으면 stage만 갱신
+UPSERT_STATE_SQL = """
+    INSERT INTO processing_state (message_id, stage, attempts, last_error, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(message_id) DO UPDATE SET
+        stage = excluded.stage,
+        attempts = attempts + excluded.attempts,
+        last_error = COALESCE(excluded.last_error, last_error),
+        updated_at = excluded.updated_at
+"""
+MARK_PROCESSED_SQL = "UPDATE messages SET processed_at = ? WHERE id = ?"
+CLEAR_STATE_SQL = "DELETE FROM processing_state WHERE message_id = ?"
+
+# 시간 단위 집계: messages 행 단위 증감 (INSERT는 더하고, 덮어쓰기는 이전 값을 빼고 새 값을 더함)
+# 아카이브(DELETE)는 집계에 반영하지 않으므로 보존 기간이 지난 메시지 수도 유지됩니다.
+# 시간 버킷은 strftime으로 UTC 변환 (timezone 없는 timestamp는 그대로)
+_ROLLUP_HOUR = "strftime('%Y-%m-%dT%H:00:00', {row}.timestamp)"
+_ROLLUP_KEY = "{hour}, {row}.channel, COALESCE({row}.project_id, ''), COALESCE({row}.priority, '')"
+_ROLLUP_ADD = """
+    INSERT INTO message_rollups_hourly (hour, channel, project_id, priority, message_count, action_count)
+    VALUES ({key}, 1, COALESCE({row}.has_action, 0) != 0)
+    ON CONFLICT(hour, channel, project_id, priority) DO UPDATE SET
+        message_count = message_count + 1,
+        action_count = action_count + excluded.action_count;
+"""
+_ROLLUP_SUB = """
+    UPDATE message_rollups_hourly SET
+        message_count = message_count - 1,
+        action_count = action_count - (COALESCE(old.has_action, 0) != 0)
+    WHERE (hour, channel, project_id, priority) = ({key});
+    DELETE FROM message_rollups_hourly
+    WHERE (hour, channel, project_id, priority) = ({key}) AND message_count <= 0;
+"""
+
+
+def _rollup_sql(template: str, row: str) -> str:
+    key = _ROLLUP_KEY.format(hour=_ROLLUP_HOUR.format(row=row), row=row)
+    return template.format(key=key, row=row)
+
+
+ROLLUP_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS trg_messages_rollup_ai AFTER INSERT ON messages BEGIN"
+    + _rollup_sql(_ROLLUP_ADD, "new") + "END",
+    "CREATE TRIGGER IF NOT EXISTS trg_messages_rollup_au"
+    " AFTER UPDATE OF timestamp, channel, project_id, priority, has_action ON messages BEGIN"
+    + _rollup_sql(_ROLLUP_SUB, "old") + _rollup_sql(_ROLLUP_ADD, "new") + "END",
+]
+ROLLUP_CLEAR_SQL = "DELETE FROM message_rollups_hourly WHERE hour = ?"
+
+# raw_json 행 밖 저장: 이 크기(바이트) 이상이면 message_payloads에 zlib 압축 저장
+PAYLOAD_INLINE_MAX = 256
+PAYLOAD_COMPRESS_LEVEL = 6
+_RAW = MESSAGE_COLUMNS.index('raw_json')
+UPSERT_PAYLOAD_SQL = "INSERT OR REPLACE INTO message_payloads (message_id, codec, raw_json) VALUES (?, ?, ?)"
+DELETE_PAYLOAD_SQL = "DELETE FROM message_payloads WHERE message_id = ?"
+
+# 보존 기간 정리: 처리 원장에 남은(처리 중/실패) 메시지는 아카이브하지 않음
+ARCHIVE_SELECT_SQL = """
+    SELECT * FROM messages
+    WHERE timestamp < ? AND NOT EXISTS (
+        SELECT 1 FROM processing_state WHERE message_id = messages.id
     )
+    ORDER BY timestamp LIMIT ?
+"""
+DEFAULT_ARCHIVE_BATCH_SIZE = 1000
+
+# raw_json을 제외한 조회 컬럼 (include_raw=False 프로젝션)
+# media_urls는 작은 메시지 필드라 기본 조회에도 포함합니다 (빈 목록으로 잘못 보이지 않도록).
+LIGHT_COLUMNS = tuple(c for c in MESSAGE_COLUMNS if c != 'raw_json')
+
+# 스트리밍 조회 페이지 크기
+DEFAULT_PAGE_SIZE = 500
+
+# write-behind 기본값
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 0.5  # 초
+
+
+def _hour_bucket(timestamp: str) -> str:
+    """ISO timestamp 문자열의 시간 버킷 ('YYYY-MM-DDTHH:00:00', timezone이 있으면 UTC 기준)"""
+    value = datetime.fromisoformat(timestamp)
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.strftime("%Y-%m-%dT%H:00:00")
+
+
+def _next_hour(hour: str) -> str:
+    return (datetime.fromisoformat(hour) + timedelta(hours=1)).isoformat()
+
+
+def _encode_payload(raw_json: str) -> tuple[str, bytes]:
+    """raw_json → (codec, 저장 바이트). 압축 이득이 없으면 'plain'"""
+    data = raw_json.encode('utf-8')
+    compressed = zlib.compress(data, PAYLOAD_COMPRESS_LEVEL)
+    if len(compressed) < len(data):
+        return 'zlib', compressed
+    return 'plain', data
+
+
+def _decode_payload(codec: str, data: bytes) -> str:
+    if codec == 'zlib':
+        data = zlib.decompress(data)
+    elif codec != 'plain':
+        raise ValueError(f"unknown payload codec: {codec}")
+    return data.decode('utf-8')
+
+
+def _split_payloads(rows: list[tuple]) -> tuple[list[tuple], list[tuple]]:
+    """
+    큰 raw_json을 messages 행에서 분리
+
+    Returns:
+        (raw_json을 NULL로 바꾼 행 목록, message_payloads upsert 파라미터 목록)
+    """
+    out_rows: list[tuple] = []
+    payloads: list[tuple] = []
+    for row in rows:
+        raw = row[_RAW]
+        if raw is not None and len(raw) >= PAYLOAD_INLINE_MAX:
+            payloads.append((row[0], *_encode_payload(raw)))
+            row = (*row[:_RAW], None, *row[_RAW + 1:])
+        out_rows.append(row)
+    return out_rows, payloads
 
 
 class UnifiedStorage:
@@ -161,17 +401,64 @@ class UnifiedStorage:
     Features:
     - 모든 채널의 메시지 저장
     - 인덱싱으로 빠른 조회
-    - 비동기 SQLite 사용
+    - 비동기 SQLite 사용 (GATEWAY_PROFILE: WAL, reader가 writer를 막지 않음)
+    - write-behind 모드 (opt-in): save_message를 버퍼링하여
+      executemany 단일 트랜잭션으로 일괄 저장
+
+    write-behind 모드에서는 batch_size 도달, flush_interval 경과,
+    flush()/close() 호출 시 버퍼가 DB에 기록됩니다.
+    처리 원장 stage 기록(record_stage)은 두 모드 모두 버퍼링되어 다음 메시지 저장
+    트랜잭션이나 flush에 함께 commit됩니다 (실패 기록은 즉시). 기본 모드의 처리 완료
+    (mark_processed)는 버퍼된 stage 기록과 함께 즉시 commit되므로, 반환 후 재시작해도
+    같은 메시지를 다시 처리하지 않습니다.
+    조회 메서드는 실행 전 버퍼를 flush하여 read-your-writes를 보장합니다.
 
     Example:
         async with UnifiedStorage() as storage:
             await storage.save_message(message)
             recent = await storage.get_recent_messages(channel='kakao', limit=10)
+
+        async with UnifiedStorage(write_behind=True) as storage:
+            await storage.save_message(message)
+            await storage.flush()  # 내구성 보장 지점
     """
 
-    def __init__(self, db_path: Path | None = None):
+    PROFILE: SQLiteProfile = GATEWAY_PROFILE
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        write_behind: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        archive_dir: Path | None = None,
+        read_only: bool = False,
+    ):
         self.db_path = db_path or DEFAULT_DB_PATH
         self._connection: aiosqlite.Connection | None = None
+        # 조회 전용 연결 (CLI status 등, 스키마 초기화/마이그레이션 없이 query_only로 열기)
+        self.read_only = read_only
+        # 월별 아카이브 파일 위치 (messages-YYYY-MM.db)
+        self.archive_dir = Path(archive_dir) if archive_dir else Path(self.db_path).parent / "archive"
+
+        # write-behind 버퍼 (message_id → row, 같은 ID는 마지막 값 유지)
+        self.write_behind = write_behind
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._pending: dict[str, tuple] = {}
+        # 같은 트랜잭션으로 기록할 처리 원장 변경 / 처리 완료 (message_id → processed_at)
+        self._pending_states: list[tuple] = []
+        self._pending_done: dict[str, str] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_timer: asyncio.Task | None = None
+        self._commit_seconds = MetricsRegistry.get_instance().histogram(
+            "secretary_db_commit_seconds", "gateway DB commit 소요 시간 (초)"
+        ).labels()
+
+    async def _commit(self) -> None:
+        """commit + 소요 시간 기록"""
+        with self._commit_seconds.time():
+            await self._connection.commit()
 
     async def __aenter__(self):
         await self.connect()
@@ -181,21 +468,21 @@ class UnifiedStorage:
         await self.close()
 
     async def connect(self) -> None:
-        """DB 연결 및 스키마 초기화"""
-        # data 디렉토리 생성
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # DB 연결
-        self._connection = await aiosqlite.connect(str(self.db_path))
-        self._connection.row_factory = aiosqlite.Row
+        """DB 연결 (연결 프로파일 적용) 및 스키마 초기화 (read_only면 DDL 없이 읽기 전용 연결)"""
+        if self.read_only:
+            self._connection = await open_connection(self.db_path, self.PROFILE.reader())
+            return
+        self._connection = await open_connection(self.db_path, self.PROFILE)
 
         # 스키마 초기화
         await self._connection.executescript(SCHEMA)
-        await self._connection.commit()
+        await self._commit()
 
         # 마이그레이션
         await self._migrate_enrichments_column()
         await self._migrate_project_id_column()
+        await self._migrate_indexes()
+        await self._migrate_rollup_triggers()
 
     async def _migrate_enrichments_column(self) -> None:
         """enrichments 컬럼 추가 (멱등)"""
@@ -203,7 +490,7 @@ class UnifiedStorage:
             await self._connection.execute(
                 "ALTER TABLE messages ADD COLUMN enrichments TEXT"
             )
-            await self._connection.commit()
+            await self._commit()
         except Exception as e:
             if "duplicate column" in str(e).lower():
                 pass
@@ -211,24 +498,41 @@ class UnifiedStorage:
                 raise
 
     async def _migrate_project_id_column(self) -> None:
-        """project_id 컬럼 + 인덱스 추가 (멱등)"""
+        """project_id 컬럼 추가 (멱등, 인덱스는 _migrate_indexes에서 생성)"""
         try:
             await self._connection.execute(
                 "ALTER TABLE messages ADD COLUMN project_id TEXT"
             )
-            await self._connection.execute(
-                "CREATE INDEX IF NOT EXISTS idx_messages_project_id ON messages(project_id)"
-            )
-            await self._connection.commit()
+            await self._commit()
         except Exception as e:
             if "duplicate column" in str(e).lower():
                 pass
             else:
                 raise
 
+    async def _migrate_indexes(self) -> None:
+        """단일 컬럼 인덱스를 복합/커버링 인덱스로 교체 (멱등)"""
+        for sql in INDEX_MIGRATIONS:
+            await self._connection.execute(sql)
+        await self._commit()
+
+    async def _migrate_rollup_triggers(self) -> None:
+        """시간 단위 집계 트리거 생성 (멱등, project_id 컬럼 마이그레이션 이후)"""
+        for sql in ROLLUP_TRIGGERS:
+            await self._connection.execute(sql)
+        await self._commit()
+
     async def close(self) -> None:
-        """DB 연결 종료"""
+        """DB 연결 종료 (write-behind 버퍼 flush 후)"""
+        if self._flush_timer and not self._flush_timer.done():
+            self._flush_timer.cancel()
+        self._flush_timer = None
+
         if self._connection:
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[Storage] 종료 전 flush 실패: {e}")
             try:
                 await self._connection.close()
             except Exception:
@@ -236,21 +540,278 @@ class UnifiedStorage:
             self._connection = None
 
     async def save_message(self, message: NormalizedMessage, received_at: datetime | None = None,
-                           project_id: str | None = None) -> str:
-        """메시지 저장 (project_id 포함)"""
+                           project_id: str | None = None, stage: str | None = None) -> str:
+        """
+        메시지 저장 (project_id 포함)
+
+        stage를 지정하면 같은 트랜잭션에서 처리 원장에도 등록합니다 (record_stage 참고).
+        """
         if not self._connection:
             raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
 
         data = _message_to_db_dict(message, received_at, project_id=project_id)
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
+        row = tuple(data[col] for col in MESSAGE_COLUMNS)
+        state = (message.id, stage, 0, None, data['received_at']) if stage else None
 
-        query = f"INSERT OR REPLACE INTO messages ({columns}) VALUES ({placeholders})"
-        await self._connection.execute(query, list(data.values()))
-        await self._connection.commit()
+        if not self.write_behind:
+            # 메시지 행 + 버퍼된 처리 원장 변경을 한 번의 commit으로 기록
+            async with self._flush_lock:
+                states, done = self._pending_states, self._pending_done
+                self._pending_states, self._pending_done = [], {}
+                try:
+                    await self._write_messages([row])
+                    await self._write_ledger(states + [state] if state else states, done)
+                    await self._commit()
+                except Exception:
+                    self._pending_states = states + self._pending_states
+                    self._pending_done = {**done, **self._pending_done}
+                    raise
+            return message.id
 
+        self._pending[message.id] = row
+        if state:
+            self._pending_states.append(state)
+        await self._schedule_flush()
         return message.id
 
+    async def _schedule_flush(self) -> None:
+        """버퍼가 batch_size에 도달하면 즉시, 아니면 flush_interval 후 flush"""
+        if len(self._pending) + len(self._pending_states) + len(self._pending_done) >= self.batch_size:
+            await self.flush()
+        elif self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = asyncio.create_task(self._delayed_flush())
+
+    @property
+    def pending_count(self) -> int:
+        """DB에 아직 기록되지 않은 버퍼 메시지 수"""
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """
+        write-behind 버퍼와 처리 원장 버퍼를 단일 트랜잭션으로 기록 (내구성 barrier)
+
+        버퍼가 비어 있으면 즉시 반환합니다.
+
+        Returns:
+            기록된 메시지 수
+        """
+        async with self._flush_lock:
+            if not self._connection or not (self._pending or self._pending_states or self._pending_done):
+                return 0
+
+            batch, states, done = self._pending, self._pending_states, self._pending_done
+            self._pending, self._pending_states, self._pending_done = {}, [], {}
+            try:
+                if batch:
+                    await self._write_messages(list(batch.values()))
+                await self._write_ledger(states, done)
+                await self._commit()
+            except Exception:
+                # 실패한 배치를 복원 (이후 저장된 같은 ID는 최신 값 유지)
+                self._pending = {**batch, **self._pending}
+                self._pending_states = states + self._pending_states
+                self._pending_done = {**done, **self._pending_done}
+                raise
+            return len(batch)
+
+    async def _write_messages(self, rows: list[tuple]) -> None:
+        """messages 행 + 행 밖 payload 기록, 시간 단위 집계는 트리거가 갱신 (commit은 호출자)"""
+        rows, payloads = _split_payloads(rows)
+        await self._connection.executemany(INSERT_MESSAGE_SQL, rows)
+        # 덮어쓴 메시지의 이전 payload (새 값이 인라인이거나 없는 행, 신규 행은 PK 조회 한 번)
+        outlined = {p[0] for p in payloads}
+        inline = [(row[0],) for row in rows if row[0] not in outlined]
+        if inline:
+            await self._connection.executemany(DELETE_PAYLOAD_SQL, inline)
+        if payloads:
+            await self._connection.executemany(UPSERT_PAYLOAD_SQL, payloads)
+
+    async def _load_payloads(self, message_ids: list[str]) -> dict[str, str]:
+        """message_payloads 일괄 조회 (message_id → raw_json)"""
+        payloads: dict[str, str] = {}
+        for start in range(0, len(message_ids), DEFAULT_PAGE_SIZE):
+            chunk = message_ids[start:start + DEFAULT_PAGE_SIZE]
+            async with self._connection.execute(
+                "SELECT message_id, codec, raw_json FROM message_payloads"
+                f" WHERE message_id IN ({', '.join('?' for _ in chunk)})", chunk
+            ) as cursor:
+                for r in await cursor.fetchall():
+                    payloads[r['message_id']] = _decode_payload(r['codec'], r['raw_json'])
+        return payloads
+
+    async def _rows_to_messages(self, rows: list, include_raw: bool) -> list[NormalizedMessage]:
+        """DB 행 → NormalizedMessage (include_raw면 행 밖 raw_json을 한 번에 채움)"""
+        messages = _db_rows_to_messages(rows)
+        if include_raw:
+            missing = [m.id for m in messages if m.raw_json is None]
+            payloads = await self._load_payloads(missing) if missing else {}
+            for message in messages:
+                if message.id in payloads:
+                    message.raw_json = payloads[message.id]
+        return messages
+
+    async def get_raw_json(self, message_id: str) -> str | None:
+        """
+        메시지 원본 raw_json 조회 (include_raw=False로 읽은 메시지의 지연 로드)
+
+        Args:
+            message_id: 메시지 ID
+
+        Returns:
+            raw_json 문자열 또는 None
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+
+        async with self._connection.execute(
+            "SELECT raw_json FROM messages WHERE id = ?", (message_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row and row['raw_json'] is not None:
+            return row['raw_json']
+        if row:
+            return (await self._load_payloads([message_id])).get(message_id)
+        message = await self.get_message(message_id)
+        return message.raw_json if message else None
+
+    async def compact_payloads(self, batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE) -> int:
+        """
+        기존 DB의 인라인 raw_json 중 큰 값을 message_payloads로 이동 (마이그레이션용, 멱등)
+
+        rowid 순서로 한 번 훑으며 배치마다 commit합니다. 비워진 페이지는 reclaim_space()로 회수합니다.
+
+        Returns:
+            이동한 payload 수
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+
+        moved = 0
+        last_rowid = 0
+        while True:
+            async with self._connection.execute(
+                "SELECT rowid, id, raw_json FROM messages WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, batch_size),
+            ) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                break
+            last_rowid = rows[-1]['rowid']
+
+            payloads = [
+                (row['id'], *_encode_payload(row['raw_json'])) for row in rows
+                if row['raw_json'] is not None and len(row['raw_json']) >= PAYLOAD_INLINE_MAX
+            ]
+            if payloads:
+                await self._connection.executemany(UPSERT_PAYLOAD_SQL, payloads)
+                await self._connection.executemany(
+                    "UPDATE messages SET raw_json = NULL WHERE id = ?", [(p[0],) for p in payloads]
+                )
+                await self._commit()
+                moved += len(payloads)
+            if len(rows) < batch_size:
+                break
+        return moved
+
+    async def rebuild_rollups(self) -> int:
+        """
+        시간 단위 집계 backfill (기존 DB 마이그레이션용)
+
+        messages에 메시지가 남아 있는 시간 버킷을 한 번의 집계로 다시 만듭니다.
+        메시지가 모두 아카이브된 버킷의 집계는 유지합니다.
+
+        Returns:
+            재계산한 시간 버킷 수
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+
+        async with self._connection.execute(
+            f"SELECT DISTINCT {_ROLLUP_HOUR.format(row='messages')} as hour FROM messages"
+        ) as cursor:
+            hours = [(row['hour'],) for row in await cursor.fetchall()]
+        if not hours:
+            return 0
+
+        await self._connection.executemany(ROLLUP_CLEAR_SQL, hours)
+        await self._connection.execute(
+            f"""INSERT INTO message_rollups_hourly
+                (hour, channel, project_id, priority, message_count, action_count)
+            SELECT {_ROLLUP_HOUR.format(row='messages')}, channel, COALESCE(project_id, ''),
+                   COALESCE(priority, ''), COUNT(*), COALESCE(SUM(has_action), 0)
+            FROM messages GROUP BY 1, 2, 3, 4"""
+        )
+        await self._commit()
+        return len(hours)
+
+    async def get_message_counts(
+        self, since: datetime, project_id: str | None = None
+    ) -> dict[str, Any]:
+        """
+        since 이후 메시지 집계 (message_rollups_hourly 기반)
+
+        정시 이후 구간은 시간 버킷 집계를 합산하고, since가 정시가 아니면 첫 시간의
+        나머지 구간만 messages에서 직접 셉니다. 조회 비용은 기간의 시간 수에 비례하며
+        메시지 수와 무관합니다.
+
+        Args:
+            since: 집계 시작 시각
+            project_id: 프로젝트 필터
+
+        Returns:
+            total, actions, by_priority, by_channel 딕셔너리
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+
+        since_ts = since.isoformat()
+        first_hour = _hour_bucket(since_ts)
+        proj_clause = " AND project_id = ?" if project_id else ""
+        proj_params = [project_id] if project_id else []
+
+        if since_ts == first_hour:
+            query = ""
+            params: list[Any] = []
+            rollup_from = first_hour
+        else:
+            rollup_from = _next_hour(first_hour)
+            query = (
+                "SELECT COALESCE(priority, '') as priority, channel, COUNT(*) as c,"
+                " COALESCE(SUM(has_action), 0) as a FROM messages"
+                f" WHERE timestamp >= ? AND timestamp < ?{proj_clause}"
+                " GROUP BY 1, 2 UNION ALL "
+            )
+            params = [since_ts, rollup_from, *proj_params]
+        query += (
+            "SELECT priority, channel, SUM(message_count) as c, SUM(action_count) as a"
+            f" FROM message_rollups_hourly WHERE hour >= ?{proj_clause} GROUP BY 1, 2"
+        )
+        params += [rollup_from, *proj_params]
+
+        counts: dict[str, Any] = {"total": 0, "actions": 0, "by_priority": {}, "by_channel": {}}
+        async with self._connection.execute(query, params) as cursor:
+            for row in await cursor.fetchall():
+                counts["total"] += row['c']
+                counts["actions"] += row['a']
+                priority = row['priority'] or None
+                counts["by_priority"][priority] = counts["by_priority"].get(priority, 0) + row['c']
+                counts["by_channel"][row['channel']] = counts["by_channel"].get(row['channel'], 0) + row['c']
+        return counts
+
+    async def _delayed_flush(self) -> None:
+        """flush_interval 경과 후 버퍼 flush (시간 임계값)"""
+        try:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"[Storage] write-behind flush 실패: {e}")
+
     async def get_message(self, message_id: str) -> NormalizedMessage | None:
         """
         메시지 조회
@@ -263,14 +824,168 @@ class UnifiedStorage:
         """
         if not self._connection:
             raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
 
         async with self._connection.execute(
             "SELECT * FROM messages WHERE id = ?", (message_id,)
         ) as cursor:
             row = await cursor.fetchone()
-            if row:
-                return _db_row_to_message(row)
+        if row:
+            return (await self._rows_to_messages([row], include_raw=True))[0]
+
+        # 보존 기간이 지나 아카이브된 메시지
+        async with self._connection.execute(
+            "SELECT month FROM archive_index WHERE message_id = ?", (message_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
             return None
+        archive = await open_connection(self._archive_path(row['month']), GATEWAY_ARCHIVE_PROFILE)
+        try:
+            async with archive.execute("SELECT * FROM messages WHERE id = ?", (message_id,)) as cursor:
+                row = await cursor.fetchone()
+        finally:
+            await archive.close()
+        return _db_row_to_message(row) if row else None
+
+    def _archive_path(self, month: str) -> Path:
+        return self.archive_dir / f"messages-{month}.db"
+
+    async def archive_messages(
+        self, before: datetime, batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE
+    ) -> dict[str, int]:
+        """
+        before 이전 메시지를 월별 아카이브 DB로 이동
+
+        배치마다 아카이브 파일에 먼저 commit한 뒤 archive_index 기록과 messages 삭제를
+        한 트랜잭션으로 처리하므로, 중간에 중단되어도 메시지가 사라지지 않습니다
+        (재실행 시 같은 행을 다시 복사). 처리 원장에 남은 메시지는 옮기지 않으며,
+        시간 단위 집계(message_rollups_hourly)는 그대로 유지됩니다.
+
+        Args:
+            before: 이 시각 이전(timestamp 기준) 메시지를 이동
+            batch_size: 배치당 이동할 행 수
+
+        Returns:
+            월('YYYY-MM')별 이동한 메시지 수
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+
+        archived: dict[str, int] = {}
+        while True:
+            async with self._connection.execute(
+                ARCHIVE_SELECT_SQL, (before.isoformat(), batch_size)
+            ) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                break
+
+            # 아카이브 행에는 raw_json을 인라인으로 복원
+            records = [dict(row) for row in rows]
+            payloads = await self._load_payloads([r['id'] for r in records if r['raw_json'] is None])
+            by_month: dict[str, list[dict]] = {}
+            for record in records:
+                if record['id'] in payloads:
+                    record['raw_json'] = payloads[record['id']]
+                by_month.setdefault(record['timestamp'][:7], []).append(record)
+            for month, month_rows in by_month.items():
+                await self._write_archive(month, month_rows)
+                archived[month] = archived.get(month, 0) + len(month_rows)
+
+            await self._connection.executemany(
+                "INSERT OR REPLACE INTO archive_index (message_id, month) VALUES (?, ?)",
+                [(row['id'], row['timestamp'][:7]) for row in rows],
+            )
+            await self._connection.executemany(
+                "DELETE FROM messages WHERE id = ?", [(row['id'],) for row in rows]
+            )
+            if payloads:
+                await self._connection.executemany(DELETE_PAYLOAD_SQL, [(message_id,) for message_id in payloads])
+            await self._commit()
+            if len(rows) < batch_size:
+                break
+        return archived
+
+    async def _write_archive(self, month: str, rows: list[dict]) -> None:
+        """월별 아카이브 DB에 행 복사 (스키마는 현재 messages 테이블 정의를 따름)"""
+        async with self._connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'messages'"
+        ) as cursor:
+            table_sql = (await cursor.fetchone())['sql']
+        table_sql = re.sub(
+            r'^CREATE TABLE\s+(IF NOT EXISTS\s+)?"?messages"?', 'CREATE TABLE IF NOT EXISTS messages', table_sql
+        )
+
+        columns = list(rows[0])
+        archive = await open_connection(self._archive_path(month), GATEWAY_ARCHIVE_PROFILE)
+        try:
+            await archive.execute(table_sql)
+            # 아카이브 생성 이후 messages에 추가된 컬럼
+            async with archive.execute("PRAGMA table_info(messages)") as cursor:
+                existing = {r['name'] for r in await cursor.fetchall()}
+            for column in columns:
+                if column not in existing:
+                    await archive.execute(f"ALTER TABLE messages ADD COLUMN {column}")
+            await archive.execute(
+                "CREATE INDEX IF NOT EXISTS idx_archive_timestamp ON messages(timestamp)"
+            )
+            await archive.executemany(
+                f"INSERT OR REPLACE INTO messages ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                [tuple(row[column] for column in columns) for row in rows],
+            )
+            await archive.commit()
+        finally:
+            await archive.close()
+
+    async def _pragma(self, name: str) -> int:
+        async with self._connection.execute(f"PRAGMA {name}") as cursor:
+            return (await cursor.fetchone())[0]
+
+    async def reclaim_space(self, max_pages: int = 2000) -> dict[str, Any]:
+        """
+        아카이브/삭제로 생긴 빈 페이지 회수 (게이트웨이 실행 중 호출용)
+
+        auto_vacuum=INCREMENTAL DB만 max_pages만큼 회수하여 쓰기 지연을 짧게 유지합니다.
+        기존(auto_vacuum=NONE) DB는 DB 전체를 잠그는 VACUUM이 필요하므로 여기서는 건너뛰고,
+        게이트웨이를 멈춘 상태에서 vacuum()(CLI `vacuum` 명령)으로 한 번 전환합니다.
+
+        Returns:
+            mode('none'|'incremental'), freed_pages 딕셔너리
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+        await self._commit()
+
+        free_before = await self._pragma("freelist_count")
+        if free_before == 0 or await self._pragma("auto_vacuum") != 2:
+            return {"mode": "none", "freed_pages": 0}
+
+        # execute()는 한 step(한 페이지)만 실행하므로 끝까지 실행하는 executescript 사용
+        await self._connection.executescript(f"PRAGMA incremental_vacuum({int(max_pages)})")
+        return {"mode": "incremental", "freed_pages": free_before - await self._pragma("freelist_count")}
+
+    async def vacuum(self) -> dict[str, Any]:
+        """
+        전체 VACUUM으로 빈 페이지를 모두 회수하고 auto_vacuum=INCREMENTAL로 전환
+
+        DB 전체를 다시 쓰고 그동안 쓰기를 막으므로 게이트웨이가 멈춘 상태에서 CLI로만 실행합니다.
+
+        Returns:
+            mode('full'), freed_pages 딕셔너리
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+        await self._commit()
+
+        free_before = await self._pragma("freelist_count")
+        await self._connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        await self._connection.execute("VACUUM")
+        return {"mode": "full", "freed_pages": free_before - await self._pragma("freelist_count")}
 
     async def get_recent_messages(
         self,
@@ -278,12 +993,20 @@ class UnifiedStorage:
         limit: int = 50,
         since: datetime | None = None,
         project_id: str | None = None,
+        include_raw: bool = False,
     ) -> list[NormalizedMessage]:
-        """최근 메시지 조회 (project_id 필터 지원)"""
+        """
+        최근 메시지 조회 (project_id 필터 지원)
+
+        기본(include_raw=False)은 raw_json을 읽지 않습니다 (get_raw_json으로 지연 로드).
+        원본이 필요한 호출자만 include_raw=True를 넘깁니다.
+        """
         if not self._connection:
             raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
 
-        query = "SELECT * FROM messages WHERE 1=1"
+        columns = ", ".join(MESSAGE_COLUMNS if include_raw else LIGHT_COLUMNS)
+        query = f"SELECT {columns} FROM messages WHERE 1=1"
         params = []
 
         if channel:
@@ -303,27 +1026,122 @@ class UnifiedStorage:
 
         async with self._connection.execute(query, params) as cursor:
             rows = await cursor.fetchall()
-            return [_db_row_to_message(row) for row in rows]
+        return await self._rows_to_messages(rows, include_raw)
 
     async def get_unprocessed_messages(self) -> list[NormalizedMessage]:
         """
         처리되지 않은 메시지 조회
 
+        대량 backlog에서는 페이지 단위로 읽는 iter_unprocessed()를 사용하세요.
+
         Returns:
             미처리 메시지 리스트 (오래된 순)
         """
+        return [message async for message in self.iter_unprocessed(include_raw=True)]
+
+    def iter_unprocessed(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        include_raw: bool = False,
+    ) -> AsyncIterator[NormalizedMessage]:
+        """
+        미처리 메시지 스트리밍 조회 (오래된 순, (timestamp, id) keyset 페이지)
+
+        순회 중 mark_processed()를 호출해도 이미 지난 위치는 다시 읽지 않습니다.
+
+        Args:
+            page_size: 한 번에 읽을 행 수
+            include_raw: True면 raw_json까지 읽음 (기본: 읽지 않음)
+
+        Example:
+            async for message in storage.iter_unprocessed(page_size=200):
+                await pipeline.process(message)
+        """
+        return self._iter_pages(
+            "processed_at IS NULL", [], descending=False,
+            page_size=page_size, include_raw=include_raw,
+        )
+
+    def iter_recent(
+        self,
+        channel: str | None = None,
+        since: datetime | None = None,
+        project_id: str | None = None,
+        limit: int | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        include_raw: bool = False,
+    ) -> AsyncIterator[NormalizedMessage]:
+        """
+        최근 메시지 스트리밍 조회 (최신 순, (timestamp, id) keyset 페이지)
+
+        Args:
+            channel: 채널 필터
+            since: 이 시각 이후 메시지만
+            project_id: 프로젝트 필터
+            limit: 최대 메시지 수 (None이면 전체)
+            page_size: 한 번에 읽을 행 수
+            include_raw: True면 raw_json까지 읽음 (기본: 읽지 않음)
+        """
+        where = ["1=1"]
+        params: list[Any] = []
+        if channel:
+            where.append("channel = ?")
+            params.append(channel)
+        if project_id:
+            where.append("project_id = ?")
+            params.append(project_id)
+        if since:
+            where.append("timestamp >= ?")
+            params.append(since.isoformat())
+        return self._iter_pages(
+            " AND ".join(where), params, descending=True,
+            page_size=page_size, include_raw=include_raw, limit=limit,
+        )
+
+    async def _iter_pages(
+        self,
+        where: str,
+        params: list[Any],
+        descending: bool,
+        page_size: int,
+        include_raw: bool,
+        limit: int | None = None,
+    ) -> AsyncIterator[NormalizedMessage]:
+        """(timestamp, id) keyset 페이지네이션 공통 구현 (OFFSET 없이 마지막 키 다음부터 조회)"""
         if not self._connection:
             raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        await self.flush()
 
-        query = """
-            SELECT * FROM messages
-            WHERE processed_at IS NULL
-            ORDER BY timestamp ASC
-        """
+        columns = ", ".join(MESSAGE_COLUMNS if include_raw else LIGHT_COLUMNS)
+        direction = "DESC" if descending else "ASC"
+        after = "<" if descending else ">"
+        base = f"SELECT {columns} FROM messages WHERE {where}"
+        order = f" ORDER BY timestamp {direction}, id {direction} LIMIT ?"
 
-        async with self._connection.execute(query) as cursor:
-            rows = await cursor.fetchall()
-            return [_db_row_to_message(row) for row in rows]
+        remaining = limit
+        last_key: tuple[str, str] | None = None
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            if last_key is None:
+                query, query_params = base + order, [*params, size]
+            else:
+                query = base + f" AND (timestamp, id) {after} (?, ?)" + order
+                query_params = [*params, *last_key, size]
+
+            async with self._connection.execute(query, query_params) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                return
+
+            last_key = (rows[-1]['timestamp'], rows[-1]['id'])
+            if remaining is not None:
+                remaining -= len(rows)
+            for message in await self._rows_to_messages(rows, include_raw):
+                yield message
+            if len(rows) < size:
+                return
 
     async def mark_processed(self, message_id: str) -> None:
         """
@@ -332,24 +1150,155 @@ class UnifiedStorage:
         Args:
             message_id: 메시지 ID
         """
+        await self.mark_processed_many([message_id])
+
+    async def mark_processed_many(self, message_ids: list[str]) -> int:
+        """
+        여러 메시지 처리 완료 표시 (단일 트랜잭션) 및 처리 원장에서 제거
+
+        기본 모드에서는 버퍼된 stage 기록과 함께 즉시 commit합니다 (반환 시점에 내구성 보장).
+        write-behind 모드에서는 다음 flush에 함께 기록됩니다.
+
+        Args:
+            message_ids: 메시지 ID 목록
+
+        Returns:
+            처리 완료로 표시한 메시지 수
+        """
         if not self._connection:
             raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
 
-        await self._connection.execute(
-            "UPDATE messages SET processed_at = ? WHERE id = ?",
-            (datetime.now().isoformat(), message_id)
+        now = datetime.now().isoformat()
+        done = dict.fromkeys(message_ids, now)
+        if not done:
+            return 0
+
+        self._pending_done.update(done)
+        if not self.write_behind:
+            await self.flush()
+        else:
+            await self._schedule_flush()
+        return len(done)
+
+    async def _write_ledger(self, states: list[tuple], done: dict[str, str]) -> None:
+        """처리 원장 upsert 후 processed_at 갱신 + 원장 삭제 (commit은 호출자)"""
+        if states:
+            await self._connection.executemany(UPSERT_STATE_SQL, states)
+        if done:
+            await self._connection.executemany(
+                MARK_PROCESSED_SQL, [(processed_at, message_id) for message_id, processed_at in done.items()]
+            )
+            await self._connection.executemany(CLEAR_STATE_SQL, [(message_id,) for message_id in done])
+
+    async def record_stage(self, message_id: str, stage: str, error: str | None = None) -> None:
+        """
+        처리 원장 기록
+
+        Args:
+            message_id: 메시지 ID
+            stage: 마지막으로 완료된 파이프라인 stage
+            error: 실패 시 오류 메시지 (지정하면 attempts 1 증가)
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+
+        state = (message_id, stage, 1 if error else 0, error, datetime.now().isoformat())
+        self._pending_states.append(state)
+        if error and not self.write_behind:
+            # 실패 횟수는 재시작 후 poison 메시지 판단에 쓰이므로 즉시 기록
+            await self.flush()
+            return
+        await self._schedule_flush()
+
+    async def record_stage_many(self, message_ids: list[str], stage: str) -> int:
+        """
+        여러 메시지를 처리 원장에 같은 stage로 등록 (단일 트랜잭션)
+
+        종료 시 끝내지 못한 작업을 원장에 남겨 재시작 후 replay()로 이어서 처리합니다.
+
+        Returns:
+            등록한 메시지 수
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+
+        now = datetime.now().isoformat()
+        states = [(message_id, stage, 0, None, now) for message_id in dict.fromkeys(message_ids)]
+        if not states:
+            return 0
+        # 버퍼의 처리 완료(원장 삭제)가 이 등록보다 나중에 적용되지 않도록 먼저 flush
+        await self.flush()
+        self._pending_states.extend(states)
+        await self.flush()
+        return len(states)
+
+    async def get_processing_states(
+        self, limit: int = 100, max_attempts: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        처리 원장 조회 (재처리 대상, 오래된 순)
+
+        Args:
+            limit: 최대 항목 수
+            max_attempts: 이 횟수 이상 실패한 메시지는 제외 (None이면 전체)
+
+        Returns:
+            message_id, stage, attempts, last_error, updated_at 딕셔너리 목록
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
+
+        query = "SELECT * FROM processing_state"
+        params: list[Any] = []
+        if max_attempts is not None:
+            query += " WHERE attempts < ?"
+            params.append(max_attempts)
+        query += " ORDER BY updated_at ASC LIMIT ?"
+        params.append(limit)
+
+        async with self._connection.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def save_cursors(self, adapter: str, cursors: dict[str, str]) -> None:
+        """
+        어댑터 조회 위치 저장 (키별 upsert)
+
+        Args:
+            adapter: 어댑터 이름 (slack, gmail 등)
+            cursors: 조회 위치 (예: Slack 채널 ID → last_ts)
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        if not cursors:
+            return
+        now = datetime.now().isoformat()
+        await self._connection.executemany(
+            "INSERT OR REPLACE INTO channel_cursors (adapter, cursor_key, value, updated_at) VALUES (?, ?, ?, ?)",
+            [(adapter, key, str(value), now) for key, value in cursors.items()],
         )
-        await self._connection.commit()
+        await self._commit()
+
+    async def load_cursors(self, adapter: str) -> dict[str, str]:
+        """저장된 어댑터 조회 위치 (없으면 빈 딕셔너리)"""
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        async with self._connection.execute(
+            "SELECT cursor_key, value FROM channel_cursors WHERE adapter = ?", (adapter,)
+        ) as cursor:
+            return {row[0]: row[1] for row in await cursor.fetchall()}
 
     async def get_stats(self) -> dict[str, Any]:
         """
         스토리지 통계 조회
 
         Returns:
-            통계 딕셔너리 (총 메시지 수, 채널별 메시지 수, 미처리 메시지 수)
+            통계 딕셔너리 (총 메시지 수, 채널별 메시지 수, 미처리 메시지 수, 아카이브 수)
         """
         if not self._connection:
             raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        await self.flush()
 
         # 총 메시지 수
         async with self._connection.execute("SELECT COUNT(*) as total FROM messages") as cursor:
@@ -370,8 +1319,72 @@ class UnifiedStorage:
             unprocessed_row = await cursor.fetchone()
             unprocessed = unprocessed_row['unprocessed']
 
+        # 처리 원장 (처리 중/실패)
+        async with self._connection.execute(
+            "SELECT COUNT(*) as in_flight, COALESCE(SUM(attempts > 0), 0) as failed FROM processing_state"
+        ) as cursor:
+            state_row = await cursor.fetchone()
+
+        # 아카이브된 메시지 수
+        async with self._connection.execute(
+            "SELECT COUNT(*) as archived FROM archive_index"
+        ) as cursor:
+            archived_row = await cursor.fetchone()
+
         return {
             'total_messages': total,
             'by_channel': by_channel,
-            'unprocessed': unprocessed
+            'unprocessed': unprocessed,
+            'in_flight': state_row['in_flight'],
+            'failed': state_row['failed'],
+            'archived': archived_row['archived'],
         }
+
+    async def load_user_directory(self, channel: str) -> dict[str, tuple[str, float]]:
+        """
+        채널별 사용자 디렉토리 조회
+
+        Args:
+            channel: 채널 타입 (예: "slack")
+
+        Returns:
+            user_id → (이름, 갱신 시각 epoch)
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+
+        async with self._connection.execute(
+            "SELECT user_id, name, updated_at FROM user_directory WHERE channel = ?", (channel,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return {row['user_id']: (row['name'], row['updated_at']) for row in rows}
+
+    async def save_user_names(self, channel: str, names: dict[str, str],
+                              updated_at: float | None = None) -> int:
+        """
+        사용자 이름 일괄 저장 (upsert, 단일 커밋)
+
+        Args:
+            channel: 채널 타입 (예: "slack")
+            names: user_id → 이름
+            updated_at: 갱신 시각 epoch (None이면 현재 시각)
+
+        Returns:
+            저장된 사용자 수
+        """
+        if not self._connection:
+            raise RuntimeError("Storage not connected. Use 'async with' or call connect() first.")
+        if not names:
+            return 0
+
+        updated_at = time.time() if updated_at is None else updated_at
+        await self._connection.executemany(
+            """
+            INSERT INTO user_directory (channel, user_id, name, updated_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(channel, user_id) DO UPDATE SET
+                name = excluded.name, updated_at = excluded.updated_at
+            """,
+            [(channel, user_id, name, updated_at) for user_id, name in names.items()],
+        )
+        await self._commit()
+        return len(names)
@@ -40,10 +40,15 @@ if sys.platform == "win32":
 REASON_CHOICES = ["부정확함", "어조부적절", "누락정보", "반복", "기타"]
 
 
-async def get_storage():
-    """IntelligenceStorage 인스턴스 생성 및 연결"""
-    from scripts.intelligence.context_store import IntelligenceStorage
-    storage = IntelligenceStorage()
+async def get_storage(read_only: bool = False):
+    """
+    IntelligenceStorage 인스턴스 생성 및 연결
+
+    read_only면 실행 중인 Gateway와 경합하지 않도록 스키마 초기화 없이 읽기 전용으로 엽니다
+    (DB 파일이 아직 없으면 일반 연결로 생성).
+    """
+    from scripts.intelligence.context_store import DEFAULT_DB_PATH, IntelligenceStorage
+    storage = IntelligenceStorage(read_only=read_only and DEFAULT_DB_PATH.exists())
     await storage.connect()
     return storage
 
@@ -99,7 +104,7 @@ async def cmd_analyze(args):
 
 async def cmd_pending(args):
     """미매칭 pending 메시지 조회"""
-    storage = await get_storage()
+    storage = await get_storage(read_only=True)
     try:
         messages = await storage.get_pending_messages()
 
@@ -140,7 +145,7 @@ async def cmd_review(args):
 
 async def cmd_drafts(args):
     """초안 목록 조회"""
-    storage = await get_storage()
+    storage = await get_storage(read_only=True)
     try:
         drafts = await storage.list_drafts(
             status=args.status,
@@ -480,7 +485,7 @@ async def cmd_save_draft(args):
 
 async def cmd_stats(args):
     """통계 조회"""
-    storage = await get_storage()
+    storage = await get_storage(read_only=True)
     try:
         stats = await storage.get_stats()
 
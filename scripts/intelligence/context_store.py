@@ -15,6 +15,14 @@ from typing import Any
 
 import aiosqlite
 
+try:
+    from scripts.shared.sqlite_profile import INTELLIGENCE_PROFILE, SQLiteProfile, open_connection
+except ImportError:
+    try:
+        from shared.sqlite_profile import INTELLIGENCE_PROFILE, SQLiteProfile, open_connection
+    except ImportError:
+        from ..shared.sqlite_profile import INTELLIGENCE_PROFILE, SQLiteProfile, open_connection
+
 DEFAULT_DB_PATH = Path(r"C:\claude\secretary\data\intelligence.db")
 
 SCHEMA = """
@@ -79,19 +87,34 @@ CREATE TABLE IF NOT EXISTS draft_responses (
     FOREIGN KEY (project_id) REFERENCES projects(id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_context_project ON context_entries(project_id);
 CREATE INDEX IF NOT EXISTS idx_context_source ON context_entries(source);
 CREATE INDEX IF NOT EXISTS idx_context_collected ON context_entries(collected_at DESC);
 CREATE INDEX IF NOT EXISTS idx_state_project_source ON analysis_state(project_id, source);
-CREATE INDEX IF NOT EXISTS idx_draft_status ON draft_responses(status);
-CREATE INDEX IF NOT EXISTS idx_draft_match_status ON draft_responses(match_status);
-CREATE INDEX IF NOT EXISTS idx_draft_project ON draft_responses(project_id);
 
 CREATE UNIQUE INDEX IF NOT EXISTS idx_draft_unique_message
 ON draft_responses(source_channel, source_message_id)
 WHERE source_message_id IS NOT NULL;
 """
 
+# 복합 인덱스 (실제 쿼리 집합 기준 설계, 멱등): 필터 등호 컬럼 → 정렬/범위 컬럼
+# 쿼리 플랜 회귀는 tests/test_query_plans.py에서 검사합니다.
+INDEX_MIGRATIONS = [
+    # 아래 복합 인덱스의 선두 컬럼과 중복되는 단일 컬럼 인덱스
+    "DROP INDEX IF EXISTS idx_context_project",
+    "DROP INDEX IF EXISTS idx_draft_status",
+    "DROP INDEX IF EXISTS idx_draft_match_status",
+    "DROP INDEX IF EXISTS idx_draft_project",
+    "DROP INDEX IF EXISTS idx_feedback_decision",
+    "CREATE INDEX IF NOT EXISTS idx_context_project_collected ON context_entries(project_id, collected_at)",
+    # list_drafts/get_awaiting_drafts/DigestReport/cleanup_old_entries
+    "CREATE INDEX IF NOT EXISTS idx_draft_status_created ON draft_responses(status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_draft_match_created ON draft_responses(match_status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_draft_project_created ON draft_responses(project_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_draft_created ON draft_responses(created_at)",
+    # FeedbackStore.list_feedback (decision 필터 + created_at DESC)
+    "CREATE INDEX IF NOT EXISTS idx_feedback_decision_created ON feedback_responses(decision, created_at)",
+]
+
 
 class IntelligenceStorage:
     """
@@ -100,9 +123,13 @@ class IntelligenceStorage:
     WAL mode로 Gateway(async writer)와 CLI(reader) 동시 접근 지원.
     """
 
-    def __init__(self, db_path: Path | None = None):
+    PROFILE: SQLiteProfile = INTELLIGENCE_PROFILE
+
+    def __init__(self, db_path: Path | None = None, read_only: bool = False):
         self.db_path = db_path or DEFAULT_DB_PATH
         self._connection: aiosqlite.Connection | None = None
+        # 조회 전용 연결 (CLI 조회 명령, 스키마 초기화/마이그레이션 없이 query_only로 열기)
+        self.read_only = read_only
 
     async def __aenter__(self):
         await self.connect()
@@ -112,18 +139,16 @@ class IntelligenceStorage:
         await self.close()
 
     async def connect(self) -> None:
-        """DB 연결 및 스키마 초기화 (WAL mode)"""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._connection = await aiosqlite.connect(str(self.db_path))
-        self._connection.row_factory = aiosqlite.Row
-
-        await self._connection.execute("PRAGMA journal_mode=WAL")
-        await self._connection.execute("PRAGMA foreign_keys=ON")
+        """DB 연결 및 스키마 초기화 (INTELLIGENCE_PROFILE: WAL, foreign_keys, read_only면 DDL 없이 읽기 전용)"""
+        if self.read_only:
+            self._connection = await open_connection(self.db_path, self.PROFILE.reader())
+            return
+        self._connection = await open_connection(self.db_path, self.PROFILE)
         await self._connection.executescript(SCHEMA)
         await self._connection.commit()
         await self._migrate_draft_columns()
         await self._migrate_feedback_table()
+        await self._migrate_indexes()
 
     async def _migrate_feedback_table(self):
         """feedback_responses 테이블 추가 (멱등)"""
@@ -140,7 +165,6 @@ class IntelligenceStorage:
                 FOREIGN KEY (draft_id) REFERENCES draft_responses(id) ON DELETE CASCADE
             )""",
             "CREATE INDEX IF NOT EXISTS idx_feedback_draft ON feedback_responses(draft_id)",
-            "CREATE INDEX IF NOT EXISTS idx_feedback_decision ON feedback_responses(decision)",
             "CREATE INDEX IF NOT EXISTS idx_feedback_created ON feedback_responses(created_at DESC)",
         ]
         for sql in migrations:
@@ -153,6 +177,12 @@ class IntelligenceStorage:
                 else:
                     raise
 
+    async def _migrate_indexes(self):
+        """단일 컬럼 인덱스를 복합 인덱스로 교체 (멱등)"""
+        for sql in INDEX_MIGRATIONS:
+            await self._connection.execute(sql)
+        await self._connection.commit()
+
     async def _migrate_draft_columns(self):
         """draft_responses에 전송 관련 컬럼 추가 (멱등)"""
         migrations = [
@@ -234,6 +264,20 @@ class IntelligenceStorage:
             rows = await cursor.fetchall()
             return [self._row_to_project(row) for row in rows]
 
+    async def get_projects_marker(self) -> tuple[int, str | None]:
+        """
+        projects 테이블 변경 표식 (행 수, 최근 updated_at)
+
+        다른 프로세스(cli.py register 등)가 같은 DB에 쓴 변경도 반영됩니다.
+        """
+        self._ensure_connected()
+
+        async with self._connection.execute(
+            "SELECT COUNT(*), MAX(updated_at) FROM projects"
+        ) as cursor:
+            count, updated_at = await cursor.fetchone()
+            return count, updated_at
+
     async def delete_project(self, project_id: str) -> bool:
         """프로젝트 삭제"""
         self._ensure_connected()
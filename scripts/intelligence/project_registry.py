@@ -62,6 +62,10 @@ class ProjectRegistry:
         """전체 프로젝트 목록"""
         return await self.storage.list_projects()
 
+    async def change_marker(self) -> tuple[int, str | None]:
+        """프로젝트 목록 변경 표식 (호출자가 목록/포맷 캐시 무효화 판단에 사용)"""
+        return await self.storage.get_projects_marker()
+
     async def delete(self, project_id: str) -> bool:
         """프로젝트 삭제"""
         return await self.storage.delete_project(project_id)
@@ -11,6 +11,7 @@ Analyzes incoming messages to determine:
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import re
@@ -30,8 +31,51 @@ except ImportError:
     except ImportError:
         retry_async = None
 
+try:
+    from scripts.shared.metrics import llm_timer
+except ImportError:
+    try:
+        from shared.metrics import llm_timer
+    except ImportError:
+        def llm_timer(backend: str, operation: str):
+            return contextlib.nullcontext()
+
+try:
+    from scripts.shared.ollama_client import OllamaClient
+except ImportError:
+    try:
+        from shared.ollama_client import OllamaClient
+    except ImportError:
+        from ...shared.ollama_client import OllamaClient
+
 logger = logging.getLogger(__name__)
 
+# 기본 프롬프트 디렉토리
+DEFAULT_PROMPT_DIR = Path(r"C:\claude\secretary\scripts\intelligence\prompts")
+
+# 모델 유지 시간. 요청 사이에 모델이 내려가면 프롬프트 prefix의 KV 캐시도 사라짐
+DEFAULT_KEEP_ALIVE = "30m"
+
+# 결정 마커 (자유 추론 뒤 마지막 줄)
+_DECISION_MARKERS = ("[RESPONSE_NEEDED]", "[NO_RESPONSE]")
+
+
+# 숫자 confidence 값 ("confidence=0.X" 같은 형식 안내 문구는 제외)
+_NUMERIC_CONFIDENCE = re.compile(r'confidence=\d+(?:\.\d+)?(?:\s|$)')
+
+
+def _is_decision_line(line: str) -> bool:
+    """project_id와 숫자 confidence까지 포함한 완성된 결정 마커 라인인지"""
+    return (
+        any(m in line for m in _DECISION_MARKERS)
+        and "project_id=" in line
+        and _NUMERIC_CONFIDENCE.search(line) is not None
+    )
+
+
+# 배치 응답의 메시지 블록 시작 마커 ("[MSG 3]", "### [MSG 3]")
+_MSG_MARKER = re.compile(r'^[ \t#*]*\[MSG\s*(\d+)\]', re.MULTILINE)
+
 
 @dataclass
 class AnalysisResult:
@@ -57,7 +101,10 @@ class OllamaAnalyzer:
         ollama_url: str = "http://localhost:11434",
         timeout: float = 90.0,
         max_context_chars: int = 12000,
-        max_requests_per_minute: int = 10
+        max_requests_per_minute: int = 10,
+        prompt_dir: Path | str | None = None,
+        stream: bool = False,
+        keep_alive: str | int = DEFAULT_KEEP_ALIVE,
     ):
         """
         Initialize Ollama analyzer.
@@ -68,24 +115,39 @@ class OllamaAnalyzer:
             timeout: Request timeout in seconds
             max_context_chars: Maximum characters to send to LLM
             max_requests_per_minute: Rate limit
+            prompt_dir: Directory containing analyze_prompt.txt (default: DEFAULT_PROMPT_DIR)
+            stream: Stream analyze responses and stop generation once the decision marker line is complete
+            keep_alive: How long Ollama keeps the model (and its prompt KV cache) loaded after a request
         """
         self.model = model
         self.ollama_url = ollama_url.rstrip("/")
         self.timeout = timeout
         self.max_context_chars = max_context_chars
         self.max_requests_per_minute = max_requests_per_minute
+        self.stream = stream
+        self.keep_alive = keep_alive
+
+        # 포맷된 프로젝트 목록 memo: (원본 list, 문자열). 같은 list 객체면 재사용
+        self._project_list_memo: tuple[list[dict[str, Any]], str] | None = None
 
         # Rate limiting
         self._request_times: deque = deque(maxlen=max_requests_per_minute)
 
         # Load prompt template
-        prompt_path = Path(r"C:\claude\secretary\scripts\intelligence\prompts\analyze_prompt.txt")
+        prompt_dir = Path(prompt_dir) if prompt_dir else DEFAULT_PROMPT_DIR
+        prompt_path = prompt_dir / "analyze_prompt.txt"
         if not prompt_path.exists():
             raise FileNotFoundError(f"Prompt template not found: {prompt_path}")
 
         with open(prompt_path, encoding="utf-8") as f:
             self.prompt_template = f.read()
 
+        # 배치 프롬프트 (없으면 analyze_batch가 메시지별 analyze()로 동작)
+        batch_path = prompt_dir / "analyze_batch_prompt.txt"
+        self.batch_prompt_template: str | None = (
+            batch_path.read_text(encoding="utf-8") if batch_path.exists() else None
+        )
+
         logger.info(f"OllamaAnalyzer initialized: model={model}, url={ollama_url}")
 
     async def _wait_for_rate_limit(self):
@@ -107,7 +169,22 @@ class OllamaAnalyzer:
         self._request_times.append(now)
 
     def _build_project_list(self, projects: list[dict[str, Any]]) -> str:
-        """Build formatted project list for prompt."""
+        """
+        Build formatted project list for prompt.
+
+        프롬프트 앞부분(prefix)에 들어가므로 같은 목록이면 같은 문자열이어야 Ollama가
+        KV 캐시를 재사용합니다. 호출자가 같은 list 객체를 넘기는 동안은 memo를 반환하고,
+        새 list(ProjectRegistry 변경 후 다시 조회한 목록)가 오면 다시 포맷합니다.
+        """
+        memo = self._project_list_memo
+        if memo is not None and memo[0] is projects:
+            return memo[1]
+        formatted = self._format_project_list(projects)
+        self._project_list_memo = (projects, formatted)
+        return formatted
+
+    @staticmethod
+    def _format_project_list(projects: list[dict[str, Any]]) -> str:
         if not projects:
             return "등록된 프로젝트가 없습니다."
 
@@ -331,47 +408,51 @@ class OllamaAnalyzer:
             # Call Ollama API
             logger.debug(f"Calling Ollama analyze: model={self.model}, sender={sender_name}")
 
-            async def _call_ollama():
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    resp = await client.post(
-                        f"{self.ollama_url}/api/chat",
-                        json={
-                            "model": self.model,
-                            "messages": [
-                                {"role": "user", "content": prompt}
-                            ],
-                            "stream": False,
-                            "options": {
-                                "temperature": 0.3,
-                                "num_predict": 2048
-                            }
-                        }
+            payload = {
+                "model": self.model,
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "stream": False,
+                "keep_alive": self.keep_alive,
+                "options": {
+                    "temperature": 0.3,
+                    "num_predict": 2048
+                }
+            }
+
+            async def _call_ollama() -> str:
+                with llm_timer("ollama", "analyze"):
+                    if self.stream:
+                        return self._join_thinking(*await self._stream_until_decisions(payload))
+                    resp = await OllamaClient.get_instance().post(
+                        f"{self.ollama_url}/api/chat", payload, timeout=self.timeout,
                     )
-                    resp.raise_for_status()
-                    return resp
+                    msg_data = resp.json().get("message", {})
+                    return self._join_thinking(msg_data.get("thinking", ""), msg_data.get("content", ""))
 
             if retry_async:
-                response = await retry_async(
+                full_response = await retry_async(
                     _call_ollama,
                     max_retries=2,
                     base_delay=2.0,
                     retryable_exceptions=(httpx.RequestError, httpx.HTTPStatusError),
                 )
             else:
-                response = await _call_ollama()
-
-            result_data = response.json()
-            msg_data = result_data.get("message", {})
-            content = msg_data.get("content", "")
-            thinking = msg_data.get("thinking", "")
-
-            # thinking이 있으면 content와 합침
-            full_response = content
-            if thinking and thinking.strip():
-                full_response = thinking + "\n" + content
+                full_response = await _call_ollama()
 
             # 마커 기반 결정 추출
-            result = self._extract_decision(full_response)
+            try:
+                result = self._extract_decision(full_response)
+            except ValueError:
+                # confidence=0.X 처럼 숫자가 아닌 값 (형식 안내를 그대로 출력한 경우)
+                logger.warning("Invalid confidence in Ollama decision marker")
+                return AnalysisResult(
+                    needs_response=False,
+                    reasoning=full_response,
+                    confidence=0.0,
+                    summary="마커 파싱 실패",
+                )
             logger.info(
                 f"Analysis complete: project={result.project_id}, "
                 f"needs_response={result.needs_response}, confidence={result.confidence:.2f}"
@@ -396,6 +477,49 @@ class OllamaAnalyzer:
                 reasoning=f"예외 발생: {str(e)}"
             )
 
+    @staticmethod
+    def _join_thinking(thinking: str, content: str) -> str:
+        """thinking이 있으면 content 앞에 합침"""
+        if thinking and thinking.strip():
+            return thinking + "\n" + content
+        return content
+
+    async def _stream_until_decisions(self, payload: dict[str, Any], decisions: int = 1) -> tuple[str, str]:
+        """
+        스트리밍으로 응답을 받다가 content에 결정 마커 라인이 decisions개 완성되면 생성 중단
+
+        스트림을 닫으면 Ollama도 해당 요청의 생성을 멈추므로, 마커 뒤에 붙는 부연
+        설명 토큰을 생성하지 않습니다. 마커가 끝까지 나오지 않으면 전체 응답을
+        반환합니다 (비스트리밍과 동일).
+
+        Returns:
+            (thinking, content) - content는 마지막 마커 라인까지
+        """
+        thinking: list[str] = []
+        content: list[str] = []
+        partial = ""
+        seen = 0
+        stream = OllamaClient.get_instance().stream(
+            f"{self.ollama_url}/api/chat", {**payload, "stream": True}, timeout=self.timeout,
+        )
+        async with contextlib.aclosing(stream):
+            async for chunk in stream:
+                msg_data = chunk.get("message") or {}
+                if msg_data.get("thinking"):
+                    thinking.append(msg_data["thinking"])
+                text = msg_data.get("content") or ""
+                if text:
+                    content.append(text)
+                    # 완성된 줄만 검사 (마커 라인의 필드가 끝까지 도착한 뒤 중단)
+                    *lines, partial = (partial + text).split("\n")
+                    seen += sum(1 for line in lines if _is_decision_line(line))
+                    if seen >= decisions:
+                        logger.debug(f"Decision marker received, stopping generation: decisions={seen}")
+                        break
+                if chunk.get("done"):
+                    break
+        return "".join(thinking), "".join(content)
+
     async def chatbot_respond(
         self,
         text: str,
@@ -457,24 +581,24 @@ class OllamaAnalyzer:
                 )
 
             async def _call_ollama():
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    resp = await client.post(
+                with llm_timer("ollama", "chatbot"):
+                    return await OllamaClient.get_instance().post(
                         f"{self.ollama_url}/api/chat",
-                        json={
+                        {
                             "model": self.model,
                             "messages": [
                                 {"role": "system", "content": system_prompt},
                                 {"role": "user", "content": user_content},
                             ],
                             "stream": False,
+                            "keep_alive": self.keep_alive,
                             "options": {
                                 "temperature": 0.3,
                                 "num_predict": 2048,
                             },
-                        }
+                        },
+                        timeout=self.timeout,
                     )
-                    resp.raise_for_status()
-                    return resp
 
             if retry_async:
                 response = await retry_async(
@@ -525,32 +649,236 @@ class OllamaAnalyzer:
     async def analyze_batch(
         self,
         messages: list[dict[str, Any]],
-        project_list: list[dict[str, Any]]
+        project_list: list[dict[str, Any]],
+        max_batch_size: int = 8,
     ) -> list[AnalysisResult]:
         """
-        Analyze multiple messages in batch (with rate limiting).
+        Analyze multiple messages with one Ollama call per chunk.
+
+        최대 max_batch_size개 메시지를 [MSG n] 마커로 묶은 한 프롬프트로 분석합니다
+        (프로젝트 목록은 프롬프트당 1회만 포함). 응답에서 블록이나 결정 마커를
+        찾지 못한 메시지, 또는 호출 자체가 실패한 chunk는 analyze()로 개별 분석합니다.
 
         Args:
-            messages: List of message dicts with keys: text, sender_name, source_channel, channel_id, rule_hint
+            messages: List of message dicts with keys: text, sender_name, source_channel,
+                channel_id, rule_hint, rag_context (rule_hint/rag_context optional)
             project_list: List of registered projects
+            max_batch_size: Messages per Ollama prompt
 
         Returns:
             List of AnalysisResult (same order as input)
         """
         results = []
-        for msg in messages:
-            result = await self.analyze(
-                text=msg["text"],
-                sender_name=msg["sender_name"],
-                source_channel=msg["source_channel"],
-                channel_id=msg["channel_id"],
-                project_list=project_list,
-                rule_hint=msg.get("rule_hint")
-            )
-            results.append(result)
+        for start in range(0, len(messages), max(1, max_batch_size)):
+            chunk = messages[start:start + max(1, max_batch_size)]
+            parsed: list[AnalysisResult | None] = [None] * len(chunk)
+            if len(chunk) > 1 and self.batch_prompt_template:
+                try:
+                    parsed = await self._analyze_chunk(chunk, project_list)
+                except Exception as e:
+                    logger.warning(f"Batch analyze failed, falling back to single analyze: {e}")
+
+            missing = sum(1 for r in parsed if r is None)
+            if len(chunk) > 1 and missing:
+                logger.warning(f"Batch analyze: {missing}/{len(chunk)} messages unparsed, analyzing individually")
+            for msg, result in zip(chunk, parsed, strict=True):
+                if result is None:
+                    result = await self.analyze(
+                        text=msg["text"],
+                        sender_name=msg["sender_name"],
+                        source_channel=msg["source_channel"],
+                        channel_id=msg["channel_id"],
+                        project_list=project_list,
+                        rule_hint=msg.get("rule_hint"),
+                        rag_context=msg.get("rag_context", ""),
+                    )
+                results.append(result)
+
+        return results
 
+    def _build_batch_prompt(self, chunk: list[dict[str, Any]], project_list: list[dict[str, Any]]) -> str:
+        """배치 프롬프트 구성 (메시지별 발신자/소스/규칙 힌트/RAG 포함)"""
+        blocks = []
+        for i, msg in enumerate(chunk, 1):
+            lines = [
+                f"### [MSG {i}]",
+                f"- 발신자: {msg['sender_name']}",
+                f"- 소스: {msg['source_channel']}",
+            ]
+            if msg.get("rule_hint"):
+                lines.append(f"- 기존 규칙 매칭 결과: {msg['rule_hint']}")
+            if msg.get("rag_context"):
+                lines.append(f"- 관련 과거 커뮤니케이션:\n{msg['rag_context']}")
+            lines.append(f"\n{self._truncate_text(msg['text'])}")
+            blocks.append("\n".join(lines))
+
+        return self.batch_prompt_template.format(
+            count=len(chunk),
+            project_list=self._build_project_list(project_list),
+            messages="\n\n".join(blocks),
+        )
+
+    def _parse_batch_response(self, content: str, count: int) -> list[AnalysisResult | None]:
+        """[MSG n] 블록별 결정 마커 추출 (블록 또는 마커가 없으면 None)"""
+        content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL)
+        markers = list(_MSG_MARKER.finditer(content))
+        blocks: dict[int, str] = {}
+        for i, match in enumerate(markers):
+            index = int(match.group(1))
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(content)
+            if 1 <= index <= count and index not in blocks:
+                blocks[index] = content[match.end():end].strip()
+
+        results: list[AnalysisResult | None] = []
+        for index in range(1, count + 1):
+            block = blocks.get(index, "")
+            if "[RESPONSE_NEEDED]" not in block and "[NO_RESPONSE]" not in block:
+                results.append(None)
+                continue
+            try:
+                results.append(self._extract_decision(block))
+            except ValueError:
+                # confidence=0.X 처럼 숫자가 아닌 값
+                results.append(None)
         return results
 
+    async def _analyze_chunk(
+        self,
+        chunk: list[dict[str, Any]],
+        project_list: list[dict[str, Any]],
+    ) -> list[AnalysisResult | None]:
+        """chunk 전체를 Ollama 1회 호출로 분석"""
+        await self._wait_for_rate_limit()
+        prompt = self._build_batch_prompt(chunk, project_list)
+        logger.debug(f"Calling Ollama batch analyze: model={self.model}, messages={len(chunk)}")
+
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "stream": False,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": 0.3,
+                "num_predict": 2048
+            }
+        }
+
+        async def _call_ollama() -> str:
+            with llm_timer("ollama", "analyze_batch"):
+                if self.stream:
+                    # 모든 메시지의 결정 마커가 나오면 중단 (thinking은 파싱에 쓰지 않음)
+                    _, content = await self._stream_until_decisions(payload, decisions=len(chunk))
+                    return content
+                resp = await OllamaClient.get_instance().post(
+                    f"{self.ollama_url}/api/chat", payload, timeout=self.timeout,
+                )
+                return resp.json().get("message", {}).get("content", "")
+
+        if retry_async:
+            content = await retry_async(
+                _call_ollama,
+                max_retries=2,
+                base_delay=2.0,
+                retryable_exceptions=(httpx.RequestError, httpx.HTTPStatusError),
+            )
+        else:
+            content = await _call_ollama()
+
+        return self._parse_batch_response(content, len(chunk))
+
+
+class AnalysisBatcher:
+    """
+    짧은 시간 창(window) 안에 들어온 분석 요청을 모아 analyze_batch 1회로 처리 (micro-batching)
+
+    Example:
+        batcher = AnalysisBatcher(analyzer, window=0.05, max_batch=8)
+        result = await batcher.analyze(msg_dict, project_list)
+    """
+
+    def __init__(
+        self,
+        analyzer: OllamaAnalyzer,
+        window: float = 0.05,
+        max_batch: int = 8,
+        slot: asyncio.Semaphore | None = None,
+    ):
+        """
+        Args:
+            analyzer: 배치 분석에 사용할 OllamaAnalyzer
+            window: 첫 요청 후 배치를 모으는 최대 대기 시간 (초)
+            max_batch: 배치 최대 크기 (도달 시 즉시 실행)
+            slot: 배치 호출마다 획득할 동시 실행 슬롯 (Tier 1 동시성 제한)
+        """
+        self._analyzer = analyzer
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._slot = slot
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._project_list: list[dict[str, Any]] = []
+        self._timer: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def analyze(self, message: dict[str, Any], project_list: list[dict[str, Any]]) -> AnalysisResult:
+        """배치에 합류해 결과를 기다림 (message 키는 analyze_batch와 동일)"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((message, future))
+        self._project_list = project_list
+        if len(self._pending) >= self.max_batch:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._spawn(self._flush(self._take()))
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_later())
+        return await future
+
+    def cancel(self) -> None:
+        """대기/진행 중인 배치 취소 (종료 시)"""
+        for task in list(self._tasks):
+            task.cancel()
+        for _, future in self._take():
+            future.cancel()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _take(self) -> list[tuple[dict[str, Any], asyncio.Future]]:
+        batch, self._pending = self._pending, []
+        self._timer = None
+        return batch
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        await self._flush(self._take())
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        batch = [(message, future) for message, future in batch if not future.done()]
+        if not batch:
+            return
+        try:
+            async with self._slot or contextlib.nullcontext():
+                results = await self._analyzer.analyze_batch(
+                    [message for message, _ in batch], self._project_list, max_batch_size=self.max_batch,
+                )
+        except asyncio.CancelledError:
+            # 배치가 취소되면 대기 중인 호출자도 취소
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
 
 # CLI for testing
 if __name__ == "__main__":
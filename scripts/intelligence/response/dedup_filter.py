@@ -5,15 +5,17 @@ DedupFilter - 중복 메시지 처리 방지
 handler.py에서 추출된 독립 모듈.
 """
 
-from collections import OrderedDict
-
 # handler.py와 같은 import 패턴
 try:
     from scripts.intelligence.context_store import IntelligenceStorage
+    from scripts.shared.seen_ids import BoundedSeenSet
 except ImportError:
     try:
+        from shared.seen_ids import BoundedSeenSet
+
         from intelligence.context_store import IntelligenceStorage
     except ImportError:
+        from ...shared.seen_ids import BoundedSeenSet
         from ..context_store import IntelligenceStorage
 
 
@@ -22,7 +24,7 @@ class DedupFilter:
 
     def __init__(self, storage: IntelligenceStorage, max_cache: int = 1000):
         self.storage = storage
-        self._recent_ids: OrderedDict = OrderedDict()
+        self._recent_ids = BoundedSeenSet(max_cache)
         self._max_cache = max_cache
 
     async def is_duplicate(self, source_channel: str, source_message_id: str) -> bool:
@@ -44,19 +46,15 @@ class DedupFilter:
         # DB 체크
         existing = await self.storage.find_by_message_id(source_channel, source_message_id)
         if existing:
-            self._recent_ids[key] = True
+            self._recent_ids.add(key)
             return True
 
         return False
 
     def mark_processed(self, source_channel: str, source_message_id: str):
         """처리 완료 마킹 (메모리 캐시에만)"""
-        key = f"{source_channel}:{source_message_id}"
-        self._recent_ids[key] = True
-
         # 캐시 크기 제한 (LRU: 가장 오래된 항목부터 제거)
-        while len(self._recent_ids) > self._max_cache:
-            self._recent_ids.popitem(last=False)
+        self._recent_ids.add(f"{source_channel}:{source_message_id}")
 
     def cache_size(self) -> int:
         """현재 캐시 크기"""
@@ -13,6 +13,14 @@ from pathlib import Path
 
 import httpx
 
+try:
+    from scripts.shared.ollama_client import OllamaClient
+except ImportError:
+    try:
+        from shared.ollama_client import OllamaClient
+    except ImportError:
+        from ...shared.ollama_client import OllamaClient
+
 PROMPT_TEMPLATE_PATH = Path(r"C:\claude\secretary\scripts\intelligence\prompts\draft_prompt.txt")
 
 
@@ -222,19 +230,18 @@ class OllamaDraftGenerator:
             "stream": False,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.ollama_url}/api/chat",
-                    json=payload,
-                )
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                raise RuntimeError(f"Ollama API 타임아웃 ({self.timeout}초)")
-            except httpx.HTTPStatusError as e:
-                raise RuntimeError(f"Ollama API HTTP 에러: {e.response.status_code} {e.response.text}")
-            except httpx.RequestError as e:
-                raise RuntimeError(f"Ollama API 요청 실패: {e}")
+        try:
+            response = await OllamaClient.get_instance().post(
+                f"{self.ollama_url}/api/chat",
+                payload,
+                timeout=self.timeout,
+            )
+        except httpx.TimeoutException:
+            raise RuntimeError(f"Ollama API 타임아웃 ({self.timeout}초)")
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"Ollama API HTTP 에러: {e.response.status_code} {e.response.text}")
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Ollama API 요청 실패: {e}")
 
         try:
             data = response.json()
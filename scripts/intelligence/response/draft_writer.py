@@ -5,6 +5,7 @@ ClaudeCodeDraftWriter: claude -p --model opus subprocess로 고품질 draft 생
 """
 
 import asyncio
+import contextlib
 import logging
 import shutil
 import time
@@ -20,6 +21,15 @@ except ImportError:
         # 패키지 import 시 사용 불가하면 inline fallback
         retry_async = None
 
+try:
+    from scripts.shared.metrics import llm_timer
+except ImportError:
+    try:
+        from shared.metrics import llm_timer
+    except ImportError:
+        def llm_timer(backend: str, operation: str):
+            return contextlib.nullcontext()
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,18 +145,19 @@ class ClaudeCodeDraftWriter:
         self._rate_limit_times.append(time.time())
         return result
 
-    async def _run_claude_async(self, prompt: str) -> str:
-        """claude -p --model opus 비동기 실행"""
+    async def _run_claude_async(self, prompt: str, operation: str = "draft") -> str:
+        """claude -p --model opus 비동기 실행 (operation: 메트릭 라벨)"""
         try:
             process = await asyncio.create_subprocess_exec(
                 self.claude_path, "-p", "--model", self.model, prompt,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.timeout,
-            )
+            with llm_timer("claude", operation):
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=self.timeout,
+                )
         except TimeoutError as e:
             process.kill()
             raise RuntimeError(f"Claude CLI 타임아웃 ({self.timeout}초)") from e
@@ -197,7 +208,7 @@ class ClaudeCodeDraftWriter:
 친근하고 도움이 되는 한국어 응답을 작성하세요. (3-5문장 이내)"""
 
         try:
-            return await self._run_claude_async(prompt)
+            return await self._run_claude_async(prompt, "chatbot")
         except Exception as e:
             logger.warning(f"chatbot_respond 실패: {e}")
             return None
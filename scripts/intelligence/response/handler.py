@@ -8,6 +8,8 @@ MessagePipeline에 등록되어 수신 메시지를 처리합니다.
 - Tier 2 (Claude Opus): needs_response=true일 때만 초안 작성
 - DedupFilter: 중복 메시지 처리 방지
 - ContextMatcher: 규칙 기반 힌트 제공
+- 워커 풀: 일반 워커 N개 + urgent 전용 lane, Tier별(analyzer/draft/rag) 동시 실행 제한
+- Tier 1 micro-batching: 짧은 메시지는 batch_window_ms 동안 모아 한 프롬프트로 분석
 
 처리 흐름:
 1. DedupFilter로 중복 체크
@@ -21,8 +23,11 @@ MessagePipeline에 등록되어 수신 메시지를 처리합니다.
 """
 
 import asyncio
+import contextlib
+import contextvars
 import json
 import logging
+import time
 from typing import Any
 
 try:
@@ -33,9 +38,17 @@ except ImportError:
     except ImportError:
         _CHANNEL_CONTEXTS_DIR = None
 
+try:
+    from scripts.shared.metrics import MetricsRegistry
+except ImportError:
+    try:
+        from shared.metrics import MetricsRegistry
+    except ImportError:
+        MetricsRegistry = None
+
 from ..context_store import IntelligenceStorage
 from ..project_registry import ProjectRegistry
-from .analyzer import AnalysisResult, OllamaAnalyzer
+from .analyzer import DEFAULT_KEEP_ALIVE, AnalysisBatcher, AnalysisResult, OllamaAnalyzer
 from .context_matcher import ContextMatcher
 from .dedup_filter import DedupFilter
 from .draft_store import DraftStore
@@ -43,6 +56,25 @@ from .draft_writer import ClaudeCodeDraftWriter
 
 logger = logging.getLogger(__name__)
 
+# 우선순위 값 (낮을수록 먼저 처리)
+PRIORITY_VALUES = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+_PRIORITY_NAMES = {v: k for k, v in PRIORITY_VALUES.items()}
+
+# 워커 풀 / Tier별 동시 실행 기본값 (intelligence.workers 설정으로 덮어씀)
+DEFAULT_WORKER_CONFIG = {
+    "workers": 3,               # 일반 워커 수
+    "urgent_workers": 1,        # urgent 전용 워커 수 (0이면 예약 lane 없음)
+    "analyzer_concurrency": 1,  # Tier 1 Ollama 동시 호출 (OLLAMA_NUM_PARALLEL에 맞춤)
+    "draft_concurrency": 1,     # Tier 2 claude -p 동시 실행
+    "rag_concurrency": 4,       # Knowledge Store 검색 동시 실행
+}
+
+GENERAL_LANE = "general"
+URGENT_LANE = "urgent"
+
+# 현재 워커의 lane (urgent lane은 Tier 동시성 제한을 거치지 않음)
+_current_lane: contextvars.ContextVar[str] = contextvars.ContextVar("intelligence_lane", default=GENERAL_LANE)
+
 
 class ProjectIntelligenceHandler:
     """
@@ -64,6 +96,7 @@ class ProjectIntelligenceHandler:
         knowledge_store=None,  # Optional[KnowledgeStore]
         chatbot_channels: list | None = None,
         mastery_analyzer=None,  # Optional[ChannelMasteryAnalyzer]
+        worker_config: dict[str, Any] | None = None,
     ):
         self.storage = storage
         self.registry = registry
@@ -84,6 +117,8 @@ class ProjectIntelligenceHandler:
                     ollama_url=ollama_config.get("endpoint", "http://localhost:11434"),
                     timeout=ollama_config.get("timeout", 90),
                     max_context_chars=ollama_config.get("max_context_chars", 12000),
+                    stream=ollama_config.get("stream", True),
+                    keep_alive=ollama_config.get("keep_alive", DEFAULT_KEEP_ALIVE),
                 )
             except Exception as e:
                 print(f"[Intelligence] OllamaAnalyzer 초기화 실패: {e}")
@@ -99,10 +134,38 @@ class ProjectIntelligenceHandler:
             except Exception as e:
                 print(f"[Intelligence] ClaudeCodeDraftWriter 초기화 실패: {e}")
 
-        # Priority Queue (낮은 숫자 = 높은 우선순위)
+        # 워커 풀: 일반 워커는 PriorityQueue(낮은 숫자 = 높은 우선순위),
+        # urgent 전용 워커는 urgent 큐만 처리 (긴 LLM 호출 뒤에 urgent가 밀리지 않도록)
+        self._worker_config = {**DEFAULT_WORKER_CONFIG, **(worker_config or {})}
         self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
-        self._worker_task: asyncio.Task | None = None
+        self._urgent_queue: asyncio.Queue = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
         self._counter = 0  # 같은 우선순위 시 FIFO 보장
+        # 워커별 처리 중인 항목 (종료 시 취소되면 drain()이 반환)
+        self._in_flight: dict[int, tuple] = {}
+
+        # Tier별 동시 실행 제한
+        self._tier_slots = {
+            "analyzer": asyncio.Semaphore(max(1, self._worker_config["analyzer_concurrency"])),
+            "draft": asyncio.Semaphore(max(1, self._worker_config["draft_concurrency"])),
+            "rag": asyncio.Semaphore(max(1, self._worker_config["rag_concurrency"])),
+        }
+        self._wait_seconds = None
+        self._service_seconds = None
+
+        # Tier 1 micro-batching: 짧은 메시지를 batch_window_ms 동안 모아 한 프롬프트로 분석
+        self._batcher: AnalysisBatcher | None = None
+        self._batch_max_chars = 0
+        if self._analyzer and ollama_config.get("batch_size", 8) > 1:
+            self._batcher = AnalysisBatcher(
+                self._analyzer,
+                window=ollama_config.get("batch_window_ms", 50) / 1000,
+                max_batch=ollama_config.get("batch_size", 8),
+                slot=self._tier_slots["analyzer"],
+            )
+            self._batch_max_chars = ollama_config.get("batch_max_chars", 1000)
+        # fire-and-forget 작업 (PRD 갱신 판단), drain()에서 완료 대기
+        self._background: set[asyncio.Task] = set()
 
         # Reporter (Phase 5에서 주입)
         self._reporter = None
@@ -110,17 +173,35 @@ class ProjectIntelligenceHandler:
         # 채널 문서 캐시 (mtime 기반)
         self._channel_doc_cache: dict = {}
 
+        # 프로젝트 목록 캐시 (projects 테이블 변경 표식 기반). 같은 list 객체를 넘겨야
+        # analyzer가 포맷된 목록(프롬프트 prefix)을 재사용
+        self._project_list_cache: tuple[Any, list[dict[str, Any]]] | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """큐 대기 메시지 수 (urgent 큐 포함)"""
+        return self._queue.qsize() + self._urgent_queue.qsize()
+
+    @property
+    def worker_count(self) -> int:
+        """실행 중인 워커 수 (urgent 전용 워커 포함)"""
+        return len(self._workers)
+
     async def handle(self, enriched_or_message, result) -> None:
         """
         Pipeline handler 진입점
 
         큐 워커가 활성화되어 있으면 큐에 삽입, 아니면 직접 처리.
         """
-        if self._worker_task is not None:
+        if self._workers:
             # 우선순위 결정: urgent=0, high=1, normal=2, low=3
             priority_val = self._get_priority_value(enriched_or_message, result)
             self._counter += 1
-            await self._queue.put((priority_val, self._counter, enriched_or_message, result))
+            item = (priority_val, self._counter, time.monotonic(), enriched_or_message, result)
+            if priority_val == PRIORITY_VALUES["urgent"] and self._worker_config["urgent_workers"] > 0:
+                await self._urgent_queue.put(item)
+            else:
+                await self._queue.put(item)
             return
 
         await self._process_message(enriched_or_message, result)
@@ -128,8 +209,25 @@ class ProjectIntelligenceHandler:
     def _get_priority_value(self, enriched_or_message, result) -> int:
         """PriorityQueue용 우선순위 값 (낮을수록 먼저 처리)"""
         priority_str = getattr(result, 'priority', None) or 'normal'
-        mapping = {'urgent': 0, 'high': 1, 'normal': 2, 'low': 3}
-        return mapping.get(priority_str, 2)
+        return PRIORITY_VALUES.get(priority_str, 2)
+
+    async def _project_list(self) -> list[dict[str, Any]]:
+        """등록 프로젝트 목록 (projects 테이블이 바뀔 때만 다시 조회, 다른 프로세스의 등록 포함)"""
+        marker = await self.registry.change_marker()
+        cached = self._project_list_cache
+        if cached is None or cached[0] != marker:
+            cached = self._project_list_cache = (marker, await self.registry.list_all())
+        return cached[1]
+
+    def _tier_slot(self, tier: str):
+        """
+        Tier별 동시 실행 슬롯 (async with)
+
+        urgent lane 워커는 예약된 용량이므로 슬롯을 기다리지 않습니다.
+        """
+        if _current_lane.get() == URGENT_LANE:
+            return contextlib.nullcontext()
+        return self._tier_slots[tier]
 
     async def _process_message(self, enriched_or_message, result) -> None:
         """실제 메시지 처리 로직"""
@@ -169,11 +267,12 @@ class ProjectIntelligenceHandler:
             try:
                 # 규칙 기반 매칭의 project_id를 힌트로 활용
                 hint_project_id = rule_match.project_id if rule_match.matched else None
-                results = await self._knowledge_store.search(
-                    query=original_text[:500],
-                    project_id=hint_project_id,
-                    limit=5,
-                )
+                async with self._tier_slot("rag"):
+                    results = await self._knowledge_store.search(
+                        query=original_text[:500],
+                        project_id=hint_project_id,
+                        limit=5,
+                    )
                 if results:
                     rag_parts = []
                     for r in results:
@@ -222,7 +321,9 @@ class ProjectIntelligenceHandler:
 
         # Step 9: PRD 문서 갱신 판단 (Slack 채널 메시지만, fire-and-forget)
         if source_channel == "slack" and message.channel_id:
-            asyncio.create_task(self._check_prd_update(message, source_channel))
+            task = asyncio.create_task(self._check_prd_update(message, source_channel))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
 
     async def _analyze_message(
         self,
@@ -239,7 +340,8 @@ class ProjectIntelligenceHandler:
         if not self._analyzer:
             # Ollama 비활성화 → Claude Sonnet으로 분석 (Tier 1 fallback)
             if self._draft_writer:
-                return await self._analyze_with_claude(message, source_channel, rule_hint, rag_context)
+                async with self._tier_slot("draft"):
+                    return await self._analyze_with_claude(message, source_channel, rule_hint, rag_context)
             print("[Intelligence] WARNING: 분석기 없음 - 건너뜀")
             return AnalysisResult(
                 needs_response=False,
@@ -249,16 +351,29 @@ class ProjectIntelligenceHandler:
             )
 
         try:
-            project_list = await self.registry.list_all()
-            return await self._analyzer.analyze(
-                text=message.text or "",
-                sender_name=message.sender_name or message.sender_id or "",
-                source_channel=source_channel,
-                channel_id=message.channel_id or "",
-                project_list=project_list,
-                rule_hint=rule_hint,
-                rag_context=rag_context,
-            )
+            project_list = await self._project_list()
+            text = message.text or ""
+            # urgent lane은 배치 대기 없이 단건 분석
+            if (self._batcher and _current_lane.get() != URGENT_LANE
+                    and len(text) <= self._batch_max_chars):
+                return await self._batcher.analyze({
+                    "text": text,
+                    "sender_name": message.sender_name or message.sender_id or "",
+                    "source_channel": source_channel,
+                    "channel_id": message.channel_id or "",
+                    "rule_hint": rule_hint,
+                    "rag_context": rag_context,
+                }, project_list)
+            async with self._tier_slot("analyzer"):
+                return await self._analyzer.analyze(
+                    text=message.text or "",
+                    sender_name=message.sender_name or message.sender_id or "",
+                    source_channel=source_channel,
+                    channel_id=message.channel_id or "",
+                    project_list=project_list,
+                    rule_hint=rule_hint,
+                    rag_context=rag_context,
+                )
         except Exception as e:
             print(f"[Intelligence] WARNING: Ollama 분석 실패 - 분석 건너뜀: {e}")
             return AnalysisResult(
@@ -300,11 +415,12 @@ class ProjectIntelligenceHandler:
             rag_context = ""
             if self._knowledge_store and original_text:
                 try:
-                    results = await self._knowledge_store.search(
-                        query=original_text[:500],
-                        project_id=project_id,
-                        limit=5,
-                    )
+                    async with self._tier_slot("rag"):
+                        results = await self._knowledge_store.search(
+                            query=original_text[:500],
+                            project_id=project_id,
+                            limit=5,
+                        )
                     if results:
                         rag_parts = []
                         for r in results:
@@ -325,17 +441,18 @@ class ProjectIntelligenceHandler:
             project_name = project.get("name", project_id) if project else project_id
 
             # Claude Opus로 초안 생성
-            draft_text = await self._draft_writer.write_draft(
-                project_name=project_name,
-                project_context=context,
-                original_text=original_text,
-                sender_name=message.sender_name or message.sender_id or "",
-                source_channel=source_channel,
-                ollama_reasoning=analysis.reasoning,
-                analysis_summary=analysis.summary,
-                rag_context=rag_context,
-                channel_context=channel_ctx_section,
-            )
+            async with self._tier_slot("draft"):
+                draft_text = await self._draft_writer.write_draft(
+                    project_name=project_name,
+                    project_context=context,
+                    original_text=original_text,
+                    sender_name=message.sender_name or message.sender_id or "",
+                    source_channel=source_channel,
+                    ollama_reasoning=analysis.reasoning,
+                    analysis_summary=analysis.summary,
+                    rag_context=rag_context,
+                    channel_context=channel_ctx_section,
+                )
 
             # DraftStore에 저장
             await self.draft_store.save(
@@ -529,22 +646,24 @@ class ProjectIntelligenceHandler:
         if self._analyzer:
             try:
                 # analyze()로 에스컬레이션 판단에 필요한 메타데이터 수집
-                analysis = await self._analyzer.analyze(
-                    text=text,
-                    sender_name=sender_name,
-                    source_channel=source_channel or "slack",
-                    channel_id=channel_id or "",
-                    project_list=[],
-                )
+                async with self._tier_slot("analyzer"):
+                    analysis = await self._analyzer.analyze(
+                        text=text,
+                        sender_name=sender_name,
+                        source_channel=source_channel or "slack",
+                        channel_id=channel_id or "",
+                        project_list=[],
+                    )
                 qwen_confidence = analysis.confidence
                 qwen_intent = analysis.intent
 
-                response_text = await self._analyzer.chatbot_respond(
-                    text=text,
-                    sender_name=sender_name,
-                    context=context,
-                    channel_context=channel_context,
-                )
+                async with self._tier_slot("analyzer"):
+                    response_text = await self._analyzer.chatbot_respond(
+                        text=text,
+                        sender_name=sender_name,
+                        context=context,
+                        channel_context=channel_context,
+                    )
             except Exception as e:
                 logger.warning(f"Chatbot Ollama 응답 생성 실패: {e}")
 
@@ -569,12 +688,13 @@ class ProjectIntelligenceHandler:
         # 4. Sonnet 에스컬레이션 (또는 Qwen 없거나 실패 시 Claude fallback)
         if (not response_text or should_escalate) and self._draft_writer:
             try:
-                sonnet_response = await self._draft_writer.chatbot_respond(
-                    text=text,
-                    sender_name=sender_name,
-                    context=context,
-                    channel_context=channel_context,
-                )
+                async with self._tier_slot("draft"):
+                    sonnet_response = await self._draft_writer.chatbot_respond(
+                        text=text,
+                        sender_name=sender_name,
+                        context=context,
+                        channel_context=channel_context,
+                    )
                 if sonnet_response:
                     response_text = sonnet_response
             except Exception as e:
@@ -885,11 +1005,12 @@ class ProjectIntelligenceHandler:
         # 2. Knowledge Store 검색 (RAG)
         if self._knowledge_store and query_text:
             try:
-                results = await self._knowledge_store.search(
-                    query=query_text,
-                    project_id=project_id,
-                    limit=5,
-                )
+                async with self._tier_slot("rag"):
+                    results = await self._knowledge_store.search(
+                        query=query_text,
+                        project_id=project_id,
+                        limit=5,
+                    )
                 if results:
                     parts.append("\n## 관련 과거 커뮤니케이션")
                     for r in results:
@@ -945,21 +1066,83 @@ class ProjectIntelligenceHandler:
         return full_context, channel_ctx_section
 
     async def start_worker(self) -> None:
-        """우선순위 큐 워커 시작"""
-        if self._worker_task is None:
-            self._worker_task = asyncio.create_task(self._process_loop())
-            logger.info("Intelligence handler worker started")
+        """워커 풀 시작 (일반 워커 + urgent 전용 워커)"""
+        if self._workers:
+            return
+        lanes = [GENERAL_LANE] * max(1, self._worker_config["workers"])
+        lanes += [URGENT_LANE] * max(0, self._worker_config["urgent_workers"])
+        self._workers = [
+            asyncio.create_task(self._process_loop(worker_id, lane))
+            for worker_id, lane in enumerate(lanes)
+        ]
+        self._register_metrics()
+        logger.info(f"Intelligence handler workers started: {len(lanes)}")
 
     async def stop_worker(self) -> None:
-        """우선순위 큐 워커 중지"""
-        if self._worker_task:
-            self._worker_task.cancel()
+        """워커 풀 중지"""
+        if self._workers:
+            workers, self._workers = self._workers, []
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self._batcher:
+                self._batcher.cancel()
+            logger.info("Intelligence handler workers stopped")
+
+    def _register_metrics(self) -> None:
+        """큐 길이 gauge, 대기/처리 시간 histogram 등록"""
+        if MetricsRegistry is None:
+            return
+        registry = MetricsRegistry.get_instance()
+        depth = registry.gauge(
+            "secretary_intelligence_queue_depth", "Intelligence 큐 대기 메시지 수", ("lane",)
+        )
+        depth.labels(GENERAL_LANE).set_function(self._queue.qsize)
+        depth.labels(URGENT_LANE).set_function(self._urgent_queue.qsize)
+        self._wait_seconds = registry.histogram(
+            "secretary_intelligence_wait_seconds", "Intelligence 큐 대기 시간 (초)", ("priority",)
+        )
+        self._service_seconds = registry.histogram(
+            "secretary_intelligence_service_seconds", "Intelligence 메시지 처리 시간 (초)", ("priority",)
+        )
+
+    async def drain(self, timeout: float = 30.0) -> list[tuple]:
+        """
+        종료 전 큐 처리 후 워커 중지
+
+        timeout 안에 큐의 메시지와 진행 중인 PRD 갱신 판단을 끝내고,
+        끝내지 못한 메시지(처리 도중 취소된 항목 포함)를 반환합니다.
+        호출자가 처리 원장 등에 보존해 재시작 후 다시 전달합니다.
+
+        Returns:
+            (enriched_or_message, result) 목록 (우선순위 순)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if self._workers:
             try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
-            self._worker_task = None
-            logger.info("Intelligence handler worker stopped")
+                await asyncio.wait_for(
+                    asyncio.gather(self._urgent_queue.join(), self._queue.join()), timeout
+                )
+            except TimeoutError:
+                logger.warning(f"Intelligence queue drain timeout ({timeout}s)")
+
+        await self.stop_worker()
+        items = sorted(self._in_flight.values())
+        self._in_flight.clear()
+        for queue in (self._urgent_queue, self._queue):
+            while not queue.empty():
+                items.append(queue.get_nowait())
+                queue.task_done()
+        leftover = [(enriched_or_message, result) for *_, enriched_or_message, result in items]
+
+        if self._background:
+            _, pending = await asyncio.wait(self._background, timeout=max(0.0, deadline - loop.time()))
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"PRD 갱신 판단 {len(pending)}건 취소 (drain timeout)")
+        return leftover
 
     def set_reporter(self, reporter) -> None:
         """Reporter 주입"""
@@ -1016,14 +1199,39 @@ class ProjectIntelligenceHandler:
         except Exception as e:
             logger.warning(f"PRD 갱신 판단 실패 (무시): {e}")
 
-    async def _process_loop(self) -> None:
-        """큐에서 메시지를 꺼내 처리하는 워커 루프"""
+    async def _process_loop(self, worker_id: int = 0, lane: str = GENERAL_LANE) -> None:
+        """
+        큐에서 메시지를 꺼내 처리하는 워커 루프
+
+        urgent 워커는 urgent 큐만 처리하고, 일반 워커는 urgent 큐가 비어 있지
+        않으면 그쪽을 먼저 처리한 뒤 PriorityQueue를 처리합니다.
+        """
+        _current_lane.set(lane)
         while True:
+            if lane == URGENT_LANE or not self._urgent_queue.empty():
+                queue = self._urgent_queue
+            else:
+                queue = self._queue
+            try:
+                item = await queue.get()
+            except asyncio.CancelledError:
+                break
+            priority_val, _, enqueued_at, enriched_or_message, result = item
+            priority_name = _PRIORITY_NAMES.get(priority_val, "normal")
+            started = time.monotonic()
+            if self._wait_seconds is not None:
+                self._wait_seconds.labels(priority_name).observe(started - enqueued_at)
+            self._in_flight[worker_id] = item
             try:
-                priority_val, counter, enriched_or_message, result = await self._queue.get()
                 await self._process_message(enriched_or_message, result)
-                self._queue.task_done()
+                self._in_flight.pop(worker_id, None)
             except asyncio.CancelledError:
+                # 처리 도중 중지: _in_flight를 남겨 drain()이 반환
                 break
             except Exception as e:
+                self._in_flight.pop(worker_id, None)
                 logger.error(f"Worker loop error: {e}")
+            finally:
+                if self._service_seconds is not None:
+                    self._service_seconds.labels(priority_name).observe(time.monotonic() - started)
+                queue.task_done()
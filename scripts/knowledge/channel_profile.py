@@ -9,10 +9,14 @@ import aiosqlite
 # 3중 import fallback
 try:
     from scripts.knowledge.models import ChannelProfile
+    from scripts.shared.sqlite_profile import KNOWLEDGE_PROFILE, SQLiteProfile, open_connection
 except ImportError:
     try:
+        from shared.sqlite_profile import KNOWLEDGE_PROFILE, SQLiteProfile, open_connection
+
         from knowledge.models import ChannelProfile
     except ImportError:
+        from ..shared.sqlite_profile import KNOWLEDGE_PROFILE, SQLiteProfile, open_connection
         from .models import ChannelProfile
 
 
@@ -40,16 +44,15 @@ class ChannelProfileStore:
     기존 knowledge.db에 channel_profiles 테이블을 추가합니다.
     """
 
+    PROFILE: SQLiteProfile = KNOWLEDGE_PROFILE
+
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or DEFAULT_DB_PATH
         self._connection: aiosqlite.Connection | None = None
 
     async def init_db(self) -> None:
         """DB 연결 및 channel_profiles 테이블 생성"""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection = await aiosqlite.connect(str(self.db_path))
-        self._connection.row_factory = aiosqlite.Row
-        await self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection = await open_connection(self.db_path, self.PROFILE)
         await self._connection.executescript(CHANNEL_PROFILE_SCHEMA)
         await self._connection.commit()
 
@@ -20,6 +20,14 @@ if __name__ == "__main__":
     if str(_project_root) not in sys.path:
         sys.path.insert(0, str(_project_root))
 
+try:
+    from scripts.shared.sqlite_profile import KNOWLEDGE_PROFILE, SQLiteProfile, open_connection
+except ImportError:
+    try:
+        from shared.sqlite_profile import KNOWLEDGE_PROFILE, SQLiteProfile, open_connection
+    except ImportError:
+        from ..shared.sqlite_profile import KNOWLEDGE_PROFILE, SQLiteProfile, open_connection
+
 try:
     from scripts.knowledge.models import KnowledgeDocument, SearchResult
 except ImportError:
@@ -172,6 +180,8 @@ class KnowledgeStore:
             results = await store.search("배포 일정", project_id="secretary")
     """
 
+    PROFILE: SQLiteProfile = KNOWLEDGE_PROFILE
+
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or DEFAULT_DB_PATH
         self._connection: aiosqlite.Connection | None = None
@@ -184,13 +194,8 @@ class KnowledgeStore:
         await self.close()
 
     async def init_db(self) -> None:
-        """DB 연결 및 스키마 초기화 (WAL mode)"""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._connection = await aiosqlite.connect(str(self.db_path))
-        self._connection.row_factory = aiosqlite.Row
-
-        await self._connection.execute("PRAGMA journal_mode=WAL")
+        """DB 연결 및 스키마 초기화 (KNOWLEDGE_PROFILE: WAL mode)"""
+        self._connection = await open_connection(self.db_path, self.PROFILE)
         await self._connection.executescript(SCHEMA)
         await self._connection.commit()
 
@@ -33,37 +33,18 @@ class DigestReport:
 
     async def _count_messages(self, since: datetime,
                               project_id: str | None = None) -> dict[str, Any]:
-        """메시지 수 집계 (project_id 필터 지원)"""
+        """메시지 수 집계 (시간 단위 rollup 기반, project_id 필터 지원)"""
         try:
             if not self.gateway_storage or not self.gateway_storage._connection:
                 return {"total": 0, "urgent": 0, "high": 0}
 
-            conn = self.gateway_storage._connection
-            proj_clause = " AND project_id = ?" if project_id else ""
-            params_base = [since.isoformat()] + ([project_id] if project_id else [])
-
-            async with conn.execute(
-                f"SELECT COUNT(*) as c FROM messages WHERE timestamp >= ?{proj_clause}",
-                params_base,
-            ) as cursor:
-                row = await cursor.fetchone()
-                total = row["c"] if row else 0
-
-            async with conn.execute(
-                f"SELECT COUNT(*) as c FROM messages WHERE timestamp >= ? AND priority = 'urgent'{proj_clause}",
-                params_base,
-            ) as cursor:
-                row = await cursor.fetchone()
-                urgent = row["c"] if row else 0
-
-            async with conn.execute(
-                f"SELECT COUNT(*) as c FROM messages WHERE timestamp >= ? AND priority = 'high'{proj_clause}",
-                params_base,
-            ) as cursor:
-                row = await cursor.fetchone()
-                high = row["c"] if row else 0
-
-            return {"total": total, "urgent": urgent, "high": high}
+            counts = await self.gateway_storage.get_message_counts(since, project_id)
+            by_priority = counts["by_priority"]
+            return {
+                "total": counts["total"],
+                "urgent": by_priority.get("urgent", 0),
+                "high": by_priority.get("high", 0),
+            }
         except Exception:
             return {"total": 0, "urgent": 0, "high": 0}
 
@@ -115,20 +96,13 @@ class DigestReport:
 
     async def _count_actions(self, since: datetime,
                              project_id: str | None = None) -> int:
-        """감지된 액션 수 (project_id 필터 지원)"""
+        """감지된 액션 수 (시간 단위 rollup 기반, project_id 필터 지원)"""
         try:
             if not self.gateway_storage or not self.gateway_storage._connection:
                 return 0
 
-            proj_clause = " AND project_id = ?" if project_id else ""
-            params = [since.isoformat()] + ([project_id] if project_id else [])
-
-            async with self.gateway_storage._connection.execute(
-                f"SELECT COUNT(*) as c FROM messages WHERE timestamp >= ? AND has_action = 1{proj_clause}",
-                params,
-            ) as cursor:
-                row = await cursor.fetchone()
-                return row["c"] if row else 0
+            counts = await self.gateway_storage.get_message_counts(since, project_id)
+            return counts["actions"]
         except Exception:
             return 0
 
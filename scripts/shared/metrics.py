@@ -0,0 +1,338 @@
+"""
+Metrics - 프로세스 내 메트릭 레지스트리 (Prometheus text exposition format)
+
+외부 의존성 없이 counter/gauge/histogram을 기록하고, MetricsServer로
+GET /metrics 에서 Prometheus 텍스트 형식(0.0.4)으로 노출합니다.
+
+Example:
+    registry = MetricsRegistry.get_instance()
+    polls = registry.histogram("secretary_adapter_poll_seconds", "어댑터 polling 소요 시간", ("channel",))
+    with polls.labels("slack").time():
+        ...
+    print(registry.render())
+"""
+
+import asyncio
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+# 기본 histogram 경계 (초): 1ms ~ 60s
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_PATH = "/metrics"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("counter는 감소할 수 없습니다")
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value", "_fn")
+
+    def __init__(self):
+        self.value: float = 0
+        self._fn: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """render 시점에 fn()으로 값을 읽음 (큐 길이 등)"""
+        self._fn = fn
+
+    def get(self) -> float:
+        if self._fn is not None:
+            try:
+                return self._fn()
+            except Exception:
+                return math.nan
+        return self.value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum: float = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """블록 실행 시간(초) 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric:
+    """라벨 값 조합별 child를 보관하는 메트릭 공통 부분"""
+
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """라벨 값(labelnames 순서)에 해당하는 child"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 {self.labelnames} 값이 필요합니다")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._render_samples(),
+        ]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self.name}{_label_str(self.labelnames, key)} {_format_value(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        self.labels().set_function(fn)
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self.name}{_label_str(self.labelnames, key)} {_format_value(child.get())}"
+            for key, child in self._children.items()
+        ]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if not math.isinf(b)))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def _render_samples(self) -> list[str]:
+        lines = []
+        for key, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(child.bounds, child.counts, strict=True):
+                cumulative += count
+                le = _label_str(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            inf = _label_str(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {child.count}")
+            labels = _label_str(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 이름 → 메트릭 (같은 이름으로 다시 요청하면 기존 메트릭 반환)"""
+
+    _instance: Optional["MetricsRegistry"] = None
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        """싱글톤 인스턴스"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """싱글톤 초기화 (테스트용)"""
+        cls._instance = None
+
+    def _get_or_create(self, cls: type[_Metric], name: str, help_text: str,
+                       labelnames: tuple[str, ...], **kwargs) -> _Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+        elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"메트릭 {name}이 다른 타입/라벨로 이미 등록되어 있습니다")
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+def llm_timer(backend: str, operation: str):
+    """LLM 호출 소요 시간 기록 (with 블록, secretary_llm_request_seconds)"""
+    return MetricsRegistry.get_instance().histogram(
+        "secretary_llm_request_seconds", "LLM 호출 소요 시간 (초)", ("backend", "operation")
+    ).labels(backend, operation).time()
+
+
+class MetricsServer:
+    """
+    GET /metrics 만 처리하는 최소 HTTP 서버 (요청마다 연결 종료)
+
+    Example:
+        server = MetricsServer(port=9108)
+        await server.start()
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None,
+                 host: str = "127.0.0.1", port: int = 9108):
+        self._registry = registry
+        self.host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def registry(self) -> MetricsRegistry:
+        return self._registry or MetricsRegistry.get_instance()
+
+    @property
+    def port(self) -> int:
+        """실제 바인드된 포트 (port=0으로 시작한 경우 포함)"""
+        if self._server and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self._port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), 5.0)
+            # 헤더는 읽고 버림
+            while (await asyncio.wait_for(reader.readline(), 5.0)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].partition("?")[0] if len(parts) >= 2 else ""
+            if len(parts) < 2 or parts[0] != "GET":
+                status, body, content_type = "405 Method Not Allowed", b"method not allowed\n", "text/plain"
+            elif path != METRICS_PATH:
+                status, body, content_type = "404 Not Found", b"not found\n", "text/plain"
+            else:
+                status, body, content_type = "200 OK", self.registry.render().encode("utf-8"), CONTENT_TYPE
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except (TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
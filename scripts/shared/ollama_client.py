@@ -0,0 +1,128 @@
+"""
+Ollama Client - Ollama REST API 공유 HTTP 클라이언트
+
+요청마다 httpx.AsyncClient를 새로 만들면 호출마다 TCP 연결과 커넥션 풀을
+다시 준비합니다. 프로세스 전체가 하나의 AsyncClient(keep-alive 연결 풀)를
+공유하고, 요청별 timeout과 NDJSON 스트리밍을 지원합니다.
+
+Ollama는 HTTP/1.1만 사용하고 httpx는 파이프라이닝을 하지 않으므로, 동시 요청 수는
+max_connections(연결당 요청 1개)로 제한됩니다. Ollama의 OLLAMA_NUM_PARALLEL보다 크게
+잡아도 서버 쪽에서 대기할 뿐입니다.
+
+Example:
+    client = OllamaClient.get_instance()
+    resp = await client.post(f"{url}/api/chat", payload, timeout=90)
+    async for chunk in client.stream(f"{url}/api/chat", {**payload, "stream": True}, timeout=90):
+        print(chunk["message"]["content"], end="")
+
+    await OllamaClient.shutdown()  # Gateway 종료 시
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import httpx
+
+DEFAULT_LIMITS = {
+    "max_connections": 8,            # 동시 요청 상한 (HTTP/1.1: 연결당 요청 1개)
+    "max_keepalive_connections": 4,  # 유휴 상태로 유지할 연결 수
+    "keepalive_expiry": 120.0,       # 유휴 연결 유지 시간 (초)
+}
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+
+class OllamaClient:
+    """keep-alive 연결 풀을 공유하는 Ollama HTTP 클라이언트"""
+
+    _instance: Optional["OllamaClient"] = None
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_LIMITS["max_connections"],
+        max_keepalive_connections: int = DEFAULT_LIMITS["max_keepalive_connections"],
+        keepalive_expiry: float = DEFAULT_LIMITS["keepalive_expiry"],
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.connect_timeout = connect_timeout
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def get_instance(cls) -> "OllamaClient":
+        """싱글톤 인스턴스"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """싱글톤 초기화 (테스트용)"""
+        cls._instance = None
+
+    @classmethod
+    def configure(cls, **limits) -> "OllamaClient":
+        """연결 풀 설정을 바꿔 싱글톤 교체 (Gateway 시작 시, 첫 요청 전에 호출)"""
+        cls._instance = cls(**limits)
+        return cls._instance
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """싱글톤 연결 풀 종료"""
+        if cls._instance is not None:
+            await cls._instance.aclose()
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # httpx 연결은 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(limits=self._limits)
+            self._loop = loop
+        return self._client
+
+    def _timeout(self, timeout: float | None) -> httpx.Timeout:
+        return httpx.Timeout(timeout, connect=min(self.connect_timeout, timeout or self.connect_timeout))
+
+    async def post(self, url: str, payload: dict[str, Any], timeout: float | None = 90.0) -> httpx.Response:
+        """
+        JSON POST (비스트리밍)
+
+        Raises:
+            httpx.HTTPStatusError: 4xx/5xx 응답
+            httpx.RequestError: 연결/타임아웃 오류
+        """
+        resp = await self._get_client().post(url, json=payload, timeout=self._timeout(timeout))
+        resp.raise_for_status()
+        return resp
+
+    async def stream(
+        self, url: str, payload: dict[str, Any], timeout: float | None = 90.0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        스트리밍 POST: NDJSON 응답을 한 줄씩 dict로 반환
+
+        호출자가 중간에 반복을 멈추면 응답을 닫아 Ollama의 생성도 중단됩니다.
+        """
+        client = self._get_client()
+        async with client.stream("POST", url, json=payload, timeout=self._timeout(timeout)) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (다음 요청 시 다시 생성)"""
+        client, self._client = self._client, None
+        loop, self._loop = self._loop, None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
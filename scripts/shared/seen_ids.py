@@ -0,0 +1,123 @@
+"""
+BoundedSeenSet - 삽입 순서 기반 고정 크기 중복 ID 집합
+
+GmailAdapter(처리한 Gmail 메시지 ID)와 DedupFilter(처리한 채널:메시지 키)가 공유합니다.
+OrderedDict 기반으로 add/contains가 O(1)이며, 용량을 넘으면 가장 오래된 ID부터
+결정적으로 제거합니다. 경로를 지정하면 재시작 후에도 마지막 창(window)을 복원합니다.
+
+Example:
+    seen = BoundedSeenSet(5000, path=DATA_DIR / "gmail_seen_ids.txt")
+    seen.load()
+    if seen.add(msg_id):
+        ...  # 처음 본 ID
+    seen.save()
+"""
+
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedSeenSet:
+    """
+    용량 제한 삽입 순서 ID 집합
+
+    이미 있는 ID를 다시 add하면 가장 최근 위치로 옮깁니다 (LRU).
+    contains 조회는 순서를 바꾸지 않습니다.
+    """
+
+    def __init__(self, maxlen: int, path: Path | str | None = None):
+        """
+        Args:
+            maxlen: 최대 보관 ID 수
+            path: 영속화 파일 경로 (None이면 메모리 전용, 한 줄에 ID 하나)
+        """
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self.maxlen = maxlen
+        self.path = Path(path) if path else None
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self._dirty = False
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        """오래된 ID부터 순회"""
+        return iter(self._ids)
+
+    def add(self, key: str) -> bool:
+        """
+        ID 추가 (용량 초과 시 가장 오래된 ID 제거)
+
+        Returns:
+            새로 추가된 ID이면 True
+        """
+        self._dirty = True
+        if key in self._ids:
+            self._ids.move_to_end(key)
+            return False
+        self._ids[key] = None
+        if len(self._ids) > self.maxlen:
+            self._ids.popitem(last=False)
+        return True
+
+    def update(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: str) -> None:
+        if key in self._ids:
+            del self._ids[key]
+            self._dirty = True
+
+    def clear(self) -> None:
+        self._dirty = bool(self._ids)
+        self._ids.clear()
+
+    def load(self) -> int:
+        """
+        영속화 파일에서 복원 (파일의 마지막 maxlen개, 기존 항목 뒤에 추가)
+
+        Returns:
+            복원한 ID 수
+        """
+        if self.path is None or not self.path.exists():
+            return 0
+        try:
+            keys = [line for line in self.path.read_text(encoding="utf-8").splitlines() if line]
+        except OSError as e:
+            logger.warning("seen ID 파일 로드 실패 (%s): %s", self.path, e)
+            return 0
+        keys = keys[-self.maxlen:]
+        dirty = self._dirty
+        self.update(keys)
+        self._dirty = dirty
+        return len(keys)
+
+    def save(self) -> bool:
+        """
+        변경이 있으면 영속화 파일에 원자적으로 기록 (임시 파일 → rename)
+
+        Returns:
+            기록 여부
+        """
+        if self.path is None or not self._dirty:
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text("".join(f"{key}\n" for key in self._ids), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("seen ID 파일 저장 실패 (%s): %s", self.path, e)
+            return False
+        self._dirty = False
+        return True
@@ -0,0 +1,125 @@
+"""
+SQLite 연결 프로파일 - 스토어별 PRAGMA 튜닝
+
+모든 aiosqlite 스토어(UnifiedStorage, IntelligenceStorage, KnowledgeStore,
+WorkTrackerStorage, RoadmapStorage 등)가 동일한 방식으로 연결을 열도록
+journal/synchronous/mmap/cache/temp_store/busy_timeout 설정을 한 곳에서 관리합니다.
+
+WAL 모드에서는 reader가 writer를 막지 않으므로, Gateway가 gateway.db에 쓰는 동안
+Reporter digest나 CLI가 같은 DB를 읽어도 잠금 대기가 발생하지 않습니다.
+
+Example:
+    conn = await open_connection(db_path, GATEWAY_PROFILE)
+"""
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import aiosqlite
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    SQLite 연결 PRAGMA 프로파일
+
+    Attributes:
+        name: 프로파일 이름 (로그/디버깅용)
+        journal_mode: 저널 모드 (WAL 권장)
+        synchronous: 동기화 수준 (WAL + NORMAL은 커밋당 fsync 없이 내구성 유지)
+        mmap_size: 메모리 맵 I/O 크기 (bytes, 0이면 비활성화)
+        cache_size_kib: 페이지 캐시 크기 (KiB)
+        temp_store: 임시 테이블/인덱스 저장 위치
+        busy_timeout_ms: 잠금 대기 시간 (ms)
+        foreign_keys: 외래키 제약 활성화 여부
+        query_only: 읽기 전용 연결 여부
+        auto_vacuum: 자동 vacuum 모드 (None이면 설정 안 함, 빈 DB 생성 시에만 적용)
+    """
+    name: str
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 64 * 1024 * 1024
+    cache_size_kib: int = 8 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    foreign_keys: bool = False
+    query_only: bool = False
+    auto_vacuum: str | None = None
+
+    def pragmas(self) -> list[str]:
+        """적용할 PRAGMA 문 목록 (auto_vacuum, journal_mode 먼저)"""
+        statements = [f"PRAGMA auto_vacuum={self.auto_vacuum}"] if self.auto_vacuum else []
+        statements += [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            # 음수 cache_size는 KiB 단위
+            f"PRAGMA cache_size={-self.cache_size_kib}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            f"PRAGMA foreign_keys={'ON' if self.foreign_keys else 'OFF'}",
+        ]
+        if self.query_only:
+            statements.append("PRAGMA query_only=ON")
+        return statements
+
+    def reader(self) -> "SQLiteProfile":
+        """같은 튜닝의 읽기 전용 프로파일 (digest/CLI 조회용)"""
+        return replace(self, name=f"{self.name}-reader", query_only=True)
+
+
+# 스토어별 프로파일
+GATEWAY_PROFILE = SQLiteProfile(
+    name="gateway",
+    mmap_size=256 * 1024 * 1024,
+    cache_size_kib=32 * 1024,
+    # 보존 기간 정리 후 PRAGMA incremental_vacuum으로 공간 회수
+    auto_vacuum="INCREMENTAL",
+)
+# 월별 메시지 아카이브 (한 번 쓰고 가끔 읽는 파일, WAL 부속 파일 없이)
+GATEWAY_ARCHIVE_PROFILE = SQLiteProfile(
+    name="gateway_archive",
+    journal_mode="DELETE",
+    mmap_size=0,
+    cache_size_kib=2 * 1024,
+)
+INTELLIGENCE_PROFILE = SQLiteProfile(
+    name="intelligence",
+    foreign_keys=True,
+)
+KNOWLEDGE_PROFILE = SQLiteProfile(
+    name="knowledge",
+    mmap_size=256 * 1024 * 1024,
+    cache_size_kib=16 * 1024,
+)
+WORK_TRACKER_PROFILE = SQLiteProfile(
+    name="work_tracker",
+)
+
+
+async def apply_profile(connection: aiosqlite.Connection, profile: SQLiteProfile) -> None:
+    """열린 연결에 프로파일 PRAGMA 적용"""
+    for statement in profile.pragmas():
+        await connection.execute(statement)
+
+
+async def open_connection(db_path: Path, profile: SQLiteProfile) -> aiosqlite.Connection:
+    """
+    프로파일을 적용한 aiosqlite 연결 생성
+
+    Args:
+        db_path: DB 파일 경로 (상위 디렉토리 자동 생성)
+        profile: 적용할 연결 프로파일
+
+    Returns:
+        row_factory가 aiosqlite.Row로 설정된 연결
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    connection = await aiosqlite.connect(
+        str(db_path), timeout=profile.busy_timeout_ms / 1000
+    )
+    connection.row_factory = aiosqlite.Row
+    await apply_profile(connection, profile)
+    return connection
@@ -2,7 +2,7 @@
 Work Tracker AI 분석기 — Ollama 기반 의미적 분석
 
 OllamaAnalyzer 패턴을 답습하여:
-- httpx + deque rate limit + retry_async
+- 공유 OllamaClient + deque rate limit + retry_async
 - 5-전략 JSON 추출
 - <think> 태그 제거
 - Graceful degradation (모든 메서드 try/except → fallback)
@@ -39,6 +39,14 @@ except ImportError:
         except ImportError:
             retry_async = None
 
+try:
+    from scripts.shared.ollama_client import OllamaClient
+except ImportError:
+    try:
+        from shared.ollama_client import OllamaClient
+    except ImportError:
+        from ..shared.ollama_client import OllamaClient
+
 logger = logging.getLogger(__name__)
 
 # 프롬프트 디렉토리
@@ -232,21 +240,19 @@ class WorkTrackerAIAnalyzer:
         await self._wait_for_rate_limit()
 
         async def _do_request():
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.post(
-                    f"{self.ollama_url}/api/chat",
-                    json={
-                        "model": self.model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.3,
-                            "num_predict": 2048,
-                        },
+            return await OllamaClient.get_instance().post(
+                f"{self.ollama_url}/api/chat",
+                {
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.3,
+                        "num_predict": 2048,
                     },
-                )
-                resp.raise_for_status()
-                return resp
+                },
+                timeout=self.timeout,
+            )
 
         if retry_async:
             response = await retry_async(
@@ -38,6 +38,14 @@ try:
 except Exception:
     _DEFAULT_DB_PATH = Path(r"C:\claude\secretary\data\work_tracker.db")
 
+try:
+    from scripts.shared.sqlite_profile import WORK_TRACKER_PROFILE, SQLiteProfile, open_connection
+except ImportError:
+    try:
+        from shared.sqlite_profile import WORK_TRACKER_PROFILE, SQLiteProfile, open_connection
+    except ImportError:
+        from ...shared.sqlite_profile import WORK_TRACKER_PROFILE, SQLiteProfile, open_connection
+
 
 ROADMAP_SCHEMA = """
 CREATE TABLE IF NOT EXISTS roadmap_phases (
@@ -99,13 +107,14 @@ CREATE INDEX IF NOT EXISTS idx_roadmap_tasks_project ON roadmap_tasks(project);
 class RoadmapStorage:
     """Phase / Milestone / Task 비동기 CRUD 스토리지"""
 
+    PROFILE: SQLiteProfile = WORK_TRACKER_PROFILE
+
     def __init__(self, db_path=None):
         self.db_path = db_path or _DEFAULT_DB_PATH
         self.db: Optional[aiosqlite.Connection] = None
 
     async def __aenter__(self) -> "RoadmapStorage":
-        self.db = await aiosqlite.connect(str(self.db_path))
-        self.db.row_factory = aiosqlite.Row
+        self.db = await open_connection(self.db_path, self.PROFILE)
         await self._init_tables()
         return self
 
@@ -72,10 +72,16 @@ except Exception:
 
 DEFAULT_DB_PATH: Path = _DEFAULT_DB_PATH
 
+try:
+    from scripts.shared.sqlite_profile import WORK_TRACKER_PROFILE, SQLiteProfile, open_connection
+except ImportError:
+    try:
+        from shared.sqlite_profile import WORK_TRACKER_PROFILE, SQLiteProfile, open_connection
+    except ImportError:
+        from ..shared.sqlite_profile import WORK_TRACKER_PROFILE, SQLiteProfile, open_connection
+
 # SQL Schema
 SCHEMA = """
-PRAGMA journal_mode=WAL;
-
 CREATE TABLE IF NOT EXISTS daily_commits (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     date TEXT NOT NULL,
@@ -455,6 +461,8 @@ class WorkTrackerStorage:
             commits = await storage.get_commits_by_date("2026-03-17")
     """
 
+    PROFILE: SQLiteProfile = WORK_TRACKER_PROFILE
+
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or DEFAULT_DB_PATH
         self._connection: aiosqlite.Connection | None = None
@@ -467,10 +475,8 @@ class WorkTrackerStorage:
         await self.close()
 
     async def connect(self) -> None:
-        """DB 연결 및 스키마 초기화 (WAL 모드 포함)"""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection = await aiosqlite.connect(str(self.db_path))
-        self._connection.row_factory = aiosqlite.Row
+        """DB 연결 (WORK_TRACKER_PROFILE: WAL 모드) 및 스키마 초기화"""
+        self._connection = await open_connection(self.db_path, self.PROFILE)
         await self._connection.executescript(SCHEMA)
         await self._connection.commit()
         await self._migrate_daily_summaries()
@@ -0,0 +1,18 @@
+"""
+공유 테스트 fixtures
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.actions import todo_generator
+
+
+@pytest.fixture(autouse=True)
+def isolate_todo_output(tmp_path, monkeypatch):
+    """TODO 파일 출력 경로를 tmp_path로 격리 (저장소에 리포트가 생성되지 않도록)"""
+    monkeypatch.setattr(todo_generator, "OUTPUT_DIR", tmp_path / "todos")
@@ -0,0 +1,185 @@
+"""
+AdmissionController 및 파이프라인 수용 제어 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.gateway.admission import (
+    ADMITTED,
+    BYPASSED,
+    COALESCED,
+    DROPPED,
+    AdmissionController,
+)
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.pipeline import MessagePipeline
+from scripts.gateway.storage import UnifiedStorage
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _msg(i: int, channel_id: str = "C1", sender_id: str = "U1", mention: bool = False) -> NormalizedMessage:
+    return NormalizedMessage(
+        id=f"m{i}",
+        channel=ChannelType.SLACK,
+        channel_id=channel_id,
+        sender_id=sender_id,
+        text=f"일반 메시지 {i}",
+        is_mention=mention,
+    )
+
+
+def _controller(clock: FakeClock, **config) -> AdmissionController:
+    return AdmissionController({
+        "enabled": True,
+        "channel_per_minute": 60, "channel_burst": 5,
+        "sender_per_minute": 6, "sender_burst": 3,
+        **config,
+    }, clock=clock)
+
+
+class TestAdmissionController:
+    def test_disabled_admits_everything(self):
+        controller = AdmissionController()
+        assert [controller.admit(_msg(i), "normal") for i in range(100)] == [ADMITTED] * 100
+        assert controller.get_stats()["admitted"] == 0
+
+    def test_sender_burst_then_refill(self):
+        """발신자 burst 소진 후 coalesce, 분당 rate에 따라 보충"""
+        clock = FakeClock()
+        controller = _controller(clock)
+        decisions = [controller.admit(_msg(i), "normal") for i in range(5)]
+        assert decisions == [ADMITTED] * 3 + [COALESCED] * 2
+
+        clock.now += 10  # 6/분 → 10초에 1개
+        assert controller.admit(_msg(5), "normal") == ADMITTED
+        assert controller.admit(_msg(6), "normal") == COALESCED
+
+    def test_channel_limit_across_senders(self):
+        """발신자가 달라도 채널 bucket이 소진되면 shed"""
+        clock = FakeClock()
+        controller = _controller(clock)
+        decisions = [controller.admit(_msg(i, sender_id=f"U{i}"), "normal") for i in range(7)]
+        assert decisions.count(ADMITTED) == 5
+        # 다른 채널은 영향 없음
+        assert controller.admit(_msg(99, channel_id="C2"), "normal") == ADMITTED
+
+        stats = controller.get_stats()
+        assert stats["shed"] == 2
+        assert stats["shed_by_channel"] == {"slack:C1": 2}
+
+    def test_bypass_urgent_and_mentions(self):
+        clock = FakeClock()
+        controller = _controller(clock, sender_burst=1)
+        assert controller.admit(_msg(0), "normal") == ADMITTED
+        assert controller.admit(_msg(1), "urgent") == BYPASSED
+        assert controller.admit(_msg(2), "high") == BYPASSED
+        assert controller.admit(_msg(3, mention=True), "normal") == BYPASSED
+        assert controller.admit(_msg(4), "normal") == COALESCED
+
+    def test_take_coalesced_resets(self):
+        clock = FakeClock()
+        controller = _controller(clock, sender_burst=1)
+        for i in range(4):
+            controller.admit(_msg(i), "normal")
+        assert controller.take_coalesced(_msg(9)) == 3
+        assert controller.take_coalesced(_msg(9)) == 0
+
+    def test_drop_mode_and_validation(self):
+        clock = FakeClock()
+        controller = _controller(clock, sender_burst=1, overflow="drop")
+        assert [controller.admit(_msg(i), "low") for i in range(2)] == [ADMITTED, DROPPED]
+        assert controller.take_coalesced(_msg(0)) == 0
+        with pytest.raises(ValueError):
+            AdmissionController({"overflow": "queue"})
+
+    def test_bucket_table_bounded(self):
+        clock = FakeClock()
+        controller = _controller(clock, max_buckets=10)
+        for i in range(50):
+            controller.admit(_msg(i, channel_id=f"C{i}"), "normal")
+        assert controller.get_stats()["buckets"] == {"channels": 10, "senders": 10}
+
+    def test_sender_rate_defaults_to_rate_limit(self):
+        """sender_per_minute가 없으면 rate_limit_per_minute를 발신자 한도로 사용"""
+        controller = AdmissionController({"enabled": True, "rate_limit_per_minute": 30})
+        assert controller._senders.rate == 0.5
+
+
+class TestPipelineAdmission:
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        storage = UnifiedStorage(tmp_path / "gateway.db")
+        await storage.connect()
+        yield storage
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_burst_coalesced_and_counted(self, storage):
+        """버스트 초과분은 저장만 하고 핸들러 생략, 다음 수용 메시지에 건수 전달"""
+        pipeline = MessagePipeline(storage, {
+            "admission": {"enabled": True, "sender_per_minute": 60, "sender_burst": 2},
+        })
+        clock = FakeClock()
+        pipeline._admission._clock = clock
+        handled = []
+
+        async def handler(enriched, result):
+            handled.append((enriched.original.id, result.coalesced))
+
+        pipeline.add_handler(handler)
+        results = [await pipeline.process(_msg(i)) for i in range(5)]
+        assert [r.admission for r in results] == [ADMITTED, ADMITTED, COALESCED, COALESCED, COALESCED]
+
+        # 멘션은 한도와 무관하게 처리되고 coalesce 건수를 넘겨받음
+        mention = await pipeline.process(_msg(5, mention=True))
+        assert mention.admission == BYPASSED
+        assert mention.to_dict()["coalesced"] == 3
+        assert handled == [("m0", 0), ("m1", 0), ("m5", 3)]
+
+        # coalesce된 메시지도 저장되고 처리 원장에는 남지 않음
+        assert await storage.get_message("m3") is not None
+        assert await storage.get_processing_states() == []
+        assert pipeline.get_stats()["admission"]["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_drop_skips_storage(self, storage):
+        pipeline = MessagePipeline(storage, {
+            "admission": {"enabled": True, "sender_burst": 1, "overflow": "drop"},
+        })
+        results = [await pipeline.process(_msg(i)) for i in range(3)]
+        assert [r.admission for r in results] == [ADMITTED, DROPPED, DROPPED]
+        assert all(r.error is None for r in results)
+        assert await storage.get_message("m0") is not None
+        assert await storage.get_message("m1") is None
+
+    @pytest.mark.asyncio
+    async def test_stage_mode_sheds(self, storage):
+        pipeline = MessagePipeline(storage, {
+            "admission": {"enabled": True, "sender_burst": 3},
+        })
+        handled = []
+
+        async def handler(enriched, result):
+            handled.append(enriched.original.id)
+
+        pipeline.add_handler(handler)
+        await pipeline.start()
+        try:
+            futures = [await pipeline.submit(_msg(i)) for i in range(10)]
+            results = [await f for f in futures]
+        finally:
+            await pipeline.stop()
+        assert handled == ["m0", "m1", "m2"]
+        assert sum(r.admission == COALESCED for r in results) == 7
@@ -3,6 +3,7 @@ ChannelRegistry 단위 테스트
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -96,3 +97,16 @@ class TestChannelRegistry:
         assert r.get_by_role("monitor") == []
         assert r.get_project_id("C0985UXQN6Q") is None
         assert r.all_channel_ids() == []
+
+    def test_reload_if_changed(self, registry, channels_json):
+        """channels.json 변경 시에만 재로드"""
+        assert registry.reload_if_changed() is False
+
+        channels_json.write_text(json.dumps({"channels": [
+            {"id": "C_NEW", "roles": ["project-bound"], "project_id": "wsoptv"},
+        ]}), encoding="utf-8")
+        os.utime(channels_json, (0, 12345))
+
+        assert registry.reload_if_changed() is True
+        assert registry.get_project_id("C_NEW") == "wsoptv"
+        assert registry.get_project_id("C0985UXQN6Q") is None
@@ -0,0 +1,285 @@
+"""
+GmailAdapter 메시지 일괄 조회 테스트 (로컬 fake Gmail service)
+"""
+
+import asyncio
+import base64
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.gateway.adapters.gmail import (
+    BODY_LIMIT,
+    MESSAGE_FIELDS,
+    GmailAdapter,
+    parse_gmail_message,
+)
+
+LATENCY = 0.002
+
+
+class NotFoundError(Exception):
+    """googleapiclient HttpError 대역"""
+
+    def __init__(self, msg_id: str):
+        super().__init__(f"<HttpError 404 ... returned \"Requested entity was not found.\"> {msg_id}")
+        self.resp = SimpleNamespace(status=404)
+
+
+class FakeGmailService:
+    """users().messages().get() + new_batch_http_request()만 구현한 service. 요청마다 LATENCY 소요."""
+
+    def __init__(self, messages: dict[str, dict]):
+        self.messages = messages
+        self.round_trips = 0
+        self.requested_fields: set = set()
+
+    def _get(self, msg_id: str) -> dict:
+        if msg_id not in self.messages:
+            raise NotFoundError(msg_id)
+        return self.messages[msg_id]
+
+    def users(self):
+        service = self
+
+        class _Request:
+            def __init__(self, msg_id, fields):
+                self.msg_id = msg_id
+                service.requested_fields.add(fields)
+
+            def execute(self):
+                service.round_trips += 1
+                time.sleep(LATENCY)
+                return service._get(self.msg_id)
+
+        class _Messages:
+            def get(self, userId, id, format="full", fields=None):
+                return _Request(id, fields)
+
+        return SimpleNamespace(messages=lambda: _Messages())
+
+    def new_batch_http_request(self, callback):
+        service = self
+
+        class _Batch:
+            def __init__(self):
+                self.requests = []
+
+            def add(self, request, request_id):
+                self.requests.append((request_id, request))
+
+            def execute(self):
+                service.round_trips += 1
+                time.sleep(LATENCY)
+                for request_id, request in self.requests:
+                    try:
+                        callback(request_id, service._get(request.msg_id), None)
+                    except Exception as e:
+                        callback(request_id, None, e)
+
+        return _Batch()
+
+
+class FakeGmailClient:
+    """lib.gmail.GmailClient 대역: service + 개별 get_email"""
+
+    def __init__(self, service: FakeGmailService, history_ids: list[str]):
+        self.service = service
+        self._backend = service
+        self._history_ids = history_ids
+        # 동시에 실행 중인 get_email 수 (공유 service는 thread-safe하지 않음)
+        self._active = 0
+        self.max_active = 0
+
+    def list_history(self, start_history_id, history_types, label_id):
+        return {
+            "historyId": "200",
+            "history": [{"messagesAdded": [
+                {"message": {"id": msg_id, "labelIds": ["INBOX", "UNREAD"]}}
+                for msg_id in self._history_ids
+            ]}],
+        }
+
+    def get_email(self, msg_id):
+        self._active += 1
+        self.max_active = max(self.max_active, self._active)
+        try:
+            self._backend.round_trips += 1
+            time.sleep(LATENCY)
+            return parse_gmail_message(self._backend._get(msg_id))
+        finally:
+            self._active -= 1
+
+
+def _raw_message(i: int, body: str = "본문") -> dict:
+    return {
+        "id": f"m{i}",
+        "threadId": f"t{i}",
+        "snippet": "snippet",
+        "internalDate": "1760000000000",
+        "payload": {
+            "mimeType": "multipart/alternative",
+            "headers": [
+                {"name": "From", "value": "Alice <alice@example.com>"},
+                {"name": "To", "value": "me@example.com, bob@example.com"},
+                {"name": "Subject", "value": f"제목 {i}"},
+            ],
+            "parts": [
+                {"mimeType": "text/html", "body": {"data": "PGI-aGk8L2I-"}},
+                {"mimeType": "text/plain",
+                 "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()}},
+            ],
+        },
+    }
+
+
+def _adapter(count: int, missing: int = 0, **config) -> tuple[GmailAdapter, FakeGmailService]:
+    service = FakeGmailService({f"m{i}": _raw_message(i) for i in range(count)})
+    history_ids = [f"m{i}" for i in range(count + missing)]
+    adapter = GmailAdapter(config)
+    adapter._client = FakeGmailClient(service, history_ids)
+    adapter._last_history_id = "100"
+    return adapter, service
+
+
+class TestParse:
+    def test_parse_headers_and_plain_body(self):
+        email = parse_gmail_message(_raw_message(1, body="안녕하세요"))
+        assert email.subject == "제목 1"
+        assert email.sender == "Alice <alice@example.com>"
+        assert email.to == ["me@example.com", "bob@example.com"]
+        assert email.thread_id == "t1"
+        assert email.body_text == "안녕하세요"
+
+    def test_body_decoded_only_up_to_limit(self):
+        email = parse_gmail_message(_raw_message(1, body="가" * (BODY_LIMIT * 3)))
+        assert BODY_LIMIT <= len(email.body_text) < BODY_LIMIT * 3
+
+
+class TestBatchFetch:
+    @pytest.mark.asyncio
+    async def test_batch_fewer_round_trips_and_faster(self):
+        """200건: batch 4회 왕복 vs 개별 200회 왕복"""
+        batched, batch_service = _adapter(200)
+        started = time.perf_counter()
+        messages = await batched._poll_new_messages()
+        batch_time = time.perf_counter() - started
+
+        serial, serial_service = _adapter(200, batch_size=1)
+        started = time.perf_counter()
+        serial_messages = await serial._poll_new_messages()
+        serial_time = time.perf_counter() - started
+
+        assert [m.id for m in messages] == [m.id for m in serial_messages]
+        assert [m.text for m in messages] == [m.text for m in serial_messages]
+        assert batch_service.round_trips == 4
+        assert serial_service.round_trips == 200
+        assert batch_time < serial_time / 5
+        assert batch_service.requested_fields == {MESSAGE_FIELDS}
+
+    @pytest.mark.asyncio
+    async def test_not_found_items_skipped_and_marked_seen(self):
+        """batch 항목 404는 기존처럼 seen 처리 후 건너뜀"""
+        adapter, _ = _adapter(3, missing=2)
+        messages = await adapter._poll_new_messages()
+
+        assert [m.id for m in messages] == ["gmail_m0", "gmail_m1", "gmail_m2"]
+        assert "m3" in adapter._seen_ids and "m4" in adapter._seen_ids
+        status = await adapter.get_status()
+        assert status["fetch"]["not_found"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_fallback_without_batch(self):
+        """service가 batch를 지원하지 않으면 공유 client로 개별 조회를 겹치지 않게 순차 실행"""
+        adapter, service = _adapter(40, missing=1)
+        adapter._client.service = None
+
+        messages = await adapter._poll_new_messages()
+
+        assert len(messages) == 40
+        assert service.round_trips == 41
+        assert adapter._client.max_active == 1
+        assert "m40" in adapter._seen_ids
+
+
+class TestSeenIds:
+    @pytest.mark.asyncio
+    async def test_seen_ids_persist_across_restart(self, tmp_path):
+        """처리한 ID가 저장되어 재시작 후 같은 history를 다시 조회하지 않음"""
+        path = tmp_path / "gmail_seen_ids.txt"
+        adapter, _ = _adapter(3, seen_ids_path=str(path))
+        assert len(await adapter._poll_new_messages()) == 3
+
+        restarted, service = _adapter(3, seen_ids_path=str(path))
+        restarted._seen_ids.load()
+        assert await restarted._poll_new_messages() == []
+        assert service.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_oldest_ids_evicted_first(self):
+        """max_seen 초과 시 가장 오래된 ID만 제거"""
+        adapter, _ = _adapter(5, max_seen=3)
+        await adapter._poll_new_messages()
+        assert list(adapter._seen_ids) == ["m2", "m3", "m4"]
+
+
+class TestPush:
+    @pytest.mark.asyncio
+    async def test_notification_wakes_listen(self):
+        """Pub/Sub 알림을 받으면 reconcile 간격을 기다리지 않고 History 조회"""
+        adapter, _ = _adapter(2)
+        adapter._connected = True
+        adapter.enable_push(600)
+        adapter._client._history_ids = []
+
+        received = []
+
+        async def run():
+            async for msg in adapter.listen():
+                received.append(msg)
+                return
+
+        task = asyncio.create_task(run())
+        await asyncio.sleep(0.05)
+        assert received == []
+
+        adapter._client._history_ids = ["m0"]
+        assert await adapter.handle_push({"emailAddress": "me@example.com", "historyId": 250}) == []
+        await asyncio.wait_for(task, 1.0)
+        assert [m.id for m in received] == ["gmail_m0"]
+
+    @pytest.mark.asyncio
+    async def test_stale_notification_ignored(self):
+        adapter, _ = _adapter(1)
+        await adapter.handle_push({"historyId": "90"})
+        assert not adapter._poll_wakeup.is_set()
+        assert (await adapter.get_status())["push"] == {"notifications": 0, "stale": 1}
+
+
+class TestDrain:
+    @pytest.mark.asyncio
+    async def test_stop_listening_ends_wait(self):
+        """stop_listening은 polling 대기를 깨워 listen을 바로 종료"""
+        adapter, _ = _adapter(0)
+        adapter._connected = True
+        adapter._polling_interval = 600
+
+        async def run():
+            return [msg async for msg in adapter.listen()]
+
+        task = asyncio.create_task(run())
+        await asyncio.sleep(0.05)
+        adapter.stop_listening()
+        assert await asyncio.wait_for(task, 1.0) == []
+
+    def test_cursor_round_trip(self):
+        adapter, _ = _adapter(0)
+        assert adapter.get_cursors() == {"history_id": "100"}
+        restored = GmailAdapter({})
+        restored.restore_cursors({"history_id": "100"})
+        assert restored._last_history_id == "100"
@@ -0,0 +1,84 @@
+"""
+KeywordMatcher 테스트
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.gateway.keyword_matcher import KeywordMatcher, _required_literal
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.pipeline import DEFAULT_CONFIG, MessagePipeline
+from scripts.gateway.project_context import ProjectContext, ProjectContextResolver
+
+
+def _matcher(*contexts):
+    return KeywordMatcher(DEFAULT_CONFIG, contexts)
+
+
+class TestScan:
+    def test_urgent_requires_boundary(self):
+        assert _matcher().scan("긴급! 확인").urgent
+        assert _matcher().scan("please reply asap.").urgent
+        assert not _matcher().scan("긴급하게").urgent
+
+    def test_deny_context(self):
+        hits = _matcher().scan("지금까지 정리한 내용입니다 지금 공유")
+        assert hits.deny
+        assert hits.urgent
+
+    def test_overlapping_keywords_found(self):
+        """같은 위치/겹치는 위치의 키워드 모두 감지 (확인 + 해주세요)"""
+        hits = _matcher().scan("확인해주세요")
+        assert hits.actions == ["해주세요", "확인"]
+
+    def test_completion_excludes_action(self):
+        hits = _matcher().scan("검토완료 했습니다, 회신 부탁")
+        assert "검토" not in hits.actions
+        assert hits.actions == ["부탁", "회신"]
+
+    def test_deadlines_in_pattern_order(self):
+        hits = _matcher().scan("내일까지 또는 2/10 까지")
+        assert hits.deadlines == ["2/10 까지", "내일까지"]
+
+    def test_question_ignores_url_and_code(self):
+        assert not _matcher().scan("링크 https://x.com/a?b=1 `a?b`").question
+        assert _matcher().scan("이거 어떻게 하나요").question
+
+    def test_project_keywords(self):
+        ctx = ProjectContext("p1", urgent_keywords=["서버다운"], action_keywords=["배포", "릴리즈"])
+        hits = _matcher(ctx).scan("서버다운, 릴리즈 후 배포")
+        assert hits.project_urgent == {"p1"}
+        assert hits.project_actions == {"p1": ["배포", "릴리즈"]}
+
+    def test_required_literal(self):
+        assert _required_literal(r"(\d{1,2})일\s*까지") == "까지"
+        assert _required_literal(r"오늘\s*(중|까지|내)") == "오늘"
+        assert _required_literal("a|b") is None
+
+
+class TestPipelineRebuild:
+    def test_matcher_rebuilt_on_reload(self, tmp_path):
+        config_path = tmp_path / "projects.json"
+
+        def write(urgent):
+            config_path.write_text(json.dumps({"projects": [{
+                "id": "p1", "slack_channels": ["C1"],
+                "pipeline_config": {"urgent_keywords": urgent},
+            }]}), encoding="utf-8")
+
+        write(["장애"])
+        resolver = ProjectContextResolver(config_path)
+        pipeline = MessagePipeline(storage=None, project_resolver=resolver)
+        msg = NormalizedMessage(id="m1", channel=ChannelType.SLACK, channel_id="C1",
+                                sender_id="u1", text="송출 중단")
+
+        ctx = resolver.get_context("p1")
+        assert pipeline._analyze_priority(msg, ctx) == "normal"
+
+        write(["송출"])
+        resolver.reload()
+        ctx = resolver.get_context("p1")
+        assert pipeline._analyze_priority(msg, ctx) == "urgent"
@@ -2,16 +2,22 @@
 EnrichedMessage 모델 테스트
 """
 
+import pickle
 import sys
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.gateway.models import (
     ChannelType,
     EnrichedMessage,
+    MessageType,
     NormalizedMessage,
     Priority,
+    StoredMessage,
 )
 
 
@@ -90,3 +96,67 @@ class TestEnrichedMessage:
         )
         enriched = EnrichedMessage(original=msg)
         assert enriched.message is enriched.original
+
+
+def _stored(**overrides) -> StoredMessage:
+    values = {
+        "id": "db-1", "channel": "slack", "channel_id": "C1", "sender_id": "U1",
+        "sender_name": "kim", "text": "hello", "message_type": "text",
+        "timestamp": "2026-01-01T09:00:00", "is_group": 1, "is_mention": 0,
+        "reply_to_id": None, "media_json": None, "raw_json": None,
+        "priority": "high", "has_action": 1, "project_id": "proj",
+    }
+    values.update(overrides)
+    return StoredMessage.from_row(**values)
+
+
+class TestStoredMessage:
+    """DB 행 fast-path 생성 테스트"""
+
+    def test_slotted(self):
+        """NormalizedMessage/StoredMessage는 인스턴스 __dict__ 없음"""
+        msg = NormalizedMessage(id="s", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1")
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(_stored(), "__dict__")
+        with pytest.raises(AttributeError):
+            msg.extra = 1
+
+    def test_from_row_converts_values(self):
+        """Enum/타임스탬프/불리언 변환, 알 수 없는 값은 기본값"""
+        msg = _stored()
+        assert msg.channel is ChannelType.SLACK
+        assert msg.message_type is MessageType.TEXT
+        assert msg.priority is Priority.HIGH
+        assert msg.timestamp == datetime(2026, 1, 1, 9)
+        assert msg.is_group is True and msg.has_action is True
+
+        odd = _stored(channel="fax", message_type=None, priority="whenever")
+        assert odd.channel is ChannelType.UNKNOWN
+        assert odd.message_type is MessageType.TEXT
+        assert odd.priority is None
+
+    def test_media_urls_parsed_lazily(self):
+        """media_urls JSON은 첫 접근 시 파싱, 대입하면 그 값 사용"""
+        msg = _stored(media_json='["https://a/1.png"]')
+        assert msg._media_json == '["https://a/1.png"]'
+        assert msg.media_urls == ["https://a/1.png"]
+        assert msg._media_json is None
+        assert msg.media_urls is msg.media_urls
+        assert _stored().media_urls == []
+
+        msg.media_urls = ["https://b/2.png"]
+        assert msg.to_dict()["media_urls"] == ["https://b/2.png"]
+
+    def test_equals_constructed_message(self):
+        """같은 필드면 일반 생성 NormalizedMessage와 동일, pickle 왕복 유지"""
+        msg = _stored(media_json='["u"]')
+        expected = NormalizedMessage(
+            id="db-1", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            sender_name="kim", text="hello", timestamp=datetime(2026, 1, 1, 9),
+            is_group=True, media_urls=["u"], priority=Priority.HIGH, has_action=True,
+            project_id="proj",
+        )
+        assert msg == expected
+        assert expected == msg
+        assert pickle.loads(pickle.dumps(msg)) == expected
+        assert msg != _stored(text="other")
@@ -2,6 +2,7 @@
 Pipeline 테스트
 """
 
+import asyncio
 import sys
 import tempfile
 from datetime import datetime
@@ -13,7 +14,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.gateway.models import ChannelType, NormalizedMessage
-from scripts.gateway.pipeline import MessagePipeline, PipelineResult
+from scripts.gateway.pipeline import CHECKPOINT_STAGE, MessagePipeline, PipelineResult
 from scripts.gateway.storage import UnifiedStorage
 
 
@@ -236,6 +237,36 @@ class TestStorage:
         finally:
             await storage.close()
 
+    @pytest.mark.asyncio
+    async def test_urgent_message_flushed_in_write_behind(self, temp_db):
+        """write-behind 스토리지: 긴급 메시지는 저장 직후 flush"""
+        storage = UnifiedStorage(temp_db, write_behind=True, flush_interval=60)
+        pipeline = MessagePipeline(storage)
+        await storage.connect()
+        try:
+            normal = NormalizedMessage(
+                id="test-wb-normal",
+                channel=ChannelType.SLACK,
+                channel_id="chat-001",
+                sender_id="user-001",
+                text="일반 메시지",
+            )
+            await pipeline.process(normal)
+            assert storage.pending_count == 1
+
+            urgent = NormalizedMessage(
+                id="test-wb-urgent",
+                channel=ChannelType.SLACK,
+                channel_id="chat-001",
+                sender_id="user-001",
+                text="긴급 장애 발생",
+            )
+            result = await pipeline.process(urgent)
+            assert result.priority == "urgent"
+            assert storage.pending_count == 0
+        finally:
+            await storage.close()
+
 
 class TestPipelineResult:
     """PipelineResult 테스트"""
@@ -285,3 +316,321 @@ class TestCustomHandler:
             assert "test-handler-1" in handler_called
         finally:
             await storage.close()
+
+
+def _msg(msg_id: str, channel_id: str = "chat-001", text: str = "테스트") -> NormalizedMessage:
+    return NormalizedMessage(
+        id=msg_id,
+        channel=ChannelType.SLACK,
+        channel_id=channel_id,
+        sender_id="user-001",
+        text=text,
+    )
+
+
+class TestStagedPipeline:
+    """스테이지 모드 (start/submit/stop) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_slow_handler(self, storage):
+        """느린 핸들러가 있어도 submit()은 즉시 반환 (수신 루프 비차단)"""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_handler(enriched, result):
+            await release.wait()
+
+        await storage.connect()
+        pipeline = MessagePipeline(storage)
+        pipeline.add_handler(slow_handler)
+        await pipeline.start()
+        try:
+            futures = [await pipeline.submit(_msg(f"slow-{i}")) for i in range(5)]
+            assert not any(f.done() for f in futures)
+
+            release.set()
+            results = await asyncio.gather(*futures)
+            assert [r.message_id for r in results] == [f"slow-{i}" for i in range(5)]
+            assert all(r.processed_at is not None for r in results)
+        finally:
+            await pipeline.stop()
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_per_channel_ordering(self, storage):
+        """여러 워커에서도 같은 channel_id 메시지는 순서 유지"""
+        import asyncio
+        import random
+
+        seen: dict[str, list[str]] = {}
+
+        async def handler(enriched, result):
+            await asyncio.sleep(random.random() / 1000)
+            msg = enriched.original
+            seen.setdefault(msg.channel_id, []).append(msg.id)
+
+        await storage.connect()
+        pipeline = MessagePipeline(
+            storage,
+            {"stage_workers": {"classify": 3, "handlers": 3}, "stage_queue_size": 4},
+        )
+        pipeline.add_handler(handler)
+        await pipeline.start()
+        try:
+            futures = []
+            for i in range(20):
+                for ch in ("C1", "C2", "C3"):
+                    futures.append(await pipeline.submit(_msg(f"{ch}-{i:02d}", channel_id=ch)))
+            await asyncio.gather(*futures)
+        finally:
+            await pipeline.stop()
+            await storage.close()
+
+        for ch in ("C1", "C2", "C3"):
+            assert seen[ch] == [f"{ch}-{i:02d}" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_stage_error_skips_later_stages(self, storage):
+        """stage 오류 시 이후 stage 건너뛰고 result.error 설정"""
+        called = []
+
+        async def handler(enriched, result):
+            called.append(enriched.original.id)
+
+        await storage.close()  # 연결 없음 → persist stage에서 RuntimeError
+        pipeline = MessagePipeline(storage)
+        pipeline.add_handler(handler)
+        await pipeline.start()
+        try:
+            result = await (await pipeline.submit(_msg("err-1")))
+        finally:
+            await pipeline.stop()
+
+        assert result.error is not None
+        assert called == []
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queued_messages(self, storage):
+        """stop(drain=True)은 남은 메시지를 모두 처리"""
+        await storage.connect()
+        pipeline = MessagePipeline(storage, {"stage_queue_size": 2})
+        await pipeline.start()
+        try:
+            futures = [await pipeline.submit(_msg(f"drain-{i}")) for i in range(10)]
+            await pipeline.stop(drain=True)
+            assert all(f.done() and not f.cancelled() for f in futures)
+            assert (await storage.get_stats())["total_messages"] == 10
+            assert not pipeline.is_running
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_stop_without_drain_checkpoints_unsaved_messages(self, storage):
+        """큐에 남은 미저장 메시지는 처리 원장에 checkpoint되고 replay로 처리"""
+        await storage.connect()
+        try:
+            pipeline = MessagePipeline(storage)
+            await pipeline.start()
+            futures = [await pipeline.submit(_msg(f"cp-{i}")) for i in range(3)]
+            assert await pipeline.stop(drain=False) == 3
+            assert all(f.cancelled() for f in futures)
+            states = await storage.get_processing_states()
+            assert {s["stage"] for s in states} == {CHECKPOINT_STAGE}
+
+            handled = []
+
+            async def handler(enriched, result):
+                handled.append(enriched.original.id)
+
+            restarted = MessagePipeline(storage)
+            restarted.add_handler(handler)
+            results = await restarted.replay()
+            assert sorted(handled) == ["cp-0", "cp-1", "cp-2"]
+            assert all(r.error is None for r in results)
+            assert await storage.get_processing_states() == []
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_stop_timeout_keeps_interrupted_handler_in_ledger(self, storage):
+        """drain 시간 초과로 핸들러 도중 취소된 메시지도 재시작 후 다시 처리"""
+        await storage.connect()
+        try:
+            started = asyncio.Event()
+
+            async def stuck(enriched, result):
+                started.set()
+                await asyncio.Event().wait()
+
+            pipeline = MessagePipeline(storage)
+            pipeline.add_handler(stuck)
+            await pipeline.start()
+            future = await pipeline.submit(_msg("stuck-1"))
+            await started.wait()
+            assert await pipeline.stop(drain=True, timeout=0.05) == 1
+            assert future.cancelled()
+
+            handled = []
+
+            async def handler(enriched, result):
+                handled.append(enriched.original.id)
+
+            restarted = MessagePipeline(storage)
+            restarted.add_handler(handler)
+            await restarted.replay()
+            assert handled == ["stuck-1"]
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_submit_without_workers_processes_inline(self, storage):
+        """워커 미실행 시 submit()은 process()와 동일"""
+        await storage.connect()
+        try:
+            pipeline = MessagePipeline(storage)
+            future = await pipeline.submit(_msg("inline-1", text="긴급 확인"))
+            assert future.done()
+            assert future.result().priority == "urgent"
+            assert pipeline.get_stats()["stages"] == {}
+        finally:
+            await storage.close()
+
+
+class TestProcessingLedger:
+    """처리 원장 기록 및 replay 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_success_marks_processed_and_clears_ledger(self, storage, pipeline):
+        await storage.connect()
+        try:
+            await pipeline.process(_msg("ok-1"))
+            stats = await storage.get_stats()
+            assert stats["unprocessed"] == 0
+            assert stats["in_flight"] == 0
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_resumes_after_last_completed_stage(self, storage):
+        """handler 실패 → 원장에 기록 → replay는 dispatch 없이 handler부터 재개"""
+        await storage.connect()
+        try:
+            calls = []
+
+            async def flaky(enriched, result):
+                calls.append(enriched.original.id)
+                if len(calls) == 1:
+                    raise RuntimeError("downstream unavailable")
+
+            pipeline = MessagePipeline(storage)
+            pipeline.add_handler(flaky)
+            dispatched = []
+
+            async def dispatch(message, result):
+                dispatched.append(message.id)
+            pipeline._dispatch_actions = dispatch
+
+            result = await pipeline.process(_msg("replay-1", text="검토 부탁드립니다"))
+            assert result.error == "downstream unavailable"
+            state, = await storage.get_processing_states()
+            assert state["stage"] == "dispatch"
+            assert state["attempts"] == 1
+            assert state["last_error"] == "handlers: downstream unavailable"
+
+            results = await pipeline.replay()
+            assert [r.error for r in results] == [None]
+            assert results[0].has_action is True
+            assert dispatched == ["replay-1"]
+            assert calls == ["replay-1", "replay-1"]
+            assert await storage.get_processing_states() == []
+            assert (await storage.get_stats())["unprocessed"] == 0
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_skips_poison_messages(self, storage):
+        """max_attempts 이상 실패한 메시지는 replay 대상에서 제외"""
+        await storage.connect()
+        try:
+            async def broken(enriched, result):
+                raise RuntimeError("boom")
+
+            pipeline = MessagePipeline(storage)
+            pipeline.add_handler(broken)
+            await pipeline.process(_msg("poison-1"))
+            await pipeline.replay(max_attempts=5)
+            assert (await storage.get_processing_states())[0]["attempts"] == 2
+            assert await pipeline.replay(max_attempts=2) == []
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_counts_failures_of_checkpointed_messages(self, storage):
+        """저장 전 checkpoint된 메시지도 replay 실패 시 attempts가 늘어 poison으로 제외"""
+        await storage.connect()
+        try:
+            await storage.save_message(_msg("queued-1"), stage=CHECKPOINT_STAGE)
+            pipeline = MessagePipeline(storage)
+
+            async def broken_resolve(item):
+                raise RuntimeError("resolver down")
+            pipeline._stage_resolve = broken_resolve
+
+            await pipeline.replay(max_attempts=2)
+            state, = await storage.get_processing_states()
+            assert state["stage"] == CHECKPOINT_STAGE
+            assert state["attempts"] == 1
+            assert state["last_error"] == "resolve: resolver down"
+
+            await pipeline.replay(max_attempts=2)
+            assert await pipeline.replay(max_attempts=2) == []
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_ledger_writes_share_message_commit(self, storage):
+        """기본(write_behind=False) 모드에서 메시지당 commit은 저장 + 처리 완료 2회 (stage 기록은 여기에 포함)"""
+        await storage.connect()
+        try:
+            pipeline = MessagePipeline(storage)
+
+            async def dispatch(message, result):
+                pass
+            pipeline._dispatch_actions = dispatch
+
+            commits = 0
+            original = storage._commit
+
+            async def counting_commit():
+                nonlocal commits
+                commits += 1
+                await original()
+            storage._commit = counting_commit
+
+            for i in range(3):
+                await pipeline.process(_msg(f"commit-{i}", text="검토 부탁드립니다"))
+            assert commits == 6
+
+            stats = await storage.get_stats()
+            assert stats["unprocessed"] == 0
+            assert stats["in_flight"] == 0
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_processed_is_durable_when_process_returns(self, storage, temp_db):
+        """기본 모드에서 process()가 반환되면 처리 완료가 commit되어 다른 연결에서도 보임"""
+        await storage.connect()
+        try:
+            pipeline = MessagePipeline(storage)
+            await pipeline.process(_msg("durable-1"))
+
+            async with UnifiedStorage(temp_db, read_only=True) as reader:
+                async with reader._connection.execute(
+                    "SELECT processed_at FROM messages WHERE id = ?", ("durable-1",)
+                ) as cursor:
+                    assert (await cursor.fetchone())[0] is not None
+                assert await reader.get_processing_states() == []
+        finally:
+            await storage.close()
@@ -3,6 +3,7 @@ ProjectContextResolver 테스트 + 프로젝트별 Pipeline 통합 테스트
 """
 
 import json
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -11,6 +12,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts.gateway.channel_registry import ChannelRegistry
 from scripts.gateway.models import ChannelType, NormalizedMessage
 from scripts.gateway.pipeline import MessagePipeline
 from scripts.gateway.project_context import ProjectContextResolver
@@ -147,6 +149,87 @@ class TestProjectContextResolver:
         assert r.resolve(msg) is None
 
 
+    def test_earlier_project_wins_across_rules(self, resolver):
+        """먼저 정의된 프로젝트의 키워드가 뒤 프로젝트의 Slack 채널보다 우선 (기존 순차 탐색과 동일)"""
+        msg = NormalizedMessage(
+            id="t8", channel=ChannelType.SLACK, channel_id="C_WSOPTV",
+            sender_id="u1", text="비서 기능 문의",
+        )
+        assert resolver.resolve(msg) == "secretary"
+
+    def test_email_sender_and_overlapping_terms(self, resolver):
+        """발신자 포함 매칭, 겹치는 용어도 부분 문자열로 판정"""
+        msg = NormalizedMessage(
+            id="t9", channel=ChannelType.EMAIL, channel_id="inbox",
+            sender_id="wsop-team@example.com", text="weekly update",
+        )
+        assert resolver.resolve(msg) == "wsoptv"
+
+    def test_hot_reload_on_config_change(self, projects_config):
+        """projects.json 변경 시 resolve 중 자동 재로드 및 version 증가"""
+        r = ProjectContextResolver(projects_config)
+        r.reload_check_interval = 0
+        msg = NormalizedMessage(
+            id="t10", channel=ChannelType.SLACK, channel_id="C_NEW",
+            sender_id="u1", text="hello",
+        )
+        assert r.resolve(msg) is None
+
+        config = json.loads(projects_config.read_text(encoding="utf-8"))
+        config["projects"].append({"id": "newproj", "slack_channels": ["C_NEW"]})
+        projects_config.write_text(json.dumps(config), encoding="utf-8")
+        os.utime(projects_config, (0, 12345))
+
+        assert r.resolve(msg) == "newproj"
+        assert r.version == 1
+        assert r.reload_if_changed() is False
+
+    def test_reload_keeps_previous_config_on_parse_error(self, projects_config):
+        """깨진 projects.json은 무시하고 기존 프로젝트 유지, 파일 삭제 시 인덱스 비움"""
+        r = ProjectContextResolver(projects_config)
+        r.reload_check_interval = 0
+        msg = NormalizedMessage(
+            id="t12", channel=ChannelType.SLACK, channel_id="C_SECRETARY",
+            sender_id="u1", text="hello",
+        )
+        assert r.resolve(msg) == "secretary"
+
+        projects_config.write_text('{"projects": [', encoding="utf-8")
+        os.utime(projects_config, (0, 12345))
+        assert r.reload_if_changed() is False
+        assert r.resolve(msg) == "secretary"
+        assert r.get_context("secretary") is not None
+        assert r.version == 0
+
+        projects_config.unlink()
+        assert r.reload_if_changed() is True
+        assert r.resolve(msg) is None
+        assert r.get_context("secretary") is None
+        assert r.version == 1
+
+    def test_hot_reload_registry(self, projects_config, tmp_path):
+        """channels.json 변경 시 ChannelRegistry 재로드"""
+        channels = tmp_path / "channels.json"
+        channels.write_text(json.dumps({"channels": []}), encoding="utf-8")
+        registry = ChannelRegistry()
+        registry.load(channels)
+        r = ProjectContextResolver(projects_config, registry=registry)
+        r.reload_check_interval = 0
+        msg = NormalizedMessage(
+            id="t11", channel=ChannelType.SLACK, channel_id="C_BOUND",
+            sender_id="u1", text="hello",
+        )
+        assert r.resolve(msg) is None
+
+        channels.write_text(json.dumps({"channels": [
+            {"id": "C_BOUND", "roles": ["project-bound"], "project_id": "wsoptv"},
+        ]}), encoding="utf-8")
+        os.utime(channels, (0, 12345))
+
+        assert r.resolve(msg) == "wsoptv"
+        assert r.version == 1
+
+
 # --- 프로젝트별 Pipeline 통합 테스트 ---
 
 class TestProjectAwarePipeline:
@@ -0,0 +1,259 @@
+"""
+PushListener 테스트 (로컬 HTTP 클라이언트로 Slack/Gmail push fixture 전송)
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.gateway.adapters.slack import SlackAdapter
+from scripts.gateway.models import ChannelType
+from scripts.gateway.push_listener import GMAIL_PUSH_PATH, SLACK_EVENTS_PATH, PushListener
+from scripts.gateway.server import SecretaryGateway
+from scripts.shared.rate_limiter import RateLimiter
+
+SLACK_EVENT = {
+    "token": "legacy",
+    "team_id": "T1",
+    "type": "event_callback",
+    "event_id": "Ev1",
+    "event": {
+        "type": "message",
+        "channel": "C1",
+        "user": "U1",
+        "text": "<@U9> 긴급 확인 부탁드립니다",
+        "ts": "1760000000.000100",
+        "event_ts": "1760000000.000100",
+        "channel_type": "channel",
+    },
+}
+
+GMAIL_NOTIFICATION = {"emailAddress": "me@example.com", "historyId": 9876}
+
+
+def _pubsub(notification: dict) -> dict:
+    return {
+        "message": {
+            "data": base64.b64encode(json.dumps(notification).encode()).decode(),
+            "messageId": "136969346945",
+            "publishTime": "2026-10-16T09:00:00.000Z",
+        },
+        "subscription": "projects/secretary/subscriptions/gmail-push",
+    }
+
+
+async def _request(port: int, method: str, path: str, body: bytes = b"",
+                   headers: dict | None = None) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    lines = [f"{method} {path} HTTP/1.1", "Host: localhost", f"Content-Length: {len(body)}"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+async def _post(port: int, path: str, payload: dict, headers: dict | None = None):
+    return await _request(port, "POST", path, json.dumps(payload).encode(), headers)
+
+
+def _slack_headers(secret: str, body: bytes, timestamp: int | None = None) -> dict:
+    ts = str(timestamp or int(time.time()))
+    digest = hmac.new(secret.encode(), f"v0:{ts}:".encode() + body, hashlib.sha256).hexdigest()
+    return {"X-Slack-Request-Timestamp": ts, "X-Slack-Signature": f"v0={digest}"}
+
+
+@pytest.fixture
+async def listener():
+    received: list = []
+
+    async def on_push(channel, payload):
+        received.append((channel, payload))
+        return 1
+
+    server = PushListener(on_push, port=0, slack_signing_secret=None, gmail_token="tok")
+    server.received = received
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestRoutes:
+    @pytest.mark.asyncio
+    async def test_slack_url_verification(self, listener):
+        """url_verification은 challenge를 그대로 응답하고 전달하지 않음"""
+        status, body = await _post(listener.port, SLACK_EVENTS_PATH,
+                                   {"type": "url_verification", "challenge": "abc123"})
+        assert (status, body) == (200, {"challenge": "abc123"})
+        assert listener.received == []
+
+    @pytest.mark.asyncio
+    async def test_slack_event_forwarded(self, listener):
+        status, body = await _post(listener.port, SLACK_EVENTS_PATH, SLACK_EVENT)
+        assert (status, body) == (200, {"ok": True, "messages": 1})
+        assert listener.received == [(ChannelType.SLACK, SLACK_EVENT)]
+
+    @pytest.mark.asyncio
+    async def test_gmail_pubsub_decoded(self, listener):
+        """Pub/Sub message.data(base64 JSON)를 디코딩해 전달, ?token= 검증"""
+        status, _ = await _post(listener.port, f"{GMAIL_PUSH_PATH}?token=tok", _pubsub(GMAIL_NOTIFICATION))
+        assert status == 200
+        assert listener.received == [(ChannelType.EMAIL, GMAIL_NOTIFICATION)]
+
+        status, _ = await _post(listener.port, f"{GMAIL_PUSH_PATH}?token=wrong", _pubsub(GMAIL_NOTIFICATION))
+        assert status == 401
+        status, _ = await _post(listener.port, f"{GMAIL_PUSH_PATH}?token=tok", {"message": {}})
+        assert status == 400
+        assert len(listener.received) == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_requests(self, listener):
+        assert (await _post(listener.port, "/unknown", {}))[0] == 404
+        assert (await _request(listener.port, "GET", SLACK_EVENTS_PATH))[0] == 405
+        assert (await _request(listener.port, "POST", SLACK_EVENTS_PATH, b"not json"))[0] == 400
+        status, health = await _request(listener.port, "GET", "/health")
+        assert status == 200
+        assert health["rejected"] == 2
+        assert listener.received == []
+
+    @pytest.mark.asyncio
+    async def test_unavailable_channel(self):
+        """on_push가 None(어댑터 없음)이면 503 → 발신 측 재시도"""
+        async def on_push(channel, payload):
+            return None
+
+        server = PushListener(on_push, port=0)
+        await server.start()
+        try:
+            assert (await _post(server.port, SLACK_EVENTS_PATH, SLACK_EVENT))[0] == 503
+        finally:
+            await server.stop()
+
+
+class TestSlackSignature:
+    @pytest.mark.asyncio
+    async def test_signature_required_when_secret_set(self):
+        received = []
+
+        async def on_push(channel, payload):
+            received.append(payload)
+            return 0
+
+        server = PushListener(on_push, port=0, slack_signing_secret="s3cret")
+        await server.start()
+        try:
+            body = json.dumps(SLACK_EVENT).encode()
+            ok = await _request(server.port, "POST", SLACK_EVENTS_PATH, body, _slack_headers("s3cret", body))
+            forged = await _request(server.port, "POST", SLACK_EVENTS_PATH, body, _slack_headers("other", body))
+            replayed = await _request(
+                server.port, "POST", SLACK_EVENTS_PATH, body,
+                _slack_headers("s3cret", body, timestamp=int(time.time()) - 3600),
+            )
+            assert [ok[0], forged[0], replayed[0]] == [200, 401, 401]
+            assert len(received) == 1
+        finally:
+            await server.stop()
+
+
+class TestBindPolicy:
+    @pytest.mark.asyncio
+    async def test_refuses_public_bind_without_secrets(self):
+        """secret이 없으면 loopback이 아닌 주소에는 바인드하지 않음"""
+        async def on_push(channel, payload):
+            return 0
+
+        server = PushListener(on_push, host="0.0.0.0", port=0, slack_signing_secret="s3cret")
+        with pytest.raises(ValueError, match="gmail_token"):
+            await server.start()
+        assert not server.is_running
+
+    @pytest.mark.asyncio
+    async def test_public_bind_with_secrets(self):
+        async def on_push(channel, payload):
+            return 0
+
+        server = PushListener(on_push, host="0.0.0.0", port=0, slack_signing_secret="s3cret", gmail_token="tok")
+        await server.start()
+        try:
+            assert server.is_running
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_loopback_without_secrets_warns(self, capsys):
+        async def on_push(channel, payload):
+            return 0
+
+        server = PushListener(on_push, host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            assert "slack_signing_secret, gmail_token" in capsys.readouterr().out
+        finally:
+            await server.stop()
+
+
+class _RecordingPipeline:
+    def __init__(self):
+        self.submitted = []
+
+    async def submit(self, message):
+        self.submitted.append(message)
+        future = asyncio.get_running_loop().create_future()
+        future.cancel()
+        return future
+
+    def get_stats(self):
+        return {"submitted": len(self.submitted)}
+
+
+class TestGatewayPush:
+    @pytest.fixture(autouse=True)
+    def reset_rate_limiter(self):
+        RateLimiter.reset()
+        yield
+        RateLimiter.reset()
+
+    @pytest.mark.asyncio
+    async def test_push_feeds_pipeline_and_slows_polling(self, tmp_path):
+        """push 이벤트가 같은 파이프라인으로 전달되고, polling은 reconciliation 간격으로 전환"""
+        config_file = tmp_path / "gateway.json"
+        config_file.write_text(json.dumps({
+            "port": 0,
+            "push": {"enabled": True, "reconcile_interval": 600},
+        }), encoding="utf-8")
+        gateway = SecretaryGateway(config_file)
+        adapter = SlackAdapter({"channels": ["C1"], "polling_interval": 5})
+        adapter._connected = True
+        gateway.adapters["slack"] = adapter
+        gateway.pipeline = _RecordingPipeline()
+        gateway._running = True
+
+        await gateway._start_push_listener()
+        try:
+            assert adapter.push_enabled
+            assert adapter._polling_interval == adapter._max_interval == 600
+
+            port = gateway._push_listener.port
+            assert (await _post(port, SLACK_EVENTS_PATH, SLACK_EVENT))[1]["messages"] == 1
+            # Slack 재전송은 한 번만 처리
+            assert (await _post(port, SLACK_EVENTS_PATH, SLACK_EVENT))[1]["messages"] == 0
+            # Gmail 어댑터가 없으면 503
+            assert (await _post(port, GMAIL_PUSH_PATH, _pubsub(GMAIL_NOTIFICATION)))[0] == 503
+        finally:
+            await gateway._push_listener.stop()
+
+        [message] = gateway.pipeline.submitted
+        assert message.id == "slack_C1_1760000000.000100"
+        assert message.is_mention is True
+        assert gateway.get_status()["push"]["messages"] == 1
@@ -4,12 +4,18 @@ Server 테스트
 
 import json
 import sys
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.pipeline import CHECKPOINT_STAGE, MessagePipeline
 from scripts.gateway.server import SecretaryGateway, load_config
+from scripts.gateway.storage import UnifiedStorage
 
 
 class TestLoadConfig:
@@ -103,3 +109,27 @@ class TestSafetyConfig:
         config = load_config(Path("nonexistent.json"))
 
         assert config["safety"]["rate_limit_per_minute"] == 10
+
+
+class TestReplayPending:
+    """재시작 시 처리 원장 replay"""
+
+    @pytest.mark.asyncio
+    async def test_replays_backlog_beyond_one_batch(self, tmp_path):
+        """replay() 한 번의 limit(100)보다 많은 backlog도 시작 시 모두 처리"""
+        async with UnifiedStorage(tmp_path / "gateway.db") as storage:
+            for i in range(150):
+                message = NormalizedMessage(
+                    id=f"bl-{i}", channel=ChannelType.SLACK, channel_id="C1",
+                    sender_id="U1", text="안녕하세요", timestamp=datetime.now(),
+                )
+                await storage.save_message(message, stage=CHECKPOINT_STAGE)
+
+            gateway = SecretaryGateway()
+            gateway.storage = storage
+            gateway.pipeline = MessagePipeline(storage)
+            gateway._running = True
+            await gateway._replay_pending()
+
+            assert await storage.get_processing_states() == []
+            assert (await storage.get_stats())["unprocessed"] == 0
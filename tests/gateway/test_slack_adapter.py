@@ -0,0 +1,317 @@
+"""
+SlackAdapter polling 테스트 (동시 조회, 적응형 간격, 통계)
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.gateway.adapters.slack import (
+    BACKOFF_FACTOR,
+    HISTORY_RATE_BUCKET,
+    SlackAdapter,
+)
+from scripts.gateway.storage import UnifiedStorage
+from scripts.shared.rate_limiter import RateLimiter
+
+
+class FakeSlackClient:
+    """lib.slack.SlackClient 대역 (동기 API, 호출마다 delay초 소요)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.pending: dict[str, list] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def post(self, channel_id: str, ts: float, text: str = "hello", user: str | None = None):
+        self.pending.setdefault(channel_id, []).append(SimpleNamespace(
+            ts=f"{ts:.6f}", user=user, text=text, thread_ts=None,
+            timestamp=datetime.fromtimestamp(ts),
+        ))
+
+    def get_history(self, channel_id, limit, oldest):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.pending.pop(channel_id, [])
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    users = {"U1": "Alice", "U2": "Bob"}
+    user_calls: list = []
+
+    def get_user(self, user_id):
+        self.user_calls.append(user_id)
+        if user_id not in self.users:
+            raise KeyError(user_id)
+        return SimpleNamespace(id=user_id, real_name=self.users[user_id], display_name=None, name=None)
+
+
+class BulkSlackClient(FakeSlackClient):
+    """users.list 일괄 조회를 지원하는 클라이언트"""
+
+    def list_users(self):
+        return [
+            SimpleNamespace(id=uid, real_name=name, display_name=None, name=None)
+            for uid, name in self.users.items()
+        ]
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    RateLimiter.reset()
+    yield
+    RateLimiter.reset()
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    async with UnifiedStorage(tmp_path / "gateway.db") as s:
+        yield s
+
+
+def _adapter(client, channels, storage=None, **config) -> SlackAdapter:
+    adapter = SlackAdapter({"channels": channels, "polling_interval": 5, **config}, storage=storage)
+    client.user_calls = []
+    adapter._client = client
+    adapter._connected = True
+    for channel_id in channels:
+        adapter._last_ts[channel_id] = "0"
+    return adapter
+
+
+async def _collect(adapter: SlackAdapter, count: int, timeout: float = 5.0) -> list:
+    received = []
+
+    async def run():
+        async for msg in adapter.listen():
+            received.append(msg)
+            if len(received) >= count:
+                adapter._connected = False
+                return
+
+    await asyncio.wait_for(run(), timeout)
+    return received
+
+
+class TestSlackPolling:
+    @pytest.mark.asyncio
+    async def test_channels_polled_concurrently(self):
+        """채널 조회가 max_concurrency까지 동시에 진행"""
+        client = FakeSlackClient(delay=0.1)
+        channels = [f"C{i}" for i in range(8)]
+        for channel_id in channels:
+            client.post(channel_id, time.time())
+        adapter = _adapter(client, channels, max_concurrency=4)
+
+        started = time.perf_counter()
+        received = await _collect(adapter, len(channels))
+        elapsed = time.perf_counter() - started
+
+        assert {m.channel_id for m in received} == set(channels)
+        assert client.max_in_flight == 4
+        # 순차 조회였다면 0.8초
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_adaptive_interval(self):
+        """빈 채널은 간격 확대, 새 메시지가 있으면 간격 단축 (min/max 범위 내)"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C_QUIET", "C_BUSY"], min_interval=1, max_interval=20)
+        client.post("C_BUSY", time.time())
+
+        await adapter._poll_channel("C_QUIET")
+        await adapter._poll_channel("C_BUSY")
+        assert adapter._poll_states["C_QUIET"].interval == 5 * BACKOFF_FACTOR
+        assert adapter._poll_states["C_BUSY"].interval == 2.5
+
+        for _ in range(5):
+            await adapter._poll_channel("C_QUIET")
+        assert adapter._poll_states["C_QUIET"].interval == 20
+
+        for _ in range(5):
+            client.post("C_BUSY", time.time())
+            await adapter._poll_channel("C_BUSY")
+        assert adapter._poll_states["C_BUSY"].interval == 1
+
+    @pytest.mark.asyncio
+    async def test_status_reports_channel_stats(self):
+        """get_status()에 채널별 지연/메시지 지연/오류 통계 포함"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1", "C_ERR"], history_rate_limit=10)
+        client.post("C1", time.time() - 3)
+
+        def failing(channel_id, limit, oldest):
+            raise RuntimeError("ratelimited")
+
+        await adapter._poll_channel("C1")
+        client.get_history = failing
+        await adapter._poll_channel("C_ERR")
+
+        status = await adapter.get_status()
+        c1 = status["channel_stats"]["C1"]
+        assert c1["polls"] == 1
+        assert c1["messages"] == 1
+        assert c1["last_latency_ms"] is not None
+        assert c1["last_lag_s"] >= 3
+        err = status["channel_stats"]["C_ERR"]
+        assert err["errors"] == 1
+        assert err["last_error"] == "ratelimited"
+        assert status["rate_limit_remaining"] == 8
+
+    @pytest.mark.asyncio
+    async def test_history_calls_share_rate_bucket(self):
+        """모든 채널의 history 호출이 하나의 RateLimiter bucket을 사용"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1", "C2", "C3"], history_rate_limit=3)
+
+        for channel_id in ["C1", "C2", "C3"]:
+            await adapter._poll_channel(channel_id)
+
+        assert RateLimiter.get_instance().check(HISTORY_RATE_BUCKET) is False
+
+
+class TestUserDirectory:
+    @pytest.mark.asyncio
+    async def test_warm_up_persists_and_reloads(self, storage):
+        """일괄 조회 결과가 gateway.db에 저장되고, 재시작 후 API 호출 없이 로드"""
+        adapter = _adapter(BulkSlackClient(), ["C1"], storage=storage)
+        await adapter._warm_user_directory()
+        assert adapter._user_cache == {"U1": "Alice", "U2": "Bob"}
+
+        client = FakeSlackClient()
+        restarted = _adapter(client, ["C1"], storage=storage)
+        await restarted._warm_user_directory()
+        assert restarted._user_cache == {"U1": "Alice", "U2": "Bob"}
+        assert client.user_calls == []
+
+    @pytest.mark.asyncio
+    async def test_normalization_does_not_wait_for_lookup(self, storage):
+        """모르는 사용자는 user ID를 이름으로 정규화 후 백그라운드에서 조회/저장"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1"], storage=storage)
+        client.post("C1", time.time(), user="U1")
+        client.post("C1", time.time() + 0.001, user="U_GONE")
+
+        messages = await adapter._poll_channel("C1")
+        assert [m.sender_name for m in messages] == ["U1", "U_GONE"]
+        assert client.user_calls == []
+
+        assert await adapter._refresh_users() == 1
+        assert adapter._lookup_user("U1") == "Alice"
+        assert (await storage.load_user_directory("slack"))["U1"][0] == "Alice"
+
+        # 조회 실패한 사용자는 재시도 대기 시간 동안 다시 요청하지 않음
+        assert adapter._lookup_user("U_GONE") is None
+        assert adapter._pending_users == set()
+
+        # 조회가 끝난 뒤의 메시지는 이름으로 정규화
+        client.post("C1", time.time() + 0.002, user="U1")
+        assert [m.sender_name for m in await adapter._poll_channel("C1")] == ["Alice"]
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_refreshed(self, storage):
+        """TTL이 지난 항목은 백그라운드 갱신에서 다시 조회"""
+        await storage.save_user_names("slack", {"U1": "Old Name"}, updated_at=time.time() - 100)
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1"], storage=storage, user_cache_ttl=10)
+        await adapter._warm_user_directory()
+        assert adapter._lookup_user("U1") == "Old Name"
+
+        await adapter._refresh_users()
+        assert client.user_calls == ["U1"]
+        assert adapter._lookup_user("U1") == "Alice"
+
+    @pytest.mark.asyncio
+    async def test_background_task_resolves_new_users(self):
+        """백그라운드 태스크가 새 사용자 요청에 즉시 반응"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1"])
+        adapter._start_user_refresh()
+        try:
+            adapter._lookup_user("U2")
+            for _ in range(50):
+                if adapter._user_cache.get("U2"):
+                    break
+                await asyncio.sleep(0.01)
+            assert adapter._user_cache["U2"] == "Bob"
+        finally:
+            await adapter.disconnect()
+
+
+class TestSlackPush:
+    def _event(self, channel_id: str, ts: float, **fields) -> dict:
+        return {"type": "event_callback", "event": {
+            "type": "message", "channel": channel_id, "user": "U1", "text": "hello",
+            "ts": f"{ts:.6f}", **fields,
+        }}
+
+    @pytest.mark.asyncio
+    async def test_push_event_normalized_once(self):
+        """감시 채널의 message 이벤트만 정규화, 재전송은 무시"""
+        adapter = _adapter(FakeSlackClient(), ["C1"])
+        ts = time.time()
+
+        [msg] = await adapter.handle_push(self._event("C1", ts, thread_ts="1.0"))
+        assert msg.id == f"slack_C1_{ts:.6f}"
+        assert msg.reply_to_id == "1.0"
+        assert await adapter.handle_push(self._event("C1", ts)) == []
+        assert await adapter.handle_push(self._event("C_OTHER", ts + 1)) == []
+        assert await adapter.handle_push(self._event("C1", ts + 2, subtype="message_changed")) == []
+        assert adapter._poll_states["C1"].pushed == 1
+
+    @pytest.mark.asyncio
+    async def test_reconciliation_skips_pushed_messages(self):
+        """push 모드 sweep은 고정 간격, push로 받은 메시지는 다시 전달하지 않음"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1"], min_interval=1, max_interval=20)
+        adapter.enable_push(300)
+        ts = time.time()
+        await adapter.handle_push(self._event("C1", ts))
+
+        client.post("C1", ts, text="hello")
+        client.post("C1", ts + 1, text="missed")
+        messages = await adapter._poll_channel("C1")
+        assert [m.text for m in messages] == ["missed"]
+        assert adapter._last_ts["C1"] == f"{ts + 1:.6f}"
+        assert adapter._poll_states["C1"].interval == 300
+
+
+class TestDrain:
+    @pytest.mark.asyncio
+    async def test_stop_listening_delivers_fetched_batch(self):
+        """stop_listening 후에도 이미 조회한 메시지는 모두 전달하고 listen 종료"""
+        client = FakeSlackClient()
+        adapter = _adapter(client, ["C1"])
+        ts = time.time()
+        for i in range(3):
+            client.post("C1", ts + i, text=f"m{i}")
+
+        received = []
+
+        async def run():
+            async for msg in adapter.listen():
+                received.append(msg.text)
+                adapter.stop_listening()
+
+        await asyncio.wait_for(run(), 1.0)
+        assert received == ["m0", "m1", "m2"]
+        assert adapter.get_cursors() == {"C1": f"{ts + 2:.6f}"}
+
+    def test_restore_cursors_only_watched_channels(self):
+        adapter = SlackAdapter({"channels": ["C1", "C2"]})
+        adapter.restore_cursors({"C1": "1760000000.000100", "C_OLD": "1.0"})
+        assert adapter.get_cursors() == {"C1": "1760000000.000100"}
@@ -11,6 +11,16 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts.shared.ollama_client import OllamaClient
+
+
+@pytest.fixture(autouse=True)
+def reset_ollama_client():
+    """테스트마다 공유 Ollama 클라이언트 초기화 (httpx.AsyncClient patch 반영)"""
+    OllamaClient.reset()
+    yield
+    OllamaClient.reset()
+
 
 # ==========================================
 # Mock Models
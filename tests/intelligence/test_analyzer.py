@@ -4,6 +4,8 @@ OllamaAnalyzer 테스트
 마커 추출, 자유 추론 파싱, fallback, rate limiting 검증.
 """
 
+import asyncio
+import os
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,7 +14,8 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.intelligence.response.analyzer import AnalysisResult, OllamaAnalyzer
+from scripts.intelligence.response.analyzer import AnalysisBatcher, AnalysisResult, OllamaAnalyzer
+from scripts.shared.ollama_client import OllamaClient
 
 # ==========================================
 # AnalysisResult 기본 테스트
@@ -240,6 +243,7 @@ class TestBuildProjectList:
     def analyzer(self):
         with patch.object(OllamaAnalyzer, '__init__', lambda self: None):
             a = OllamaAnalyzer.__new__(OllamaAnalyzer)
+            a._project_list_memo = None
             return a
 
     def test_empty_projects(self, analyzer):
@@ -253,6 +257,20 @@ class TestBuildProjectList:
         assert "k1, k2" in result
         assert "desc" in result
 
+    def test_memoized_for_same_list(self, analyzer):
+        projects = [{"id": "test", "name": "Test Project"}]
+        first = analyzer._build_project_list(projects)
+
+        with patch.object(OllamaAnalyzer, "_format_project_list") as fmt:
+            assert analyzer._build_project_list(projects) is first
+            fmt.assert_not_called()
+
+    def test_new_list_is_reformatted(self, analyzer):
+        analyzer._build_project_list([{"id": "old", "name": "Old"}])
+        result = analyzer._build_project_list([{"id": "new", "name": "New"}])
+        assert "new: New" in result
+        assert "old" not in result
+
 
 # ==========================================
 # 텍스트 절삭 테스트
@@ -304,6 +322,9 @@ class TestAnalyzeIntegration:
             a.max_requests_per_minute = 10
             a._request_times = __import__('collections').deque(maxlen=10)
             a.prompt_template = prompt_file.read_text(encoding="utf-8")
+            a.stream = False
+            a.keep_alive = "30m"
+            a._project_list_memo = None
             return a
 
     @pytest.mark.asyncio
@@ -419,3 +440,394 @@ class TestAnalyzeIntegration:
 
         assert result.needs_response is False
         assert "요청 오류" in result.reasoning
+
+
+# ==========================================
+# 배치 분석 (analyze_batch / AnalysisBatcher) 테스트
+# ==========================================
+
+BATCH_TEMPLATE = "{count}개 분석\n프로젝트:\n{project_list}\n\n{messages}"
+
+
+def _batch_msg(i: int) -> dict:
+    return {
+        "text": f"메시지 {i}",
+        "sender_name": f"User{i}",
+        "source_channel": "slack",
+        "channel_id": "C1",
+        "rule_hint": "channel_match=secretary" if i == 1 else None,
+    }
+
+
+class TestAnalyzeBatch:
+
+    @pytest.fixture
+    def analyzer(self):
+        a = OllamaAnalyzer.__new__(OllamaAnalyzer)
+        a.model = "qwen3:8b"
+        a.ollama_url = "http://localhost:11434"
+        a.timeout = 10
+        a.max_context_chars = 12000
+        a.max_requests_per_minute = 100
+        a._request_times = __import__('collections').deque(maxlen=100)
+        a.prompt_template = "{project_list}{rule_hint}{sender_name}{source_channel}{original_text}{rag_context}"
+        a.batch_prompt_template = BATCH_TEMPLATE
+        a.stream = False
+        a.keep_alive = "30m"
+        a._project_list_memo = None
+        return a
+
+    def _mock_client(self, content=None, error=None):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"message": {"content": content}}
+        mock_response.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=error, return_value=mock_response)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        return mock_client
+
+    def test_build_batch_prompt(self, analyzer):
+        prompt = analyzer._build_batch_prompt(
+            [_batch_msg(1), _batch_msg(2)], [{"id": "secretary", "name": "Secretary"}]
+        )
+        assert prompt.startswith("2개 분석")
+        assert prompt.count("- secretary: Secretary") == 1
+        assert "### [MSG 1]" in prompt and "### [MSG 2]" in prompt
+        assert "기존 규칙 매칭 결과: channel_match=secretary" in prompt
+
+    def test_parse_batch_response(self, analyzer):
+        content = (
+            "<think>[MSG 1] 생각 중</think>\n"
+            "### [MSG 2]\n잡담입니다.\n[NO_RESPONSE] project_id=unknown confidence=0.9\n\n"
+            "[MSG 1]\n진행 상황 질문입니다.\n[RESPONSE_NEEDED] project_id=secretary confidence=0.8\n\n"
+            "[MSG 3]\n판단 불가\n"
+        )
+        results = analyzer._parse_batch_response(content, 4)
+        assert results[0].needs_response is True
+        assert results[0].project_id == "secretary"
+        assert results[0].summary == "진행 상황 질문입니다."
+        assert results[1].needs_response is False
+        assert results[1].project_id is None
+        assert results[2] is None
+        assert results[3] is None
+
+    @pytest.mark.asyncio
+    async def test_unparsed_items_fall_back_to_single(self, analyzer):
+        """마커를 찾지 못한 메시지만 analyze()로 개별 분석"""
+        content = (
+            "[MSG 1]\n[RESPONSE_NEEDED] project_id=secretary confidence=0.8\n"
+            "[MSG 3]\n[NO_RESPONSE] project_id=unknown confidence=0.7\n"
+        )
+        analyzer.analyze = AsyncMock(return_value=AnalysisResult(reasoning="single"))
+        with patch('httpx.AsyncClient', return_value=self._mock_client(content)) as MockClient, \
+                patch('scripts.intelligence.response.analyzer.retry_async', None):
+            results = await analyzer.analyze_batch([_batch_msg(i) for i in (1, 2, 3)], [])
+
+        assert MockClient.call_count == 1
+        assert [r.reasoning == "single" for r in results] == [False, True, False]
+        assert analyzer.analyze.await_args.kwargs["text"] == "메시지 2"
+
+    @pytest.mark.asyncio
+    async def test_batch_error_falls_back_to_single(self, analyzer):
+        import httpx
+
+        analyzer.analyze = AsyncMock(return_value=AnalysisResult(reasoning="single"))
+        error = httpx.RequestError("Connection refused")
+        with patch('httpx.AsyncClient', return_value=self._mock_client(error=error)), \
+                patch('scripts.intelligence.response.analyzer.retry_async', None):
+            results = await analyzer.analyze_batch([_batch_msg(i) for i in range(3)], [])
+
+        assert [r.reasoning for r in results] == ["single"] * 3
+
+    @pytest.mark.asyncio
+    async def test_chunks_by_max_batch_size(self, analyzer):
+        analyzer._analyze_chunk = AsyncMock(side_effect=lambda chunk, _: [AnalysisResult()] * len(chunk))
+        analyzer.analyze = AsyncMock(return_value=AnalysisResult())
+        results = await analyzer.analyze_batch([_batch_msg(i) for i in range(5)], [], max_batch_size=2)
+
+        assert len(results) == 5
+        assert [len(c.args[0]) for c in analyzer._analyze_chunk.await_args_list] == [2, 2]
+        # 마지막 1개는 배치 프롬프트 없이 단건 분석
+        assert analyzer.analyze.await_count == 1
+
+
+class TestAnalysisBatcher:
+
+    def _analyzer(self):
+        analyzer = MagicMock()
+        analyzer.analyze_batch = AsyncMock(
+            side_effect=lambda msgs, projects, max_batch_size: [AnalysisResult(summary=m["text"]) for m in msgs]
+        )
+        return analyzer
+
+    @pytest.mark.asyncio
+    async def test_window_collects_concurrent_requests(self):
+        analyzer = self._analyzer()
+        batcher = AnalysisBatcher(analyzer, window=0.02, max_batch=8)
+        results = await asyncio.gather(*(batcher.analyze(_batch_msg(i), []) for i in range(3)))
+
+        assert [r.summary for r in results] == ["메시지 0", "메시지 1", "메시지 2"]
+        assert analyzer.analyze_batch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        analyzer = self._analyzer()
+        batcher = AnalysisBatcher(analyzer, window=60, max_batch=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.analyze(_batch_msg(i), []) for i in range(4))), 1.0
+        )
+
+        assert len(results) == 4
+        assert analyzer.analyze_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_waiters(self):
+        batcher = AnalysisBatcher(self._analyzer(), window=60, max_batch=8)
+        waiter = asyncio.create_task(batcher.analyze(_batch_msg(0), []))
+        await asyncio.sleep(0)
+        batcher.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+
+# ==========================================
+# 스트리밍 분석 (결정 마커 수신 시 조기 종료) 테스트
+# ==========================================
+
+# 기록된 Ollama 응답 (thinking, content)
+RECORDED_RESPONSES = [
+    ("", "발신자가 secretary 일일 리포트 진행 상황을 묻는 질문입니다.\n"
+         "답변이 필요합니다.\n[RESPONSE_NEEDED] project_id=secretary confidence=0.85"),
+    ("", "배포 완료를 공유하는 메시지입니다. 별도 요청은 없습니다.\n"
+         "[NO_RESPONSE] project_id=wsoptv confidence=0.9\n\n"
+         "참고로 과거 대화에서도 같은 형식의 배포 공지가 반복되었고, 응답 없이 넘어간 이력이 있습니다. "
+         "따라서 이번에도 응답 없이 확인만 하면 됩니다."),
+    ("사용자가 일정을 물어보고 있다. 어떤 프로젝트인지 불확실하다.",
+     "일정 확인을 요청하는 질문이지만 프로젝트가 불분명합니다.\n"
+     "[RESPONSE_NEEDED] project_id=unknown confidence=0.4\n"
+     "추가 설명: 채널 정보만으로는 판단이 어렵습니다."),
+    ("", "점심 메뉴 이야기로 잡담입니다.\n결정을 내리기 어렵습니다."),
+    ("", "리뷰 부탁 요청입니다.\n[RESPONSE_NEEDED] project_id=secretary confidence=0.7\n"),
+]
+
+
+class ReplayOllamaClient:
+    """기록된 응답을 post(전체) 또는 stream(토큰 단위 청크)으로 재생"""
+
+    def __init__(self, thinking: str, content: str, piece: int = 4):
+        self.thinking = thinking
+        self.content = content
+        self.piece = piece
+        self.sent = 0
+        self.closed = False
+        self.payloads: list[dict] = []
+
+    async def post(self, url, payload, timeout=None):
+        self.payloads.append(payload)
+        resp = MagicMock()
+        resp.json.return_value = {"message": {"thinking": self.thinking, "content": self.content}}
+        return resp
+
+    async def stream(self, url, payload, timeout=None):
+        assert payload["stream"] is True
+        self.payloads.append(payload)
+        try:
+            for i in range(0, len(self.thinking), self.piece):
+                yield {"message": {"thinking": self.thinking[i:i + self.piece], "content": ""}, "done": False}
+            for i in range(0, len(self.content), self.piece):
+                self.sent += 1
+                yield {"message": {"content": self.content[i:i + self.piece]}, "done": False}
+            yield {"message": {"content": ""}, "done": True}
+        finally:
+            self.closed = True
+
+    @property
+    def total_pieces(self) -> int:
+        return -(-len(self.content) // self.piece)
+
+
+class TestStreamingAnalyze:
+
+    @pytest.fixture
+    def analyzer(self):
+        a = OllamaAnalyzer.__new__(OllamaAnalyzer)
+        a.model = "qwen3:8b"
+        a.ollama_url = "http://localhost:11434"
+        a.timeout = 10
+        a.max_context_chars = 12000
+        a.max_requests_per_minute = 100
+        a._request_times = __import__('collections').deque(maxlen=100)
+        a.prompt_template = "{project_list}{rule_hint}{sender_name}{source_channel}{original_text}{rag_context}"
+        a.batch_prompt_template = BATCH_TEMPLATE
+        a.stream = False
+        a.keep_alive = "30m"
+        a._project_list_memo = None
+        return a
+
+    async def _analyze(self, analyzer, client, stream: bool) -> AnalysisResult:
+        analyzer.stream = stream
+        with patch.object(OllamaClient, "get_instance", return_value=client), \
+                patch('scripts.intelligence.response.analyzer.retry_async', None):
+            return await analyzer.analyze(
+                text="t", sender_name="u", source_channel="slack", channel_id="C1", project_list=[],
+            )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("thinking,content", RECORDED_RESPONSES)
+    async def test_same_decision_as_non_streaming(self, analyzer, thinking, content):
+        """기록된 응답 전체에서 스트리밍 결과(결정/프로젝트/신뢰도/의도/요약)가 비스트리밍과 동일"""
+        full = await self._analyze(analyzer, ReplayOllamaClient(thinking, content), stream=False)
+        client = ReplayOllamaClient(thinking, content)
+        streamed = await self._analyze(analyzer, client, stream=True)
+
+        for name in ("needs_response", "project_id", "confidence", "intent", "summary"):
+            assert getattr(streamed, name) == getattr(full, name), name
+        assert client.closed
+        if thinking:
+            assert streamed.reasoning.startswith(thinking)
+
+    @pytest.mark.asyncio
+    async def test_stops_after_marker_line(self, analyzer):
+        """마커 라인이 완성되면 나머지 토큰을 받지 않고 스트림을 닫음"""
+        _, content = RECORDED_RESPONSES[1]
+        client = ReplayOllamaClient("", content)
+        result = await self._analyze(analyzer, client, stream=True)
+
+        assert result.project_id == "wsoptv"
+        assert client.sent < client.total_pieces
+        assert "참고로" not in result.reasoning
+
+    @pytest.mark.asyncio
+    async def test_marker_split_across_chunks(self, analyzer):
+        """필드가 다음 청크로 이어지면 줄이 끝날 때까지 기다림"""
+        content = "요청입니다.\n[RESPONSE_NEEDED] project_id=secretary confidence=0.75\n부연 설명"
+        client = ReplayOllamaClient("", content, piece=7)
+        result = await self._analyze(analyzer, client, stream=True)
+        assert result.project_id == "secretary"
+        assert result.confidence == 0.75
+
+    @pytest.mark.asyncio
+    async def test_batch_stream_waits_for_all_markers(self, analyzer):
+        content = (
+            "[MSG 1]\n질문\n[RESPONSE_NEEDED] project_id=secretary confidence=0.8\n"
+            "[MSG 2]\n잡담\n[NO_RESPONSE] project_id=unknown confidence=0.9\n"
+            "이후 요약: 두 메시지 모두 처리했습니다."
+        )
+        client = ReplayOllamaClient("", content)
+        analyzer.stream = True
+        with patch.object(OllamaClient, "get_instance", return_value=client), \
+                patch('scripts.intelligence.response.analyzer.retry_async', None):
+            results = await analyzer.analyze_batch([_batch_msg(1), _batch_msg(2)], [])
+
+        assert [r.needs_response for r in results] == [True, False]
+        assert client.sent < client.total_pieces
+
+    @pytest.mark.asyncio
+    async def test_restated_format_line_is_not_a_decision(self, analyzer):
+        """모델이 결정 전에 형식 안내(confidence=0.X)를 다시 써도 실제 마커 라인까지 받음"""
+        content = (
+            "출력 형식: [RESPONSE_NEEDED] project_id=프로젝트ID confidence=0.X\n"
+            "요청입니다.\n"
+            "[RESPONSE_NEEDED] project_id=secretary confidence=0.85\n"
+            "참고로 부연 설명"
+        )
+        client = ReplayOllamaClient("", content)
+        result = await self._analyze(analyzer, client, stream=True)
+
+        assert result.needs_response is True
+        assert result.project_id == "secretary"
+        assert result.confidence == 0.85
+        assert client.sent < client.total_pieces
+
+    @pytest.mark.asyncio
+    async def test_batch_stream_ignores_restated_format_line(self, analyzer):
+        content = (
+            "각 메시지마다 [NO_RESPONSE] project_id=프로젝트ID confidence=0.X 형식으로 답합니다.\n"
+            "[MSG 1]\n질문\n[RESPONSE_NEEDED] project_id=secretary confidence=0.8\n"
+            "[MSG 2]\n잡담\n[NO_RESPONSE] project_id=unknown confidence=0.9\n"
+            "이후 요약: 두 메시지 모두 처리했습니다."
+        )
+        client = ReplayOllamaClient("", content)
+        analyzer.stream = True
+        with patch.object(OllamaClient, "get_instance", return_value=client), \
+                patch('scripts.intelligence.response.analyzer.retry_async', None):
+            results = await analyzer.analyze_batch([_batch_msg(1), _batch_msg(2)], [])
+
+        assert [r.needs_response for r in results] == [True, False]
+        assert [r.confidence for r in results] == [0.8, 0.9]
+        assert len(client.payloads) == 1  # 개별 analyze() 재시도 없음
+        assert client.sent < client.total_pieces
+
+    @pytest.mark.asyncio
+    async def test_non_numeric_confidence_falls_back(self, analyzer):
+        """결정 마커의 confidence가 숫자가 아니면 예외 대신 no_response로 처리"""
+        content = "형식만 출력\n[RESPONSE_NEEDED] project_id=프로젝트ID confidence=0.X"
+        result = await self._analyze(analyzer, ReplayOllamaClient("", content), stream=False)
+
+        assert result.needs_response is False
+        assert result.confidence == 0.0
+        assert result.summary == "마커 파싱 실패"
+        assert result.reasoning == content
+
+
+# ==========================================
+# 프롬프트 prefix (KV 캐시 재사용) 테스트
+# ==========================================
+
+PROMPT_DIR = Path(__file__).parent.parent.parent / "scripts" / "intelligence" / "prompts"
+PROJECTS = [
+    {"id": "secretary", "name": "Secretary", "keywords": ["daily report"], "description": "AI 비서"},
+    {"id": "wsoptv", "name": "WSOP TV", "keywords": ["wsop"], "description": "방송 자동화"},
+]
+
+
+class TestPromptPrefix:
+
+    @pytest.fixture
+    def analyzer(self):
+        return OllamaAnalyzer(prompt_dir=PROMPT_DIR, max_requests_per_minute=100)
+
+    async def _prompts(self, analyzer, calls) -> tuple[list[str], ReplayOllamaClient]:
+        client = ReplayOllamaClient("", "[RESPONSE_NEEDED] project_id=secretary confidence=0.8")
+        with patch.object(OllamaClient, "get_instance", return_value=client), \
+                patch('scripts.intelligence.response.analyzer.retry_async', None):
+            for call in calls:
+                await call()
+        return [p["messages"][-1]["content"] for p in client.payloads], client
+
+    @pytest.mark.asyncio
+    async def test_single_prompts_share_static_prefix(self, analyzer):
+        """메시지별 내용은 프로젝트 목록과 분석 지시 뒤에 위치"""
+        first, second = (await self._prompts(analyzer, [
+            lambda: analyzer.analyze("배포 일정?", "Kim", "slack", "C1", PROJECTS, rule_hint="hint"),
+            lambda: analyzer.analyze("회의록 공유", "Lee", "gmail", "T2", PROJECTS, rag_context="이력"),
+        ]))[0]
+
+        prefix = first[:len(os.path.commonprefix([first, second]))]
+        assert "- wsoptv: WSOP TV" in prefix
+        assert "project_id=unknown confidence=0.X" in prefix
+        assert "Kim" not in prefix and "배포 일정?" not in prefix
+
+    @pytest.mark.asyncio
+    async def test_batch_prompts_share_static_prefix(self, analyzer):
+        """배치 크기({count})가 달라도 공통 prefix 유지"""
+        messages = [_batch_msg(i) for i in range(1, 4)]
+        first, second = (await self._prompts(analyzer, [
+            lambda: analyzer._analyze_chunk(messages[:2], PROJECTS),
+            lambda: analyzer._analyze_chunk(messages, PROJECTS),
+        ]))[0]
+
+        prefix = first[:len(os.path.commonprefix([first, second]))]
+        assert "- wsoptv: WSOP TV" in prefix
+        assert "[NO_RESPONSE] project_id=프로젝트ID" in prefix
+        assert "### [MSG 1]" not in prefix
+
+    @pytest.mark.asyncio
+    async def test_payload_keeps_model_loaded(self, analyzer):
+        analyzer.keep_alive = "1h"
+        _, client = await self._prompts(analyzer, [
+            lambda: analyzer.analyze("질문", "Kim", "slack", "C1", PROJECTS),
+            lambda: analyzer._analyze_chunk([_batch_msg(1), _batch_msg(2)], PROJECTS),
+        ])
+        assert [p["keep_alive"] for p in client.payloads] == ["1h", "1h"]
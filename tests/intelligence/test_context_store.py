@@ -173,6 +173,22 @@ class TestIntelligenceStorageIntegration:
         retrieved = await storage.get_project("proj-del")
         assert retrieved is None
 
+    @pytest.mark.asyncio
+    async def test_projects_marker_sees_other_connection_writes(self, storage, tmp_path):
+        """다른 연결(CLI register)에서 등록/삭제한 프로젝트도 변경 표식에 반영"""
+        await storage.save_project({"id": "proj-a", "name": "A"})
+        before = await storage.get_projects_marker()
+        assert before[0] == 1
+
+        async with IntelligenceStorage(db_path=tmp_path / "test_intelligence.db") as other:
+            await other.save_project({"id": "proj-b", "name": "B"})
+        added = await storage.get_projects_marker()
+        assert added != before
+
+        async with IntelligenceStorage(db_path=tmp_path / "test_intelligence.db") as other:
+            await other.delete_project("proj-a")
+        assert await storage.get_projects_marker() not in (before, added)
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_project_returns_none(self, storage):
         """존재하지 않는 프로젝트 조회 시 None 반환"""
@@ -4,6 +4,7 @@ ProjectIntelligenceHandler 테스트
 Priority queue, fast-track, full pipeline 통합 테스트.
 """
 
+import asyncio
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -244,6 +245,48 @@ class TestProcessMessage:
         # needs_response=False이므로 draft 생성하지 않음
         # dedup.mark_processed만 호출됨
 
+    @pytest.mark.asyncio
+    async def test_analyze_uses_batcher_for_short_messages(self, handler):
+        """짧은 메시지는 micro-batch, 긴 메시지와 urgent lane은 단건 분석"""
+        from scripts.intelligence.response.handler import URGENT_LANE, _current_lane
+
+        handler._analyzer = AsyncMock()
+        handler._analyzer.analyze = AsyncMock(return_value=AnalysisResult(reasoning="single"))
+        handler._batcher = MagicMock()
+        handler._batcher.analyze = AsyncMock(return_value=AnalysisResult(reasoning="batch"))
+        handler._batch_max_chars = 20
+
+        short = MockMessage(text="짧은 질문")
+        result = await handler._analyze_message(short, "slack", "hint", rag_context="rag")
+        assert result.reasoning == "batch"
+        item = handler._batcher.analyze.await_args.args[0]
+        assert item["rule_hint"] == "hint" and item["rag_context"] == "rag"
+
+        result = await handler._analyze_message(MockMessage(text="긴" * 50), "slack", "")
+        assert result.reasoning == "single"
+
+        token = _current_lane.set(URGENT_LANE)
+        try:
+            result = await handler._analyze_message(short, "slack", "")
+        finally:
+            _current_lane.reset(token)
+        assert result.reasoning == "single"
+        assert handler._batcher.analyze.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_project_list_cached_until_projects_change(self, handler):
+        """변경 표식이 같으면 같은 list 객체 재사용 (analyzer 프롬프트 prefix 유지)"""
+        handler.registry.change_marker = AsyncMock(return_value=(1, "2026-10-16T09:00:00"))
+        handler.registry.list_all = AsyncMock(side_effect=lambda: [{"id": "secretary"}])
+
+        first = await handler._project_list()
+        assert await handler._project_list() is first
+        assert handler.registry.list_all.await_count == 1
+
+        handler.registry.change_marker.return_value = (1, "2026-10-16T09:05:00")
+        assert await handler._project_list() is not first
+        assert handler.registry.list_all.await_count == 2
+
     @pytest.mark.asyncio
     async def test_fast_track_urgent_with_rule_match(self, handler):
         """urgent + rule match → Ollama 건너뛰기 (fast-track)"""
@@ -424,7 +467,7 @@ class TestWorkerLifecycle:
     async def test_start_worker(self, handler):
         """워커 시작"""
         await handler.start_worker()
-        assert handler._worker_task is not None
+        assert handler.worker_count == 4
         await handler.stop_worker()
 
     @pytest.mark.asyncio
@@ -432,13 +475,127 @@ class TestWorkerLifecycle:
         """워커 중지"""
         await handler.start_worker()
         await handler.stop_worker()
-        assert handler._worker_task is None
+        assert handler.worker_count == 0
 
     @pytest.mark.asyncio
     async def test_stop_worker_when_not_started(self, handler):
         """워커 미시작 시 stop_worker 안전"""
         await handler.stop_worker()  # 예외 없이 종료
 
+    @pytest.mark.asyncio
+    async def test_drain_processes_queue(self, handler):
+        """drain()은 큐를 모두 처리하고 워커를 중지"""
+        processed = []
+
+        async def process(enriched, result):
+            processed.append(enriched.original.id)
+
+        handler._process_message = process
+        await handler.start_worker()
+        for i in range(3):
+            await handler.handle(MockEnriched(MockMessage(id=f"m{i}")), MockResult())
+
+        assert await handler.drain(timeout=1.0) == []
+        assert processed == ["m0", "m1", "m2"]
+        assert handler.worker_count == 0
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_returns_unfinished(self, handler):
+        """drain 시간 초과 시 처리 중이던 항목과 큐 잔여 항목을 우선순위 순으로 반환"""
+        started = asyncio.Event()
+
+        async def process(enriched, result):
+            started.set()
+            await asyncio.Event().wait()
+
+        handler._process_message = process
+        handler._worker_config.update(workers=1, urgent_workers=0)
+        await handler.start_worker()
+        await handler.handle(MockEnriched(MockMessage(id="busy")), MockResult())
+        await started.wait()
+        await handler.handle(MockEnriched(MockMessage(id="low")), MockResult("low"))
+        await handler.handle(MockEnriched(MockMessage(id="urgent")), MockResult("urgent"))
+
+        leftover = await handler.drain(timeout=0.05)
+        assert [enriched.original.id for enriched, _ in leftover] == ["busy", "urgent", "low"]
+        assert handler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_urgent_lane_not_blocked(self, handler):
+        """일반 워커가 모두 처리 중이어도 urgent는 전용 lane에서 바로 처리"""
+        release = asyncio.Event()
+        urgent_done = asyncio.Event()
+
+        async def process(enriched, result):
+            if result.priority == "urgent":
+                urgent_done.set()
+            else:
+                await release.wait()
+
+        handler._process_message = process
+        handler._worker_config.update(workers=2, urgent_workers=1)
+        await handler.start_worker()
+        for i in range(4):
+            await handler.handle(MockEnriched(MockMessage(id=f"n{i}")), MockResult())
+        await handler.handle(MockEnriched(MockMessage(id="u")), MockResult("urgent"))
+
+        await asyncio.wait_for(urgent_done.wait(), 1.0)
+        assert handler.queue_depth == 2
+        release.set()
+        assert await handler.drain(timeout=1.0) == []
+
+    @pytest.mark.asyncio
+    async def test_tier_concurrency_limit(self, handler):
+        """Tier 슬롯 수만큼만 동시 실행, urgent lane은 슬롯을 기다리지 않음"""
+        running = 0
+        peak = 0
+        urgent_in_slot = asyncio.Event()
+        release = asyncio.Event()
+
+        async def process(enriched, result):
+            nonlocal running, peak
+            async with handler._tier_slot("analyzer"):
+                if result.priority == "urgent":
+                    urgent_in_slot.set()
+                    return
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+        handler._process_message = process
+        handler._worker_config.update(workers=3, urgent_workers=1)
+        handler._tier_slots["analyzer"] = asyncio.Semaphore(1)
+        await handler.start_worker()
+        for i in range(3):
+            await handler.handle(MockEnriched(MockMessage(id=f"n{i}")), MockResult())
+        await handler.handle(MockEnriched(MockMessage(id="u")), MockResult("urgent"))
+
+        await asyncio.wait_for(urgent_in_slot.wait(), 1.0)
+        assert peak == 1
+        release.set()
+        assert await handler.drain(timeout=1.0) == []
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_and_service_metrics(self, handler):
+        """대기/처리 시간과 lane별 큐 길이 노출"""
+        from scripts.shared.metrics import MetricsRegistry
+
+        MetricsRegistry.reset()
+        try:
+            handler._process_message = AsyncMock()
+            await handler.start_worker()
+            await handler.handle(MockEnriched(), MockResult("high"))
+            await handler.drain(timeout=1.0)
+
+            text = MetricsRegistry.get_instance().render()
+            assert 'secretary_intelligence_wait_seconds_count{priority="high"} 1' in text
+            assert 'secretary_intelligence_service_seconds_count{priority="high"} 1' in text
+            assert 'secretary_intelligence_queue_depth{lane="urgent"} 0' in text
+        finally:
+            MetricsRegistry.reset()
+
     @pytest.mark.asyncio
     async def test_handle_with_worker_queues(self, handler):
         """워커 활성화 시 handle()이 큐에 삽입"""
@@ -8,12 +8,13 @@ Note:
     storage.py는 더 이상 자체 NormalizedMessage를 정의하지 않습니다.
 """
 
-from datetime import datetime, timedelta
+import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 from scripts.gateway.models import ChannelType, MessageType, NormalizedMessage, Priority
-from scripts.gateway.storage import UnifiedStorage
+from scripts.gateway.storage import UnifiedStorage, _db_row_to_message
 
 
 @pytest.fixture
@@ -241,6 +242,22 @@ async def test_message_with_media(temp_storage):
         assert retrieved.media_urls[0] == "https://example.com/photo1.jpg"
 
 
+@pytest.mark.asyncio
+async def test_hydrated_message_round_trip(temp_storage):
+    """DB에서 읽은 메시지(StoredMessage)는 저장한 메시지와 동일"""
+    async with temp_storage:
+        msg = NormalizedMessage(
+            id="rt_msg", channel=ChannelType.EMAIL, channel_id="inbox", sender_id="a@b.c",
+            sender_name="A", text="본문", message_type=MessageType.HTML,
+            timestamp=datetime(2026, 1, 2, 3, 4, 5), is_group=True, reply_to_id="prev",
+            media_urls=["https://example.com/f.pdf"], priority=Priority.URGENT, has_action=True,
+        )
+        await temp_storage.save_message(msg)
+
+        assert await temp_storage.get_message("rt_msg") == msg
+        assert (await temp_storage.get_recent_messages(include_raw=True)) == [msg]
+
+
 @pytest.mark.asyncio
 async def test_duplicate_insert(temp_storage, sample_message):
     """중복 삽입 테스트 (REPLACE 동작 확인)"""
@@ -263,3 +280,570 @@ async def test_duplicate_insert(temp_storage, sample_message):
         # 조회 시 업데이트된 내용 확인
         retrieved = await temp_storage.get_message(sample_message.id)
         assert retrieved.text == "업데이트된 메시지"
+
+
+def _burst(count: int, prefix: str = "wb") -> list[NormalizedMessage]:
+    now = datetime.now()
+    return [
+        NormalizedMessage(
+            id=f"{prefix}_{i}",
+            channel=ChannelType.SLACK,
+            channel_id="room_1",
+            sender_id=f"user_{i}",
+            text=f"Burst {i}",
+            timestamp=now - timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_on_batch_size(tmp_path):
+    """write-behind: batch_size 도달 시 자동 flush"""
+    db_path = tmp_path / "wb.db"
+    async with UnifiedStorage(db_path, write_behind=True, batch_size=3, flush_interval=60) as storage:
+        for msg in _burst(4):
+            await storage.save_message(msg)
+
+        # 3개는 배치로 기록, 1개는 버퍼에 남음
+        assert storage.pending_count == 1
+
+        # 별도 연결로 조회해도 3개가 보여야 함
+        async with UnifiedStorage(db_path) as reader:
+            async with reader._connection.execute("SELECT COUNT(*) FROM messages") as cursor:
+                assert (await cursor.fetchone())[0] == 3
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flush_barrier_and_close(tmp_path):
+    """write-behind: flush() barrier 및 close() 시 잔여 버퍼 기록"""
+    db_path = tmp_path / "wb.db"
+    storage = UnifiedStorage(db_path, write_behind=True, batch_size=100, flush_interval=60)
+    await storage.connect()
+    for msg in _burst(5):
+        await storage.save_message(msg)
+    assert storage.pending_count == 5
+
+    assert await storage.flush() == 5
+    assert storage.pending_count == 0
+    assert await storage.flush() == 0
+
+    for msg in _burst(2, prefix="tail"):
+        await storage.save_message(msg)
+    await storage.close()
+
+    async with UnifiedStorage(db_path) as reader:
+        stats = await reader.get_stats()
+        assert stats['total_messages'] == 7
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_on_interval(tmp_path):
+    """write-behind: flush_interval 경과 시 자동 flush"""
+    import asyncio
+
+    async with UnifiedStorage(tmp_path / "wb.db", write_behind=True, flush_interval=0.01) as storage:
+        await storage.save_message(_burst(1)[0])
+        assert storage.pending_count == 1
+        await asyncio.sleep(0.1)
+        assert storage.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_write_behind_read_your_writes(tmp_path):
+    """write-behind: 조회 시 버퍼 선 flush, 같은 ID는 마지막 값 유지"""
+    async with UnifiedStorage(tmp_path / "wb.db", write_behind=True, flush_interval=60) as storage:
+        first, = _burst(1)
+        await storage.save_message(first)
+        first.text = "updated"
+        await storage.save_message(first)
+
+        retrieved = await storage.get_message(first.id)
+        assert retrieved is not None
+        assert retrieved.text == "updated"
+        assert (await storage.get_stats())['total_messages'] == 1
+
+
+@pytest.mark.asyncio
+async def test_user_directory_upsert(tmp_path):
+    """사용자 디렉토리: 채널별 저장, 같은 ID는 이름/갱신 시각 갱신"""
+    async with UnifiedStorage(tmp_path / "users.db") as storage:
+        assert await storage.save_user_names("slack", {"U1": "Alice", "U2": "Bob"}, 100.0) == 2
+        await storage.save_user_names("slack", {"U1": "Alice Kim"}, 200.0)
+        await storage.save_user_names("email", {"U1": "other"}, 300.0)
+
+        directory = await storage.load_user_directory("slack")
+        assert directory == {"U1": ("Alice Kim", 200.0), "U2": ("Bob", 100.0)}
+
+
+def _paged(count: int) -> list[NormalizedMessage]:
+    """같은 timestamp가 여러 개 섞인 메시지 (keyset 경계 검증용)"""
+    base = datetime(2026, 1, 1, 9, 0, 0)
+    return [
+        NormalizedMessage(
+            id=f"pg_{i:03d}",
+            channel=ChannelType.SLACK if i % 2 else ChannelType.EMAIL,
+            channel_id="room_1",
+            sender_id="u",
+            text=f"Page {i}",
+            timestamp=base + timedelta(seconds=i // 3),
+            media_urls=["https://example.com/a.png"],
+            raw_json='{"big": "payload"}',
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_unprocessed_keyset_pages(tmp_path):
+    """iter_unprocessed: (timestamp, id) 순서로 누락/중복 없이 페이지 조회"""
+    async with UnifiedStorage(tmp_path / "pg.db") as storage:
+        messages = _paged(11)
+        for msg in reversed(messages):
+            await storage.save_message(msg)
+
+        ids = [m.id async for m in storage.iter_unprocessed(page_size=2)]
+        assert ids == [m.id for m in messages]
+        assert await storage.get_unprocessed_messages() == [
+            m async for m in storage.iter_unprocessed(page_size=4, include_raw=True)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_iter_unprocessed_while_marking(tmp_path):
+    """순회 중 mark_processed 해도 건너뛰는 행 없음"""
+    async with UnifiedStorage(tmp_path / "pg.db") as storage:
+        for msg in _paged(9):
+            await storage.save_message(msg)
+
+        seen = []
+        async for message in storage.iter_unprocessed(page_size=2):
+            seen.append(message.id)
+            await storage.mark_processed(message.id)
+        assert len(seen) == 9
+        assert [m async for m in storage.iter_unprocessed()] == []
+
+
+@pytest.mark.asyncio
+async def test_iter_recent_filters_limit_and_projection(tmp_path):
+    """iter_recent: 최신 순, 채널 필터/limit, 기본은 raw_json 제외 프로젝션"""
+    async with UnifiedStorage(tmp_path / "pg.db") as storage:
+        messages = _paged(12)
+        for msg in messages:
+            await storage.save_message(msg)
+
+        slack = [m for m in messages if m.channel == ChannelType.SLACK]
+        recent = [m async for m in storage.iter_recent(channel="slack", limit=4, page_size=3, include_raw=True)]
+        assert [m.id for m in recent] == [m.id for m in reversed(slack)][:4]
+        assert recent[0].raw_json == '{"big": "payload"}'
+        assert recent[0].media_urls == ["https://example.com/a.png"]
+
+        light = [m async for m in storage.iter_recent(page_size=5)]
+        assert len(light) == 12
+        assert all(m.raw_json is None for m in light)
+        assert all(m.media_urls == ["https://example.com/a.png"] for m in light)
+
+
+@pytest.mark.asyncio
+async def test_default_reads_keep_media_urls(tmp_path):
+    """기본 인자 조회(get_recent_messages/iter_recent/iter_unprocessed)도 media_urls 유지"""
+    urls = ["https://example.com/photo1.jpg", "https://example.com/photo2.jpg"]
+    async with UnifiedStorage(tmp_path / "media.db") as storage:
+        await storage.save_message(NormalizedMessage(
+            id="md", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="사진", timestamp=datetime(2026, 1, 1), media_urls=urls, raw_json='{"a": 1}',
+        ))
+
+        recent = await storage.get_recent_messages()
+        streamed = [m async for m in storage.iter_recent()]
+        unprocessed = [m async for m in storage.iter_unprocessed()]
+        for messages in (recent, streamed, unprocessed):
+            assert [m.media_urls for m in messages] == [urls]
+            assert messages[0].raw_json is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_mark_processed_many_and_ledger(tmp_path, write_behind):
+    """mark_processed_many: 단일 트랜잭션 처리 완료 + 원장 제거, 실패 기록 시 attempts 증가"""
+    async with UnifiedStorage(tmp_path / "ledger.db", write_behind=write_behind,
+                              flush_interval=60) as storage:
+        messages = _burst(5, prefix="led")
+        for msg in messages:
+            await storage.save_message(msg, stage="persist")
+        await storage.record_stage("led_0", "persist", error="dispatch: timeout")
+        await storage.record_stage("led_0", "dispatch", error="handlers: boom")
+
+        states = {s["message_id"]: s for s in await storage.get_processing_states()}
+        assert len(states) == 5
+        assert states["led_0"]["stage"] == "dispatch"
+        assert states["led_0"]["attempts"] == 2
+        assert states["led_0"]["last_error"] == "handlers: boom"
+        assert "led_0" not in {
+            s["message_id"] for s in await storage.get_processing_states(max_attempts=2)
+        }
+
+        assert await storage.mark_processed_many([m.id for m in messages[:4]]) == 4
+        stats = await storage.get_stats()
+        assert stats["unprocessed"] == 1
+        assert stats["in_flight"] == 1
+        assert [s["message_id"] for s in await storage.get_processing_states()] == ["led_4"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_record_stage_many_requeues_processed(tmp_path, write_behind):
+    """처리 완료된 메시지도 record_stage_many로 원장에 다시 등록 (종료 시 미처리 작업 보존)"""
+    async with UnifiedStorage(tmp_path / "requeue.db", write_behind=write_behind,
+                              flush_interval=60) as storage:
+        messages = _burst(3, prefix="rq")
+        for msg in messages:
+            await storage.save_message(msg, stage="persist")
+        await storage.mark_processed_many([m.id for m in messages])
+
+        assert await storage.record_stage_many(["rq_0", "rq_2", "rq_0"], "dispatch") == 2
+        states = await storage.get_processing_states()
+        assert {(s["message_id"], s["stage"], s["attempts"]) for s in states} == {
+            ("rq_0", "dispatch", 0), ("rq_2", "dispatch", 0),
+        }
+
+
+@pytest.mark.asyncio
+async def test_channel_cursors_round_trip(tmp_path):
+    db_path = tmp_path / "cursors.db"
+    async with UnifiedStorage(db_path) as storage:
+        await storage.save_cursors("slack", {"C1": "1760000000.000100", "C2": "1760000001.000200"})
+        await storage.save_cursors("slack", {"C1": "1760000005.000100"})
+        await storage.save_cursors("gmail", {"history_id": "9876"})
+
+    async with UnifiedStorage(db_path) as storage:
+        assert await storage.load_cursors("slack") == {
+            "C1": "1760000005.000100", "C2": "1760000001.000200",
+        }
+        assert await storage.load_cursors("gmail") == {"history_id": "9876"}
+        assert await storage.load_cursors("telegram") == {}
+
+
+async def _raw_counts(storage, since: datetime) -> tuple[int, int, int]:
+    """messages 직접 집계 (total, urgent, actions)"""
+    async with storage._connection.execute(
+        "SELECT COUNT(*), COALESCE(SUM(priority = 'urgent'), 0), COALESCE(SUM(has_action), 0)"
+        " FROM messages WHERE timestamp >= ?",
+        (since.isoformat(),),
+    ) as cursor:
+        return tuple(await cursor.fetchone())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_hourly_rollups_incremental(tmp_path, write_behind):
+    """저장/덮어쓰기 시 시간 단위 집계가 messages 직접 집계와 일치"""
+    base = datetime(2026, 3, 1, 9, 0)
+    async with UnifiedStorage(tmp_path / "rollup.db", write_behind=write_behind,
+                              flush_interval=60) as storage:
+        for i in range(30):
+            await storage.save_message(NormalizedMessage(
+                id=f"r{i}", channel=ChannelType.SLACK if i % 3 else ChannelType.EMAIL,
+                channel_id="C1", sender_id="U1", text="hi",
+                timestamp=base + timedelta(minutes=17 * i),
+                priority=Priority.URGENT if i % 5 == 0 else Priority.NORMAL,
+                has_action=i % 4 == 0,
+            ), project_id="p1" if i % 2 else None)
+        # 덮어쓰기: 우선순위와 시간 버킷 변경
+        await storage.save_message(NormalizedMessage(
+            id="r1", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            timestamp=base + timedelta(hours=20), priority=Priority.URGENT, has_action=True,
+        ))
+
+        for since in (base, base + timedelta(minutes=45), base + timedelta(hours=5, seconds=1)):
+            counts = await storage.get_message_counts(since)
+            total, urgent, actions = await _raw_counts(storage, since)
+            assert (counts["total"], counts["by_priority"].get("urgent", 0), counts["actions"]) == (
+                total, urgent, actions,
+            )
+
+        project = await storage.get_message_counts(base, project_id="p1")
+        assert project["total"] == 14
+
+
+@pytest.mark.asyncio
+async def test_rebuild_rollups_backfill(tmp_path):
+    """기존 DB: 집계 테이블을 비운 뒤 backfill하면 증분 결과와 동일"""
+    base = datetime(2026, 3, 1, 9, 0)
+    async with UnifiedStorage(tmp_path / "rollup.db") as storage:
+        for msg in _burst(12, prefix="bf"):
+            msg.timestamp = base + timedelta(minutes=25 * int(msg.id[3:]))
+            await storage.save_message(msg)
+        expected = await storage.get_message_counts(base)
+
+        await storage._connection.execute("DELETE FROM message_rollups_hourly")
+        await storage._connection.commit()
+        assert (await storage.get_message_counts(base))["total"] == 0
+
+        assert await storage.rebuild_rollups() == 5
+        assert await storage.get_message_counts(base) == expected
+
+
+@pytest.mark.asyncio
+async def test_db_row_to_message_accepts_dict_rows(tmp_path):
+    """_db_row_to_message는 Row와 dict 행을 같은 메시지로 변환"""
+    async with UnifiedStorage(tmp_path / "rows.db") as storage:
+        await storage.save_message(NormalizedMessage(
+            id="d1", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="hi", timestamp=datetime(2026, 1, 5, 9, 0), media_urls=["https://x/1.png"],
+        ))
+        async with storage._connection.execute("SELECT * FROM messages WHERE id = 'd1'") as cursor:
+            row = await cursor.fetchone()
+
+    from_row, from_dict = _db_row_to_message(row), _db_row_to_message(dict(row))
+    assert from_dict.id == from_row.id == "d1"
+    assert from_dict.channel == from_row.channel == ChannelType.SLACK
+    assert from_dict.media_urls == from_row.media_urls == ["https://x/1.png"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_storage_skips_schema_and_rejects_writes(tmp_path):
+    """read_only 연결은 DDL 없이 조회만 가능"""
+    import sqlite3
+
+    db_path = tmp_path / "ro.db"
+    async with UnifiedStorage(db_path) as storage:
+        await storage.save_message(NormalizedMessage(
+            id="ro1", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="hi", timestamp=datetime(2026, 1, 5, 9, 0),
+        ))
+        await storage._connection.execute("DROP TRIGGER trg_messages_rollup_ai")
+        await storage._connection.commit()
+
+    async with UnifiedStorage(db_path, read_only=True) as storage:
+        assert (await storage.get_message_counts(datetime(2026, 1, 5)))["total"] == 1
+        async with storage._connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = 'trg_messages_rollup_ai'"
+        ) as cursor:
+            assert (await cursor.fetchone())[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            await storage.save_message(NormalizedMessage(
+                id="ro2", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text="hi", timestamp=datetime(2026, 1, 5, 9, 0),
+            ))
+
+
+@pytest.mark.asyncio
+async def test_rollups_keep_archived_counts_on_overwrite(tmp_path):
+    """같은 시간 버킷의 메시지를 덮어써도 아카이브된 메시지 집계는 유지"""
+    base = datetime(2026, 1, 5, 9, 0)
+    async with UnifiedStorage(tmp_path / "rollup.db", archive_dir=tmp_path / "archive") as storage:
+        for i in range(3):
+            await storage.save_message(NormalizedMessage(
+                id=f"a{i}", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text="hi", timestamp=base + timedelta(minutes=i),
+            ))
+        await storage.archive_messages(base + timedelta(minutes=2))
+
+        await storage.save_message(NormalizedMessage(
+            id="a2", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="edited", timestamp=base + timedelta(minutes=2), priority=Priority.URGENT, has_action=True,
+        ))
+        counts = await storage.get_message_counts(base)
+        assert (counts["total"], counts["actions"], counts["by_priority"]) == (3, 1, {None: 2, "urgent": 1})
+
+
+@pytest.mark.asyncio
+async def test_rollups_bucket_timezone_aware_timestamps_in_utc(tmp_path):
+    """timezone이 있는 timestamp는 UTC 시간 버킷으로 집계"""
+    kst = timezone(timedelta(hours=9))
+    async with UnifiedStorage(tmp_path / "rollup.db") as storage:
+        await storage.save_message(NormalizedMessage(
+            id="tz1", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="hi", timestamp=datetime(2026, 1, 5, 9, 30, tzinfo=kst),
+        ))
+        async with storage._connection.execute("SELECT hour FROM message_rollups_hourly") as cursor:
+            assert [row[0] for row in await cursor.fetchall()] == ["2026-01-05T00:00:00"]
+        assert (await storage.get_message_counts(datetime(2026, 1, 5, 0, 0)))["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_old_messages_by_month(tmp_path):
+    """보존 기간 지난 메시지는 월별 아카이브로 이동, get_message는 계속 조회 가능"""
+    async with UnifiedStorage(tmp_path / "gw.db", archive_dir=tmp_path / "archive") as storage:
+        stamps = [datetime(2026, 1, 20), datetime(2026, 2, 3), datetime(2026, 2, 27), datetime(2026, 5, 1)]
+        for i, ts in enumerate(stamps):
+            await storage.save_message(NormalizedMessage(
+                id=f"old_{i}", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text=f"본문 {i}", timestamp=ts, raw_json='{"k": 1}',
+            ))
+        # 처리 원장에 남은 메시지는 이동하지 않음
+        await storage.record_stage("old_1", "persist", error="boom")
+        before = await storage.get_message_counts(datetime(2026, 1, 1))
+
+        archived = await storage.archive_messages(datetime(2026, 4, 1), batch_size=1)
+        assert archived == {"2026-01": 1, "2026-02": 1}
+        assert sorted(p.name for p in (tmp_path / "archive").iterdir()) == [
+            "messages-2026-01.db", "messages-2026-02.db",
+        ]
+
+        stats = await storage.get_stats()
+        assert stats["total_messages"] == 2
+        assert stats["archived"] == 2
+        restored = await storage.get_message("old_2")
+        assert restored.text == "본문 2"
+        assert restored.raw_json == '{"k": 1}'
+        assert await storage.get_message("old_1") is not None
+        assert await storage.get_message("missing") is None
+        # 집계는 아카이브 후에도 유지
+        assert await storage.get_message_counts(datetime(2026, 1, 1)) == before
+        await storage.rebuild_rollups()
+        assert await storage.get_message_counts(datetime(2026, 1, 1)) == before
+
+        # 재실행은 멱등
+        assert await storage.archive_messages(datetime(2026, 4, 1)) == {}
+
+
+@pytest.mark.asyncio
+async def test_reclaim_space_after_archive(tmp_path):
+    """아카이브 후 incremental vacuum으로 빈 페이지 회수"""
+    async with UnifiedStorage(tmp_path / "gw.db") as storage:
+        base = datetime(2026, 1, 1)
+        for i in range(300):
+            await storage.save_message(NormalizedMessage(
+                id=f"v{i}", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text="x" * 500, timestamp=base + timedelta(minutes=i),
+            ))
+        async with storage._connection.execute("PRAGMA auto_vacuum") as cursor:
+            assert (await cursor.fetchone())[0] == 2
+
+        await storage.archive_messages(base + timedelta(days=1))
+        result = await storage.reclaim_space(max_pages=10)
+        assert result == {"mode": "incremental", "freed_pages": 10}
+        result = await storage.reclaim_space(max_pages=100000)
+        assert result["freed_pages"] > 0
+        assert (await storage.reclaim_space())["mode"] == "none"
+
+
+@pytest.mark.asyncio
+async def test_vacuum_converts_legacy_db(tmp_path):
+    """auto_vacuum=NONE인 기존 DB는 reclaim_space가 건너뛰고, vacuum()으로 INCREMENTAL 전환"""
+    import sqlite3
+
+    db_path = tmp_path / "legacy.db"
+    sqlite3.connect(db_path).execute("CREATE TABLE legacy (x)").connection.close()
+
+    async with UnifiedStorage(db_path) as storage:
+        base = datetime(2026, 1, 1)
+        for i in range(200):
+            await storage.save_message(NormalizedMessage(
+                id=f"l{i}", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text="x" * 500, timestamp=base + timedelta(minutes=i),
+            ))
+        await storage.archive_messages(base + timedelta(days=1))
+
+        # 실행 중 회수는 전체 VACUUM을 하지 않음
+        assert await storage.reclaim_space() == {"mode": "none", "freed_pages": 0}
+
+        result = await storage.vacuum()
+        assert result["mode"] == "full"
+        assert result["freed_pages"] > 0
+        async with storage._connection.execute("PRAGMA auto_vacuum") as cursor:
+            assert (await cursor.fetchone())[0] == 2
+
+
+def _large_payload(i: int) -> str:
+    return json.dumps({"ts": f"{i}.0001", "blocks": [{"type": "section", "text": "본문 " * 40}] * 3})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_large_raw_json_stored_out_of_row(tmp_path, write_behind):
+    """큰 raw_json은 message_payloads에 압축 저장, 작은 값은 인라인 유지"""
+    async with UnifiedStorage(tmp_path / "payload.db", write_behind=write_behind,
+                              flush_interval=60) as storage:
+        for i, raw in enumerate([_large_payload(0), '{"ts": "1.0"}', None]):
+            await storage.save_message(NormalizedMessage(
+                id=f"p{i}", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text="본문", timestamp=datetime(2026, 1, 1, 0, i), raw_json=raw,
+            ))
+        await storage.flush()
+
+        async with storage._connection.execute(
+            "SELECT m.id, m.raw_json, p.codec, length(p.raw_json) as size"
+            " FROM messages m LEFT JOIN message_payloads p ON p.message_id = m.id ORDER BY m.id"
+        ) as cursor:
+            rows = [tuple(row) for row in await cursor.fetchall()]
+        assert rows[0][:3] == ("p0", None, "zlib")
+        assert rows[0][3] < len(_large_payload(0).encode()) / 4
+        assert rows[1] == ("p1", '{"ts": "1.0"}', None, None)
+        assert rows[2] == ("p2", None, None, None)
+
+        assert (await storage.get_message("p0")).raw_json == _large_payload(0)
+        recent = await storage.get_recent_messages(include_raw=True)
+        assert [m.raw_json for m in recent] == [None, '{"ts": "1.0"}', _large_payload(0)]
+        paged = [m async for m in storage.iter_unprocessed(page_size=2, include_raw=True)]
+        assert paged[0].raw_json == _large_payload(0)
+
+
+@pytest.mark.asyncio
+async def test_raw_json_loaded_lazily(tmp_path):
+    """기본(include_raw=False)은 payload를 읽지 않고, get_raw_json으로 필요할 때 조회"""
+    async with UnifiedStorage(tmp_path / "lazy.db") as storage:
+        await storage.save_message(NormalizedMessage(
+            id="lz", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="본문", timestamp=datetime(2026, 1, 1), raw_json=_large_payload(1),
+        ))
+        recorder: list[str] = []
+        await storage._connection.set_trace_callback(recorder.append)
+        light = await storage.get_recent_messages()
+        await storage._connection.set_trace_callback(None)
+
+        assert light[0].raw_json is None
+        assert not any("message_payloads" in sql for sql in recorder)
+        assert await storage.get_raw_json("lz") == _large_payload(1)
+        assert await storage.get_raw_json("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_replace_and_archive_keep_payloads_consistent(tmp_path):
+    """덮어쓰면 이전 payload 삭제, 아카이브 시 raw_json은 아카이브 행에 인라인 복원"""
+    async with UnifiedStorage(tmp_path / "gw.db", archive_dir=tmp_path / "archive") as storage:
+        msg = NormalizedMessage(
+            id="rp", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+            text="본문", timestamp=datetime(2026, 1, 5), raw_json=_large_payload(2),
+        )
+        await storage.save_message(msg)
+        msg.raw_json = '{"small": true}'
+        await storage.save_message(msg)
+        async with storage._connection.execute("SELECT COUNT(*) FROM message_payloads") as cursor:
+            assert (await cursor.fetchone())[0] == 0
+        assert (await storage.get_message("rp")).raw_json == '{"small": true}'
+
+        msg.raw_json = _large_payload(3)
+        await storage.save_message(msg)
+        assert await storage.archive_messages(datetime(2026, 2, 1)) == {"2026-01": 1}
+        async with storage._connection.execute("SELECT COUNT(*) FROM message_payloads") as cursor:
+            assert (await cursor.fetchone())[0] == 0
+        assert (await storage.get_message("rp")).raw_json == _large_payload(3)
+        assert await storage.get_raw_json("rp") == _large_payload(3)
+
+
+@pytest.mark.asyncio
+async def test_compact_payloads_moves_legacy_inline_rows(tmp_path):
+    """기존 DB의 큰 인라인 raw_json을 payload 테이블로 이동 (멱등)"""
+    async with UnifiedStorage(tmp_path / "legacy.db") as storage:
+        for i in range(5):
+            await storage.save_message(NormalizedMessage(
+                id=f"c{i}", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1",
+                text="본문", timestamp=datetime(2026, 1, 1, 0, i), raw_json='{"ts": "1"}',
+            ))
+        await storage._connection.execute(
+            "UPDATE messages SET raw_json = ? WHERE id IN ('c1', 'c3')", (_large_payload(4),)
+        )
+        await storage._connection.commit()
+
+        assert await storage.compact_payloads(batch_size=2) == 2
+        assert await storage.compact_payloads() == 0
+        async with storage._connection.execute(
+            "SELECT id FROM messages WHERE raw_json IS NULL ORDER BY id"
+        ) as cursor:
+            assert [row[0] for row in await cursor.fetchall()] == ["c1", "c3"]
+        assert [m.raw_json for m in await storage.get_recent_messages(include_raw=True)] == [
+            '{"ts": "1"}', _large_payload(4), '{"ts": "1"}', _large_payload(4), '{"ts": "1"}',
+        ]
@@ -0,0 +1,110 @@
+"""
+MetricsRegistry / MetricsServer 테스트
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.gateway.models import ChannelType, NormalizedMessage
+from scripts.gateway.pipeline import MessagePipeline
+from scripts.gateway.storage import UnifiedStorage
+from scripts.shared.metrics import MetricsRegistry, MetricsServer, llm_timer
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    MetricsRegistry.reset()
+    yield
+    MetricsRegistry.reset()
+
+
+class TestMetricsRegistry:
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry.get_instance()
+        received = registry.counter("test_received_total", "수신 메시지", ("channel",))
+        received.labels("slack").inc()
+        received.labels("slack").inc(2)
+        received.labels('e"mail').inc()
+        registry.gauge("test_depth", "큐 길이").set_function(lambda: 7)
+
+        text = registry.render()
+        assert "# TYPE test_received_total counter" in text
+        assert 'test_received_total{channel="slack"} 3' in text
+        assert 'test_received_total{channel="e\\"mail"} 1' in text
+        assert "test_depth 7" in text
+        assert text.endswith("\n")
+
+    def test_histogram_buckets_cumulative(self):
+        registry = MetricsRegistry.get_instance()
+        latency = registry.histogram("test_seconds", "지연", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            latency.labels("persist").observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'test_seconds_bucket{stage="persist",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{stage="persist",le="1.0"} 3' in lines
+        assert 'test_seconds_bucket{stage="persist",le="+Inf"} 4' in lines
+        assert 'test_seconds_count{stage="persist"} 4' in lines
+        assert 'test_seconds_sum{stage="persist"} 4.25' in lines
+
+    def test_same_name_returns_existing(self):
+        registry = MetricsRegistry.get_instance()
+        assert registry.counter("c_total", "a") is registry.counter("c_total", "a")
+        with pytest.raises(ValueError):
+            registry.gauge("c_total", "a")
+        with pytest.raises(ValueError):
+            registry.counter("c_total", "a").labels("extra")
+        with pytest.raises(ValueError):
+            registry.counter("c_total", "a").inc(-1)
+
+    def test_llm_timer_records_on_error(self):
+        with pytest.raises(RuntimeError), llm_timer("ollama", "analyze"):
+            raise RuntimeError("timeout")
+        text = MetricsRegistry.get_instance().render()
+        assert 'secretary_llm_request_seconds_count{backend="ollama",operation="analyze"} 1' in text
+
+
+class TestInstrumentation:
+    @pytest.mark.asyncio
+    async def test_pipeline_and_storage_metrics(self, tmp_path):
+        async with UnifiedStorage(tmp_path / "gateway.db") as storage:
+            pipeline = MessagePipeline(storage)
+            await pipeline.process(NormalizedMessage(
+                id="m1", channel=ChannelType.SLACK, channel_id="C1", sender_id="U1", text="확인 부탁드립니다",
+            ))
+
+        text = MetricsRegistry.get_instance().render()
+        for stage in ("resolve", "classify", "persist", "dispatch", "handlers"):
+            assert f'secretary_pipeline_stage_seconds_count{{stage="{stage}"}} 1' in text
+        assert 'secretary_pipeline_messages_total{admission="admitted",status="ok"} 1' in text
+        assert "secretary_db_commit_seconds_count" in text
+
+
+class TestMetricsServer:
+    @pytest.mark.asyncio
+    async def test_serves_text_format(self):
+        MetricsRegistry.get_instance().counter("test_total", "테스트").inc()
+        server = MetricsServer(port=0)
+        await server.start()
+        try:
+            async def get(path: str) -> bytes:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+                return response
+
+            response = await get("/metrics")
+            head, _, body = response.partition(b"\r\n\r\n")
+            assert head.startswith(b"HTTP/1.1 200")
+            assert b"text/plain; version=0.0.4" in head
+            assert b"test_total 1\n" in body
+            assert (await get("/other")).startswith(b"HTTP/1.1 404")
+        finally:
+            await server.stop()
@@ -0,0 +1,126 @@
+"""
+OllamaClient (공유 keep-alive 연결 풀) 테스트
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.shared.ollama_client import OllamaClient
+
+
+class FakeOllama:
+    """keep-alive를 지원하는 최소 /api/chat 서버 (연결 수 기록)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while await reader.readline():
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                body = json.loads(await reader.readexactly(length))
+                self.requests += 1
+                await asyncio.sleep(self.delay)
+                if body.get("stream"):
+                    chunks = b"".join(
+                        json.dumps({"message": {"content": word}, "done": False}).encode() + b"\n"
+                        for word in ("a", "b", "c")
+                    ) + b'{"done": true}\n'
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                                 b"Transfer-Encoding: chunked\r\n\r\n")
+                    writer.write(f"{len(chunks):x}\r\n".encode() + chunks + b"\r\n0\r\n\r\n")
+                else:
+                    payload = json.dumps({"message": {"content": body["model"]}}).encode()
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                                 + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    OllamaClient.reset()
+    yield
+    OllamaClient.reset()
+
+
+class TestOllamaClient:
+    @pytest.mark.asyncio
+    async def test_requests_reuse_connection(self):
+        async with FakeOllama() as server:
+            client = OllamaClient.get_instance()
+            for i in range(3):
+                resp = await client.post(f"{server.url}/api/chat", {"model": f"m{i}"}, timeout=5)
+                assert resp.json()["message"]["content"] == f"m{i}"
+            await OllamaClient.shutdown()
+
+        assert server.requests == 3
+        assert server.connections == 1
+        assert not client.is_open
+
+    @pytest.mark.asyncio
+    async def test_max_connections_bounds_concurrency(self):
+        async with FakeOllama(delay=0.05) as server:
+            client = OllamaClient.configure(max_connections=2, max_keepalive_connections=2)
+            await asyncio.gather(*(
+                client.post(f"{server.url}/api/chat", {"model": "m"}, timeout=5) for _ in range(6)
+            ))
+            await OllamaClient.shutdown()
+
+        assert server.requests == 6
+        assert server.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_ndjson(self):
+        async with FakeOllama() as server:
+            client = OllamaClient.get_instance()
+            chunks = [c async for c in client.stream(f"{server.url}/api/chat", {"model": "m", "stream": True})]
+            await client.aclose()
+
+        assert [c.get("message", {}).get("content") for c in chunks] == ["a", "b", "c", None]
+        assert chunks[-1]["done"] is True
+
+    @pytest.mark.asyncio
+    async def test_per_request_timeout(self):
+        async with FakeOllama(delay=0.5) as server:
+            client = OllamaClient.get_instance()
+            with pytest.raises(httpx.ReadTimeout):
+                await client.post(f"{server.url}/api/chat", {"model": "m"}, timeout=0.05)
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_connect_error_raises(self):
+        client = OllamaClient.get_instance()
+        with pytest.raises(httpx.ConnectError):
+            await client.post("http://127.0.0.1:9/api/chat", {"model": "m"}, timeout=1)
+        await client.aclose()
@@ -0,0 +1,207 @@
+"""
+쿼리 플랜 회귀 테스트
+
+UnifiedStorage / IntelligenceStorage / FeedbackStore / DigestReport의 모든 조회 경로를
+필터 조합별로 실행하면서 연결의 trace callback으로 실제 SQL을 수집하고,
+각 SELECT/UPDATE/DELETE에 EXPLAIN QUERY PLAN을 실행하여 인덱스 없는 전체 스캔이 없는지 검사합니다.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from scripts.gateway.models import ChannelType, NormalizedMessage, Priority
+from scripts.gateway.storage import UnifiedStorage
+from scripts.intelligence.context_store import IntelligenceStorage
+from scripts.intelligence.feedback_store import FeedbackStore
+from scripts.reporter.digest import DigestReport
+
+# 프로젝트 등록 정보/스키마 카탈로그처럼 항상 수십 행 이하인 테이블은 전체 스캔 허용
+SMALL_TABLES = {"projects", "sqlite_master"}
+
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+_PLANNED = ("SELECT", "UPDATE", "DELETE")
+
+
+class QueryRecorder:
+    """aiosqlite 연결에서 실행된 조회/갱신 SQL 수집 (중복 제거, 실행 순서 유지)"""
+
+    def __init__(self):
+        self.queries: dict[str, None] = {}
+
+    def __call__(self, sql: str) -> None:
+        statement = " ".join(sql.split())
+        if statement.upper().startswith(_PLANNED):
+            self.queries[statement] = None
+
+
+async def _full_scans(connection, queries) -> dict[str, list[str]]:
+    """쿼리별 인덱스 없는 전체 스캔 플랜 행"""
+    scans = {}
+    for sql in queries:
+        async with connection.execute(f"EXPLAIN QUERY PLAN {sql}") as cursor:
+            details = [row[3] for row in await cursor.fetchall()]
+        bad = [
+            detail for detail in details
+            if (m := _FULL_SCAN.match(detail)) and m.group(1) not in SMALL_TABLES
+        ]
+        if bad:
+            scans[sql] = details
+    return scans
+
+
+def _message(i: int, **kwargs) -> NormalizedMessage:
+    return NormalizedMessage(
+        id=f"msg_{i}",
+        channel=ChannelType.SLACK if i % 2 else ChannelType.EMAIL,
+        channel_id="C1",
+        sender_id="U1",
+        text=f"메시지 {i}",
+        timestamp=datetime(2026, 1, 1) + timedelta(minutes=i),
+        **kwargs,
+    )
+
+
+async def _exercise_gateway(storage: UnifiedStorage, intel: IntelligenceStorage) -> None:
+    """gateway.db 조회 경로 전체 실행"""
+    for i in range(5):
+        await storage.save_message(
+            _message(i, priority=Priority.HIGH, has_action=bool(i % 2)),
+            project_id="proj",
+        )
+    await storage.save_message(_message(5, raw_json='{"blocks": "' + "x" * 1000 + '"}'), project_id="proj")
+    await storage.save_message(_message(5, raw_json='{"ts": "1"}'), project_id="proj")
+    await storage.flush()
+
+    since = datetime(2025, 12, 31)
+    await storage.get_message("msg_0")
+    await storage.get_raw_json("msg_5")
+    await storage.compact_payloads(batch_size=2)
+    for channel in (None, "slack"):
+        for project_id in (None, "proj"):
+            for when in (None, since):
+                await storage.get_recent_messages(channel=channel, since=when, project_id=project_id)
+                [m async for m in storage.iter_recent(
+                    channel=channel, since=when, project_id=project_id, page_size=2,
+                )]
+    [m async for m in storage.iter_unprocessed(page_size=2)]
+    await storage.record_stage("msg_1", "classify", error="boom")
+    await storage.get_processing_states()
+    await storage.get_processing_states(max_attempts=3)
+    await storage.mark_processed_many(["msg_0", "msg_1"])
+    await storage.get_stats()
+    await storage.load_user_directory("slack")
+    await storage.get_message_counts(since + timedelta(minutes=30))
+    await storage.archive_messages(datetime(2026, 1, 1, 0, 2))
+    await storage.get_message("msg_0")
+    await storage.get_message_counts(since + timedelta(minutes=30), project_id="proj")
+
+    digest = DigestReport(storage, intel)
+    await digest.generate(since=since)
+    await digest.generate(since=since, project_id="proj")
+
+
+async def _exercise_intelligence(intel: IntelligenceStorage) -> None:
+    """intelligence.db 조회 경로 전체 실행"""
+    await intel.save_project({"id": "proj", "name": "Project"})
+    await intel.get_project("proj")
+    await intel.list_projects()
+    await intel.save_context_entry({
+        "id": "ctx1", "project_id": "proj", "source": "slack", "entry_type": "message",
+    })
+    for source in (None, "slack"):
+        for entry_type in (None, "message"):
+            await intel.get_context_entries("proj", source=source, entry_type=entry_type)
+    await intel.save_analysis_state("proj", "slack", "last_ts", "1")
+    await intel.get_analysis_state("proj", "slack", "last_ts")
+
+    draft_id = await intel.save_draft({
+        "project_id": "proj", "source_channel": "slack", "source_message_id": "m1",
+    })
+    await intel.get_draft(draft_id)
+    for status in (None, "pending"):
+        for match_status in (None, "matched"):
+            for project_id in (None, "proj"):
+                await intel.list_drafts(status=status, match_status=match_status, project_id=project_id)
+    await intel.get_awaiting_drafts()
+    await intel.get_awaiting_drafts(project_id="proj")
+    await intel.get_pending_messages()
+    await intel.find_by_message_id("slack", "m1")
+    await intel.update_draft_status(draft_id, "approved")
+    await intel.update_match(draft_id, "proj", 0.9, "rule")
+    await intel.save_draft_text(draft_id, "초안")
+    await intel.get_stats()
+    await intel.cleanup_old_entries(dry_run=False)
+
+    feedback = FeedbackStore(intel)
+    await feedback.save_feedback(draft_id, "approved")
+    await feedback.get_feedback_by_draft(draft_id)
+    await feedback.list_feedback()
+    await feedback.list_feedback(decision="approved")
+
+    await intel.save_project({"id": "empty", "name": "Empty"})
+    await intel.delete_project("empty")
+
+
+@pytest.fixture
+async def storages(tmp_path):
+    async with UnifiedStorage(tmp_path / "gateway.db") as storage:
+        async with IntelligenceStorage(tmp_path / "intelligence.db") as intel:
+            yield storage, intel
+
+
+class TestQueryPlans:
+    @pytest.mark.asyncio
+    async def test_gateway_queries_use_indexes(self, storages):
+        storage, intel = storages
+        recorder = QueryRecorder()
+        await storage._connection.set_trace_callback(recorder)
+        await _exercise_gateway(storage, intel)
+        await storage._connection.set_trace_callback(None)
+
+        assert any("processed_at IS NULL" in sql and "(timestamp, id) >" in sql for sql in recorder.queries)
+        assert any("FROM message_rollups_hourly" in sql for sql in recorder.queries)
+        assert any("FROM message_payloads" in sql for sql in recorder.queries)
+        assert await _full_scans(storage._connection, recorder.queries) == {}
+
+    @pytest.mark.asyncio
+    async def test_intelligence_queries_use_indexes(self, storages):
+        storage, intel = storages
+        recorder = QueryRecorder()
+        await intel._connection.set_trace_callback(recorder)
+        await _exercise_intelligence(intel)
+        await DigestReport(storage, intel).generate(since=datetime(2025, 12, 31))
+        await intel._connection.set_trace_callback(None)
+
+        assert any("awaiting_draft" in sql for sql in recorder.queries)
+        assert any("FROM feedback_responses" in sql for sql in recorder.queries)
+        assert await _full_scans(intel._connection, recorder.queries) == {}
+
+    @pytest.mark.asyncio
+    async def test_detects_full_scan(self, storages):
+        """인덱스가 없는 컬럼 필터는 전체 스캔으로 보고"""
+        storage, _ = storages
+        sql = "SELECT * FROM messages WHERE sender_id = 'U1'"
+        assert sql in await _full_scans(storage._connection, [sql])
+
+    @pytest.mark.asyncio
+    async def test_index_migration_idempotent(self, tmp_path):
+        """기존 단일 컬럼 인덱스 DB에서 재연결해도 복합 인덱스로 교체"""
+        db_path = tmp_path / "gateway.db"
+        async with UnifiedStorage(db_path) as storage:
+            await storage._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_priority ON messages(priority)"
+            )
+            await storage._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_priority_ts ON messages(priority, timestamp, project_id)"
+            )
+            await storage._connection.commit()
+
+        for _ in range(2):
+            async with UnifiedStorage(db_path) as storage:
+                async with storage._connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'messages'"
+                ) as cursor:
+                    names = {row[0] for row in await cursor.fetchall()}
+        assert not {"idx_messages_priority", "idx_messages_priority_ts", "idx_messages_action_ts"} & names
+        assert {"idx_messages_channel_ts", "idx_messages_unprocessed"} <= names
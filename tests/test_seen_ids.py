@@ -0,0 +1,52 @@
+"""
+BoundedSeenSet 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.shared.seen_ids import BoundedSeenSet
+
+
+class TestBoundedSeenSet:
+    def test_evicts_oldest_deterministically(self):
+        """용량 초과 시 가장 오래된 ID부터 제거"""
+        seen = BoundedSeenSet(3)
+        for key in ["a", "b", "c", "d"]:
+            assert seen.add(key) is True
+        assert list(seen) == ["b", "c", "d"]
+        assert "a" not in seen
+
+    def test_re_add_refreshes_position(self):
+        """이미 있는 ID를 다시 추가하면 최근 위치로 이동"""
+        seen = BoundedSeenSet(3)
+        seen.update(["a", "b", "c"])
+        assert seen.add("a") is False
+        seen.add("d")
+        assert list(seen) == ["c", "a", "d"]
+
+    def test_persistence_restores_last_window(self, tmp_path):
+        """저장 후 새 인스턴스에서 마지막 maxlen개 복원"""
+        path = tmp_path / "seen.txt"
+        seen = BoundedSeenSet(3, path=path)
+        seen.update(["a", "b", "c", "d"])
+        assert seen.save() is True
+        assert seen.save() is False  # 변경 없으면 기록 생략
+
+        smaller = BoundedSeenSet(2, path=path)
+        assert smaller.load() == 2
+        assert list(smaller) == ["c", "d"]
+
+    def test_memory_only(self):
+        seen = BoundedSeenSet(2)
+        seen.add("a")
+        assert seen.save() is False
+        assert seen.load() == 0
+
+    def test_invalid_maxlen(self):
+        with pytest.raises(ValueError):
+            BoundedSeenSet(0)
@@ -0,0 +1,103 @@
+"""
+SQLite 연결 프로파일 테스트
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.gateway.storage import UnifiedStorage
+from scripts.intelligence.context_store import IntelligenceStorage
+from scripts.shared.sqlite_profile import (
+    GATEWAY_PROFILE,
+    INTELLIGENCE_PROFILE,
+    SQLiteProfile,
+    open_connection,
+)
+
+
+async def _pragma(conn, name: str):
+    async with conn.execute(f"PRAGMA {name}") as cursor:
+        row = await cursor.fetchone()
+        return row[0]
+
+
+class TestSQLiteProfile:
+    def test_pragmas_order_and_values(self):
+        profile = SQLiteProfile(name="t", cache_size_kib=1024, busy_timeout_ms=1234)
+        pragmas = profile.pragmas()
+        assert pragmas[0] == "PRAGMA journal_mode=WAL"
+        assert "PRAGMA synchronous=NORMAL" in pragmas
+        assert "PRAGMA cache_size=-1024" in pragmas
+        assert "PRAGMA temp_store=MEMORY" in pragmas
+        assert "PRAGMA busy_timeout=1234" in pragmas
+        assert "PRAGMA query_only=ON" not in pragmas
+
+    def test_reader_profile(self):
+        reader = GATEWAY_PROFILE.reader()
+        assert reader.query_only is True
+        assert reader.mmap_size == GATEWAY_PROFILE.mmap_size
+        assert "PRAGMA query_only=ON" in reader.pragmas()
+
+    @pytest.mark.asyncio
+    async def test_open_connection_applies_profile(self, tmp_path):
+        conn = await open_connection(tmp_path / "sub" / "p.db", INTELLIGENCE_PROFILE)
+        try:
+            assert (await _pragma(conn, "journal_mode")).lower() == "wal"
+            assert await _pragma(conn, "synchronous") == 1  # NORMAL
+            assert await _pragma(conn, "temp_store") == 2  # MEMORY
+            assert await _pragma(conn, "busy_timeout") == INTELLIGENCE_PROFILE.busy_timeout_ms
+            assert await _pragma(conn, "foreign_keys") == 1
+        finally:
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_stores_declare_profiles(self, tmp_path):
+        assert UnifiedStorage.PROFILE is GATEWAY_PROFILE
+        assert IntelligenceStorage.PROFILE is INTELLIGENCE_PROFILE
+
+        async with UnifiedStorage(tmp_path / "gateway.db") as storage:
+            assert (await _pragma(storage._connection, "journal_mode")).lower() == "wal"
+
+    @pytest.mark.asyncio
+    async def test_read_only_stores_use_reader_profile(self, tmp_path):
+        """read_only 스토어는 reader 프로파일(query_only)로 열려 조회만 가능"""
+        async with IntelligenceStorage(tmp_path / "intelligence.db") as storage:
+            await storage.save_project({"id": "p1", "name": "P1"})
+
+        async with IntelligenceStorage(tmp_path / "intelligence.db", read_only=True) as storage:
+            assert await _pragma(storage._connection, "query_only") == 1
+            assert [p["id"] for p in await storage.list_projects()] == ["p1"]
+            with pytest.raises(sqlite3.OperationalError):
+                await storage.save_project({"id": "p2", "name": "P2"})
+
+    @pytest.mark.asyncio
+    async def test_reader_does_not_block_writer(self, tmp_path):
+        """WAL: 열린 읽기 트랜잭션이 있어도 쓰기 커밋 가능"""
+        db_path = tmp_path / "gateway.db"
+        async with UnifiedStorage(db_path):
+            pass
+
+        writer = await open_connection(db_path, GATEWAY_PROFILE)
+        reader = await open_connection(db_path, GATEWAY_PROFILE.reader())
+        try:
+            await reader.execute("BEGIN")
+            async with reader.execute("SELECT COUNT(*) FROM messages") as cursor:
+                assert (await cursor.fetchone())[0] == 0
+
+            await writer.execute(
+                "INSERT INTO messages (id, channel, channel_id, sender_id, timestamp) "
+                "VALUES ('m1', 'slack', 'C1', 'U1', '2026-01-01T00:00:00')"
+            )
+            await writer.commit()
+
+            with pytest.raises(sqlite3.OperationalError):
+                await reader.execute("DELETE FROM messages")
+            await reader.execute("COMMIT")
+        finally:
+            await reader.close()
+            await writer.close()